@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Series comparison and lag estimation on a shared time base
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from utils.helpers import to_seconds
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on samples in the shared time base
+MAX_COMMON_POINTS = 20000
+
+# Upper bound on samples per series when estimating a lag
+MAX_ALIGNMENT_POINTS = 1 << 18
+
+
+def common_time_base(x_arrays: List[np.ndarray], max_points: int = MAX_COMMON_POINTS,
+                     step: Optional[float] = None) -> np.ndarray:
+    """
+    Evenly spaced time base over the range every series covers
+
+    The spacing follows the finest median sample interval among the series
+    (or the given step), capped at max_points samples.
+
+    Returns:
+        Float array (empty when the series do not overlap)
+    """
+    t_min = max(float(np.min(x)) for x in x_arrays)
+    t_max = min(float(np.max(x)) for x in x_arrays)
+    if not t_max > t_min:
+        return np.empty(0, dtype=float)
+
+    if step is not None and step > 0:
+        spacings = [step]
+    else:
+        spacings = [np.median(np.diff(np.sort(x))) for x in x_arrays if len(x) > 1]
+        spacings = [s for s in spacings if s > 0]
+    n_points = int(np.ceil((t_max - t_min) / min(spacings))) + 1 if spacings else max_points
+    return np.linspace(t_min, t_max, max(2, min(n_points, max_points)))
+
+
+def resample_matrix(series: List[Tuple[np.ndarray, np.ndarray]], time_base: np.ndarray) -> np.ndarray:
+    """
+    Interpolate every series onto the time base
+
+    Returns:
+        (n_series, len(time_base)) float matrix
+    """
+    matrix = np.empty((len(series), len(time_base)), dtype=float)
+    for row, (x, y) in enumerate(series):
+        order = np.argsort(x, kind='stable')
+        matrix[row] = np.interp(time_base, x[order], y[order])
+    return matrix
+
+
+def pairwise_rms(matrix: np.ndarray) -> np.ndarray:
+    """RMS difference between every pair of rows, from one Gram matrix"""
+    gram = matrix @ matrix.T
+    norms = np.diag(gram)
+    squared = np.maximum(norms[:, None] + norms[None, :] - 2 * gram, 0.0)
+    rms = np.sqrt(squared / matrix.shape[1])
+    np.fill_diagonal(rms, 0.0)
+    return rms
+
+
+def pairwise_lags(matrix: np.ndarray, max_lag: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lag of best cross-correlation between every pair of rows
+
+    Rows are standardised and transformed once; each row's cross-correlation
+    with all the others is then a single batched inverse FFT.
+
+    Args:
+        matrix: (n_series, n_points) values on a shared time base
+        max_lag: Largest shift in samples considered (defaults to a quarter
+            of the series length)
+
+    Returns:
+        (lags, peaks): lags[i, j] is the shift in samples by which row j
+        trails row i (negative if it leads); peaks[i, j] is the correlation
+        at that shift
+    """
+    n_series, n_points = matrix.shape
+    if max_lag is None:
+        max_lag = n_points // 4
+    max_lag = int(min(max(max_lag, 0), n_points - 1))
+
+    std = matrix.std(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        standardised = (matrix - matrix.mean(axis=1, keepdims=True)) / std
+    standardised[~np.isfinite(standardised)] = 0.0
+
+    n_fft = 1 << int(np.ceil(np.log2(2 * n_points)))
+    spectra = np.fft.rfft(standardised, n=n_fft, axis=1)
+    shifts = np.r_[0:max_lag + 1, -max_lag:0]
+
+    lags = np.zeros((n_series, n_series), dtype=np.int64)
+    peaks = np.full((n_series, n_series), np.nan)
+    for i in range(n_series):
+        correlation = np.fft.irfft(np.conj(spectra[i]) * spectra, n=n_fft, axis=1)
+        # Keep shifts within max_lag (negative shifts wrap to the end)
+        window = np.concatenate((correlation[:, :max_lag + 1], correlation[:, n_fft - max_lag:]), axis=1)
+        best = np.argmax(window, axis=1)
+        lags[i] = shifts[best]
+        peaks[i] = window[np.arange(n_series), best] / n_points
+
+    constant = (std[:, 0] == 0) | ~np.isfinite(std[:, 0])
+    peaks[constant, :] = np.nan
+    peaks[:, constant] = np.nan
+    return lags, peaks
+
+
+def compare_all_pairs(names: List[str], series: List[Tuple[np.ndarray, np.ndarray]],
+                      align_start: bool = False, max_points: int = MAX_COMMON_POINTS,
+                      max_lag: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Correlation, RMS difference and lag for every pair of series
+
+    All series are resampled onto one shared time base and compared as a
+    matrix, so the cost is a few array operations rather than one
+    comparison per pair.
+
+    Args:
+        names: Series names
+        series: (x, y) float arrays per series; x in seconds or plain numbers
+        align_start: Shift each series so it starts at t=0 before comparing
+        max_points: Upper bound on the shared time base length
+        max_lag: Largest lag considered, in samples of the shared time base
+
+    Returns:
+        Dictionary with 'names', 'time', 'values' (resampled matrix),
+        'mean', 'std', 'correlation', 'rms_difference', 'lag' (x units),
+        'lag_correlation' and 'n_points'
+
+    Raises:
+        ValueError: Fewer than two usable series, or no common time range
+    """
+    cleaned = []
+    for x, y in series:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        mask = np.isfinite(x) & np.isfinite(y)
+        x, y = x[mask], y[mask]
+        if align_start and len(x):
+            x = x - x.min()
+        cleaned.append((x, y))
+
+    if len(cleaned) < 2 or any(len(x) < 2 for x, _ in cleaned):
+        raise ValueError("At least two series with two or more valid points are required")
+
+    time_base = common_time_base([x for x, _ in cleaned], max_points)
+    if len(time_base) == 0:
+        raise ValueError("The series do not share a common time range")
+
+    matrix = resample_matrix(cleaned, time_base)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = np.corrcoef(matrix)
+    lags, lag_correlation = pairwise_lags(matrix, max_lag)
+    step = time_base[1] - time_base[0]
+
+    return {
+        'names': list(names),
+        'time': time_base,
+        'values': matrix,
+        'mean': matrix.mean(axis=1),
+        'std': matrix.std(axis=1),
+        'correlation': np.atleast_2d(correlation),
+        'rms_difference': pairwise_rms(matrix),
+        'lag': lags * step,
+        'lag_correlation': lag_correlation,
+        'n_points': len(time_base)
+    }
+
+
+def pair_metrics(y1: np.ndarray, y2: np.ndarray) -> Dict[str, Any]:
+    """
+    Correlation, difference statistics and two-sample tests of aligned series
+
+    The means and centred sums of squares and products are computed once
+    and shared by the correlation, the difference statistics and the
+    pooled-variance t-test (identical to scipy.stats.ttest_ind).
+
+    Args:
+        y1, y2: Equal-length finite values on a shared time base
+
+    Returns:
+        Dictionary with 'correlation', 'difference_stats' (mean_diff,
+        std_diff, max_diff, rms_diff), 'ttest' and 'ks_test'
+    """
+    n = len(y1)
+    mean1, mean2 = y1.mean(), y2.mean()
+    d1, d2 = y1 - mean1, y2 - mean2
+    ss1, ss2, sp = np.dot(d1, d1), np.dot(d2, d2), np.dot(d1, d2)
+
+    correlation = 0.0
+    if ss1 > 1e-20 * n and ss2 > 1e-20 * n:
+        correlation = float(np.clip(sp / np.sqrt(ss1 * ss2), -1.0, 1.0))
+
+    mean_diff = mean1 - mean2
+    var_diff = max((ss1 + ss2 - 2 * sp) / n, 0.0)
+
+    dof = 2 * n - 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_stat = mean_diff / np.sqrt((ss1 + ss2) / dof * (2.0 / n))
+    t_pval = float(2 * stats.t.sf(abs(t_stat), dof)) if np.isfinite(t_stat) else np.nan
+    ks = stats.ks_2samp(y1, y2)
+
+    return {
+        'correlation': correlation,
+        'difference_stats': {
+            'mean_diff': float(mean_diff),
+            'std_diff': float(np.sqrt(var_diff)),
+            'max_diff': float(np.max(np.abs(y1 - y2))),
+            'rms_diff': float(np.sqrt(var_diff + mean_diff * mean_diff))
+        },
+        'ttest': {'statistic': float(t_stat), 'p_value': t_pval},
+        'ks_test': {'statistic': float(ks.statistic), 'p_value': float(ks.pvalue)}
+    }
+
+
+def compare_pair(x1: Any, y1: Any, x2: Any, y2: Any, step: Optional[float] = None,
+                 max_points: int = MAX_COMMON_POINTS) -> Dict[str, Any]:
+    """
+    Resample two series onto one time base and compare them
+
+    The time base covers the overlap of the series at the finer of their
+    native sample intervals (or the given step), so long logs are not
+    decimated to a fixed point count and short ones are not oversampled.
+
+    Args:
+        x1, y1: First series (x numeric or datetime)
+        x2, y2: Second series
+        step: Time base spacing in x units (seconds for datetimes and timedeltas);
+            None picks it from the sample rates
+        max_points: Upper bound on the time base length
+
+    Returns:
+        pair_metrics() result plus 'common_time' (x units; seconds from
+        the start of the overlap for datetimes), 'y1_interpolated',
+        'y2_interpolated', 'step' and 'n_points'
+
+    Raises:
+        ValueError: A series without valid points, or no common time range
+    """
+    series = []
+    datetime_x = False
+    for x, y in ((x1, y1), (x2, y2)):
+        x_series = pd.Series(x)
+        datetime_x = datetime_x or pd.api.types.is_datetime64_any_dtype(x_series.dtype)
+        x = to_seconds(x_series)
+        y = np.asarray(y, dtype=float)
+        mask = np.isfinite(x) & np.isfinite(y)
+        if mask.sum() < 2:
+            raise ValueError("Each series needs at least two valid points")
+        series.append((x[mask], y[mask]))
+
+    time_base = common_time_base([x for x, _ in series], max_points, step)
+    if len(time_base) == 0:
+        raise ValueError("The series do not share a common time range")
+
+    y1_interp, y2_interp = resample_matrix(series, time_base)
+    result = pair_metrics(y1_interp, y2_interp)
+    result.update({
+        'common_time': time_base - time_base[0] if datetime_x else time_base,
+        'y1_interpolated': y1_interp,
+        'y2_interpolated': y2_interp,
+        'step': float(time_base[1] - time_base[0]),
+        'n_points': len(time_base)
+    })
+    return result
+
+
+def _uniform(x: np.ndarray, y: np.ndarray, step: float) -> Tuple[float, np.ndarray]:
+    """Series resampled at a fixed step from its first sample, standardised"""
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+    grid = x[0] + step * np.arange(int(np.floor((x[-1] - x[0]) / step)) + 1)
+    values = np.interp(grid, x, y)
+    std = values.std()
+    values = values - values.mean()
+    return x[0], values / std if std > 0 else values
+
+
+def estimate_lag(x1: Any, y1: Any, x2: Any, y2: Any, max_lag: Optional[float] = None,
+                 max_points: int = MAX_ALIGNMENT_POINTS) -> Dict[str, Any]:
+    """
+    Time shift that best lines series 2 up with series 1
+
+    Both series are resampled to one common rate (the finer of their
+    median sample intervals, coarsened if needed to stay under max_points
+    samples), and their full cross-correlation is computed with one FFT
+    product, so the cost is O(n log n) rather than O(n*m). The lag is
+    refined to a fraction of a sample by fitting a parabola through the
+    correlation peak.
+
+    Args:
+        x1, y1: Reference series (x numeric or datetime)
+        x2, y2: Series to shift
+        max_lag: Largest shift considered, in x units (seconds for
+            datetimes), relative to the series' current positions
+        max_points: Upper bound on resampled points per series
+
+    Returns:
+        Dictionary with 'lag' (add to x2 to align it, in x units),
+        'lag_samples', 'step', 'confidence' (normalised correlation at
+        the peak, 0-1), 'zero_lag_correlation' (normalised correlation as
+        currently positioned) and 'n_points'
+
+    Raises:
+        ValueError: Too few valid points or an empty max_lag window
+    """
+    series = []
+    for x, y in ((x1, y1), (x2, y2)):
+        x = to_seconds(pd.Series(x))
+        y = np.asarray(y, dtype=float)
+        mask = np.isfinite(x) & np.isfinite(y)
+        if mask.sum() < 2 or np.ptp(x[mask]) <= 0:
+            raise ValueError("Each series needs at least two valid points spanning some time")
+        series.append((x[mask], y[mask]))
+
+    spacings = [np.median(np.diff(np.unique(x))) for x, _ in series]
+    step = min(spacings)
+    longest = max(np.ptp(x) for x, _ in series)
+    step = max(step, longest / (max_points - 1))
+
+    start1, a = _uniform(*series[0], step)
+    start2, b = _uniform(*series[1], step)
+    n_a, n_b = len(a), len(b)
+
+    # c[k] = sum_j a[j + k] * b[j]; a peak at k puts x2 + (start1 - start2 + k*step) onto x1
+    n_fft = 1 << int(np.ceil(np.log2(n_a + n_b - 1)))
+    correlation = np.fft.irfft(np.fft.rfft(a, n_fft) * np.conj(np.fft.rfft(b, n_fft)), n_fft)
+    correlation = np.concatenate((correlation[n_fft - (n_b - 1):], correlation[:n_a]))
+    shifts = np.arange(-(n_b - 1), n_a)
+    correlation /= np.sqrt(np.dot(a, a) * np.dot(b, b)) or 1.0
+
+    base = (start1 - start2) / step
+    window = np.ones(len(shifts), dtype=bool)
+    if max_lag is not None:
+        window = np.abs(base + shifts) * step <= max_lag
+        if not window.any():
+            raise ValueError("No shift within max_lag overlaps the two series")
+
+    candidates = np.flatnonzero(window)
+    peak = candidates[np.argmax(correlation[candidates])]
+
+    # Parabolic refinement between the neighbouring shifts
+    offset = 0.0
+    if 0 < peak < len(correlation) - 1 and window[peak - 1] and window[peak + 1]:
+        left, centre, right = correlation[peak - 1:peak + 2]
+        curvature = left - 2 * centre + right
+        if curvature < 0:
+            offset = 0.5 * (left - right) / curvature
+
+    lag_samples = shifts[peak] + offset
+    zero = int(np.rint(-base))
+    zero_lag = float(correlation[zero + n_b - 1]) if -(n_b - 1) <= zero < n_a else 0.0
+
+    return {
+        'lag': float((base + lag_samples) * step),
+        'lag_samples': float(base + lag_samples),
+        'step': float(step),
+        'confidence': float(np.clip(correlation[peak], 0.0, 1.0)),
+        'zero_lag_correlation': zero_lag,
+        'n_points': (n_a, n_b)
+    }
@@ -10,8 +10,14 @@ import pandas as pd
 from scipy import stats
 from dataclasses import dataclass, field
 
+from analysis.vacuum import run_positions
+from utils.helpers import to_seconds
+
 logger = logging.getLogger(__name__)
 
+# Values per column block scanned at once by DataQualityAnalyzer._scan_columns
+SCAN_BLOCK_CELLS = 2_000_000
+
 
 @dataclass
 class QualityReport:
@@ -47,8 +53,173 @@ class DataQualityAnalyzer:
             'noise_window': 50
         }
 
-    def analyze_quality(self, data: pd.DataFrame) -> QualityReport:
-        """Analyze quality of DataFrame data - ULTRA AGGRESSIVE SCORING"""
+    @staticmethod
+    def _column_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs of True down every column of a 2D mask, in one pass
+
+        Returns:
+            (columns, starts, ends) int arrays; each run covers rows [start, end)
+        """
+        # Only columns with any True need the edge search
+        flagged = np.flatnonzero(mask.any(axis=0))
+        padded = np.zeros((len(flagged), mask.shape[0] + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask[:, flagged].T
+        edges = np.diff(padded, axis=1)
+        rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return flagged[rows], starts, ends
+
+    @staticmethod
+    def _sorted_quantile(ordered: np.ndarray, valid: np.ndarray, q: float) -> np.ndarray:
+        """
+        Linear-interpolated quantile of every column of a column-wise sorted
+        matrix whose first valid[i] rows of column i are its valid values
+        """
+        last = np.maximum(valid - 1, 0)
+        position = q * last
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        columns = np.arange(ordered.shape[1])
+        low_values = ordered[lower, columns]
+        return low_values + (position - lower) * (ordered[upper, columns] - low_values)
+
+    def _scan_columns(self, frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Quality counts of every column of a numeric frame
+
+        Columns are scanned in blocks of about SCAN_BLOCK_CELLS values, so
+        the float matrix and the masks and sorted copies made from it stay
+        bounded however wide the frame is.
+
+        Returns:
+            Column -> {'missing', 'zeros', 'outliers', 'duplicates' (counts),
+            'noise' (noise sigma relative to the column std), 'zero_runs'
+            and 'missing_runs' ((starts, ends) arrays; missing runs of at
+            least gap_threshold rows)}
+        """
+        block = max(1, SCAN_BLOCK_CELLS // max(len(frame), 1))
+        result = {}
+        for start in range(0, frame.shape[1], block):
+            result.update(self._scan_block(frame.iloc[:, start:start + block]))
+        return result
+
+    def _scan_block(self, frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Quality counts of a block of columns (see _scan_columns)
+
+        The block is converted to one float matrix and every count is a
+        reduction over it: missing and zero masks, one column-wise sort
+        that gives both the IQR bounds and the duplicate counts (equal
+        neighbours once sorted, rather than hashing), and a robust noise
+        estimate from the interquartile range of first differences.
+        """
+        values = frame.to_numpy(dtype=float, na_value=np.nan)
+        n_rows, n_cols = values.shape
+
+        missing_mask = np.isnan(values)
+        zero_mask = values == 0
+        missing = missing_mask.sum(axis=0)
+        zeros = zero_mask.sum(axis=0)
+        valid = n_rows - missing
+
+        # Sorting puts NaN last, so each column's valid values lead
+        ordered = np.sort(values, axis=0)
+        if n_rows > 1:
+            duplicates = (ordered[1:] == ordered[:-1]).sum(axis=0) + np.maximum(missing - 1, 0)
+        else:
+            duplicates = np.zeros(n_cols, dtype=np.int64)
+
+        q1 = self._sorted_quantile(ordered, valid, 0.25)
+        q3 = self._sorted_quantile(ordered, valid, 0.75)
+        iqr = q3 - q1
+        has_spread = (valid > 0) & (iqr > 0)
+        with np.errstate(invalid='ignore'):
+            outside = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+        outliers = np.where(has_spread, outside.sum(axis=0), 0)
+
+        # White-noise sigma from the IQR of first differences (IQR / 1.349 / sqrt(2))
+        noise = np.full(n_cols, np.nan)
+        if n_rows > 2:
+            steps = np.sort(np.diff(values, axis=0), axis=0)
+            valid_steps = n_rows - 1 - np.isnan(steps).sum(axis=0)
+            step_iqr = (self._sorted_quantile(steps, valid_steps, 0.75) -
+                        self._sorted_quantile(steps, valid_steps, 0.25))
+            # All-missing columns have no std (nanstd would warn about them)
+            std = np.full(n_cols, np.nan)
+            has_values = valid > 0
+            std[has_values] = np.nanstd(values[:, has_values], axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                noise = step_iqr / (1.349 * np.sqrt(2)) / std
+            noise[(valid_steps == 0) | ~np.isfinite(noise)] = np.nan
+
+        zero_cols, zero_starts, zero_ends = self._column_runs(zero_mask)
+        gap_cols, gap_starts, gap_ends = self._column_runs(missing_mask)
+        long_gaps = (gap_ends - gap_starts) >= self.config['gap_threshold']
+        gap_cols, gap_starts, gap_ends = gap_cols[long_gaps], gap_starts[long_gaps], gap_ends[long_gaps]
+
+        # Runs come out grouped by column, so each column's runs are one slice
+        zero_bounds = np.searchsorted(zero_cols, np.arange(n_cols + 1))
+        gap_bounds = np.searchsorted(gap_cols, np.arange(n_cols + 1))
+
+        result = {}
+        for i, col in enumerate(frame.columns):
+            zero_sel = slice(zero_bounds[i], zero_bounds[i + 1])
+            gap_sel = slice(gap_bounds[i], gap_bounds[i + 1])
+            result[col] = {
+                'missing': int(missing[i]),
+                'zeros': int(zeros[i]),
+                'outliers': int(outliers[i]),
+                'duplicates': int(duplicates[i]),
+                'noise': float(noise[i]),
+                'zero_runs': (zero_starts[zero_sel], zero_ends[zero_sel]),
+                'missing_runs': (gap_starts[gap_sel], gap_ends[gap_sel])
+            }
+        return result
+
+    def _timestamp_gaps(self, times: pd.Series) -> np.ndarray:
+        """Rows following a time step over gap_threshold times the median step"""
+        seconds = to_seconds(times)
+        steps = np.diff(seconds)
+        finite = np.isfinite(steps) & (steps > 0)
+        if not finite.any():
+            return np.empty(0, dtype=np.int64)
+        median_step = np.median(steps[finite])
+        with np.errstate(invalid='ignore'):
+            return np.flatnonzero(steps > self.config['gap_threshold'] * median_step) + 1
+
+    def _fill_scan_fields(self, report: QualityReport, scans: Dict[str, Dict[str, Any]],
+                          timestamp_gaps: np.ndarray):
+        """Zeros, gaps and noise level of the report from per-column scans"""
+        zero_rows = [run_positions(*scan['zero_runs']) for scan in scans.values()]
+        report.zeros = np.unique(np.concatenate(zero_rows)).tolist() if zero_rows else []
+
+        gap_rows = [scan['missing_runs'][0] for scan in scans.values()] + [timestamp_gaps]
+        report.gaps = np.unique(np.concatenate(gap_rows)).astype(np.int64).tolist()
+
+        noise = [scan['noise'] for scan in scans.values() if np.isfinite(scan['noise'])]
+        report.noise_level = float(np.mean(noise)) if noise else 0.0
+
+        columns = {}
+        for col, scan in scans.items():
+            summary = {key: scan[key] for key in ('missing', 'zeros', 'outliers', 'duplicates', 'noise')}
+            zero_starts, zero_ends = scan['zero_runs']
+            summary['zero_runs'] = len(zero_starts)
+            summary['longest_zero_run'] = int(np.max(zero_ends - zero_starts)) if len(zero_starts) else 0
+            summary['missing_gaps'] = len(scan['missing_runs'][0])
+            columns[col] = summary
+        report.statistics['columns'] = columns
+        report.statistics['timestamp_gaps'] = len(timestamp_gaps)
+
+    def analyze_quality(self, data: pd.DataFrame, file_data=None) -> QualityReport:
+        """
+        Analyze quality of DataFrame data - ULTRA AGGRESSIVE SCORING
+
+        Args:
+            data: DataFrame (or Series) to analyze
+            file_data: FileData holding data; per-column counts are then read
+                from and stored in its statistics cache
+        """
         report = QualityReport()
 
         if isinstance(data, pd.DataFrame):
@@ -63,40 +234,34 @@ class DataQualityAnalyzer:
                 report.quality_score = 0
                 return report
 
-            # Analyze all numeric columns for issues
-            total_cells = 0
-            total_missing = 0
-            total_zeros = 0
-            total_outliers = 0
-            total_duplicates = 0
-
-            for col in numeric_cols:
-                col_data = data[col]
-                total_cells += len(col_data)
-
-                # Count missing values
-                missing = col_data.isna().sum()
-                total_missing += missing
-
-                # Count zeros
-                zeros = (col_data == 0).sum()
-                total_zeros += zeros
-
-                # Detect outliers using IQR
-                valid_data = col_data.dropna()
-                if len(valid_data) > 0:
-                    q1 = valid_data.quantile(0.25)
-                    q3 = valid_data.quantile(0.75)
-                    iqr = q3 - q1
-                    if iqr > 0:
-                        lower = q1 - 1.5 * iqr
-                        upper = q3 + 1.5 * iqr
-                        outliers = ((valid_data < lower) | (valid_data > upper)).sum()
-                        total_outliers += outliers
-
-                # Count duplicates
-                duplicates = col_data.duplicated().sum()
-                total_duplicates += duplicates
+            use_cache = file_data is not None and file_data.data is data
+
+            # Scan every column not already cached in one pass
+            scans = {}
+            if use_cache:
+                scans = {col: file_data.cached_stat('quality', col) for col in numeric_cols}
+                scans = {col: scan for col, scan in scans.items() if scan is not None}
+            pending = [col for col in numeric_cols if col not in scans]
+            if pending:
+                data_key = file_data.data_key() if use_cache else None
+                scanned = self._scan_columns(data[pending])
+                # Results are not cached if the data changed during the scan
+                if use_cache and file_data.data_key() == data_key:
+                    for col, scan in scanned.items():
+                        file_data.store_stat('quality', col, None, None, scan)
+                scans.update(scanned)
+            scans = {col: scans[col] for col in numeric_cols}
+
+            total_cells = len(data) * len(numeric_cols)
+            total_missing = sum(scan['missing'] for scan in scans.values())
+            total_zeros = sum(scan['zeros'] for scan in scans.values())
+            total_outliers = sum(scan['outliers'] for scan in scans.values())
+            total_duplicates = sum(scan['duplicates'] for scan in scans.values())
+
+            timestamp_gaps = np.empty(0, dtype=np.int64)
+            time_cols = data.select_dtypes(include=['datetime', 'datetimetz']).columns
+            if len(time_cols) > 0:
+                timestamp_gaps = self._timestamp_gaps(data[time_cols[0]])
 
             # Calculate percentages
             missing_pct = (total_missing / total_cells) * 100 if total_cells > 0 else 0
@@ -157,6 +322,7 @@ class DataQualityAnalyzer:
                 'outliers_pct': outliers_pct,
                 'duplicates_pct': duplicates_pct
             }
+            self._fill_scan_fields(report, scans, timestamp_gaps)
 
             # Add recommendations based on score
             if score < 50:
@@ -194,4 +360,8 @@ class DataQualityAnalyzer:
             if missing_pct > 0:
                 report.issues.append(f"{missing_pct:.1f}% missing values")
 
+            if pd.api.types.is_numeric_dtype(series_data.dtype) and total > 0:
+                scans = self._scan_columns(series_data.to_frame())
+                self._fill_scan_fields(report, scans, np.empty(0, dtype=np.int64))
+
         return report
@@ -17,6 +17,10 @@ from sklearn.decomposition import PCA
 from typing import Dict, List, Tuple, Optional, Any
 import logging
 
+from analysis.vacuum import mask_runs, run_reduce
+from analysis.rolling import base_pressure_by_window
+from utils.descriptive import describe
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,45 +41,10 @@ class DataAnalysisTools:
         Returns:
             dict: Dictionary containing statistical measures
         """
-        data = np.array(data)
-        valid_data = data[~np.isnan(data)]
-        
-        if len(valid_data) == 0:
-            return {
-                'count': 0,
-                'mean': np.nan,
-                'median': np.nan,
-                'std': np.nan,
-                'var': np.nan,
-                'min': np.nan,
-                'max': np.nan,
-                'range': np.nan,
-                'q1': np.nan,
-                'q3': np.nan,
-                'iqr': np.nan,
-                'skewness': np.nan,
-                'kurtosis': np.nan,
-                'cv': np.nan
-            }
-
-        # Initialize statistics dictionary
-        stats_dict = {
-            'count': len(valid_data),
-            'mean': np.mean(valid_data),
-            'median': np.median(valid_data),
-            'std': np.std(valid_data),
-            'var': np.var(valid_data),
-            'min': np.min(valid_data),
-            'max': np.max(valid_data),
-            'range': np.max(valid_data) - np.min(valid_data),
-            'q1': np.percentile(valid_data, 25),
-            'q3': np.percentile(valid_data, 75),
-            'iqr': np.percentile(valid_data, 75) - np.percentile(valid_data, 25),
-            'skewness': stats.skew(valid_data),
-            'kurtosis': stats.kurtosis(valid_data),
-            'cv': np.std(valid_data) / np.mean(valid_data) if np.mean(valid_data) != 0 else np.nan
-        }
-        return stats_dict
+        summary = describe(data)
+        return {key: summary[key] for key in
+                ('count', 'mean', 'median', 'std', 'var', 'min', 'max', 'range',
+                 'q1', 'q3', 'iqr', 'skewness', 'kurtosis', 'cv')}
 
     @staticmethod
     def find_peaks_and_valleys(x_data, y_data, prominence=None):
@@ -266,18 +235,39 @@ class VacuumAnalysisTools:
         Returns:
             tuple: (base_pressure, rolling_min, rolling_std)
         """
-        window_size = int(window_minutes * 60 * sample_rate_hz)
-        
-        rolling_min = pd.Series(pressure_data).rolling(window=window_size, center=True).min()
-        rolling_std = pd.Series(pressure_data).rolling(window=window_size, center=True).std()
+        return VacuumAnalysisTools.calculate_base_pressure_windows(
+            pressure_data, [window_minutes], sample_rate_hz)[window_minutes]
 
-        if not rolling_std.isna().all():
-            most_stable_idx = rolling_std.idxmin()
-            base_pressure = rolling_min.iloc[most_stable_idx]
-        else:
-            base_pressure = np.min(pressure_data)
+    @staticmethod
+    def calculate_base_pressure_windows(pressure_data, windows_minutes, sample_rate_hz=1):
+        """
+        Calculate base pressure for several window sizes at once
 
-        return base_pressure, rolling_min, rolling_std
+        Every window costs O(n), so a window slider can be served quickly.
+        Only windows holding a full window of valid samples are considered,
+        as with pandas rolling defaults.
+
+        Args:
+            pressure_data: Array of pressure values (NaNs are skipped)
+            windows_minutes: Window sizes in minutes
+            sample_rate_hz: Data sampling rate in Hz
+
+        Returns:
+            dict: window_minutes -> (base_pressure, rolling_min, rolling_std)
+        """
+        index = pressure_data.index if isinstance(pressure_data, pd.Series) else None
+        values = np.asarray(pressure_data, dtype=float)
+        samples = {minutes: max(1, int(minutes * 60 * sample_rate_hz)) for minutes in windows_minutes}
+        by_window = {window: base_pressure_by_window(values, [window], min_periods=window)[window]
+                     for window in set(samples.values())}
+
+        results = {}
+        for minutes, window in samples.items():
+            base_pressure, _, stats = by_window[window]
+            results[minutes] = (base_pressure,
+                                pd.Series(stats['min'], index=index),
+                                pd.Series(stats['std'], index=index))
+        return results
 
     @staticmethod
     def calculate_noise_metrics(pressure_data, sample_rate_hz=1):
@@ -349,50 +339,36 @@ class VacuumAnalysisTools:
             rolling_std = pressure_clean.rolling(window=window_size, center=True).std()
             
             # Fill NaN values at edges
-            rolling_mean = rolling_mean.fillna(method='bfill').fillna(method='ffill')
-            rolling_std = rolling_std.fillna(method='bfill').fillna(method='ffill')
+            rolling_mean = rolling_mean.bfill().ffill()
+            rolling_std = rolling_std.bfill().ffill()
 
             threshold = rolling_mean + threshold_factor * rolling_std
-            spike_mask = pressure_clean > threshold
-
-            spikes = []
-            spike_start = None
-
-            for i, is_spike in enumerate(spike_mask):
-                if is_spike and spike_start is None:
-                    spike_start = i
-                elif not is_spike and spike_start is not None:
-                    duration = i - spike_start
-                    if duration >= min_spike_duration:
-                        spike_data = pressure_clean.iloc[spike_start:i]
-                        max_pressure = spike_data.max()
-                        baseline = rolling_mean.iloc[spike_start]
-                        
-                        # Improved severity classification
-                        pressure_ratio = max_pressure / baseline if baseline > 0 else float('inf')
-                        if pressure_ratio > 100:
-                            severity = 'critical'
-                        elif pressure_ratio > 10:
-                            severity = 'high'
-                        elif pressure_ratio > 3:
-                            severity = 'medium'
-                        else:
-                            severity = 'low'
-
-                        spikes.append({
-                            'start': spike_start,
-                            'end': i,
-                            'duration': duration,
-                            'max_pressure': max_pressure,
-                            'baseline_pressure': baseline,
-                            'pressure_ratio': pressure_ratio,
-                            'severity': severity,
-                            'spike_magnitude': max_pressure - baseline,
-                            'time_indices': list(range(spike_start, i))
-                        })
-                    spike_start = None
+            spike_mask = (pressure_clean > threshold).to_numpy()
+
+            # Spike events as [start, end) runs of the mask
+            starts, ends = mask_runs(spike_mask, min_spike_duration)
+            if len(starts) == 0:
+                return []
 
-            return spikes
+            max_pressure = run_reduce(np.maximum, pressure_clean.to_numpy(dtype=float), starts, ends)
+            baseline = rolling_mean.to_numpy(dtype=float)[starts]
+
+            # Improved severity classification
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pressure_ratio = np.where(baseline > 0, max_pressure / baseline, np.inf)
+            severity = np.select([pressure_ratio > 100, pressure_ratio > 10, pressure_ratio > 3],
+                                 ['critical', 'high', 'medium'], 'low')
+
+            return [{
+                'start': int(starts[k]),
+                'end': int(ends[k]),
+                'duration': int(ends[k] - starts[k]),
+                'max_pressure': float(max_pressure[k]),
+                'baseline_pressure': float(baseline[k]),
+                'pressure_ratio': float(pressure_ratio[k]),
+                'severity': str(severity[k]),
+                'spike_magnitude': float(max_pressure[k] - baseline[k])
+            } for k in range(len(starts))]
             
         except Exception as e:
             logger.error(f"Error in spike detection: {e}")
@@ -845,9 +821,9 @@ class VacuumAnalysisTools:
             return []
 
     @staticmethod
-    def calculate_base_pressure(pressure_data, percentile=10):
+    def calculate_percentile_base_pressure(pressure_data, percentile=10):
         """
-        Calculate the base pressure from vacuum data
+        Calculate the base pressure from vacuum data as a low percentile
         
         Args:
             pressure_data: Array of pressure values
@@ -911,7 +887,7 @@ class VacuumAnalysisTools:
             
             # Detect different operational phases
             # 1. Base pressure regions (stable low pressure)
-            base_pressure = VacuumAnalysisTools.calculate_base_pressure(pressure_clean)
+            base_pressure = VacuumAnalysisTools.calculate_percentile_base_pressure(pressure_clean)
             results['base_pressure'] = base_pressure
             
             # 2. Pump-down cycles
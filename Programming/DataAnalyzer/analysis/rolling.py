@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Rolling window statistics in O(n) per window, tolerant of missing values
+"""
+
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _window_reduce(values: np.ndarray, window: int, ufunc: np.ufunc, identity: float) -> np.ndarray:
+    """
+    Reduce every trailing window [i - window + 1, i] with an associative ufunc
+
+    The series is cut into blocks of window samples, and each block is
+    accumulated forwards and backwards (van Herk / Gil-Werman). A window
+    then covers the tail of one block and the head of the next, so its
+    value is one ufunc of two precomputed entries: O(n) for any window
+    length. Sums only ever add samples inside the window, so they keep
+    full precision even next to much larger values.
+
+    Windows before the first full one cover rows [0, i].
+    """
+    n = len(values)
+    n_blocks = -(-n // window)
+    padded = np.full(n_blocks * window, identity, dtype=float)
+    padded[:n] = values
+    blocks = padded.reshape(n_blocks, window)
+    forward = ufunc.accumulate(blocks, axis=1).ravel()[:n]
+    backward = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:n]
+
+    result = forward.copy()
+    ufunc(backward[:n - window + 1], forward[window - 1:], out=result[window - 1:])
+    # A window starting on a block boundary is that whole block
+    aligned = np.arange(0, n - window + 1, window)
+    result[aligned + window - 1] = backward[aligned]
+    return result
+
+
+def rolling_window_stats(values: np.ndarray, windows: Iterable[int], min_periods: Optional[int] = None,
+                         center: bool = True) -> Dict[int, Dict[str, np.ndarray]]:
+    """
+    Rolling min, max, mean and sample std for several window lengths
+
+    NaN samples are skipped; a window yields NaN when it holds fewer than
+    min_periods valid samples. The NaN-filled copies of the series are
+    built once and shared by every window. Results match pandas
+    ``rolling(window, center=center, min_periods=min_periods)``.
+
+    Args:
+        values: Series values
+        windows: Window lengths in samples
+        min_periods: Valid samples required per window (defaults to half
+            the window, at least 2)
+        center: Label windows by their centre rather than their last sample
+
+    Returns:
+        Requested window -> {'min', 'max', 'mean', 'std', 'count'} arrays
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    valid = np.isfinite(values)
+    low = np.where(valid, values, np.inf)
+    high = np.where(valid, values, -np.inf)
+    # Squares about a reference value keep the variance well conditioned
+    reference = float(np.median(values[valid])) if valid.any() else 0.0
+    shifted = np.where(valid, values - reference, 0.0)
+    squares = shifted * shifted
+    ones = valid.astype(float)
+    sources = {
+        'min': (low, np.minimum, np.inf),
+        'max': (high, np.maximum, -np.inf),
+        'shifted': (shifted, np.add, 0.0),
+        'squares': (squares, np.add, 0.0),
+        'count': (ones, np.add, 0.0),
+    }
+
+    results = {}
+    for requested in windows:
+        # Windows longer than the series cover all of it
+        window = int(max(1, min(requested, n))) if n else 1
+        required = max(2, window // 2) if min_periods is None else max(1, int(min_periods))
+        if n == 0:
+            empty = np.empty(0, dtype=float)
+            results[requested] = {'min': empty, 'max': empty, 'mean': empty, 'std': empty, 'count': empty}
+            continue
+
+        stats = {}
+        for key, (source, ufunc, identity) in sources.items():
+            trailing = _window_reduce(source, window, ufunc, identity)
+            if center:
+                # The window centred on i is the trailing one ending at i + offset;
+                # the last offset windows run past the end and hold the series' tail
+                offset = (window - 1) // 2
+                tail = source[max(0, n - window):]
+                suffix = ufunc.accumulate(tail[::-1])[::-1]
+                first = np.arange(n - offset, n) - (window - 1 - offset) - max(0, n - window)
+                trailing = np.concatenate((trailing[offset:], suffix[np.maximum(first, 0)]))
+            stats[key] = trailing
+
+        count = stats['count']
+        enough = count >= required
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centred = stats['shifted'] / count
+            mean = reference + centred
+            variance = (stats['squares'] - count * centred * centred) / (count - 1)
+        std = np.sqrt(np.maximum(variance, 0.0))
+
+        results[requested] = {
+            'min': np.where(enough, stats['min'], np.nan),
+            'max': np.where(enough, stats['max'], np.nan),
+            'mean': np.where(enough, mean, np.nan),
+            'std': np.where(enough & (count > 1), std, np.nan),
+            'count': count
+        }
+    return results
+
+
+def base_pressure_by_window(pressure_data: np.ndarray, windows: Iterable[int],
+                            min_periods: Optional[int] = None) -> Dict[int, Tuple[float, int, Dict[str, np.ndarray]]]:
+    """
+    Base pressure for several window lengths
+
+    For each window the base pressure is the rolling minimum at the centre
+    of the most stable window (lowest rolling std), as in
+    VacuumAnalyzer.calculate_base_pressure. Positions are located with
+    nanargmin, so the result does not depend on the data's index labels.
+
+    Returns:
+        Window -> (base pressure or NaN, position of the most stable
+        window or -1, rolling_window_stats() entry)
+    """
+    results = {}
+    for window, stats in rolling_window_stats(pressure_data, windows, min_periods).items():
+        std = stats['std']
+        if np.isfinite(std).any():
+            position = int(np.nanargmin(std))
+            results[window] = (float(stats['min'][position]), position, stats)
+        else:
+            finite = np.asarray(pressure_data, dtype=float)
+            finite = finite[np.isfinite(finite)]
+            results[window] = (float(finite.min()) if len(finite) else np.nan, -1, stats)
+    return results
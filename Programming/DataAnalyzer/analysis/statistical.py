@@ -9,8 +9,13 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from utils.descriptive import describe
+
 logger = logging.getLogger(__name__)
 
+BASIC_STATS_KEYS = ('count', 'mean', 'median', 'std', 'min', 'max', 'q1', 'q3', 'iqr',
+                    'skewness', 'kurtosis')
+
 
 class StatisticalAnalyzer:
     """Fixed Statistical analysis methods (no self in static methods)"""
@@ -18,36 +23,8 @@ class StatisticalAnalyzer:
     @staticmethod
     def calculate_basic_stats(data: np.ndarray) -> Dict[str, float]:
         """Calculate basic statistical measures"""
-        clean_data = data[~np.isnan(data)]
-
-        if len(clean_data) == 0:
-            return {
-                'count': 0,
-                'mean': np.nan,
-                'median': np.nan,
-                'std': np.nan,
-                'min': np.nan,
-                'max': np.nan,
-                'q1': np.nan,
-                'q3': np.nan,
-                'iqr': np.nan,
-                'skewness': np.nan,
-                'kurtosis': np.nan
-            }
-
-        return {
-            'count': len(clean_data),
-            'mean': float(np.mean(clean_data)),
-            'median': float(np.median(clean_data)),
-            'std': float(np.std(clean_data)),
-            'min': float(np.min(clean_data)),
-            'max': float(np.max(clean_data)),
-            'q1': float(np.percentile(clean_data, 25)),
-            'q3': float(np.percentile(clean_data, 75)),
-            'iqr': float(np.percentile(clean_data, 75) - np.percentile(clean_data, 25)),
-            'skewness': float(stats.skew(clean_data)),
-            'kurtosis': float(stats.kurtosis(clean_data))
-        }
+        summary = describe(data)
+        return {key: summary[key] for key in BASIC_STATS_KEYS}
 
     @staticmethod
     def test_normality(data: np.ndarray, alpha: float = 0.05) -> Dict[str, Any]:
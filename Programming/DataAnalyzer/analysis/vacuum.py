@@ -4,13 +4,58 @@ Vacuum-specific analysis tools - FIXED VERSION
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple
 import numpy as np
 import pandas as pd
 
+from analysis.rolling import base_pressure_by_window
+
 logger = logging.getLogger(__name__)
 
 
+def mask_runs(mask: np.ndarray, min_length: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs of True in a boolean mask
+
+    Args:
+        mask: Boolean array
+        min_length: Shorter runs are dropped
+
+    Returns:
+        (starts, ends) int arrays; each run covers positions [start, end)
+    """
+    padded = np.concatenate(([0], np.asarray(mask, dtype=np.int8), [0]))
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= max(1, min_length)
+    return starts[keep], ends[keep]
+
+
+def run_reduce(ufunc: np.ufunc, values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Reduce values over each [start, end) run with a ufunc (e.g. np.maximum)
+
+    One reduceat call over interleaved start/end bounds; the gaps between
+    runs are reduced too and discarded.
+    """
+    if len(starts) == 0:
+        return np.empty(0, dtype=float)
+    # A sentinel so an end equal to len(values) is a valid bound
+    values = np.append(np.asarray(values, dtype=float), np.nan)
+    bounds = np.column_stack((starts, ends)).ravel()
+    return ufunc.reduceat(values, bounds)[::2]
+
+
+def run_positions(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Every position covered by a set of [start, end) runs"""
+    lengths = ends - starts
+    if lengths.sum() == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(lengths.sum()) + offsets
+
+
 class VacuumAnalyzer:
     """Fixed Vacuum analysis tools (no self in static methods)"""
 
@@ -23,16 +68,9 @@ class VacuumAnalyzer:
             int(window_minutes * 60 * sample_rate_hz),
             len(pressure_data)
         ))
-        pressure_series = pd.Series(pressure_data)
-        rolling_min = pressure_series.rolling(window=window_samples, center=True).min()
-        rolling_std = pressure_series.rolling(window=window_samples, center=True).std()
-
-        if rolling_std.empty:
-            base_pressure = np.nanmin(pressure_data)
-        else:
-            most_stable_idx = rolling_std.idxmin()
-            base_pressure = rolling_min.iloc[most_stable_idx]
-
+        # Only full windows count, as with pandas rolling defaults
+        base_pressure, _, _ = base_pressure_by_window(pressure_data, [window_samples],
+                                                      min_periods=window_samples)[window_samples]
         return float(base_pressure) if not np.isnan(base_pressure) else 1e-6
 
     @staticmethod
@@ -58,12 +96,23 @@ class VacuumAnalyzer:
             return 0.0
 
     @staticmethod
-    def detect_pressure_spikes(pressure_data: np.ndarray,
-                              threshold_sigma: float = 3.0,
-                              min_duration: int = 1) -> List[int]:
-        """Detect pressure spikes - returns list of indices"""
-        spike_indices = []
+    def detect_spike_events(pressure_data: np.ndarray,
+                            threshold_sigma: float = 3.0,
+                            min_duration: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Detect pressure spikes as events
+
+        A point is part of a spike when it exceeds the centred rolling mean
+        by threshold_sigma rolling standard deviations.
+
+        Returns:
+            (starts, ends) int arrays, one entry per spike covering [start, end)
+        """
+        pressure_data = np.asarray(pressure_data, dtype=float)
         window = min(100, len(pressure_data) // 10)
+        if window < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
         pressure_series = pd.Series(pressure_data)
 
         rolling_mean = pressure_series.rolling(window=window, center=True).mean()
@@ -72,68 +121,46 @@ class VacuumAnalyzer:
         rolling_std = pressure_series.rolling(window=window, center=True).std()
         rolling_std = rolling_std.bfill().ffill()
 
-        threshold = rolling_mean + threshold_sigma * rolling_std
+        threshold = (rolling_mean + threshold_sigma * rolling_std).to_numpy()
         spike_mask = pressure_data > threshold
 
-        in_spike = False
-        spike_start = None
+        return mask_runs(spike_mask, min_duration)
 
-        for i, is_spike in enumerate(spike_mask):
-            if is_spike and not in_spike:
-                spike_start = i
-                in_spike = True
-            elif not is_spike and in_spike:
-                if i - spike_start >= min_duration:
-                    for idx in range(spike_start, i):
-                        spike_indices.append(idx)
-                in_spike = False
-                spike_start = None
-
-        if in_spike and spike_start is not None:
-            if len(pressure_data) - spike_start >= min_duration:
-                for idx in range(spike_start, len(pressure_data)):
-                    spike_indices.append(idx)
-
-        return spike_indices
+    @staticmethod
+    def detect_pressure_spikes(pressure_data: np.ndarray,
+                              threshold_sigma: float = 3.0,
+                              min_duration: int = 1) -> List[int]:
+        """Detect pressure spikes - returns list of indices"""
+        starts, ends = VacuumAnalyzer.detect_spike_events(pressure_data, threshold_sigma, min_duration)
+        return run_positions(starts, ends).tolist()
 
     def detect_spikes(self, pressure_data: np.ndarray, threshold_sigma: float = 3.0, time_data: np.ndarray = None) -> List[dict]:
-        """Instance method wrapper for spike detection"""
-        spike_indices = self.detect_pressure_spikes(pressure_data, threshold_sigma)
-        
-        # Convert indices to spike objects with properties
-        spikes = []
+        """Instance method wrapper for spike detection - one dict per spike event"""
+        pressure_data = np.asarray(pressure_data, dtype=float)
+        starts, ends = self.detect_spike_events(pressure_data, threshold_sigma)
+        if len(starts) == 0:
+            return []
+
         if time_data is None:
             time_data = np.arange(len(pressure_data), dtype=float)
-        
-        # Group consecutive indices into spike events
-        if spike_indices:
-            spike_groups = []
-            current_group = [spike_indices[0]]
-            
-            for i in range(1, len(spike_indices)):
-                if spike_indices[i] == spike_indices[i-1] + 1:
-                    current_group.append(spike_indices[i])
-                else:
-                    spike_groups.append(current_group)
-                    current_group = [spike_indices[i]]
-            spike_groups.append(current_group)
-            
-            # Create spike objects
-            for group in spike_groups:
-                start_idx = group[0]
-                end_idx = group[-1]
-                
-                spike_data = {
-                    'start_time': float(time_data[start_idx]),
-                    'end_time': float(time_data[end_idx]),
-                    'duration': float(time_data[end_idx] - time_data[start_idx]),
-                    'max_pressure': float(np.max(pressure_data[start_idx:end_idx+1])),
-                    'severity': 'High' if len(group) > 10 else 'Medium' if len(group) > 5 else 'Low',
-                    'indices': group
-                }
-                spikes.append(spike_data)
-        
-        return spikes
+        time_data = np.asarray(time_data)
+
+        # Per-event reductions instead of per-point lists
+        lengths = ends - starts
+        start_times = time_data[starts].astype(float)
+        end_times = time_data[ends - 1].astype(float)
+        max_pressures = run_reduce(np.maximum, pressure_data, starts, ends)
+        severities = np.select([lengths > 10, lengths > 5], ['High', 'Medium'], 'Low')
+
+        return [{
+            'start_time': float(start_times[k]),
+            'end_time': float(end_times[k]),
+            'duration': float(end_times[k] - start_times[k]),
+            'max_pressure': float(max_pressures[k]),
+            'severity': str(severities[k]),
+            'start': int(starts[k]),
+            'end': int(ends[k])
+        } for k in range(len(starts))]
 
     def detect_leaks(self, pressure_data: np.ndarray, time_data: np.ndarray = None, volume_liters: float = 1.0) -> float:
         """Instance method wrapper for leak detection"""
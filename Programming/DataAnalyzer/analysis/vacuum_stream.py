@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Streaming vacuum metrics for live-growing logs
+"""
+
+import math
+import logging
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.helpers import to_seconds
+
+logger = logging.getLogger(__name__)
+
+# Pump-down phase states
+PUMPDOWN = 'pumpdown'
+STABLE = 'stable'
+RISING = 'rising'
+
+# (count, mean, sum of squared deviations) of no samples
+_EMPTY = (0, 0.0, 0.0)
+
+
+def _merge(a: Tuple[int, float, float], b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+    """Combine the (count, mean, M2) of two sample sets (Chan et al.)"""
+    na, mean_a, m2_a = a
+    nb, mean_b, m2_b = b
+    if not na:
+        return b
+    if not nb:
+        return a
+    n = na + nb
+    delta = mean_b - mean_a
+    return n, mean_a + delta * nb / n, m2_a + m2_b + delta * delta * na * nb / n
+
+
+class StreamingVacuumMetrics:
+    """
+    Online counterpart of VacuumAnalyzer, updated one sample at a time
+
+    Every sample costs O(1) (amortised for the rolling minimum):
+
+    * rolling mean/std over a fixed sample window, kept as a two-stack
+      queue of (count, mean, M2) aggregates merged with Chan's formula;
+      samples leaving the window are never subtracted, so the std stays
+      exact when the window slides from atmosphere down to base pressure
+    * rolling minimum from a monotonic deque
+    * base pressure - the rolling minimum of the most stable (lowest std)
+      full window seen so far, as in calculate_base_pressure
+    * spikes - samples above mean + threshold_sigma * std of the trailing
+      window, grouped into start/end events
+    * leak rate - running least-squares sums of log pressure against time,
+      as in calculate_leak_rate
+    * pump-down phase from an exponentially weighted slope of log pressure
+
+    Unlike the batch analysis the windows trail the newest sample rather
+    than being centred, since future samples are not known yet.
+    """
+
+    def __init__(self, window: int = 600, threshold_sigma: float = 3.0,
+                 min_spike_duration: int = 1, volume_liters: float = 1.0,
+                 phase_smoothing: float = 0.05, phase_tolerance: float = 1e-4):
+        """
+        Initialize streaming metrics
+
+        Args:
+            window: Samples in the rolling window (600 = 10 minutes at 1 Hz)
+            threshold_sigma: Standard deviations above the rolling mean for a spike
+            min_spike_duration: Minimum samples for a spike event
+            volume_liters: Chamber volume for the leak rate
+            phase_smoothing: EWMA weight of the newest log-pressure slope
+            phase_tolerance: |slope| (log pressure per time unit) counted as stable
+        """
+        self.window = max(2, int(window))
+        self.threshold_sigma = threshold_sigma
+        self.min_spike_duration = max(1, int(min_spike_duration))
+        self.volume_liters = volume_liters
+        self.phase_smoothing = phase_smoothing
+        self.phase_tolerance = phase_tolerance
+        self.reset()
+
+    def reset(self):
+        """Forget every sample"""
+        self.samples = 0
+        self.skipped = 0
+        self.current_pressure: Optional[float] = None
+
+        # Rolling window as a queue of two stacks. Front entries aggregate
+        # one sample and every newer front sample, the oldest on top; the
+        # back stack keeps its values and one aggregate of all of them.
+        self._front: List[Tuple[int, float, float]] = []
+        self._back: List[float] = []
+        self._back_agg = _EMPTY
+        self._min_deque = deque()  # (sample, value), values increasing
+
+        self.overall_min = math.inf
+        self.base_pressure: Optional[float] = None
+        self._best_std = math.inf
+
+        # Spike events: dicts with start/end sample numbers (end exclusive)
+        self.spikes: List[Dict[str, Any]] = []
+        self._spike: Optional[Dict[str, Any]] = None
+
+        # Least-squares sums of log pressure against time, plus pressure sum
+        self._t0: Optional[float] = None
+        self._n = 0
+        self._st = 0.0
+        self._sy = 0.0
+        self._stt = 0.0
+        self._sty = 0.0
+        self._sp = 0.0
+
+        self._last_log: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._slope: Optional[float] = None
+        self.phase = STABLE
+        self.phase_changes: List[Dict[str, Any]] = []
+
+    # ---- Rolling window ----
+    @property
+    def window_count(self) -> int:
+        """Samples currently in the rolling window"""
+        return len(self._front) + len(self._back)
+
+    def _window_agg(self) -> Tuple[int, float, float]:
+        front = self._front[-1] if self._front else _EMPTY
+        return _merge(front, self._back_agg)
+
+    @property
+    def rolling_mean(self) -> Optional[float]:
+        n, mean, _ = self._window_agg()
+        return mean if n else None
+
+    @property
+    def rolling_std(self) -> Optional[float]:
+        """Sample standard deviation of the window (None below two samples)"""
+        n, _, m2 = self._window_agg()
+        if n < 2:
+            return None
+        return math.sqrt(max(m2, 0.0) / (n - 1))
+
+    @property
+    def rolling_min(self) -> Optional[float]:
+        return self._min_deque[0][1] if self._min_deque else None
+
+    def _push(self, value: float):
+        self._back.append(value)
+        self._back_agg = _merge(self._back_agg, (1, value, 0.0))
+
+        if self.window_count > self.window:
+            if not self._front:
+                # Move the back stack over, newest first, so every front
+                # entry aggregates only samples that are still in the window
+                agg = _EMPTY
+                while self._back:
+                    old = self._back.pop()
+                    agg = _merge((1, old, 0.0), agg)
+                    self._front.append(agg)
+                self._back_agg = _EMPTY
+            self._front.pop()
+
+        while self._min_deque and self._min_deque[-1][1] >= value:
+            self._min_deque.pop()
+        self._min_deque.append((self.samples, value))
+        if self._min_deque[0][0] <= self.samples - self.window:
+            self._min_deque.popleft()
+
+    # ---- Updates ----
+    def update(self, pressure: float, time_value: Optional[float] = None):
+        """
+        Add one sample
+
+        Args:
+            pressure: Pressure reading; NaN readings are counted and skipped
+            time_value: Sample time in seconds (defaults to the sample number)
+        """
+        try:
+            pressure = float(pressure)
+        except (TypeError, ValueError):
+            pressure = math.nan
+        if math.isnan(pressure):
+            self.skipped += 1
+            return
+
+        sample = self.samples
+        t = float(sample if time_value is None else time_value)
+        if math.isnan(t):
+            t = float(sample)
+
+        self._update_spike(sample, pressure)
+        self._push(pressure)
+        self.samples += 1
+        self.current_pressure = pressure
+        self.overall_min = min(self.overall_min, pressure)
+
+        # Base pressure: minimum of the steadiest full window so far
+        if self.window_count >= self.window:
+            std = self.rolling_std
+            if std is not None and std < self._best_std:
+                self._best_std = std
+                self.base_pressure = self.rolling_min
+
+        self._update_regression(t, pressure)
+        self._update_phase(sample, t, pressure)
+
+    def _update_spike(self, sample: int, pressure: float):
+        """Classify a sample against the window before it is added"""
+        mean, std = self.rolling_mean, self.rolling_std
+        is_spike = std is not None and self.window_count >= min(self.window, 10) and \
+            pressure > mean + self.threshold_sigma * std
+
+        if is_spike:
+            if self._spike is None:
+                self._spike = {'start': sample, 'end': sample + 1, 'max_pressure': pressure,
+                               'baseline_pressure': mean}
+            else:
+                self._spike['end'] = sample + 1
+                self._spike['max_pressure'] = max(self._spike['max_pressure'], pressure)
+        elif self._spike is not None:
+            self._close_spike()
+
+    def _close_spike(self):
+        spike, self._spike = self._spike, None
+        spike['duration'] = spike['end'] - spike['start']
+        if spike['duration'] >= self.min_spike_duration:
+            self.spikes.append(spike)
+
+    def _update_regression(self, t: float, pressure: float):
+        if self._t0 is None:
+            self._t0 = t
+        dt = t - self._t0
+        y = math.log(max(pressure, 1e-10))
+        self._n += 1
+        self._st += dt
+        self._sy += y
+        self._stt += dt * dt
+        self._sty += dt * y
+        self._sp += pressure
+
+    def _update_phase(self, sample: int, t: float, pressure: float):
+        log_p = math.log(max(pressure, 1e-10))
+        if self._last_log is not None and t > self._last_time:
+            slope = (log_p - self._last_log) / (t - self._last_time)
+            if self._slope is None:
+                self._slope = slope
+            else:
+                self._slope += self.phase_smoothing * (slope - self._slope)
+
+            if self._slope < -self.phase_tolerance:
+                phase = PUMPDOWN
+            elif self._slope > self.phase_tolerance:
+                phase = RISING
+            else:
+                phase = STABLE
+            if phase != self.phase:
+                self.phase = phase
+                self.phase_changes.append({'sample': sample, 'time': t, 'phase': phase})
+
+        self._last_log = log_p
+        self._last_time = t
+
+    def feed(self, pressures, times=None):
+        """Add a batch of samples in order"""
+        pressures = np.asarray(pressures, dtype=float)
+        if times is None:
+            for pressure in pressures:
+                self.update(pressure)
+        else:
+            for pressure, t in zip(pressures, np.asarray(times, dtype=float)):
+                self.update(pressure, t)
+
+    def feed_frame(self, df: pd.DataFrame, pressure_column: str, time_column: Optional[str] = None):
+        """
+        Add the rows of a DataFrame (e.g. rows read by a tail reader)
+
+        Datetime time columns are converted to seconds.
+        """
+        if df is None or df.empty or pressure_column not in df.columns:
+            return
+        pressures = pd.to_numeric(df[pressure_column], errors='coerce').to_numpy(dtype=float)
+        times = None
+        if time_column and time_column in df.columns:
+            times = to_seconds(df[time_column])
+        self.feed(pressures, times)
+
+    # ---- Results ----
+    @property
+    def spike_count(self) -> int:
+        """Finished spike events plus the one in progress (if long enough)"""
+        open_spike = self._spike is not None and \
+            self._spike['end'] - self._spike['start'] >= self.min_spike_duration
+        return len(self.spikes) + int(open_spike)
+
+    @property
+    def in_spike(self) -> bool:
+        return self._spike is not None
+
+    @property
+    def leak_rate(self) -> float:
+        """Leak rate from the running log-pressure regression"""
+        n = self._n
+        if n < 2:
+            return 0.0
+        denominator = n * self._stt - self._st * self._st
+        if denominator <= 0:
+            return 0.0
+        slope = (n * self._sty - self._st * self._sy) / denominator
+        return abs(float(self.volume_liters * slope * (self._sp / n)))
+
+    def current_base_pressure(self) -> Optional[float]:
+        """Base pressure, falling back to the lowest reading before a window fills"""
+        if self.base_pressure is not None:
+            return self.base_pressure
+        return None if math.isinf(self.overall_min) else self.overall_min
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values of every metric"""
+        return {
+            'samples': self.samples,
+            'skipped': self.skipped,
+            'current_pressure': self.current_pressure,
+            'rolling_mean': self.rolling_mean,
+            'rolling_std': self.rolling_std,
+            'rolling_min': self.rolling_min,
+            'base_pressure': self.current_base_pressure(),
+            'spike_count': self.spike_count,
+            'in_spike': self.in_spike,
+            'leak_rate': self.leak_rate,
+            'phase': self.phase
+        }
+
+
+class LiveVacuumMonitor:
+    """
+    Keeps StreamingVacuumMetrics current from a file that is still growing
+
+    Each poll() reads only the rows appended since the previous one (via a
+    CsvTailReader from FileManager.open_tail) and feeds them to the metrics.
+    Alternatively attach() it to a followed FileData and it is fed every
+    time rows are appended there.
+    """
+
+    def __init__(self, reader, pressure_column: str, time_column: Optional[str] = None,
+                 metrics: Optional[StreamingVacuumMetrics] = None):
+        """
+        Initialize live monitor
+
+        Args:
+            reader: Tail reader with a read_new() method returning new rows,
+                or None when fed through attach()
+            pressure_column: Column holding pressure readings
+            time_column: Optional time column
+            metrics: Metrics to update (a default instance is created if omitted)
+        """
+        self.reader = reader
+        self.pressure_column = pressure_column
+        self.time_column = time_column
+        self.metrics = metrics or StreamingVacuumMetrics()
+
+    def poll(self) -> int:
+        """
+        Feed any new rows to the metrics
+
+        Returns:
+            Number of rows read
+        """
+        if self.reader is None:
+            return 0
+        try:
+            rows = self.reader.read_new()
+        except Exception as e:
+            logger.error(f"Failed to read new rows: {e}")
+            return 0
+        if rows is None or rows.empty:
+            return 0
+        self.metrics.feed_frame(rows, self.pressure_column, self.time_column)
+        return len(rows)
+
+    def attach(self, file_data):
+        """Feed the metrics from rows appended to a followed FileData"""
+        file_data.subscribe(self._on_rows_appended)
+
+    def detach(self, file_data):
+        """Stop receiving rows from a FileData"""
+        file_data.unsubscribe(self._on_rows_appended)
+
+    def _on_rows_appended(self, file_data, rows: pd.DataFrame):
+        self.metrics.feed_frame(rows, self.pressure_column, self.time_column)
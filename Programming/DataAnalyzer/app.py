@@ -60,7 +60,13 @@ from ui.annotation_dialog import show_annotation_dialog
 
 # Import core managers
 from core.file_manager import FileManager
+from core.file_loader import BackgroundFileLoader
+from core.data_cache import DataCache
 from core.plot_manager import PlotManager
+from core.decimation import decimate_for_axes, should_decimate, bucket_count, take, ViewportDecimator
+from core.pyramid import PyramidBuilder, overview_positions
+from core.quality_profiler import QualityProfiler
+from core.plot_model import RetainedPlotModel, NEW, UNCHANGED, STYLE
 from core.annotation_manager import AnnotationManager
 from core.project_manager import ProjectManager
 from core.export_manager import ExportManager
@@ -68,6 +74,7 @@ from core.export_manager import ExportManager
 # Import analysis tools
 from analysis.statistical import StatisticalAnalyzer
 from analysis.vacuum import VacuumAnalyzer
+from analysis.vacuum_stream import LiveVacuumMonitor
 from analysis.data_quality import DataQualityAnalyzer
 from analysis.legacy_analysis_tools import DataAnalysisTools, VacuumAnalysisTools
 
@@ -125,14 +132,25 @@ class ExcelDataPlotter(ctk.CTk):
         self.color_index = 0  # For auto-assigning colors
         self.auto_colors = ColorPalette.CHART_COLORS
         self.file_id_mapping = {}  # Mapping from display text to file ID
+        self.live_monitors = {}  # File ID -> [(series name, LiveVacuumMonitor)] while following
+        self.follow_callbacks = {}  # File ID -> this window's new-rows callback while following
 
         # Initialize managers
-        self.file_manager = FileManager()
+        self.data_cache = DataCache()
+        self.file_manager = FileManager(data_cache=self.data_cache)
+        self.file_loader = BackgroundFileLoader(self.file_manager)
+        self.pyramid_builder = PyramidBuilder()
+        self.quality_profiler = QualityProfiler()
         self.plot_manager = PlotManager()
         self.theme_manager = theme_manager  # Use the global singleton
         self.enhanced_plot_manager = None  # Will be initialized when figure is created
         self.annotation_manager = AnnotationManager()
         self.project_manager = ProjectManager()
+        # The working project shares the app's file and series dictionaries
+        self.project = self.project_manager.create_new_project()
+        self.project.files = self.loaded_files
+        self.project.series = self.all_series
+        self.annotation_manager.on_change = self.project_manager.mark_modified
         self.export_manager = ExportManager()
         self.statistical_analyzer = StatisticalAnalyzer()
         self.vacuum_analyzer = VacuumAnalyzer()
@@ -150,6 +168,8 @@ class ExcelDataPlotter(ctk.CTk):
         self.canvas = None  # Matplotlib canvas
         self.toolbar = None  # Matplotlib toolbar
         self.plot_axes = None  # Current plot axes for annotations
+        self.viewport_decimator = None  # Re-decimates long lines on zoom/pan
+        self.plot_model = RetainedPlotModel()  # Artists per series, for in-place updates
         self.plot_config = PlotConfiguration()  # Current plot configuration
         self._creating_plot = False  # Mutex flag to prevent multiple simultaneous plot creation
 
@@ -168,8 +188,18 @@ class ExcelDataPlotter(ctk.CTk):
         # Initialize preview in welcome mode
         self.update_preview("welcome")
 
+        # Periodic autosave of the working project
+        self._autosave_job = self.after(AppConfig.AUTOSAVE_INTERVAL * 1000, self._autosave_tick)
+
         logger.info("Application initialized successfully")
 
+    def _autosave_tick(self):
+        """Journal changes to the working project and schedule the next tick"""
+        if self.project_manager.project_modified:
+            self.project.annotations = {a.annotation_id: a for a in self.annotation_manager.get_annotations()}
+            self.project_manager.autosave_project(self.project)
+        self._autosave_job = self.after(AppConfig.AUTOSAVE_INTERVAL * 1000, self._autosave_tick)
+
     def init_variables(self):
         """Initialize tkinter variables for UI controls"""
         # Plot configuration variables
@@ -620,7 +650,7 @@ class ExcelDataPlotter(ctk.CTk):
     def refresh_plot(self):
         """Refresh the current plot"""
         if hasattr(self, 'figure') and self.figure and self.all_series:
-            self.create_plot()
+            self.create_plot(force_rebuild=True)
             self.status_bar.set_status("Plot refreshed", "success")
         else:
             self.status_bar.set_status("No plot to refresh", "warning")
@@ -866,7 +896,7 @@ class ExcelDataPlotter(ctk.CTk):
         self.bind(KeyBindings.SAVE_PROJECT, lambda e: self.save_project())
         self.bind(KeyBindings.ADD_FILE, lambda e: self.add_files())
         self.bind(KeyBindings.ADD_SERIES, lambda e: self.add_series())
-        self.bind(KeyBindings.REFRESH_PLOT, lambda e: self.create_plot())
+        self.bind(KeyBindings.REFRESH_PLOT, lambda e: self.create_plot(force_rebuild=True))
         self.bind(KeyBindings.EXPORT_PLOT, lambda e: self.export_plot())
         self.bind(KeyBindings.TOGGLE_GRID, lambda e: self.toggle_grid())
         self.bind(KeyBindings.TOGGLE_LEGEND, lambda e: self.toggle_legend())
@@ -889,70 +919,89 @@ class ExcelDataPlotter(ctk.CTk):
 
         if filenames:
             self.status_bar.set_status(f"Loading {len(filenames)} file(s)...", "info")
-            self.status_bar.show_progress()
-            success_count = 0
-            error_files = []
-
-            for i, filename in enumerate(filenames):
-                # Update progress
-                progress = i / len(filenames)
-                self.status_bar.show_progress(progress)
-                self.status_bar.set_status(f"Loading file {i+1}/{len(filenames)}: {os.path.basename(filename)}", "info")
-                
-                # Force UI update
-                self.update_idletasks()
-                try:
-                    # Load file using FileManager for proper handling
-                    file_data = self.file_manager.load_file(filename)
+            job = self.file_loader.load_files(
+                list(filenames),
+                self,
+                on_loaded=self._on_file_loaded,
+                on_complete=self._on_files_load_complete,
+                on_progress=self._on_files_load_progress
+            )
+            self.status_bar.show_progress(cancel_command=job.cancel)
 
-                    if file_data:
-                        # Ensure series_list exists (for backward compatibility)
-                        if not hasattr(file_data, 'series_list'):
-                            file_data.series_list = []
-                        # Store with proper ID
-                        self.loaded_files[file_data.id] = file_data
-                        self.add_file_card(file_data)
-                        success_count += 1
-                    else:
-                        # If FileManager couldn't load it, try direct approach
-                        # Load the data
-                        if filename.endswith('.csv'):
-                            df = pd.read_csv(filename)
-                        else:
-                            df = pd.read_excel(filename)
-
-                        # Create FileData object with CORRECT parameter order
-                        file_data = FileData(
-                            filepath=filename,  # filepath first
-                            data=df,           # data second
-                            filename=os.path.basename(filename)  # optional filename
-                        )
-
-                        # Ensure series_list exists (for backward compatibility)
-                        if not hasattr(file_data, 'series_list'):
-                            file_data.series_list = []
-                        self.loaded_files[file_data.id] = file_data
-                        self.add_file_card(file_data)
-                        success_count += 1
+    def _on_file_loaded(self, file_data):
+        """Register a file finished by the background loader"""
+        # Ensure series_list exists (for backward compatibility)
+        if not hasattr(file_data, 'series_list'):
+            file_data.series_list = []
+        # Store with proper ID
+        self.loaded_files[file_data.id] = file_data
+        self.project_manager.track_file(file_data)
+        self.project_manager.mark_modified(file_data.id)
+        self.add_file_card(file_data)
+        self.update_series_file_combo()
+        self.update_counts()
 
-                except Exception as e:
-                    error_files.append((filename, str(e)))
-                    logger.error(f"Failed to load {filename}: {e}")
+        # Overview pyramids for long columns, shared by every series
+        self.pyramid_builder.schedule(file_data)
+
+        # Quality profile for the file card and the quality report
+        self.quality_profiler.schedule(file_data, self, on_ready=self._on_quality_profiled)
+
+    def _on_quality_profiled(self, file_data, report):
+        """Show a file's background quality profile on its card"""
+        card = self.file_cards.get(file_data.id)
+        label = getattr(card, 'quality_label', None)
+        if label is not None and label.winfo_exists():
+            label.configure(text=self._quality_summary(report))
+
+    @staticmethod
+    def _quality_summary(report) -> str:
+        """One-line quality summary for a file card"""
+        if report is None:
+            return "Quality: profiling..."
+        text = f"Quality: {report.quality_score:.0f}/100"
+        if report.gaps:
+            text += f", {len(report.gaps)} gap(s)"
+        if report.issues:
+            text += f" - {report.issues[0]}"
+        return text
+
+    def _on_files_load_progress(self, job):
+        """Reflect background loading progress in the status bar"""
+        self.status_bar.show_progress(job.progress)
+        self.status_bar.set_status(
+            f"Loading files... {job.finished}/{job.total} done", "info"
+        )
 
-            # Update UI
-            self.update_series_file_combo()
-            self.status_bar.hide_progress()
-            self.update_counts()
+    def _on_files_load_complete(self, job):
+        """Summarise a finished background load"""
+        success_count = len(job.loaded)
+        error_files = job.errors
 
-            # Show results
-            if success_count > 0:
-                self.status_bar.set_status(f"Successfully loaded {success_count} file(s)", "success")
-                if error_files:
-                    self.show_error_details(error_files)
-            else:
-                self.status_bar.set_status("Failed to load any files", "error")
-                if error_files:
-                    self.show_error_details(error_files)
+        # Update UI
+        self.update_series_file_combo()
+        self.status_bar.hide_progress()
+        self.update_counts()
+
+        # Show results
+        if job.cancel_event.is_set():
+            self.status_bar.set_status(f"Loading cancelled ({success_count} file(s) loaded)", "warning")
+            if error_files:
+                self.show_error_details(error_files)
+        elif success_count > 0:
+            cache_stats = self.data_cache.get_stats()
+            logger.info(f"File cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                        f"{cache_stats['seconds_saved']:.1f}s saved")
+            message = f"Successfully loaded {success_count} file(s)"
+            if cache_stats['hits']:
+                message += f" (cache: {cache_stats['hits']} hits, {cache_stats['seconds_saved']:.1f}s saved)"
+            self.status_bar.set_status(message, "success")
+            if error_files:
+                self.show_error_details(error_files)
+        else:
+            self.status_bar.set_status("Failed to load any files", "error")
+            if error_files:
+                self.show_error_details(error_files)
 
     def add_file_card(self, file_data):
         """Add a file card to the files panel"""
@@ -966,6 +1015,9 @@ class ExcelDataPlotter(ctk.CTk):
         ctk.CTkLabel(info_frame, text=file_data.filename, font=("", 12, "bold")).pack(anchor="w")
         size_label = ctk.CTkLabel(info_frame, text=f"{len(file_data.df)} rows, {len(file_data.df.columns)} columns")
         size_label.pack(anchor="w")
+        card.quality_label = ctk.CTkLabel(info_frame, text=self._quality_summary(file_data.get_quality_report()),
+                                          font=("", 10), text_color=("gray40", "gray60"))
+        card.quality_label.pack(anchor="w")
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card)
@@ -973,12 +1025,176 @@ class ExcelDataPlotter(ctk.CTk):
 
         ctk.CTkButton(btn_frame, text="View", width=60,
                       command=lambda f=file_data: self.view_file_data(f)).pack(side="left", padx=2)
+        if Path(file_data.filepath).suffix.lower() in ('.csv', '.tsv', '.txt'):
+            follow_btn = ctk.CTkButton(btn_frame, text="Follow", width=60)
+            follow_btn.configure(command=lambda f=file_data, b=follow_btn, l=size_label: self.toggle_follow_file(f, b, l))
+            follow_btn.pack(side="left", padx=2)
         ctk.CTkButton(btn_frame, text="Remove", width=60, fg_color=ColorPalette.ERROR,
                       command=lambda f=file_data: self.remove_file(f)).pack(side="right", padx=2)
 
         # Store reference
         self.file_cards[file_data.id] = card
 
+    def toggle_follow_file(self, file_data, button=None, size_label=None):
+        """Start or stop appending rows written to a file after it was loaded"""
+        if file_data.is_following:
+            self._stop_following(file_data)
+            if button is not None:
+                button.configure(text="Follow")
+            self.status_bar.set_status(f"Stopped following {file_data.filename}", "info")
+            return
+
+        if not self.file_manager.start_following(file_data):
+            self.status_bar.set_status(f"Cannot follow {file_data.filename}", "error")
+            return
+
+        def on_rows(f, rows, label=size_label):
+            self._on_file_appended(f, rows)
+            if label is not None and label.winfo_exists():
+                label.configure(text=f"{f.row_count} rows, {f.column_count} columns")
+
+        # Monitors subscribe first so on_rows reports metrics including the new rows
+        self._attach_live_monitors(file_data)
+        file_data.subscribe(on_rows)
+        self.follow_callbacks[file_data.id] = on_rows
+        if button is not None:
+            button.configure(text="Stop")
+        self.status_bar.set_status(f"Following {file_data.filename} for new rows", "info")
+
+        if not getattr(self, '_follow_job', None):
+            self._follow_job = self.after(AppConfig.FOLLOW_POLL_INTERVAL, self._poll_followed_files)
+
+    def _stop_following(self, file_data):
+        """Stop following a file and drop this window's subscriptions to it"""
+        if not file_data.is_following:
+            return
+        file_data.stop_follow()
+        self._detach_live_monitors(file_data)
+        callback = self.follow_callbacks.pop(file_data.id, None)
+        if callback is not None:
+            file_data.unsubscribe(callback)
+        # Overview pyramids were left stale while rows were appended
+        self.pyramid_builder.schedule(file_data)
+
+    def _attach_live_monitors(self, file_data):
+        """Keep streaming vacuum metrics of each of the file's series current"""
+        monitors = []
+        for series in self.all_series.values():
+            if series.file_id != file_data.id or series.y_column not in file_data.numeric_columns:
+                continue
+            time_column = series.x_column if series.x_column in file_data.df.columns else None
+            monitor = LiveVacuumMonitor(None, series.y_column, time_column)
+            # Seed with the latest loaded rows (once), then only new rows
+            seed = file_data.df.tail(AppConfig.LIVE_METRICS_SEED_ROWS)
+            monitor.metrics.feed_frame(seed, series.y_column, time_column)
+            monitor.attach(file_data)
+            monitors.append((series.name, monitor))
+        self.live_monitors[file_data.id] = monitors
+
+    def _detach_live_monitors(self, file_data):
+        """Stop updating the streaming vacuum metrics of a file"""
+        for _, monitor in self.live_monitors.pop(file_data.id, []):
+            monitor.detach(file_data)
+
+    def _live_metrics_summary(self, file_data) -> str:
+        """Base pressure and spike count of a followed file's series"""
+        parts = []
+        for name, monitor in self.live_monitors.get(file_data.id, []):
+            metrics = monitor.metrics
+            base = metrics.current_base_pressure()
+            base_text = "n/a" if base is None else f"{base:.3e}"
+            parts.append(f"{name}: base {base_text}, {metrics.spike_count} spikes, {metrics.phase}")
+        return "; ".join(parts)
+
+    def _poll_followed_files(self):
+        """Append new rows of every followed file, then check again later"""
+        self._follow_job = None
+        following = [f for f in self.loaded_files.values() if f.is_following]
+        for file_data in following:
+            try:
+                file_data.poll_follow()
+            except Exception as e:
+                logger.error(f"Failed to read new rows of {file_data.filename}: {e}")
+
+        if following:
+            self._follow_job = self.after(AppConfig.FOLLOW_POLL_INTERVAL, self._poll_followed_files)
+
+    def _on_file_appended(self, file_data, rows):
+        """Extend plots of a followed file with its new rows"""
+        first_row = file_data.row_count - len(rows)
+        replot = False
+        extended = False
+        for series in self.all_series.values():
+            if series.file_id != file_data.id:
+                continue
+            if series.end_index and series.end_index >= first_row:
+                # Series that reached the old last row keep following the end
+                series.end_index = series.end_row = file_data.row_count
+            if series.id not in self.plot_model.entries:
+                replot = replot or series.visible
+            elif self._extend_plotted_series(series, file_data, rows, first_row):
+                extended = True
+            else:
+                replot = True
+
+        if replot and self.figure is not None:
+            # Series that cannot grow in place are re-plotted by the incremental update
+            self.create_plot()
+        elif extended and self.canvas is not None:
+            self.plot_axes.relim(visible_only=True)
+            self.plot_axes.autoscale_view()
+            self.canvas.draw_idle()
+
+        message = f"{file_data.filename}: +{len(rows)} rows ({file_data.row_count} total)"
+        live_metrics = self._live_metrics_summary(file_data)
+        if live_metrics:
+            message += f" | {live_metrics}"
+        self.status_bar.set_status(message, "info")
+
+    def _extend_plotted_series(self, series, file_data, rows, first_row):
+        """
+        Append a followed file's new rows to a series' drawn line
+
+        Returns:
+            False if the series has to be re-plotted instead (smoothing,
+            trend lines and fills depend on every point)
+        """
+        data_key = file_data.data_key()
+        end = min(file_data.row_count, series.end_index or file_data.row_count)
+        start = max(first_row, series.start_index or 0)
+        if end <= first_row:
+            # The new rows are outside the series' range
+            self.plot_model.mark_current(series, data_key)
+            return True
+        if not series.visible:
+            # Hidden series are re-plotted from scratch when shown again
+            self._remove_tracked_series(series.id)
+            return True
+        if series.plot_type != 'line' or series.smooth_factor > 0 or \
+                series.show_trendline or series.missing_data_method in ('forward_fill', 'interpolate') or \
+                (series.sheet_name and series.sheet_name != file_data.sheet_name):
+            return False
+
+        new_rows = rows.iloc[start - first_row:end - first_row]
+        if series.x_column == 'Index':
+            x_new = pd.Series(np.arange(start, end), index=new_rows.index)
+        else:
+            x_new = new_rows[series.x_column]
+        y_new = self.handle_missing_data(new_rows[series.y_column], series.missing_data_method)
+        valid = ~(x_new.isna() | y_new.isna())
+        x_new, y_new = x_new[valid], y_new[valid]
+
+        line = self.plot_model.entries[series.id].primary
+        if self.viewport_decimator is not None and self.viewport_decimator.is_tracked(line):
+            if not self.viewport_decimator.extend(line, x_new, y_new):
+                return False
+            self.plot_model.mark_current(series, data_key)
+            return True
+        # Lines growing past the decimation threshold are re-plotted once to be decimated
+        if should_decimate(series, len(line.get_xdata(orig=True)) + len(x_new)):
+            return False
+        return self.plot_model.extend(series, x_new.to_numpy(), y_new.to_numpy(dtype=float), data_key)
+
     def add_series(self):
         """Add a new data series"""
         selection = self.series_file_var.get()
@@ -1019,7 +1235,8 @@ class ExcelDataPlotter(ctk.CTk):
             x_column=x_col,
             y_column=y_col,
             start_index=start_idx,
-            end_index=end_idx
+            end_index=end_idx,
+            sheet_name=matching_file.sheet_name
         )
 
         # Set visualization properties
@@ -1035,6 +1252,7 @@ class ExcelDataPlotter(ctk.CTk):
         logger.info(f"Created series '{series_name}' with visible={series.visible}")
 
         self.all_series[series.id] = series
+        self.project_manager.mark_modified()
         
         # Ensure series_list exists (for backward compatibility)
         if not hasattr(matching_file, 'series_list'):
@@ -1134,7 +1352,10 @@ class ExcelDataPlotter(ctk.CTk):
                         self.remove_series(series_id)
 
                 # Remove file
+                self._stop_following(file_data)
+                self.project_manager.untrack_file(file_data)
                 del self.loaded_files[file_data.id]
+                self.project_manager.mark_modified()
                 self.file_cards[file_data.id].destroy()
                 del self.file_cards[file_data.id]
 
@@ -1151,7 +1372,10 @@ class ExcelDataPlotter(ctk.CTk):
                 fg_color=ColorPalette.ERROR
             ).pack(side="left", padx=10)
         else:
+            self._stop_following(file_data)
+            self.project_manager.untrack_file(file_data)
             del self.loaded_files[file_data.id]
+            self.project_manager.mark_modified()
             self.file_cards[file_data.id].destroy()
             del self.file_cards[file_data.id]
             self.update_counts()
@@ -1291,22 +1515,22 @@ class ExcelDataPlotter(ctk.CTk):
             # Get data slice (limit to reasonable size for preview performance)
             max_preview_points = 1000
             actual_range = end_idx - start_idx
-            if actual_range > max_preview_points:
+            positions = overview_positions(file_data, y_col, start_idx, end_idx, max_preview_points // 4)
+            if positions is not None:
+                # Min/max of each bucket from the column pyramid - spikes stay visible
+                data_slice = file_data.df.iloc[positions]
+            elif actual_range > max_preview_points:
                 # Sample data for better performance
                 step = actual_range // max_preview_points
-                sample_indices = range(start_idx, end_idx, step)
-                data_slice = file_data.df.iloc[sample_indices]
-                display_start = start_idx
+                positions = np.arange(start_idx, end_idx, step)
+                data_slice = file_data.df.iloc[positions]
             else:
+                positions = np.arange(start_idx, end_idx)
                 data_slice = file_data.df.iloc[start_idx:end_idx]
-                display_start = start_idx
             
             # Prepare x and y data
             if x_col == 'Index':
-                if actual_range > max_preview_points:
-                    x_data = [display_start + i * step for i in range(len(data_slice))]
-                else:
-                    x_data = range(display_start, display_start + len(data_slice))
+                x_data = positions[:len(data_slice)]
                 x_label = 'Index'
             else:
                 x_data = data_slice[x_col]
@@ -1498,14 +1722,16 @@ class ExcelDataPlotter(ctk.CTk):
             if not matching_file:
                 return
 
-            # If this is an Excel file with multiple sheets, reload the specific sheet
+            # If this is an Excel file with multiple sheets, switch to the specific sheet
+            # (parsed on first access and cached by the lazy sheet mapping)
             if hasattr(matching_file, 'sheets') and sheet_name in matching_file.sheets:
                 # Update the DataFrame to the selected sheet
-                matching_file.df = matching_file.sheets[sheet_name]
+                matching_file.data = matching_file.get_sheet_data(sheet_name)
                 matching_file.sheet_name = sheet_name
 
                 # Re-analyze the data
                 matching_file.analyze_data()
+                self.pyramid_builder.schedule(matching_file)
 
                 # Update column combos
                 columns = matching_file.df.columns.tolist()
@@ -1585,7 +1811,8 @@ class ExcelDataPlotter(ctk.CTk):
             x_column=x_col,
             y_column=y_col,
             start_index=start_idx,
-            end_index=end_idx
+            end_index=end_idx,
+            sheet_name=matching_file.sheet_name
         )
 
         # Assign unique color from palette
@@ -1595,6 +1822,7 @@ class ExcelDataPlotter(ctk.CTk):
         # Store series
         logger.info(f"Creating new series with ID: {series.id}")
         self.all_series[series.id] = series
+        self.project_manager.mark_modified()
         self.add_series_card(series)
         
         # Update counts and plot button
@@ -1852,6 +2080,7 @@ class ExcelDataPlotter(ctk.CTk):
             # Update the series object
             series.visible = is_visible
             self.all_series[series.id] = series
+            self.project_manager.mark_modified()
             
             # Log the change
             logger.info(f"Series '{series.name}' visibility changed to: {is_visible}")
@@ -2062,6 +2291,7 @@ class ExcelDataPlotter(ctk.CTk):
             
             # Store the new series
             self.all_series[new_series.id] = new_series
+            self.project_manager.mark_modified()
             self.add_series_card(new_series)
             self.update_counts()
             
@@ -2085,6 +2315,7 @@ class ExcelDataPlotter(ctk.CTk):
                         self.series_visibility_vars[series_id].set(True)
             
             if count > 0:
+                self.project_manager.mark_modified()
                 self.status_bar.set_status(f"Made {count} series visible", "success")
                 self.update_counts()  # Update the counts display
                 # Update plot if it exists
@@ -2111,6 +2342,7 @@ class ExcelDataPlotter(ctk.CTk):
                         self.series_visibility_vars[series_id].set(False)
             
             if count > 0:
+                self.project_manager.mark_modified()
                 self.status_bar.set_status(f"Hidden {count} series", "success")
                 self.update_counts()  # Update the counts display
                 # Clear plot since no series are visible
@@ -2214,6 +2446,7 @@ class ExcelDataPlotter(ctk.CTk):
                 
                 # Clear data structures
                 self.all_series.clear()
+                self.project_manager.mark_modified()
                 self.series_cards.clear()
                 if hasattr(self, 'series_color_frames'):
                     self.series_color_frames.clear()
@@ -2302,6 +2535,7 @@ class ExcelDataPlotter(ctk.CTk):
         for i, series in enumerate(self.all_series.values()):
             series.color = colors[i % len(colors)]
             self.all_series[series.id] = series
+            self.project_manager.mark_modified()
             self.update_series_card_color(series)
         
         # Refresh plot if exists
@@ -2347,6 +2581,7 @@ class ExcelDataPlotter(ctk.CTk):
         for i, series in enumerate(self.all_series.values(), 1):
             series.name = f"{base_name} {i}"
             self.all_series[series.id] = series
+            self.project_manager.mark_modified()
             
             # Update UI if widget exists
             if hasattr(self, 'series_widgets') and series.id in self.series_widgets:
@@ -2444,6 +2679,7 @@ class ExcelDataPlotter(ctk.CTk):
                 # Update series color
                 series.color = color[1]
                 self.all_series[series.id] = series
+                self.project_manager.mark_modified()
                 
                 # Update the color in the existing series card instead of recreating
                 self.update_series_card_color(series)
@@ -2552,6 +2788,7 @@ class ExcelDataPlotter(ctk.CTk):
             if dialog_result:
                 # Update the series in the dictionary
                 self.all_series[series.id] = dialog_result
+                self.project_manager.mark_modified()
                 
                 # Update the visual card
                 self.update_series_card(series.id, dialog_result)
@@ -2875,6 +3112,7 @@ class ExcelDataPlotter(ctk.CTk):
                 file_data.series_list.remove(series.id)
 
         del self.all_series[series.id]
+        self.project_manager.mark_modified()
         self.series_cards[series.id].destroy()
         del self.series_cards[series.id]
         
@@ -2919,8 +3157,14 @@ class ExcelDataPlotter(ctk.CTk):
             # Fall back to smaller default values
             return 6.0, 4.0
 
-    def create_plot(self):
-        """Create the plot with custom styling"""
+    def create_plot(self, force_rebuild=False):
+        """
+        Create the plot with custom styling
+
+        When a plot is already shown with the same theme and axis scales, it
+        is updated in place (see _update_plot_incrementally) instead of being
+        rebuilt. Pass force_rebuild=True to always build a new figure.
+        """
         # Prevent multiple simultaneous plot creation
         if hasattr(self, '_creating_plot') and self._creating_plot:
             logger.info("Plot creation already in progress, skipping...")
@@ -2933,6 +3177,9 @@ class ExcelDataPlotter(ctk.CTk):
         self._creating_plot = True
         
         try:
+            if not force_rebuild and self._update_plot_incrementally():
+                return
+
             # Enhanced debugging for series visibility
             logger.info(f"=== DETAILED SERIES DEBUG START ===")
             logger.info(f"Total series in self.all_series: {len(self.all_series)}")
@@ -3015,6 +3262,10 @@ class ExcelDataPlotter(ctk.CTk):
             
             # Store axes reference for annotations
             self.plot_axes = ax
+
+            # Decimated lines are re-sliced to the view on zoom/pan
+            self.viewport_decimator = ViewportDecimator(ax)
+            self.plot_model.reset(ax, self._plot_layout_key())
             
             # Log plotting details
             logger.info(f"Starting to plot {len(visible_series)} visible series")
@@ -3029,7 +3280,7 @@ class ExcelDataPlotter(ctk.CTk):
 
                 try:
                     logger.info(f"Plotting series {i+1}/{len(visible_series)}: '{series.name}' (color: {series.color})")
-                    self.plot_single_series(ax, series, file_data)
+                    self._plot_tracked_series(ax, series, file_data)
                 except Exception as e:
                     logger.error(f"Error plotting series {series.name}: {e}")
                     continue
@@ -3116,15 +3367,97 @@ class ExcelDataPlotter(ctk.CTk):
             # Update preview to show plot context
             self.update_preview("auto")
 
+    def _plot_layout_key(self):
+        """Figure-wide settings that need a full plot rebuild when they change"""
+        return (ctk.get_appearance_mode(), bool(self.log_scale_x_var.get()), bool(self.log_scale_y_var.get()))
+
+    def _plot_tracked_series(self, ax, series, file_data):
+        """Plot one series and record its artists in the retained plot model"""
+        artists = self.plot_model.capture(ax, lambda: self.plot_single_series(ax, series, file_data))
+        self.plot_model.record(series, artists, file_data.data_key())
+
+    def _remove_tracked_series(self, series_id):
+        """Remove a series' artists from the plot"""
+        removed = self.plot_model.remove(series_id)
+        if removed and self.viewport_decimator is not None:
+            self.viewport_decimator.unregister(removed)
+
+    def _update_plot_incrementally(self):
+        """
+        Bring the current plot in line with the series without rebuilding it
+
+        Each series is diffed against the settings it was drawn with: style
+        changes (visibility, colour, line style, legend label...) are applied
+        to its existing artists, and only series whose data settings or file
+        data changed are re-plotted. The canvas, toolbar and figure are kept.
+
+        Returns:
+            True if the plot was updated, False if a full rebuild is needed
+        """
+        ax = self.plot_axes
+        if self.canvas is None or self.figure is None or \
+                not self.plot_model.can_update(ax, self._plot_layout_key()):
+            return False
+
+        try:
+            rescale = False
+
+            for series_id in list(self.plot_model.entries):
+                if series_id not in self.all_series:
+                    self._remove_tracked_series(series_id)
+                    rescale = True
+
+            for series in self.all_series.values():
+                file_data = self.loaded_files.get(series.file_id)
+                data_key = file_data.data_key() if file_data else None
+                state = self.plot_model.classify(series, data_key)
+
+                if state == UNCHANGED or (state == NEW and not series.visible):
+                    continue
+                if state == STYLE:
+                    if 'visible' in self.plot_model.apply_style(series):
+                        rescale = True
+                    continue
+
+                self._remove_tracked_series(series.id)
+                if file_data and series.visible:
+                    self._plot_tracked_series(ax, series, file_data)
+                rescale = True
+
+            # Title, labels, grid and legend are cheap to redo and may have changed
+            legend = ax.get_legend()
+            if legend is not None:
+                legend.remove()
+            ax.grid(False, which='both')
+            self.configure_plot_axes(ax)
+
+            if rescale:
+                ax.relim(visible_only=True)
+                ax.autoscale_view()
+
+            self.canvas.draw_idle()
+            self.update_counts()
+
+            visible = sum(1 for s in self.all_series.values() if s.visible)
+            self.status_bar.set_status(f"Plot updated with {visible} series", "success")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Incremental plot update failed, rebuilding: {e}")
+            return False
+
     def plot_single_series(self, ax, series, file_data):
         """Plot a single data series with enhanced problematic data handling"""
+        # Series may point at a sheet other than the active one
+        source_df = file_data.get_sheet_data(getattr(series, 'sheet_name', None))
+
         start_idx = max(0, series.start_index)
-        end_idx = min(len(file_data.df), series.end_index or len(file_data.df))
+        end_idx = min(len(source_df), series.end_index or len(source_df))
 
         if start_idx >= end_idx:
             return
 
-        data_slice = file_data.df.iloc[start_idx:end_idx].copy()
+        data_slice = source_df.iloc[start_idx:end_idx].copy()
 
         # Get X data
         if series.x_column == 'Index':
@@ -3173,9 +3506,24 @@ class ExcelDataPlotter(ctk.CTk):
         if hasattr(series, 'show_in_legend') and series.show_in_legend:
             series_label = getattr(series, 'legend_label', series.name) or series.name
 
+        # Reduce long lines to what the axes can show (keeps spikes). Unsmoothed
+        # series on the active sheet take their overview from the column pyramid.
+        overview = None
+        if (y_plot_smooth is y_plot and len(y_data) == len(data_slice) and
+                source_df is file_data.data and should_decimate(series, len(y_plot))):
+            overview = overview_positions(file_data, series.y_column, start_idx, end_idx,
+                                          bucket_count(ax, series.decimation_factor))
+        if overview is not None:
+            keep = valid_mask.to_numpy()[overview - start_idx]
+            rows = overview[keep] - start_idx
+            x_draw = take(x_data, rows)
+            y_draw = y_data.iloc[rows]
+        else:
+            x_draw, y_draw = decimate_for_axes(x_plot, y_plot_smooth, ax, series)
+
         # Main plot
         if series.plot_type == 'line':
-            ax.plot(x_plot, y_plot_smooth,
+            line, = ax.plot(x_draw, y_draw,
                     color=series.color,
                     linestyle=series.line_style,
                     linewidth=series.line_width,
@@ -3184,6 +3532,10 @@ class ExcelDataPlotter(ctk.CTk):
                     alpha=series.alpha,
                     label=series_label,
                     zorder=getattr(series, 'z_order', 1))
+
+            # Restore detail for the visible range when zooming in
+            if len(y_draw) < len(y_plot_smooth) and self.viewport_decimator is not None:
+                self.viewport_decimator.register(line, x_plot, y_plot_smooth, series.decimation_factor)
         elif series.plot_type == 'scatter':
             ax.scatter(x_plot, y_plot_smooth,
                        color=series.color,
@@ -3301,7 +3653,7 @@ class ExcelDataPlotter(ctk.CTk):
 
         if self.show_legend_var.get():
             handles, labels = ax.get_legend_handles_labels()
-            filtered = [(h, l) for h, l in zip(handles, labels) if l]
+            filtered = [(h, l) for h, l in zip(handles, labels) if l and h.get_visible()]
             if filtered:
                 handles, labels = zip(*filtered)
                 legend = ax.legend(handles, labels, loc='best', frameon=True,
@@ -3682,8 +4034,11 @@ class ExcelDataPlotter(ctk.CTk):
             ).pack(side="left", padx=10)
 
             def confirm_clear():
+                for file_data in self.loaded_files.values():
+                    self.project_manager.untrack_file(file_data)
                 self.loaded_files.clear()
                 self.all_series.clear()
+                self.project_manager.mark_modified()
                 self.color_index = 0
 
                 # Clear UI elements
@@ -3931,12 +4286,24 @@ class ExcelDataPlotter(ctk.CTk):
             ctk.CTkButton(
                 btn_frame,
                 text="Quit",
-                command=self.destroy,
+                command=self.quit_application,
                 fg_color=ColorPalette.ERROR,
                 width=80
             ).pack(side="left", padx=10)
         else:
-            self.destroy()
+            self.quit_application()
+
+    def quit_application(self):
+        """Stop background workers and close the window"""
+        if self._autosave_job is not None:
+            self.after_cancel(self._autosave_job)
+            self._autosave_job = None
+        self.file_loader.shutdown()
+        self.pyramid_builder.shutdown()
+        self.quality_profiler.shutdown()
+        self.project_manager.shutdown()
+        self.project_manager.discard_autosave(self.project.project_id)
+        self.destroy()
 
     # Stubs for unimplemented methods
     def new_project(self):
@@ -3999,7 +4366,102 @@ class ExcelDataPlotter(ctk.CTk):
             messagebox.showerror("Error", f"Failed to open statistical analysis: {str(e)}")
 
     def show_data_quality_report(self):
-        self.status_bar.set_status("Data quality report generated", "info")
+        """
+        Show the quality profile of every loaded file
+
+        Current reports are shown straight away. Files whose data changed
+        since their last profile show that report marked as profiling (or
+        just a placeholder) and are profiled in the background; their
+        section is replaced once the new report is ready.
+        """
+        if not self.loaded_files:
+            self.status_bar.set_status("Load a file to see its data quality report", "warning")
+            return
+
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Data Quality Report")
+        dialog.geometry("760x560")
+        dialog.transient(self)
+
+        text_widget = ctk.CTkTextbox(dialog, font=("Consolas", 10))
+        text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        ctk.CTkButton(dialog, text="Close", command=dialog.destroy, width=100).pack(pady=(0, 10))
+
+        sections = {}
+
+        def render():
+            try:
+                text_widget.configure(state="normal")
+                text_widget.delete("1.0", "end")
+                text_widget.insert("1.0", "\n\n".join(sections.values()))
+                text_widget.configure(state="disabled")
+            except tk.TclError:
+                # Dialog closed while profiling
+                pass
+
+        def on_ready(file_data, report):
+            self._on_quality_profiled(file_data, report)
+            if file_data.id in sections:
+                sections[file_data.id] = self._format_quality_report(file_data, report)
+                render()
+
+        def on_error(file_data, error):
+            if file_data.id in sections:
+                sections[file_data.id] = f"{file_data.filename}\n  Profiling failed: {error}"
+                render()
+
+        pending = 0
+        for file_data in self.loaded_files.values():
+            if file_data.data is None:
+                continue
+            report = file_data.get_quality_report()
+            if report is not None:
+                sections[file_data.id] = self._format_quality_report(file_data, report)
+                continue
+
+            if file_data.quality_report is not None:
+                sections[file_data.id] = ("Profiling... (report below is for earlier data)\n" +
+                                          self._format_quality_report(file_data, file_data.quality_report))
+            else:
+                sections[file_data.id] = f"{file_data.filename}\n  Profiling..."
+            self.quality_profiler.schedule(file_data, self, on_ready=on_ready, on_error=on_error)
+            pending += 1
+
+        render()
+        if pending:
+            self.status_bar.set_status(f"Data quality report: profiling {pending} file(s) in the background", "info")
+        else:
+            self.status_bar.set_status("Data quality report generated", "info")
+
+    @staticmethod
+    def _format_quality_report(file_data, report) -> str:
+        """Text of one file's quality report"""
+        lines = [
+            f"{file_data.filename}",
+            "=" * 60,
+            f"Quality score: {report.quality_score:.1f}/100",
+            f"Cells: {report.total_points}  valid: {report.valid_points}  missing: {report.missing_points}",
+            f"Rows with zeros: {len(report.zeros)}  gaps: {len(report.gaps)} "
+            f"({report.statistics.get('timestamp_gaps', 0)} in timestamps)",
+            f"Noise level (relative to spread): {report.noise_level:.3f}",
+        ]
+        for issue in report.issues:
+            lines.append(f"  ! {issue}")
+        for recommendation in report.recommendations:
+            lines.append(f"  > {recommendation}")
+
+        columns = report.statistics.get('columns', {})
+        if columns:
+            lines.append("")
+            lines.append(f"{'Column':<24}{'Missing':>9}{'Zeros':>8}{'Zero runs':>11}"
+                         f"{'Outliers':>10}{'Gaps':>6}{'Noise':>8}")
+            for column, summary in columns.items():
+                noise = f"{summary['noise']:.3f}" if np.isfinite(summary['noise']) else "-"
+                lines.append(
+                    f"{str(column)[:23]:<24}{summary['missing']:>9}{summary['zeros']:>8}"
+                    f"{summary['zero_runs']:>11}{summary['outliers']:>10}{summary['missing_gaps']:>6}{noise:>8}"
+                )
+        return "\n".join(lines)
 
     def show_correlation_matrix(self):
         self.status_bar.set_status("Correlation matrix displayed", "info")
@@ -4092,7 +4554,8 @@ class ExcelDataPlotter(ctk.CTk):
             x_column=x_col,
             y_column=y_col,
             start_index=start_idx,
-            end_index=end_idx
+            end_index=end_idx,
+            sheet_name=matching_file.sheet_name
         )
 
         self.show_series_editing_mode()  # Switch to series editing preview mode
@@ -4111,6 +4574,7 @@ class ExcelDataPlotter(ctk.CTk):
             
             # Store the advanced configuration
             self.all_series[updated_series.id] = updated_series
+            self.project_manager.mark_modified()
             self.add_series_card(updated_series)
             
             self.status_bar.set_status("Series created with advanced settings", "success")
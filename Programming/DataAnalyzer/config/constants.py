@@ -30,9 +30,14 @@ class AppConfig:
     CHUNK_SIZE = 10000
     PREVIEW_ROWS = 1000
     CACHE_SIZE = 100
+    SHEET_CACHE_SIZE = 4  # Parsed Excel sheets kept in memory per workbook
+    FILE_CACHE_SIZE_MB = 2048  # On-disk cache of parsed files (needs pyarrow)
+    AUTO_DECIMATION_POINTS = 100000  # Line series longer than this are decimated for drawing
 
     # Auto-save
     AUTOSAVE_INTERVAL = 300  # seconds
+    FOLLOW_POLL_INTERVAL = 1000  # ms between checks of followed files for new rows
+    LIVE_METRICS_SEED_ROWS = 50000  # loaded rows fed to live vacuum metrics when following starts
     BACKUP_COUNT = 5
 
 
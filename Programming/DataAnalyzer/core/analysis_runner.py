@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+core/analysis_runner.py - Background Analysis Runner
+Fans per-series analyses out over a process pool and streams results to the UI
+"""
+
+import os
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, List, Callable, Tuple, Any
+
+import numpy as np
+import pandas as pd
+
+from analysis.statistical import StatisticalAnalyzer
+from analysis.vacuum import VacuumAnalyzer
+from analysis.comparison import compare_all_pairs
+from utils.descriptive import describe
+
+logger = logging.getLogger(__name__)
+
+# Interval (ms) at which the Tk main loop drains worker results
+POLL_INTERVAL_MS = 50
+
+# Statistical analyses that run per series, keyed by the dialog option name
+STATISTICAL_ANALYSES = {
+    'basic_stats': ('basic_stats', describe),
+    'normality_test': ('normality', StatisticalAnalyzer.test_normality),
+    'outlier_detection': ('outliers', StatisticalAnalyzer.detect_outliers),
+}
+
+
+def analyze_series_statistics(series_id: str, y_data: np.ndarray,
+                              options: List[str]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run the selected statistical analyses on one series
+
+    Module level so it can be pickled for the process pool.
+
+    Args:
+        series_id: Series identifier, returned with the results
+        y_data: Series values
+        options: Option keys from STATISTICAL_ANALYSES
+
+    Returns:
+        (series_id, {result key: result})
+    """
+    y_data = np.asarray(y_data, dtype=float)
+    results = {}
+    for option in options:
+        if option in STATISTICAL_ANALYSES:
+            key, analysis = STATISTICAL_ANALYSES[option]
+            results[key] = analysis(y_data)
+    return series_id, results
+
+
+def analyze_series_vacuum(series_id: str, time_data: np.ndarray, pressure_data: np.ndarray,
+                          options: List[str], params: Dict[str, float]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run the selected vacuum analyses on one pressure series
+
+    Args:
+        series_id: Series identifier, returned with the results
+        time_data: Sample times in seconds (or sample numbers)
+        pressure_data: Pressure values
+        options: Any of 'base_pressure', 'leak_detection', 'spike_detection',
+            'pumpdown_curves', 'stability_analysis'
+        params: 'spike_threshold' (sigma), 'leak_threshold' and
+            'window_size' (samples)
+
+    Returns:
+        (series_id, {result key: result})
+    """
+    analyzer = VacuumAnalyzer()
+    time_data = np.asarray(time_data, dtype=float)
+    pressure_data = np.asarray(pressure_data, dtype=float)
+    window = max(2, int(params.get('window_size', 100)))
+    results = {}
+
+    if 'base_pressure' in options:
+        # The window is given in samples - one sample per second makes it window/60 minutes
+        results['base_pressure'] = analyzer.calculate_base_pressure(
+            pressure_data, window_minutes=window / 60.0, sample_rate_hz=1.0)
+
+    if 'leak_detection' in options:
+        leak_rate = analyzer.calculate_leak_rate(pressure_data, time_data)
+        results['leak'] = {
+            'leak_rate': leak_rate,
+            'leak_detected': bool(leak_rate > params.get('leak_threshold', 0.01))
+        }
+
+    if 'spike_detection' in options:
+        results['spikes'] = analyzer.detect_spikes(
+            pressure_data, params.get('spike_threshold', 3.0), time_data)
+
+    if 'pumpdown_curves' in options:
+        results['pumpdown'] = analyzer.analyze_pumpdown(pressure_data, time_data)
+
+    if 'stability_analysis' in options:
+        mean = np.mean(pressure_data)
+        series = pd.Series(pressure_data)
+        rolling_cv = (series.rolling(window, min_periods=2).std() /
+                      series.rolling(window, min_periods=2).mean()).to_numpy()
+        results['stability'] = {
+            'coefficient_of_variation': float(np.std(pressure_data) / mean) if mean else np.nan,
+            'max_rolling_cv': float(np.nanmax(rolling_cv)) if np.isfinite(rolling_cv).any() else np.nan,
+            'final_rolling_cv': float(rolling_cv[-1]) if len(rolling_cv) else np.nan
+        }
+
+    return series_id, results
+
+
+def compare_series_batch(job_id: str, names: List[str],
+                         series: List[Tuple[np.ndarray, np.ndarray]],
+                         align_start: bool) -> Tuple[str, Dict[str, Any]]:
+    """
+    All-pairs comparison of several series as one task
+
+    Returns:
+        (job_id, compare_all_pairs result)
+    """
+    return job_id, compare_all_pairs(names, series, align_start=align_start)
+
+
+class AnalysisJob:
+    """Tracks one batch of series submitted to the AnalysisJobRunner"""
+
+    def __init__(self, series_ids: List[str]):
+        self.series_ids = list(series_ids)
+        self.cancel_event = threading.Event()
+        self.results_queue: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        self.futures: Dict[Future, str] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.errors: List[Tuple[str, str]] = []
+        self.finished = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.series_ids)
+
+    @property
+    def done(self) -> bool:
+        return self.finished >= self.total
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    @property
+    def progress(self) -> float:
+        """Fraction of series finished (0-1)"""
+        return self.finished / self.total if self.total else 1.0
+
+    def cancel(self):
+        """
+        Request cancellation
+
+        Series that have not started are dropped from the pool; results of
+        series already running are discarded when they arrive.
+        """
+        self.cancel_event.set()
+        for future in self.futures:
+            future.cancel()
+
+
+class AnalysisJobRunner:
+    """
+    Runs per-series analyses off the UI thread
+
+    Each series is an independent task on a process pool, since the scipy
+    statistics hold the GIL for much of their run. Results are queued as
+    each series finishes and drained on the Tk main loop via ``after()``,
+    so callbacks always run on the UI thread. Falls back to a thread pool
+    where processes are unavailable.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize analysis runner
+
+        Args:
+            max_workers: Worker count (defaults to the CPU count)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self._pool = None
+        self._use_processes = True
+        self._active_jobs: List[AnalysisJob] = []
+
+    def _get_pool(self):
+        if self._pool is None and self._use_processes:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, analysing on threads: {e}")
+                self._use_processes = False
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="analysis")
+        return self._pool
+
+    def run(self, tasks: Dict[str, Tuple[Any, ...]], worker: Callable[..., Tuple[str, Any]],
+            tk_widget, on_result: Callable[[str, Any], None],
+            on_complete: Callable[[AnalysisJob], None],
+            on_progress: Optional[Callable[[AnalysisJob], None]] = None) -> AnalysisJob:
+        """
+        Start analysing series in the background
+
+        Args:
+            tasks: Series ID -> extra arguments for worker
+            worker: Picklable function called as worker(series_id, *args),
+                returning (series_id, result)
+            tk_widget: Any Tk widget, used to schedule callbacks with after()
+            on_result: Called on the UI thread with each series' result as it finishes
+            on_complete: Called on the UI thread once every series has finished
+                or the job was cancelled
+            on_progress: Called on the UI thread when progress changes
+
+        Returns:
+            AnalysisJob that can be used to cancel the batch
+        """
+        job = AnalysisJob(list(tasks))
+        self._active_jobs.append(job)
+
+        for series_id, args in tasks.items():
+            self._submit(job, worker, series_id, args)
+
+        tk_widget.after(POLL_INTERVAL_MS, self._poll, job, tk_widget,
+                        on_result, on_complete, on_progress)
+        return job
+
+    def _submit(self, job: AnalysisJob, worker, series_id: str, args: Tuple[Any, ...]):
+        try:
+            future = self._get_pool().submit(worker, series_id, *args)
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool broken, analysing on threads: {e}")
+            self._use_processes = False
+            self._pool = None
+            future = self._get_pool().submit(worker, series_id, *args)
+
+        job.futures[future] = series_id
+        future.add_done_callback(lambda f, sid=series_id: self._on_future_done(job, sid, f))
+
+    @staticmethod
+    def _on_future_done(job: AnalysisJob, series_id: str, future: Future):
+        """Runs on the worker side - only touches the thread-safe queue"""
+        if future.cancelled():
+            job.results_queue.put(('cancelled', series_id, None))
+            return
+
+        error = future.exception()
+        if error is None:
+            job.results_queue.put(('result', series_id, future.result()[1]))
+        else:
+            job.results_queue.put(('error', series_id, str(error)))
+
+    def drain(self, job: AnalysisJob, on_result: Callable[[str, Any], None]) -> bool:
+        """
+        Hand queued results to on_result
+
+        Returns:
+            True if any series finished
+        """
+        changed = False
+        while True:
+            try:
+                kind, series_id, payload = job.results_queue.get_nowait()
+            except queue.Empty:
+                return changed
+
+            job.finished += 1
+            changed = True
+
+            if job.cancelled:
+                continue
+            if kind == 'result':
+                job.results[series_id] = payload
+                try:
+                    on_result(series_id, payload)
+                except Exception as e:
+                    logger.error(f"Failed to show results for {series_id}: {e}")
+                    job.errors.append((series_id, str(e)))
+            elif kind == 'error':
+                logger.error(f"Analysis failed for {series_id}: {payload}")
+                job.errors.append((series_id, payload))
+
+    def _poll(self, job: AnalysisJob, tk_widget, on_result, on_complete, on_progress):
+        """Drain queued worker results on the UI thread"""
+        if self.drain(job, on_result) and on_progress and not job.cancelled:
+            on_progress(job)
+
+        if job.done or job.cancelled:
+            if job in self._active_jobs:
+                self._active_jobs.remove(job)
+            on_complete(job)
+            return
+
+        try:
+            tk_widget.after(POLL_INTERVAL_MS, self._poll, job, tk_widget,
+                            on_result, on_complete, on_progress)
+        except Exception:
+            # Window was destroyed while analysing
+            job.cancel()
+            if job in self._active_jobs:
+                self._active_jobs.remove(job)
+
+    @property
+    def is_busy(self) -> bool:
+        """True while any batch is still running"""
+        return bool(self._active_jobs)
+
+    def shutdown(self):
+        """Cancel outstanding analyses and stop the worker pool"""
+        for job in self._active_jobs:
+            job.cancel()
+        self._active_jobs.clear()
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+core/annotation_index.py - Annotation Spatial Index
+Uniform grid over annotation extents in display space for fast hit-testing
+"""
+
+import math
+import logging
+from itertools import count
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[float, float, float, float]
+Segment = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class AnnotationIndex:
+    """
+    Grid of display-space cells mapping to the annotations that overlap them
+
+    Each annotation is stored with its pixel bounding box and, for lines and
+    arrows, the segment it draws. A hit-test only looks at the cells around
+    the pointer and measures the true distance to each candidate (inside the
+    box, or along the segment), so the cost depends on how crowded that
+    spot is rather than on the total number of annotations. Entries are
+    inserted and removed one at a time as annotations change; the owner
+    rebuilds the index when the axes limits or size change, since every
+    display position moves.
+    """
+
+    CELL_SIZE = 32.0
+    # Entries spanning more cells than this are kept in a list checked on every query
+    MAX_CELLS = 4096
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        """
+        Initialize spatial index
+
+        Args:
+            cell_size: Grid cell edge in display pixels
+        """
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._entries: Dict[str, Tuple[BBox, Optional[Segment], List[Tuple[int, int]], int]] = {}
+        self._oversized: Set[str] = set()
+        self._order = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, annotation_id: str) -> bool:
+        return annotation_id in self._entries
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[range, range]:
+        size = self.cell_size
+        return (range(math.floor(x0 / size), math.floor(x1 / size) + 1),
+                range(math.floor(y0 / size), math.floor(y1 / size) + 1))
+
+    def insert(self, annotation_id: str, bbox: BBox, segment: Optional[Segment] = None):
+        """
+        Add or move an annotation
+
+        Args:
+            annotation_id: Annotation identifier
+            bbox: (x0, y0, x1, y1) extent in display pixels
+            segment: Endpoints in display pixels for line-like annotations
+        """
+        self.remove(annotation_id)
+
+        x0, y0, x1, y1 = bbox
+        if not all(map(math.isfinite, bbox)):
+            return
+        bbox = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+
+        cols, rows = self._cell_range(*bbox)
+        cells = []
+        if len(cols) * len(rows) > self.MAX_CELLS:
+            self._oversized.add(annotation_id)
+        else:
+            cells = [(i, j) for i in cols for j in rows]
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(annotation_id)
+
+        self._entries[annotation_id] = (bbox, segment, cells, next(self._order))
+
+    def remove(self, annotation_id: str):
+        """Drop an annotation from the index"""
+        entry = self._entries.pop(annotation_id, None)
+        if entry is None:
+            return
+        self._oversized.discard(annotation_id)
+        for cell in entry[2]:
+            members = self._cells.get(cell)
+            if members is not None:
+                members.discard(annotation_id)
+                if not members:
+                    del self._cells[cell]
+
+    def clear(self):
+        """Drop every entry"""
+        self._cells.clear()
+        self._entries.clear()
+        self._oversized.clear()
+
+    @staticmethod
+    def _box_distance(bbox: BBox, x: float, y: float) -> float:
+        dx = max(bbox[0] - x, 0.0, x - bbox[2])
+        dy = max(bbox[1] - y, 0.0, y - bbox[3])
+        return math.hypot(dx, dy)
+
+    @staticmethod
+    def _segment_distance(segment: Segment, x: float, y: float) -> float:
+        (ax, ay), (bx, by) = segment
+        vx, vy = bx - ax, by - ay
+        length_sq = vx * vx + vy * vy
+        t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - ax) * vx + (y - ay) * vy) / length_sq))
+        return math.hypot(x - (ax + t * vx), y - (ay + t * vy))
+
+    def query(self, x: float, y: float, tolerance: float = 0.0) -> List[str]:
+        """
+        Annotations within tolerance pixels of a display point
+
+        Returns:
+            Annotation IDs, nearest first; among overlapping entries the
+            one centred closest wins, then the most recently inserted
+            (drawn on top)
+        """
+        cols, rows = self._cell_range(x - tolerance, y - tolerance, x + tolerance, y + tolerance)
+        candidates = set(self._oversized)
+        for i in cols:
+            for j in rows:
+                candidates.update(self._cells.get((i, j), ()))
+
+        hits = []
+        for annotation_id in candidates:
+            bbox, segment, _, order = self._entries[annotation_id]
+            if segment is not None:
+                distance = self._segment_distance(segment, x, y)
+            else:
+                distance = self._box_distance(bbox, x, y)
+            if distance <= tolerance:
+                # Among overlapping boxes prefer the one centred nearest the point
+                centre = math.hypot(x - (bbox[0] + bbox[2]) / 2, y - (bbox[1] + bbox[3]) / 2)
+                hits.append((distance, centre, -order, annotation_id))
+
+        return [hit[-1] for hit in sorted(hits)]
@@ -7,21 +7,112 @@ Handles plot annotations including text, arrows, and shapes
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.dates as mdates
-from typing import List, Dict, Optional, Any, Tuple
+from matplotlib.lines import Line2D
+from typing import List, Dict, Optional, Any, Tuple, Callable
 import logging
 import uuid
 
 from models.data_models import AnnotationConfig
+from core.annotation_index import AnnotationIndex
 
 logger = logging.getLogger(__name__)
 
 
+class BlitLayer:
+    """
+    Redraws a few moving artists over a cached copy of the static plot
+
+    The layer's artists are marked animated so a full canvas draw leaves
+    them out; the result (series, grid, axes, other annotations) is saved
+    with copy_from_bbox after every full draw. An update then only restores
+    that background, draws the layer's artists and blits, so dragging or
+    previewing an annotation costs one artist instead of the whole figure.
+    Canvases without blitting fall back to draw_idle.
+    """
+
+    # Interactive updates are coalesced to roughly one per display frame (60 Hz)
+    FRAME_INTERVAL_MS = 16
+
+    def __init__(self, axes):
+        """
+        Initialize blit layer
+
+        Args:
+            axes: Axes whose figure holds the interactive artists
+        """
+        self.axes = axes
+        self.canvas = axes.figure.canvas
+        self.artists: List[Any] = []
+        self.background = None
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def supported(self) -> bool:
+        return bool(getattr(self.canvas, 'supports_blit', False))
+
+    def set_artists(self, artists: List[Any], in_background: bool = True):
+        """
+        Choose the artists redrawn on every update
+
+        Args:
+            artists: Artists to animate; any previous ones become static again
+            in_background: Whether the artists may already be drawn into the
+                cached background (existing annotations). If so the
+                background is dropped and recaptured on the next update.
+                Pass False for artists that were just created.
+        """
+        artists = [a for a in artists if a is not None]
+        for artist in self.artists:
+            if artist not in artists:
+                artist.set_animated(False)
+        for artist in artists:
+            if in_background and not artist.get_animated():
+                self.background = None
+            artist.set_animated(True)
+        self.artists = artists
+
+    def _on_draw(self, event):
+        """Save the static background after every full draw"""
+        if not self.supported:
+            return
+        self.background = self.canvas.copy_from_bbox(self.axes.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            if artist.figure is not None:
+                self.axes.figure.draw_artist(artist)
+
+    def update(self):
+        """Show the current state of the layer's artists"""
+        if not self.supported:
+            self.canvas.draw_idle()
+            return
+
+        if self.background is None:
+            # Full draw; _on_draw captures the background and adds the artists
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_artists()
+        self.canvas.blit(self.axes.figure.bbox)
+
+    def close(self):
+        """Make the artists static again and stop tracking draws"""
+        self.set_artists([])
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self.background = None
+
+
 class AnnotationManager:
     """
     Manages plot annotations
     Handles adding, removing, and updating annotations on plots
     """
 
+    # How close (in display pixels) a click must be to select an annotation
+    HIT_TOLERANCE_PX = 5.0
+
     def __init__(self):
         """Initialize annotation manager"""
         self.annotations: List[AnnotationConfig] = []
@@ -37,8 +128,25 @@ class AnnotationManager:
         # Drag/move support
         self.dragging_annotation = None
         self.drag_start_pos = None
+        self.drag_moved = False
         self.drag_event_ids = []
 
+        # Interactive layer for dragged/preview artists and coalesced motion
+        self._blit_layer: Optional[BlitLayer] = None
+        self._pending_motion: Optional[Tuple[float, float]] = None
+        self._motion_timer = None
+
+        # Display-space hit-test index and the view it was built for
+        self._index = AnnotationIndex()
+        self._index_view = None
+
+        # Called after annotations are added, removed or edited
+        self.on_change: Optional[Callable[[], None]] = None
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
     def set_data_context(self, axes):
         """
         Set the current axes and data context
@@ -72,6 +180,7 @@ class AnnotationManager:
                     pass
                 finally:
                     self.annotation_objects.pop(ann_id, None)
+            self._index.clear()
 
             # Redraw all visible annotations
             self.draw_all_annotations(self.current_axes)
@@ -93,6 +202,7 @@ class AnnotationManager:
         self.annotations.append(annotation)
         if self.current_axes:
             self.draw_annotation(annotation)
+        self._changed()
 
     def remove_annotation(self, annotation_id: str):
         """
@@ -110,12 +220,37 @@ class AnnotationManager:
             if hasattr(obj, 'remove'):
                 obj.remove()
             del self.annotation_objects[annotation_id]
+        self._index.remove(annotation_id)
+        self._changed()
 
     def clear_annotations(self):
         """Clear all annotations"""
         for ann_id in list(self.annotation_objects.keys()):
             self.remove_annotation(ann_id)
         self.annotations.clear()
+        self._index.clear()
+        self._changed()
+
+    @staticmethod
+    def _norm_x(val):
+        """Normalize potential datetime x-coordinates to Matplotlib float dates"""
+        try:
+            # If it's already a float/int, return as-is
+            if isinstance(val, (int, float)):
+                return float(val)
+            # pandas/np datetime64 or python datetime
+            return mdates.date2num(val)
+        except Exception:
+            try:
+                # Try to parse common string dates
+                import pandas as pd
+                return mdates.date2num(pd.to_datetime(val, errors='coerce'))
+            except Exception:
+                # Fallback: best-effort float cast
+                try:
+                    return float(val)
+                except Exception:
+                    return val
 
     def draw_annotation(self, annotation: AnnotationConfig):
         """
@@ -131,28 +266,8 @@ class AnnotationManager:
             ax = self.current_axes
             ann_obj = None
 
-            # Normalize potential datetime x-coordinates to Matplotlib float dates
-            def _norm_x(val):
-                try:
-                    # If it's already a float/int, return as-is
-                    if isinstance(val, (int, float)):
-                        return float(val)
-                    # pandas/np datetime64 or python datetime
-                    return mdates.date2num(val)
-                except Exception:
-                    try:
-                        # Try to parse common string dates
-                        import pandas as pd
-                        return mdates.date2num(pd.to_datetime(val, errors='coerce'))
-                    except Exception:
-                        # Fallback: best-effort float cast
-                        try:
-                            return float(val)
-                        except Exception:
-                            return val
-
-            x = _norm_x(annotation.x)
-            x2 = _norm_x(annotation.x2)
+            x = self._norm_x(annotation.x)
+            x2 = self._norm_x(annotation.x2)
 
             if annotation.annotation_type == "text":
                 ann_obj = ax.annotate(
@@ -264,10 +379,100 @@ class AnnotationManager:
             # Store reference
             if ann_obj:
                 self.annotation_objects[annotation.annotation_id] = ann_obj
+                if annotation.annotation_id != "preview":
+                    self._index_annotation(annotation, ann_obj)
 
         except Exception as e:
             logger.error(f"Failed to draw annotation: {e}")
 
+    # ---- Hit-testing ----
+    def _view_key(self):
+        """Everything that maps data to display positions"""
+        ax = self.current_axes
+        return (id(ax), ax.get_xlim(), ax.get_ylim(), tuple(ax.bbox.bounds),
+                ax.get_xscale(), ax.get_yscale())
+
+    def _display_geometry(self, annotation: AnnotationConfig, artist):
+        """
+        Pixel extent of a drawn annotation
+
+        Returns:
+            (bbox, segment) - segment holds the endpoints of lines and
+            arrows so hits are measured along them, not their bounding box
+        """
+        ax = self.current_axes
+        kind = annotation.annotation_type
+
+        if kind == "line" and isinstance(artist, Line2D):
+            points = artist.get_transform().transform(artist.get_xydata())
+        elif kind == "arrow":
+            transform = ax.transData if self.is_data_coordinates(annotation) else ax.transAxes
+            points = transform.transform([(self._norm_x(annotation.x), annotation.y),
+                                          (self._norm_x(annotation.x2), annotation.y2)])
+        elif kind == "point":
+            cx, cy = ax.transData.transform((self._norm_x(annotation.x), annotation.y))
+            radius = max(1.0, (annotation.marker_size or 6.0) * ax.figure.dpi / 72.0 / 2.0)
+            return (cx - radius, cy - radius, cx + radius, cy + radius), None
+        else:
+            # Text, rectangles and circles: the artist's own extent
+            extent = artist.get_window_extent()
+            return (extent.x0, extent.y0, extent.x1, extent.y1), None
+
+        (x0, y0), (x1, y1) = points[0], points[-1]
+        bbox = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        return bbox, ((x0, y0), (x1, y1))
+
+    def _index_annotation(self, annotation: AnnotationConfig, artist):
+        """Insert or move one annotation in the hit-test index"""
+        try:
+            bbox, segment = self._display_geometry(annotation, artist)
+            self._index.insert(annotation.annotation_id, tuple(map(float, bbox)), segment)
+        except Exception as e:
+            logger.debug(f"Could not index annotation {annotation.annotation_id}: {e}")
+            self._index.remove(annotation.annotation_id)
+
+    def _ensure_index(self):
+        """Rebuild the hit-test index if the axes limits or size changed"""
+        view = self._view_key()
+        if view == self._index_view:
+            return
+
+        self._index.clear()
+        for annotation in self.annotations:
+            artist = self.annotation_objects.get(annotation.annotation_id)
+            if artist is not None and annotation.visible:
+                self._index_annotation(annotation, artist)
+        self._index_view = view
+
+    def hit_test(self, x_px: float, y_px: float,
+                 tolerance_px: Optional[float] = None) -> Optional[AnnotationConfig]:
+        """
+        Annotation under a display-space point
+
+        Args:
+            x_px: Display x in pixels (e.g. event.x)
+            y_px: Display y in pixels (e.g. event.y)
+            tolerance_px: Allowed distance; defaults to HIT_TOLERANCE_PX
+
+        Returns:
+            The nearest annotation within tolerance, or None
+        """
+        if not self.current_axes:
+            return None
+        if tolerance_px is None:
+            tolerance_px = self.HIT_TOLERANCE_PX
+
+        self._ensure_index()
+        hits = self._index.query(x_px, y_px, tolerance_px)
+        if not hits:
+            return None
+
+        by_id = {a.annotation_id: a for a in self.annotations}
+        for annotation_id in hits:
+            if annotation_id in by_id:
+                return by_id[annotation_id]
+        return None
+
     def is_data_coordinates(self, annotation: AnnotationConfig) -> bool:
         """
         Determine if annotation uses data coordinates or axes fraction
@@ -328,6 +533,7 @@ class AnnotationManager:
         # Redraw
         if self.current_axes:
             self.draw_annotation(annotation)
+        self._changed()
 
     def get_annotations(self) -> List[AnnotationConfig]:
         """Get all annotations"""
@@ -339,6 +545,7 @@ class AnnotationManager:
         self.annotations = annotations
         if self.current_axes:
             self.draw_all_annotations(self.current_axes)
+        self._changed()
 
     def find_annotation_at_point(self, x: float, y: float) -> Optional[AnnotationConfig]:
         """
@@ -351,12 +558,7 @@ class AnnotationManager:
         Returns:
             AnnotationConfig if found, None otherwise
         """
-        # Simple proximity check - could be improved
-        for annotation in self.annotations:
-            if annotation.annotation_type == "text":
-                if abs(annotation.x - x) < 0.05 and abs(annotation.y - y) < 0.05:
-                    return annotation
-        return None
+        return self._find_annotation_at_point(x, y)
 
     def add_pumpdown_annotation(self, x_start: float, x_end: float, p_initial: float, 
                                p_final: float = None, time_to_base: float = None, 
@@ -605,6 +807,24 @@ class AnnotationManager:
         self.preview_mode = False
         self.clear_preview()
         self._disable_drag_interactions()
+        self._close_blit_layer()
+
+    def _get_blit_layer(self) -> Optional[BlitLayer]:
+        """Blit layer for the current axes, created on first use"""
+        if not self.current_axes or not hasattr(self.current_axes, 'figure'):
+            return None
+        if self._blit_layer is not None and self._blit_layer.axes is not self.current_axes:
+            self._close_blit_layer()
+        if self._blit_layer is None:
+            self._blit_layer = BlitLayer(self.current_axes)
+        return self._blit_layer
+
+    def _close_blit_layer(self):
+        if self._blit_layer is not None:
+            self._blit_layer.close()
+            self._blit_layer = None
+            if self.current_axes:
+                self.current_axes.figure.canvas.draw_idle()
     
     def update_preview(self, annotation_config: AnnotationConfig):
         """Update the preview annotation in real-time"""
@@ -612,7 +832,7 @@ class AnnotationManager:
             return
             
         # Clear existing preview
-        self.clear_preview()
+        self._remove_preview_artist()
         
         # Store preview config
         self.preview_annotation = annotation_config
@@ -626,25 +846,33 @@ class AnnotationManager:
         self.draw_annotation(preview_config)
         self.preview_object = self.annotation_objects.get("preview")
         
-        # Refresh canvas
-        if self.current_axes and hasattr(self.current_axes, 'figure'):
-            self.current_axes.figure.canvas.draw_idle()
-    
-    def clear_preview(self):
-        """Clear the current preview annotation"""
+        # Blit just the preview over the cached plot
+        layer = self._get_blit_layer()
+        if layer:
+            layer.set_artists([self.preview_object], in_background=False)
+            layer.update()
+
+    def _remove_preview_artist(self):
+        """Remove the preview artist without redrawing"""
         if self.preview_object and hasattr(self.preview_object, 'remove'):
             try:
                 self.preview_object.remove()
             except:
                 pass
         self.preview_object = None
-        self.preview_annotation = None
         if "preview" in self.annotation_objects:
             del self.annotation_objects["preview"]
+    
+    def clear_preview(self):
+        """Clear the current preview annotation"""
+        self._remove_preview_artist()
+        self.preview_annotation = None
         
-        # Refresh canvas
-        if self.current_axes and hasattr(self.current_axes, 'figure'):
-            self.current_axes.figure.canvas.draw_idle()
+        # Restore the plot underneath
+        layer = self._get_blit_layer()
+        if layer:
+            layer.set_artists([], in_background=False)
+            layer.update()
     
     def commit_preview(self):
         """Convert the current preview to a permanent annotation"""
@@ -659,6 +887,8 @@ class AnnotationManager:
             
             # Add as permanent annotation
             self.add_annotation(permanent_config)
+            if self.current_axes:
+                self.current_axes.figure.canvas.draw_idle()
             return permanent_config
         return None
     
@@ -698,67 +928,149 @@ class AnnotationManager:
             return
             
         # Find annotation under cursor
-        annotation = self._find_annotation_at_point(event.xdata, event.ydata)
+        annotation = self.hit_test(event.x, event.y)
         if annotation:
             self.dragging_annotation = annotation
             self.drag_start_pos = (event.xdata, event.ydata)
+            self.drag_moved = False
+            # The dragged artist moves on the blit layer; the rest stays cached
+            layer = self._get_blit_layer()
+            if layer:
+                layer.set_artists([self.annotation_objects.get(annotation.annotation_id)])
             return True
         return False
     
     def _on_mouse_release(self, event):
         """Handle mouse release for drag interactions"""
         if self.dragging_annotation:
+            # Apply the last coalesced move before finishing
+            self._flush_motion()
+            if self._motion_timer is not None:
+                self._motion_timer.stop()
+            if self._blit_layer is not None:
+                self._blit_layer.set_artists([])
+            moved = self.drag_moved
             self.dragging_annotation = None
             self.drag_start_pos = None
-            # Refresh plot after drag
-            self.refresh_plot_annotations()
+            self.drag_moved = False
+            # A plain click leaves the plot and the project untouched
+            if moved:
+                self.refresh_plot_annotations()
+                self._changed()
     
     def _on_mouse_motion(self, event):
-        """Handle mouse motion for drag interactions"""
+        """
+        Handle mouse motion for drag interactions
+
+        Only the latest position is kept; it is applied at most once per
+        frame by _flush_motion, however fast motion events arrive.
+        """
         if not self.dragging_annotation or not self.drag_start_pos:
             return
             
         if not event.inaxes == self.current_axes:
             return
-            
+
+        scheduled = self._pending_motion is not None
+        self._pending_motion = (event.xdata, event.ydata)
+        if not scheduled:
+            self._schedule_motion_flush()
+
+    def _schedule_motion_flush(self):
+        """Run _flush_motion on the next frame"""
+        if self._motion_timer is None:
+            canvas = self.current_axes.figure.canvas
+            self._motion_timer = canvas.new_timer(interval=BlitLayer.FRAME_INTERVAL_MS)
+            self._motion_timer.single_shot = True
+            self._motion_timer.add_callback(self._flush_motion)
+        self._motion_timer.start()
+
+    def _flush_motion(self):
+        """Move the dragged annotation to the latest pointer position"""
+        pending, self._pending_motion = self._pending_motion, None
+        if pending is None or not self.dragging_annotation or not self.drag_start_pos:
+            return
+
         # Calculate drag delta
-        dx = event.xdata - self.drag_start_pos[0]
-        dy = event.ydata - self.drag_start_pos[1]
+        dx = pending[0] - self.drag_start_pos[0]
+        dy = pending[1] - self.drag_start_pos[1]
+        if not dx and not dy:
+            return
         
         # Update annotation position
-        self.dragging_annotation.x += dx
-        self.dragging_annotation.y += dy
+        annotation = self.dragging_annotation
+        annotation.x += dx
+        annotation.y += dy
         
         # Update secondary coordinates for lines/arrows
-        if hasattr(self.dragging_annotation, 'x2'):
-            self.dragging_annotation.x2 += dx
-        if hasattr(self.dragging_annotation, 'y2'):
-            self.dragging_annotation.y2 += dy
+        if hasattr(annotation, 'x2'):
+            annotation.x2 += dx
+        if hasattr(annotation, 'y2'):
+            annotation.y2 += dy
             
         # Update drag start position
-        self.drag_start_pos = (event.xdata, event.ydata)
+        self.drag_start_pos = pending
+        self.drag_moved = True
         
-        # Redraw annotation
-        self.update_annotation(self.dragging_annotation)
+        # Move the artist and blit it over the cached background; the
+        # annotation is redrawn and reported as changed once, on release
+        artist = self.annotation_objects.get(annotation.annotation_id)
+        in_background = True
+        if not self._move_artist(annotation, artist):
+            artist = self._redraw_artist(annotation)
+            in_background = False
+        layer = self._get_blit_layer()
+        if layer:
+            layer.set_artists([artist], in_background=in_background)
+            layer.update()
+
+    def _move_artist(self, annotation: AnnotationConfig, artist) -> bool:
+        """
+        Move a drawn annotation's artist to the annotation's position
+
+        Returns:
+            False if the artist cannot be moved in place and must be redrawn
+        """
+        if artist is None:
+            return False
+
+        kind = annotation.annotation_type
+        x = self._norm_x(annotation.x)
+        try:
+            if kind == "text":
+                artist.xy = (x, annotation.y)
+                artist.set_position((x, annotation.y))
+            elif kind == "arrow":
+                artist.xy = (self._norm_x(annotation.x2), annotation.y2)
+                artist.set_position((x, annotation.y))
+            elif kind == "line":
+                artist.set_data([x, self._norm_x(annotation.x2)], [annotation.y, annotation.y2])
+            elif kind == "point" and not annotation.text:
+                artist.set_offsets([(x, annotation.y)])
+            elif kind == "rect" and self.is_data_coordinates(annotation):
+                artist.set_xy((annotation.x, annotation.y))
+            elif kind == "circle":
+                artist.set_center((annotation.x, annotation.y))
+            else:
+                return False
+        except Exception as e:
+            logger.debug(f"Could not move annotation {annotation.annotation_id}: {e}")
+            return False
+        return True
+
+    def _redraw_artist(self, annotation: AnnotationConfig):
+        """Replace a drawn annotation's artist without reporting a change"""
+        obj = self.annotation_objects.pop(annotation.annotation_id, None)
+        if hasattr(obj, 'remove'):
+            obj.remove()
+        self.draw_annotation(annotation)
+        return self.annotation_objects.get(annotation.annotation_id)
     
-    def _find_annotation_at_point(self, x: float, y: float, tolerance: float = 0.05) -> Optional[AnnotationConfig]:
-        """Find annotation near the given point"""
-        if not self.current_axes:
+    def _find_annotation_at_point(self, x: float, y: float,
+                                  tolerance_px: Optional[float] = None) -> Optional[AnnotationConfig]:
+        """Find annotation near the given data-space point"""
+        if not self.current_axes or x is None or y is None:
             return None
-            
-        # Get axis limits for tolerance calculation
-        x_range = self.current_axes.get_xlim()[1] - self.current_axes.get_xlim()[0]
-        y_range = self.current_axes.get_ylim()[1] - self.current_axes.get_ylim()[0]
-        x_tol = x_range * tolerance
-        y_tol = y_range * tolerance
-        
-        for annotation in self.annotations:
-            if not annotation.visible:
-                continue
-                
-            # Check if point is near annotation
-            if (abs(annotation.x - x) <= x_tol and 
-                abs(annotation.y - y) <= y_tol):
-                return annotation
-        
-        return None
\ No newline at end of file
+
+        x_px, y_px = self.current_axes.transData.transform((self._norm_x(x), y))
+        return self.hit_test(x_px, y_px, tolerance_px)
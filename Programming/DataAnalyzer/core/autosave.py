@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+core/autosave.py - Autosave Journal
+Incremental, append-only autosave of project state
+"""
+
+import os
+import json
+import shutil
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Set
+
+from models.data_models import FileData
+from models.project_models import Project
+from core.project_store import ProjectDataStore
+
+logger = logging.getLogger(__name__)
+
+# Record kinds; 'project' holds the top-level settings
+PROJECT = 'project'
+FILE = 'file'
+SERIES = 'series'
+ANNOTATION = 'annotation'
+
+_COLLECTIONS = {FILE: 'files', SERIES: 'series', ANNOTATION: 'annotations'}
+
+
+class AutosaveDelta:
+    """Changes collected from a project, ready to be written by a worker"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self.files: List[FileData] = []
+        self.fingerprints: Dict[Tuple[str, str], str] = {}
+        self.removed: Set[Tuple[str, str]] = set()
+        # Full project dictionary when a new base snapshot is due
+        self.base: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.records and not self.files and self.base is None
+
+
+class AutosaveJournal:
+    """
+    Per-project autosave made of a base snapshot plus an append-only journal
+
+    Layout::
+
+        autosave/<project_id>/base.json      full project dictionary
+        autosave/<project_id>/journal.jsonl  one put/delete record per change
+        autosave/<project_id>/data/          ProjectDataStore for file data
+
+    Each series, annotation, file and the project settings are fingerprinted
+    by their serialized form, so a tick only journals what changed since the
+    last one. File data goes through the columnar store, which skips files
+    whose DataFrame has not been replaced or invalidated. The journal is
+    folded into a new base once it grows past COMPACT_AFTER records.
+
+    collect() must run on the thread that owns the project (the UI thread);
+    write() does all disk I/O and is meant for a background worker.
+    """
+
+    BASE = 'base.json'
+    JOURNAL = 'journal.jsonl'
+    COMPACT_AFTER = 200
+
+    def __init__(self, autosave_dir: Path, project_id: str):
+        """
+        Initialize autosave journal
+
+        Args:
+            autosave_dir: Root autosave directory
+            project_id: Project the journal belongs to
+        """
+        self.directory = Path(autosave_dir) / project_id
+        self.store = ProjectDataStore(self.directory / 'data')
+        self._fingerprints: Dict[Tuple[str, str], str] = {}
+        self._entries = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_path(self) -> Path:
+        return self.directory / self.BASE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / self.JOURNAL
+
+    def exists(self) -> bool:
+        """True if a base snapshot has been written"""
+        return self.base_path.exists()
+
+    @staticmethod
+    def _fingerprint(data: Dict[str, Any]) -> str:
+        return json.dumps(data, sort_keys=True, default=str)
+
+    @staticmethod
+    def _project_items(project: Project) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Serialized form of every journaled item, keyed by (kind, id)"""
+        settings = project.to_dict()
+        items = {(PROJECT, ''): {k: v for k, v in settings.items() if k not in _COLLECTIONS.values()}}
+        for kind, collection in _COLLECTIONS.items():
+            for item_id, data in settings[collection].items():
+                items[(kind, item_id)] = data
+        return items
+
+    def collect(self, project: Project, dirty_files: Optional[Set[str]] = None) -> AutosaveDelta:
+        """
+        Work out what changed since the last successful write
+
+        Args:
+            project: Project to autosave
+            dirty_files: IDs of files whose data was edited in place
+
+        Returns:
+            AutosaveDelta to hand to write()
+        """
+        delta = AutosaveDelta()
+        items = self._project_items(project)
+
+        # Files edited in place are journaled even if their metadata is unchanged
+        dirty_keys = set()
+        for file_id in dirty_files or ():
+            if file_id in project.files:
+                ProjectDataStore.invalidate(project.files[file_id])
+                dirty_keys.add((FILE, file_id))
+
+        with self._lock:
+            previous = dict(self._fingerprints)
+            compact = not previous or not self.exists() or self._entries >= self.COMPACT_AFTER
+
+        for key, data in items.items():
+            fingerprint = self._fingerprint(data)
+            delta.fingerprints[key] = fingerprint
+            if not compact and (previous.get(key) != fingerprint or key in dirty_keys):
+                kind, item_id = key
+                delta.records.append({'op': 'put', 'kind': kind, 'id': item_id, 'data': data})
+
+        for key in previous.keys() - items.keys():
+            delta.removed.add(key)
+            if not compact:
+                kind, item_id = key
+                delta.records.append({'op': 'delete', 'kind': kind, 'id': item_id})
+
+        if compact:
+            delta.base = project.to_dict()
+
+        delta.files = [f for f in project.files.values() if not self.store.is_current(f)]
+        return delta
+
+    def write(self, delta: AutosaveDelta) -> bool:
+        """
+        Write collected changes to disk
+
+        Returns:
+            True if the changes were persisted
+        """
+        if delta.is_empty:
+            return True
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            for file_data in delta.files:
+                self.store.write(file_data)
+
+            if delta.base is not None:
+                tmp_path = self.base_path.with_suffix('.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(delta.base, f, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
+                tmp_path.replace(self.base_path)
+                # Base now holds everything - start a fresh journal
+                open(self.journal_path, 'w').close()
+                self.store.prune(delta.base.get('files', {}).keys())
+                entries = 0
+            else:
+                timestamp = datetime.now().isoformat()
+                with open(self.journal_path, 'a') as f:
+                    for record in delta.records:
+                        record['time'] = timestamp
+                        f.write(json.dumps(record, default=str) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                for kind, file_id in delta.removed:
+                    if kind == FILE:
+                        self.store.remove(file_id)
+                entries = self._entries + len(delta.records)
+
+        except Exception as e:
+            logger.error(f"Autosave write failed: {e}")
+            return False
+
+        with self._lock:
+            self._fingerprints = delta.fingerprints
+            self._entries = entries
+        return True
+
+    def replay(self) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the latest project dictionary from base and journal
+
+        A record cut short by a crash ends the replay; everything before it
+        is kept.
+        """
+        if not self.exists():
+            return None
+
+        with open(self.base_path, 'r') as f:
+            state = json.load(f)
+
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Ignoring truncated autosave record")
+                        break
+                    self._apply(state, record)
+
+        return state
+
+    @staticmethod
+    def _apply(state: Dict[str, Any], record: Dict[str, Any]):
+        kind = record.get('kind')
+        if kind == PROJECT:
+            if record.get('op') == 'put':
+                state.update(record['data'])
+            return
+
+        collection = state.setdefault(_COLLECTIONS.get(kind, kind), {})
+        if record.get('op') == 'put':
+            collection[record['id']] = record['data']
+        else:
+            collection.pop(record['id'], None)
+
+    def clear(self):
+        """Delete the autosave for this project"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        with self._lock:
+            self._fingerprints = {}
+            self._entries = 0
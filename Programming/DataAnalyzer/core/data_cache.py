@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+core/data_cache.py - Data Cache
+On-disk columnar cache of parsed source files
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import pandas as pd
+
+from models.data_models import FileData
+from config.constants import AppConfig
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401 - required by DataFrame.to_feather/read_feather
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+
+class DataCache:
+    """
+    Content-addressed cache of analyzed DataFrames
+
+    Entries are keyed by source path, size, modification time and sheet, so
+    an edited file simply misses. Each entry is a Feather file holding the
+    post-analysis DataFrame plus a small JSON sidecar with the FileData
+    metadata needed to rebuild it. The total size is capped and the least
+    recently used entries are evicted first.
+    """
+
+    DATA_SUFFIX = '.feather'
+    META_SUFFIX = '.json'
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_size_mb: float = AppConfig.FILE_CACHE_SIZE_MB):
+        """
+        Initialize data cache
+
+        Args:
+            cache_dir: Directory for cache entries
+            max_size_mb: Size cap for all entries together
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.excel_data_plotter' / 'cache'
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = FEATHER_AVAILABLE
+
+        # Counters so the savings are visible
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+
+        self._lock = threading.Lock()
+
+        if not self.enabled:
+            logger.info("pyarrow not installed - file cache disabled")
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Cannot create cache directory {self.cache_dir}: {e}")
+            self.enabled = False
+
+    @staticmethod
+    def make_key(filepath: str, sheet_name: Optional[str] = None) -> Optional[str]:
+        """
+        Build the cache key for a source file
+
+        Returns:
+            Hex digest, or None if the file cannot be stat'ed
+        """
+        try:
+            path = Path(filepath).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+
+        identity = f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{sheet_name or ''}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def _entry_paths(self, key: str):
+        return (self.cache_dir / f"{key}{self.DATA_SUFFIX}",
+                self.cache_dir / f"{key}{self.META_SUFFIX}")
+
+    def get(self, filepath: str, sheet_name: Optional[str] = None) -> Optional[FileData]:
+        """
+        Look up a previously parsed file
+
+        Args:
+            filepath: Source file path
+            sheet_name: Requested sheet (None for the default sheet)
+
+        Returns:
+            Rebuilt FileData on a hit, None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(filepath, sheet_name)
+        data_path, meta_path = self._entry_paths(key) if key else (None, None)
+
+        if key is None or not data_path.exists() or not meta_path.exists():
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            start = time.perf_counter()
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            df = pd.read_feather(data_path)
+
+            file_data = FileData(filepath=meta['filepath'], data=df, filename=meta.get('filename'))
+            file_data.file_size = meta.get('file_size', 0)
+            file_data.source_offset = meta.get('source_offset', 0)
+            file_data.sheet_name = meta.get('sheet_name')
+            file_data.datetime_formats = meta.get('datetime_formats', {})
+
+            sheet_names = meta.get('sheet_names')
+            if sheet_names:
+                # Imported here to avoid a circular import with FileManager
+                from core.file_manager import LazySheetMapping
+                file_data.sheets = LazySheetMapping(meta['filepath'], sheet_names)
+
+            # Touch the entry so LRU eviction sees it as recently used
+            now = time.time()
+            for path in (data_path, meta_path):
+                try:
+                    os.utime(path, (now, now))
+                except OSError:
+                    pass
+
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.hits += 1
+                self.seconds_saved += max(0.0, meta.get('parse_seconds', 0.0) - elapsed)
+
+            logger.info(f"Cache hit for {Path(filepath).name} ({elapsed:.2f}s)")
+            return file_data
+
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {filepath}: {e}")
+            self._remove_entry(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+    def put(self, file_data: FileData, sheet_name: Optional[str] = None,
+            parse_seconds: float = 0.0) -> bool:
+        """
+        Store an analyzed file
+
+        Args:
+            file_data: Loaded and analyzed FileData
+            sheet_name: Sheet the caller requested (the lookup key)
+            parse_seconds: How long the original parse took
+
+        Returns:
+            True if the entry was written
+        """
+        if not self.enabled or file_data is None or file_data.data is None:
+            return False
+
+        key = self.make_key(file_data.filepath, sheet_name)
+        if key is None:
+            return False
+
+        # A file still being written was parsed only up to its last complete line
+        try:
+            if file_data.source_offset and file_data.source_offset != os.path.getsize(file_data.filepath):
+                return False
+        except OSError:
+            return False
+
+        data_path, meta_path = self._entry_paths(key)
+        tmp_path = data_path.with_suffix(f'.{threading.get_ident()}.tmp')
+
+        try:
+            df = file_data.data.reset_index(drop=True)
+            df.columns = [str(col) for col in df.columns]
+            df.to_feather(tmp_path)
+            tmp_path.replace(data_path)
+
+            meta = {
+                'filepath': file_data.filepath,
+                'filename': file_data.filename,
+                'file_size': file_data.file_size,
+                'source_offset': file_data.source_offset,
+                'sheet_name': file_data.sheet_name,
+                'sheet_names': list(file_data.sheets) if file_data.sheets else [],
+                'datetime_formats': file_data.datetime_formats,
+                'parse_seconds': parse_seconds,
+            }
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+
+        except Exception as e:
+            # Mixed-type object columns cannot be stored column-wise - skip them
+            logger.debug(f"Could not cache {file_data.filename}: {e}")
+            self._remove_entry(key)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        self._evict()
+        return True
+
+    def _remove_entry(self, key: str):
+        for path in self._entry_paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Remove least recently used entries until under the size cap"""
+        with self._lock:
+            entries = []
+            total = 0
+            for data_path in self.cache_dir.glob(f"*{self.DATA_SUFFIX}"):
+                try:
+                    stat = data_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, data_path.stem))
+                total += stat.st_size
+
+            entries.sort()
+            while total > self.max_size_bytes and entries:
+                _, size, key = entries.pop(0)
+                self._remove_entry(key)
+                total -= size
+                logger.debug(f"Evicted cache entry {key}")
+
+    def clear(self):
+        """Delete every cache entry and reset the counters"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.suffix in (self.DATA_SUFFIX, self.META_SUFFIX):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.seconds_saved = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current disk usage"""
+        size = 0
+        entries = 0
+        if self.enabled and self.cache_dir.exists():
+            for data_path in self.cache_dir.glob(f"*{self.DATA_SUFFIX}"):
+                try:
+                    size += data_path.stat().st_size
+                    entries += 1
+                except OSError:
+                    pass
+
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'seconds_saved': self.seconds_saved,
+            'entries': entries,
+            'size_bytes': size,
+            'max_size_bytes': self.max_size_bytes
+        }
@@ -12,6 +12,8 @@ from sklearn.linear_model import LinearRegression
 from typing import Tuple, List, Optional, Dict, Any
 import logging
 
+from utils.descriptive import describe
+
 logger = logging.getLogger(__name__)
 
 
@@ -241,22 +243,10 @@ class DataProcessor:
             Dictionary of basic statistics
         """
         try:
-            stats_dict = {
-                "count": len(y_data),
-                "mean": np.mean(y_data),
-                "median": np.median(y_data),
-                "std": np.std(y_data),
-                "var": np.var(y_data),
-                "min": np.min(y_data),
-                "max": np.max(y_data),
-                "range": np.max(y_data) - np.min(y_data),
-                "q1": np.percentile(y_data, 25),
-                "q3": np.percentile(y_data, 75),
-                "skewness": stats.skew(y_data),
-                "kurtosis": stats.kurtosis(y_data)
-            }
-            
-            return stats_dict
+            summary = describe(y_data)
+            return {key: summary[key] for key in
+                    ("count", "mean", "median", "std", "var", "min", "max", "range",
+                     "q1", "q3", "skewness", "kurtosis")}
             
         except Exception as e:
             logger.error(f"Error calculating statistics: {e}")
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+core/decimation.py - Plot Decimation
+Min/max (M4) reduction of long series to what the screen can show
+"""
+
+import logging
+from typing import Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.constants import AppConfig
+
+logger = logging.getLogger(__name__)
+
+# Line-like plot types where dropping hidden points does not change the picture
+DECIMATED_PLOT_TYPES = ('line', 'step')
+
+
+def as_float_array(values: Any) -> np.ndarray:
+    """
+    Numeric view of x or y values for bucketing
+
+    Datetimes become int64 nanoseconds (NaT -> NaN); everything else is
+    coerced to float.
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+        index = pd.DatetimeIndex(values)
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        values = index.values
+
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        out = values.astype('datetime64[ns]').view(np.int64).astype(float)
+        out[np.isnat(values)] = np.nan
+        return out
+    if values.dtype.kind in 'biuf':
+        return values.astype(float, copy=False)
+    return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+
+
+def m4_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Positions of the points to keep after M4 bucketing
+
+    The data is split into n_buckets buckets and the first, last, minimum
+    and maximum point of each is kept, so every spike survives and the
+    drawn line looks the same as the full-resolution one at that width.
+    Buckets span equal x ranges when x is sorted, and equal point counts
+    otherwise.
+
+    Args:
+        x: Float x values (see as_float_array)
+        y: Float y values; NaN gaps are preserved
+        n_buckets: Number of buckets (roughly the pixel width of the axes)
+
+    Returns:
+        Sorted int64 positions into x/y
+    """
+    n = len(y)
+    if n_buckets <= 0 or n <= 4 * n_buckets:
+        return np.arange(n)
+
+    is_sorted = len(x) == n and not np.isnan(x).any() and x[-1] > x[0] and bool(np.all(np.diff(x) >= 0))
+
+    if is_sorted:
+        edges = np.searchsorted(x, np.linspace(x[0], x[-1], n_buckets + 1)[1:-1], side='left')
+        starts = np.unique(np.concatenate(([0], edges)))
+    else:
+        starts = np.unique(np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1])
+    starts = starts[starts < n]
+
+    ends = np.append(starts[1:], n) - 1
+    positions = np.arange(n)
+
+    # NaN-aware extremes per bucket, then the first position that attains each
+    with np.errstate(invalid='ignore'):
+        mins = np.fmin.reduceat(y, starts)
+        maxs = np.fmax.reduceat(y, starts)
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    argmin = np.minimum.reduceat(np.where(y == mins[bucket], positions, n), starts)
+    argmax = np.minimum.reduceat(np.where(y == maxs[bucket], positions, n), starts)
+
+    # All-NaN buckets keep their first point so the gap is still drawn
+    argmin = np.where(argmin == n, starts, argmin)
+    argmax = np.where(argmax == n, starts, argmax)
+
+    keep = np.concatenate((starts, argmin, argmax, ends))
+    return np.unique(keep)
+
+
+def take(values: Any, positions: np.ndarray) -> Any:
+    """Select positions from a Series, array or list, keeping the container type"""
+    if isinstance(values, pd.Series):
+        return values.iloc[positions]
+    return np.asarray(values)[positions]
+
+
+def m4_decimate(x: Any, y: Any, n_buckets: int) -> Tuple[Any, Any]:
+    """
+    Reduce x/y to at most four points per bucket
+
+    Works on numeric and datetime x; the returned values keep the input
+    types (Series stay Series, datetimes stay datetimes).
+    """
+    if len(y) <= 4 * max(n_buckets, 1):
+        return x, y
+
+    positions = m4_indices(as_float_array(x), as_float_array(y), n_buckets)
+    return take(x, positions), take(y, positions)
+
+
+def axes_pixel_width(ax, default: int = 1000) -> int:
+    """Width of an Axes in display pixels"""
+    try:
+        width = int(ax.get_window_extent().width)
+        return width if width > 0 else default
+    except Exception:
+        return default
+
+
+def bucket_count(ax, decimation_factor: int = 1) -> int:
+    """
+    Buckets to use for an Axes
+
+    One bucket per pixel gives 2-4 drawn points per pixel. A
+    decimation_factor above 1 widens each bucket to that many pixels.
+    """
+    return max(1, axes_pixel_width(ax) // max(1, int(decimation_factor or 1)))
+
+
+def should_decimate(series_config, n_points: int) -> bool:
+    """
+    Whether a series should be decimated before drawing
+
+    Series with data_decimation set are always decimated; long line series
+    are decimated automatically above AppConfig.AUTO_DECIMATION_POINTS.
+    """
+    plot_type = getattr(series_config, 'plot_type', 'line') or 'line'
+    if plot_type not in DECIMATED_PLOT_TYPES:
+        return False
+    if getattr(series_config, 'data_decimation', False):
+        return True
+    return n_points > AppConfig.AUTO_DECIMATION_POINTS
+
+
+def decimate_for_axes(x: Any, y: Any, ax, series_config: Optional[Any] = None) -> Tuple[Any, Any]:
+    """
+    Decimate a series for drawing on ax, honouring the series settings
+
+    Returns the input unchanged when decimation is not wanted or would not
+    reduce the point count.
+    """
+    if series_config is not None and not should_decimate(series_config, len(y)):
+        return x, y
+
+    factor = getattr(series_config, 'decimation_factor', 1) if series_config is not None else 1
+    x_out, y_out = m4_decimate(x, y, bucket_count(ax, factor))
+    if len(y_out) < len(y):
+        logger.debug(f"Decimated {len(y)} points to {len(y_out)}")
+    return x_out, y_out
+
+
+class ViewportDecimator:
+    """
+    Re-decimates lines to the visible x-range when an Axes is zoomed or panned
+
+    Each registered line keeps its full-resolution arrays. On every
+    xlim change the visible window is found with a binary search on the
+    sorted x values, only that slice is decimated, and the line's data is
+    replaced in place - the figure is not rebuilt. Zooming far enough in
+    shows every raw point.
+    """
+
+    def __init__(self, ax):
+        """
+        Initialize viewport decimator
+
+        Args:
+            ax: Axes whose x-limit changes trigger re-decimation
+        """
+        self.ax = ax
+        self._lines = []
+        self._callback_id = ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def register(self, line, x: Any, y: Any, decimation_factor: int = 1) -> bool:
+        """
+        Track a decimated line
+
+        Args:
+            line: Line2D currently drawn with decimated data
+            x: Full-resolution x values (numeric or datetime)
+            y: Full-resolution y values
+            decimation_factor: Pixels per bucket (see bucket_count)
+
+        Returns:
+            True if the line will be re-decimated on zoom; lines with
+            unsorted x cannot be windowed and are left as drawn
+        """
+        if isinstance(x, (pd.Series, pd.Index)) and isinstance(x.dtype, pd.DatetimeTZDtype):
+            # Matplotlib plots aware datetimes in UTC - keep the same instants
+            x = pd.DatetimeIndex(x).tz_convert(None)
+        x_values = x.to_numpy() if isinstance(x, (pd.Series, pd.Index)) else np.asarray(x)
+        y_values = as_float_array(y)
+
+        # Window lookups happen in axis units (matplotlib date numbers for datetimes)
+        x_units = np.asarray(self.ax.convert_xunits(x_values), dtype=float) \
+            if np.issubdtype(x_values.dtype, np.datetime64) else as_float_array(x_values)
+
+        if len(x_units) < 2 or np.isnan(x_units).any() or np.any(np.diff(x_units) < 0):
+            return False
+
+        self._lines.append({
+            'line': line,
+            'x': x_values,
+            'y': y_values,
+            'x_units': x_units,
+            'factor': decimation_factor,
+            'window': None
+        })
+        return True
+
+    def extend(self, line, x: Any, y: Any) -> bool:
+        """
+        Append points to a tracked line (e.g. rows added to a followed file)
+
+        The full-resolution arrays grow and the line is re-decimated. A
+        view that reached the old last point is widened to the new one.
+
+        Returns:
+            False if the line is not tracked or x would no longer be sorted;
+            the caller should re-plot it
+        """
+        entry = next((e for e in self._lines if e['line'] is line), None)
+        if entry is None:
+            return False
+
+        if isinstance(x, (pd.Series, pd.Index)) and isinstance(x.dtype, pd.DatetimeTZDtype):
+            x = pd.DatetimeIndex(x).tz_convert(None)
+        x_values = x.to_numpy() if isinstance(x, (pd.Series, pd.Index)) else np.asarray(x)
+        if len(x_values) == 0:
+            return True
+        x_units = np.asarray(self.ax.convert_xunits(x_values), dtype=float) \
+            if np.issubdtype(x_values.dtype, np.datetime64) else as_float_array(x_values)
+        if np.isnan(x_units).any() or np.any(np.diff(x_units) < 0) or x_units[0] < entry['x_units'][-1]:
+            return False
+
+        lo, hi = sorted(self.ax.get_xlim())
+        if hi >= entry['x_units'][-1]:
+            hi = x_units[-1]
+        entry['x'] = np.concatenate((entry['x'], x_values))
+        entry['y'] = np.concatenate((entry['y'], as_float_array(y)))
+        entry['x_units'] = np.concatenate((entry['x_units'], x_units))
+        entry['window'] = None
+        self._update_line(entry, lo, hi)
+        return True
+
+    def is_tracked(self, line) -> bool:
+        """True if a line is re-decimated on zoom"""
+        return any(entry['line'] is line for entry in self._lines)
+
+    def _on_xlim_changed(self, ax):
+        lo, hi = sorted(ax.get_xlim())
+        for entry in self._lines:
+            try:
+                self._update_line(entry, lo, hi)
+            except Exception as e:
+                logger.debug(f"Viewport re-decimation failed: {e}")
+
+    def _update_line(self, entry: dict, lo: float, hi: float):
+        x_units = entry['x_units']
+        n = len(x_units)
+
+        # One extra point on each side so the line runs to the axes edges
+        start = max(0, int(np.searchsorted(x_units, lo, side='left')) - 1)
+        stop = min(n, int(np.searchsorted(x_units, hi, side='right')) + 1)
+        n_buckets = bucket_count(self.ax, entry['factor'])
+
+        window = (start, stop, n_buckets)
+        if window == entry['window']:
+            return
+        entry['window'] = window
+
+        positions = start + m4_indices(x_units[start:stop], entry['y'][start:stop], n_buckets)
+        entry['line'].set_data(entry['x'][positions], entry['y'][positions])
+
+    def unregister(self, artists):
+        """Stop tracking the given lines (e.g. after they were removed)"""
+        artist_ids = {id(artist) for artist in artists}
+        self._lines = [entry for entry in self._lines if id(entry['line']) not in artist_ids]
+
+    def clear(self):
+        """Stop tracking lines"""
+        self._lines.clear()
+
+    def disconnect(self):
+        """Detach from the Axes"""
+        self.ax.callbacks.disconnect(self._callback_id)
+        self._lines.clear()
+
+    def __len__(self) -> int:
+        return len(self._lines)
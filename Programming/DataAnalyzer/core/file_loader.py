@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+core/file_loader.py - Background File Loader
+Parses data files in worker pools and hands results back to the Tk main loop
+"""
+
+import os
+import queue
+import time
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, List, Callable, Tuple, Any
+
+import pandas as pd
+
+from models.data_models import FileData
+from core.file_manager import FileManager, LoadCancelled
+
+logger = logging.getLogger(__name__)
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xls', '.xlsm', '.xlsb')
+TEXT_EXTENSIONS = ('.csv', '.tsv', '.txt')
+
+# Interval (ms) at which the Tk main loop drains worker results
+POLL_INTERVAL_MS = 50
+
+
+def _load_path(file_manager: FileManager, filepath: str,
+               progress_callback=None, cancel_event=None) -> FileData:
+    """
+    Load a single file, falling back to a plain pandas read
+
+    Raises on failure so the error text reaches the UI.
+    """
+    file_data = file_manager.load_file(filepath, progress_callback=progress_callback,
+                                       cancel_event=cancel_event)
+    if file_data is not None:
+        return file_data
+
+    # FileManager logs and swallows errors - repeat its checks and retry
+    # directly so the caller gets either data or the underlying error
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    if path.stat().st_size > file_manager.max_file_size:
+        raise ValueError(f"File too large: {path.stat().st_size / 1024 ** 2:.0f} MB "
+                         f"(limit {file_manager.max_file_size / 1024 ** 2:.0f} MB)")
+
+    ext = path.suffix.lower()
+    if ext in EXCEL_EXTENSIONS:
+        df = pd.read_excel(filepath)
+    elif ext in TEXT_EXTENSIONS:
+        df = pd.read_csv(filepath, delimiter=FileManager._detect_delimiter(filepath))
+    else:
+        raise ValueError(f"Unsupported file type: {ext or path.name}")
+
+    return FileData(filepath=filepath, data=df, filename=os.path.basename(filepath))
+
+
+def _parse_in_process(filepath: str) -> Tuple[FileData, float]:
+    """
+    Parse a file in a worker process without touching the cache
+
+    Module level so it can be pickled for the process pool.
+    """
+    start = time.perf_counter()
+    file_data = _load_path(FileManager(), filepath)
+    return file_data, time.perf_counter() - start
+
+
+class LoadJob:
+    """Tracks one batch of files submitted to the BackgroundFileLoader"""
+
+    def __init__(self, filepaths: List[str]):
+        self.filepaths = list(filepaths)
+        self.cancel_event = threading.Event()
+        self.results: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        self.futures: Dict[Future, str] = {}
+        self.file_progress: Dict[str, float] = {path: 0.0 for path in self.filepaths}
+        self.loaded: List[FileData] = []
+        self.errors: List[Tuple[str, str]] = []
+        self.finished = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.filepaths)
+
+    @property
+    def done(self) -> bool:
+        return self.finished >= self.total
+
+    @property
+    def progress(self) -> float:
+        """Overall progress across all files (0-1)"""
+        if not self.file_progress:
+            return 1.0
+        return sum(self.file_progress.values()) / len(self.file_progress)
+
+    def cancel(self):
+        """Request cancellation of every file that has not finished yet"""
+        self.cancel_event.set()
+        for future in self.futures:
+            future.cancel()
+
+
+class BackgroundFileLoader:
+    """
+    Loads files off the UI thread
+
+    CSV files are parsed on a thread pool (pandas releases the GIL while
+    tokenising) and Excel workbooks on a process pool, since openpyxl parsing
+    is pure Python. Worker results are queued and drained on the Tk main loop
+    via ``after()``, so callbacks always run on the UI thread.
+    """
+
+    def __init__(self, file_manager: Optional[FileManager] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize background loader
+
+        Args:
+            file_manager: FileManager (and its cache) used for loading
+            max_workers: Worker count per pool (defaults to the CPU count)
+        """
+        self.file_manager = file_manager or FileManager()
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._use_processes = True
+        self._active_jobs: List[LoadJob] = []
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="file-loader")
+        return self._thread_pool
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        if not self._use_processes:
+            return None
+        if self._process_pool is None:
+            try:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, loading Excel on threads: {e}")
+                self._use_processes = False
+                return None
+        return self._process_pool
+
+    def load_files(self, filepaths: List[str], tk_widget,
+                   on_loaded: Callable[[FileData], None],
+                   on_complete: Callable[[LoadJob], None],
+                   on_progress: Optional[Callable[[LoadJob], None]] = None) -> LoadJob:
+        """
+        Start loading files in the background
+
+        Args:
+            filepaths: Files to load
+            tk_widget: Any Tk widget, used to schedule callbacks with after()
+            on_loaded: Called on the UI thread with each FileData as it finishes
+            on_complete: Called on the UI thread once every file has finished
+            on_progress: Called on the UI thread when overall progress changes
+
+        Returns:
+            LoadJob that can be used to cancel the batch
+        """
+        job = LoadJob(filepaths)
+        self._active_jobs.append(job)
+
+        for filepath in job.filepaths:
+            self._submit(job, filepath)
+
+        tk_widget.after(POLL_INTERVAL_MS, self._poll, job, tk_widget,
+                        on_loaded, on_complete, on_progress)
+        return job
+
+    def _submit(self, job: LoadJob, filepath: str):
+        """Submit one file to the worker threads"""
+        if Path(filepath).suffix.lower() in EXCEL_EXTENSIONS:
+            future = self._get_thread_pool().submit(self._load_excel, filepath, job.cancel_event)
+        else:
+            def report_progress(fraction, path=filepath):
+                job.results.put(('progress', path, fraction))
+
+            future = self._get_thread_pool().submit(_load_path, self.file_manager, filepath,
+                                                    report_progress, job.cancel_event)
+
+        job.futures[future] = filepath
+        future.add_done_callback(lambda f, path=filepath: self._on_future_done(job, path, f))
+
+    def _load_excel(self, filepath: str, cancel_event: threading.Event) -> FileData:
+        """
+        Load a workbook, parsing it in a worker process on a cache miss
+
+        Runs on a loader thread; the cache is only read and written from this
+        process so its counters stay accurate.
+        """
+        cache = self.file_manager.data_cache
+        if cache is not None:
+            cached = cache.get(filepath)
+            if cached is not None:
+                return cached
+
+        if cancel_event.is_set():
+            raise LoadCancelled(f"Loading cancelled: {os.path.basename(filepath)}")
+
+        pool = self._get_process_pool()
+        if pool is not None:
+            try:
+                file_data, parse_seconds = pool.submit(_parse_in_process, filepath).result()
+                if cache is not None:
+                    cache.put(file_data, parse_seconds=parse_seconds)
+                return file_data
+            except BrokenProcessPool as e:
+                logger.warning(f"Process pool broken, loading Excel on threads: {e}")
+                self._use_processes = False
+                self._process_pool = None
+
+        return _load_path(self.file_manager, filepath, cancel_event=cancel_event)
+
+    @staticmethod
+    def _on_future_done(job: LoadJob, filepath: str, future: Future):
+        """Runs on the worker side - only touches the thread-safe queue"""
+        if future.cancelled():
+            job.results.put(('cancelled', filepath, None))
+            return
+
+        error = future.exception()
+        if error is None:
+            job.results.put(('loaded', filepath, future.result()))
+        elif isinstance(error, LoadCancelled):
+            job.results.put(('cancelled', filepath, None))
+        else:
+            job.results.put(('error', filepath, str(error)))
+
+    def _poll(self, job: LoadJob, tk_widget, on_loaded, on_complete, on_progress):
+        """Drain queued worker results on the UI thread"""
+        progress_changed = False
+
+        while True:
+            try:
+                kind, filepath, payload = job.results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                job.file_progress[filepath] = payload
+                progress_changed = True
+                continue
+
+            job.finished += 1
+            job.file_progress[filepath] = 1.0
+            progress_changed = True
+
+            if kind == 'loaded' and job.cancel_event.is_set():
+                # Finished after the user cancelled - drop it
+                continue
+            elif kind == 'loaded':
+                job.loaded.append(payload)
+                try:
+                    on_loaded(payload)
+                except Exception as e:
+                    logger.error(f"Failed to register {filepath}: {e}")
+                    job.errors.append((filepath, str(e)))
+            elif kind == 'error':
+                logger.error(f"Failed to load {filepath}: {payload}")
+                job.errors.append((filepath, payload))
+
+        if progress_changed and on_progress:
+            on_progress(job)
+
+        if job.done:
+            if job in self._active_jobs:
+                self._active_jobs.remove(job)
+            on_complete(job)
+        else:
+            try:
+                tk_widget.after(POLL_INTERVAL_MS, self._poll, job, tk_widget,
+                                on_loaded, on_complete, on_progress)
+            except Exception:
+                # Window was destroyed while loading
+                job.cancel()
+
+    @property
+    def is_busy(self) -> bool:
+        """True while any batch is still loading"""
+        return bool(self._active_jobs)
+
+    def shutdown(self):
+        """Cancel outstanding loads and stop the worker pools"""
+        for job in self._active_jobs:
+            job.cancel()
+        self._active_jobs.clear()
+
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False)
+        self._thread_pool = None
+        self._process_pool = None
@@ -6,17 +6,150 @@ Handles file operations including loading Excel/CSV files
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Tuple, Callable, Iterator, Mapping
+from collections import OrderedDict
 import logging
+import threading
+import io
+import time
 import uuid
 from tkinter import filedialog
 import os
 
 from models.data_models import FileData
-from config.constants import FileTypes
+from config.constants import AppConfig, FileTypes
+from utils.type_inference import convert_text_columns
 
 logger = logging.getLogger(__name__)
 
+# Progress callbacks receive the fraction of the file consumed so far (0-1)
+ProgressCallback = Callable[[float], None]
+
+
+class LoadCancelled(Exception):
+    """Raised when the user cancels a file load in progress"""
+
+
+def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Ensure column names are strings to prevent integer column issues"""
+    df.columns = [str(col) if col is not None else f"Unnamed_{i}" for i, col in enumerate(df.columns)]
+    return df
+
+
+class LazySheetMapping(Mapping):
+    """
+    Read-only mapping of sheet name to DataFrame that parses sheets on demand
+
+    Only sheet names are read when a workbook is opened. Each sheet is parsed
+    the first time it is accessed and kept in a small LRU cache, so a
+    workbook with dozens of sheets costs one parse until others are needed.
+    Text columns holding numbers or datetimes are converted as each sheet is
+    parsed, the same way FileData.analyze_data converts the main sheet.
+
+    The workbook is not kept open between parses (an open handle locks the
+    file on Windows); a sheet missing from the cache reopens it.
+    """
+
+    def __init__(self, filepath: str, sheet_names: List[str],
+                 max_cached: int = AppConfig.SHEET_CACHE_SIZE,
+                 excel_file: Optional[pd.ExcelFile] = None):
+        """
+        Initialize lazy sheet mapping
+
+        Args:
+            filepath: Path to the workbook
+            sheet_names: Sheet names in workbook order
+            max_cached: Number of parsed sheets to keep in memory
+            excel_file: Already open workbook handle to use until
+                release_workbook() is called
+        """
+        self.filepath = filepath
+        self.sheet_names = list(sheet_names)
+        self.max_cached = max(1, max_cached)
+        self._excel_file = excel_file
+        self._cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self.sheet_names:
+            raise KeyError(name)
+
+        with self._lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                return self._cache[name]
+
+            if self._excel_file is not None:
+                df = pd.read_excel(self._excel_file, sheet_name=name)
+            else:
+                with pd.ExcelFile(self.filepath) as excel_file:
+                    df = pd.read_excel(excel_file, sheet_name=name)
+            df = normalize_column_names(df)
+            convert_text_columns(df)
+            logger.debug(f"Parsed sheet '{name}' with columns: {list(df.columns)}")
+
+            self._cache[name] = df
+            while len(self._cache) > self.max_cached:
+                evicted, _ = self._cache.popitem(last=False)
+                logger.debug(f"Evicted sheet '{evicted}' from cache")
+            return df
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.sheet_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sheet_names)
+
+    def __len__(self) -> int:
+        return len(self.sheet_names)
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a sheet is currently parsed and cached"""
+        return name in self._cache
+
+    def release_workbook(self):
+        """Close the workbook handle; later cache misses reopen the file"""
+        with self._lock:
+            if self._excel_file is not None:
+                self._excel_file.close()
+                self._excel_file = None
+
+    def close(self):
+        """Release the workbook handle and cached sheets"""
+        with self._lock:
+            self._cache.clear()
+        self.release_workbook()
+
+    def __getstate__(self):
+        # Workbook handles and parsed sheets are not carried across
+        # pickling (worker processes, project files) - re-read on demand
+        state = self.__dict__.copy()
+        state['_excel_file'] = None
+        state['_cache'] = OrderedDict()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+class _BoundedReader(io.RawIOBase):
+    """Binary file handle that ends at a byte limit"""
+
+    def __init__(self, handle, limit: int):
+        self._handle = handle
+        self._limit = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        remaining = self._limit - self._handle.tell()
+        if remaining <= 0:
+            return 0
+        return self._handle.readinto(memoryview(buffer)[:remaining])
+
 
 class FileManager:
     """
@@ -24,21 +157,34 @@ class FileManager:
     Handles loading, validating, and processing data files
     """
 
-    def __init__(self):
-        """Initialize file manager"""
+    def __init__(self, data_cache=None):
+        """
+        Initialize file manager
+
+        Args:
+            data_cache: Optional DataCache consulted before parsing files
+        """
         self.supported_extensions = ['.xlsx', '.xls', '.xlsm', '.xlsb', '.csv', '.tsv', '.txt']
         self.max_file_size = 500 * 1024 * 1024  # 500 MB
+        self.data_cache = data_cache
 
-    def load_file(self, filepath: str, sheet_name: Optional[str] = None) -> Optional[FileData]:
+    def load_file(self, filepath: str, sheet_name: Optional[str] = None,
+                  progress_callback: Optional[ProgressCallback] = None,
+                  cancel_event: Optional[threading.Event] = None) -> Optional[FileData]:
         """
         Load a data file
 
         Args:
             filepath: Path to the file
             sheet_name: Specific sheet for Excel files
+            progress_callback: Called with the fraction loaded (0-1) while streaming
+            cancel_event: Set this event to abort a streaming load
 
         Returns:
             FileData object if successful, None otherwise
+
+        Raises:
+            LoadCancelled: If cancel_event was set during the load
         """
         try:
             path = Path(filepath)
@@ -52,19 +198,34 @@ class FileManager:
                 logger.error(f"File too large: {filepath}")
                 return None
 
+            # Reuse a previous parse of the same file if it is cached
+            if self.data_cache is not None:
+                cached = self.data_cache.get(filepath, sheet_name)
+                if cached is not None:
+                    if progress_callback:
+                        progress_callback(1.0)
+                    return cached
+
             # Determine file type and load
             ext = path.suffix.lower()
+            parse_start = time.perf_counter()
 
             if ext in ['.xlsx', '.xls', '.xlsm', '.xlsb']:
                 file_data = self.load_excel_file(filepath, sheet_name)
             elif ext in ['.csv', '.tsv', '.txt']:
-                file_data = self.load_csv_file(filepath)
+                file_data = self.load_csv_file(filepath, progress_callback=progress_callback,
+                                               cancel_event=cancel_event)
             else:
                 logger.error(f"Unsupported file type: {ext}")
                 return None
 
+            if file_data is not None and self.data_cache is not None:
+                self.data_cache.put(file_data, sheet_name, time.perf_counter() - parse_start)
+
             return file_data
 
+        except LoadCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to load file {filepath}: {e}")
             return None
@@ -84,45 +245,33 @@ class FileManager:
             path = Path(filepath)
             logger.info(f"Loading Excel file: {path}")
 
-            # Read Excel file
+            # Open the workbook - only sheet names are read at this point
             excel_file = pd.ExcelFile(filepath)
+            sheets = LazySheetMapping(str(path), excel_file.sheet_names, excel_file=excel_file)
+            main_df = None
 
-            # Get all sheets
-            sheets = {}
-
-            if sheet_name:
-                # Load specific sheet
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                # Immediately ensure column names are strings to prevent integer column issues
-                df.columns = [str(col) if col is not None else f"Unnamed_{i}" for i, col in enumerate(df.columns)]
-                sheets[sheet_name] = df
-                main_df = df
-                logger.debug(f"Loaded specific sheet '{sheet_name}' with columns: {list(df.columns)}")
-            else:
-                # Load all sheets with improved error handling
-                for name in excel_file.sheet_names:
-                    try:
-                        sheet_df = pd.read_excel(excel_file, sheet_name=name)
-                        # Ensure column names are strings and handle None/NaN columns
-                        sheet_df.columns = [str(col) if col is not None else f"Unnamed_{i}" for i, col in enumerate(sheet_df.columns)]
-                        sheets[name] = sheet_df
-                        logger.debug(f"Successfully loaded sheet '{name}' with columns: {list(sheet_df.columns)}")
-                    except Exception as sheet_error:
-                        logger.warning(f"Failed to load sheet '{name}': {sheet_error}")
-                        continue
-
-                # Use first successfully loaded sheet as main dataframe
-                if sheets:
-                    main_df = list(sheets.values())[0]
-                    logger.info(f"Using sheet '{list(sheets.keys())[0]}' as main dataframe")
+            try:
+                if sheet_name:
+                    # Load specific sheet
+                    main_df = sheets[sheet_name]
                 else:
-                    logger.error("No sheets could be loaded from Excel file")
-                    return None
-
-            # Double-check main dataframe column names are strings
-            if main_df is not None:
-                main_df.columns = [str(col) if col is not None else f"Unnamed_{i}" for i, col in enumerate(main_df.columns)]
-                logger.debug(f"Final main dataframe columns: {list(main_df.columns)}")
+                    # Parse sheets in order until one loads successfully
+                    for name in excel_file.sheet_names:
+                        try:
+                            main_df = sheets[name]
+                            sheet_name = name
+                            logger.info(f"Using sheet '{name}' as main dataframe")
+                            break
+                        except Exception as sheet_error:
+                            logger.warning(f"Failed to load sheet '{name}': {sheet_error}")
+                            continue
+            finally:
+                # Other sheets reopen the workbook when first accessed
+                sheets.release_workbook()
+
+            if main_df is None:
+                logger.error("No sheets could be loaded from Excel file")
+                return None
 
             # Create FileData object
             file_data = FileData(
@@ -133,9 +282,9 @@ class FileManager:
             
             # Set additional properties
             file_data.file_size = path.stat().st_size
-            file_data.sheet_name = sheet_name or excel_file.sheet_names[0]
-            
-            # Store sheets info (if needed for future use)
+            file_data.sheet_name = sheet_name
+
+            # Remaining sheets are parsed on first access
             file_data.sheets = sheets
 
             logger.info(f"Successfully loaded Excel file: {path.name} with {len(sheets)} sheet(s)")
@@ -145,40 +294,71 @@ class FileManager:
             logger.error(f"Failed to load Excel file: {e}")
             return None
 
-            logger.info(f"Loaded Excel file: {path.name} with {len(sheets)} sheet(s)")
-            return file_data
-
-        except Exception as e:
-            logger.error(f"Failed to load Excel file: {e}")
-            return None
-
-    def load_csv_file(self, filepath: str) -> Optional[FileData]:
+    def load_csv_file(self, filepath: str,
+                      progress_callback: Optional[ProgressCallback] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      chunk_size: Optional[int] = None) -> Optional[FileData]:
         """
-        Load a CSV file
+        Load a CSV file in row chunks
+
+        The file is streamed in chunks of ``chunk_size`` rows so progress can be
+        reported and the load cancelled between chunks. Text columns that hold
+        numbers are converted per chunk, and each chunk is split into
+        independent columns that are concatenated one column at a time at the
+        end, so peak memory stays close to the size of the final frame plus
+        one column rather than twice the frame.
 
         Args:
             filepath: Path to CSV file
+            progress_callback: Called with the fraction of bytes consumed (0-1)
+            cancel_event: Set this event to abort the load between chunks
+            chunk_size: Rows per chunk (defaults to AppConfig.CHUNK_SIZE)
 
         Returns:
             FileData object if successful
+
+        Raises:
+            LoadCancelled: If cancel_event was set during the load
         """
         try:
             path = Path(filepath)
+            chunk_size = chunk_size or AppConfig.CHUNK_SIZE
+
+            delimiter = self._detect_delimiter(filepath)
+
+            # Parse only up to the last complete line: a file that is still
+            # being written may end mid-value, and follow mode resumes there
+            source_offset = self._complete_lines_end(filepath)
+            total_bytes = max(source_offset, 1)
+            column_parts: Dict[str, List[pd.Series]] = {}
+            n_chunks = 0
+
+            # Read CSV in chunks, reporting progress from the handle position
+            with open(filepath, 'rb') as raw:
+                handle = io.BufferedReader(_BoundedReader(raw, source_offset))
+                reader = pd.read_csv(handle, delimiter=delimiter, chunksize=chunk_size)
+                for chunk in reader:
+                    if cancel_event is not None and cancel_event.is_set():
+                        reader.close()
+                        raise LoadCancelled(f"Loading cancelled: {path.name}")
+
+                    # Copy columns out so each chunk's 2D blocks are freed now
+                    chunk = self._convert_chunk_dtypes(chunk)
+                    for col in chunk.columns:
+                        column_parts.setdefault(col, []).append(chunk[col].copy())
+                    del chunk
+                    n_chunks += 1
+
+                    if progress_callback:
+                        progress_callback(min(raw.tell() / total_bytes, 1.0))
+
+            if column_parts:
+                df = pd.DataFrame(self._join_column_parts(column_parts), copy=False)
+            else:
+                df = pd.read_csv(filepath, delimiter=delimiter, nrows=0)
 
-            # Try to detect delimiter
-            with open(filepath, 'r') as f:
-                first_line = f.readline()
-                if '\t' in first_line:
-                    delimiter = '\t'
-                elif ',' in first_line:
-                    delimiter = ','
-                elif ';' in first_line:
-                    delimiter = ';'
-                else:
-                    delimiter = ','
-
-            # Read CSV
-            df = pd.read_csv(filepath, delimiter=delimiter)
+            if progress_callback:
+                progress_callback(1.0)
 
             # Create FileData object
             file_data = FileData(
@@ -188,15 +368,127 @@ class FileManager:
             )
             
             # Set additional properties
-            file_data.file_size = path.stat().st_size
+            file_data.file_size = source_offset
+            file_data.source_offset = source_offset
 
-            logger.info(f"Loaded CSV file: {path.name} with {len(df)} rows")
+            logger.info(f"Loaded CSV file: {path.name} with {len(df)} rows in {n_chunks} chunk(s)")
             return file_data
 
+        except LoadCancelled:
+            logger.info(f"Cancelled loading CSV file: {filepath}")
+            raise
         except Exception as e:
             logger.error(f"Failed to load CSV file: {e}")
             return None
 
+    @staticmethod
+    def _join_column_parts(column_parts: Dict[str, List[pd.Series]]) -> Dict[str, pd.Series]:
+        """
+        Concatenate per-chunk pieces column by column
+
+        Each column's pieces are released as soon as it is joined, so only
+        one column exists twice at any time.
+        """
+        columns = {}
+        for col in list(column_parts):
+            parts = column_parts.pop(col)
+            columns[col] = (pd.concat(parts, ignore_index=True) if len(parts) > 1
+                            else parts[0].reset_index(drop=True))
+            del parts
+        return columns
+
+    @staticmethod
+    def _complete_lines_end(filepath: str, block_size: int = 65536) -> int:
+        """
+        Byte offset just past the last newline of a file
+
+        A file without any newline (a lone header) is taken whole.
+        """
+        with open(filepath, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            position = size
+            while position > 0:
+                start = max(0, position - block_size)
+                f.seek(start)
+                cut = f.read(position - start).rfind(b'\n')
+                if cut >= 0:
+                    return start + cut + 1
+                position = start
+        return size
+
+    @staticmethod
+    def _detect_delimiter(filepath: str) -> str:
+        """Guess the delimiter of a delimited text file from its first line"""
+        with open(filepath, 'r') as f:
+            first_line = f.readline()
+        if '\t' in first_line:
+            return '\t'
+        elif ',' in first_line:
+            return ','
+        elif ';' in first_line:
+            return ';'
+        return ','
+
+    def open_tail(self, filepath: str, from_start: bool = False) -> Optional['CsvTailReader']:
+        """
+        Open a reader for rows appended to a CSV file
+
+        Args:
+            filepath: Path to the CSV file
+            from_start: Read the existing rows on the first call instead of
+                only rows appended after this point
+
+        Returns:
+            CsvTailReader, or None if the file cannot be read
+        """
+        try:
+            return CsvTailReader(filepath, self._detect_delimiter(filepath), from_start=from_start)
+        except Exception as e:
+            logger.error(f"Failed to open {filepath} for tailing: {e}")
+            return None
+
+    def start_following(self, file_data: FileData) -> bool:
+        """
+        Put a loaded CSV file into follow mode
+
+        Rows past the bytes the load parsed (FileData.source_offset),
+        including any written while it ran, are appended by
+        FileData.poll_follow().
+
+        Returns:
+            True if the file is now followed
+        """
+        if Path(file_data.filepath).suffix.lower() not in ('.csv', '.tsv', '.txt'):
+            logger.warning(f"Follow mode only supports delimited text files: {file_data.filename}")
+            return False
+
+        try:
+            offset = file_data.source_offset or file_data.file_size or None
+            reader = CsvTailReader(file_data.filepath, self._detect_delimiter(file_data.filepath),
+                                   offset=offset)
+        except Exception as e:
+            logger.error(f"Failed to follow {file_data.filepath}: {e}")
+            return False
+
+        file_data.start_follow(reader)
+        logger.info(f"Following {file_data.filename} from byte {reader.offset}")
+        return True
+
+    @staticmethod
+    def _convert_chunk_dtypes(chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert numeric-looking text columns of a single chunk
+
+        Mirrors the numeric rule in FileData.analyze_data: a text column becomes
+        numeric when at least one value parses. Chunks that disagree are
+        concatenated as object and resolved over the full column afterwards.
+        """
+        for col in chunk.select_dtypes(include=['object', 'string']).columns:
+            numeric = pd.to_numeric(chunk[col], errors='coerce')
+            if numeric.notna().any():
+                chunk[col] = numeric
+        return chunk
+
     def save_dataframe(self, df: pd.DataFrame, filepath: str, **kwargs):
         """
         Save a dataframe to file
@@ -332,3 +624,105 @@ class FileManager:
 
         except Exception as e:
             return False, str(e)
+
+
+class CsvTailReader:
+    """
+    Reads the rows appended to a CSV file since the previous read
+
+    Only bytes past the stored offset are read and parsed. A trailing line
+    without a newline is still being written, so it is left for the next
+    read rather than parsed half-finished. If the file is replaced (new
+    inode) or truncated below the offset, it is treated as rotated and read
+    again from just after its header.
+    """
+
+    def __init__(self, filepath: str, delimiter: str = ',', from_start: bool = False,
+                 offset: Optional[int] = None):
+        """
+        Initialize tail reader
+
+        Args:
+            filepath: Path to the CSV file (first line is the header)
+            delimiter: Field delimiter
+            from_start: Start after the header instead of at the current end
+            offset: Byte offset to continue from (e.g. the size the file had
+                when it was loaded); a position inside a line skips to the
+                next line
+        """
+        self.filepath = str(filepath)
+        self.delimiter = delimiter
+        self.rotations = 0
+
+        stat = os.stat(self.filepath)
+        self._inode = stat.st_ino
+        self._read_header()
+
+        if offset is not None:
+            self.offset = self._align(max(offset, self.header_end))
+        else:
+            self.offset = self.header_end if from_start else self._align(stat.st_size)
+
+    def _read_header(self):
+        with open(self.filepath, 'rb') as f:
+            header = f.readline()
+            self.header_end = f.tell()
+        self.columns = list(pd.read_csv(io.BytesIO(header), sep=self.delimiter, nrows=0).columns)
+
+    def _align(self, offset: int) -> int:
+        """Move an offset inside a line to the start of the next line"""
+        if offset <= self.header_end:
+            return self.header_end
+        with open(self.filepath, 'rb') as f:
+            f.seek(offset - 1)
+            if f.read(1) == b'\n':
+                return offset
+            rest = f.readline()
+        # No newline yet: the line is still being written past the end
+        return offset + len(rest) if rest.endswith(b'\n') else offset
+
+    def _check_rotation(self, stat: os.stat_result) -> bool:
+        """Start over on a replaced or truncated file"""
+        if stat.st_ino == self._inode and stat.st_size >= self.offset:
+            return False
+
+        logger.info(f"{self.filepath} was rotated or truncated - reading it from the start")
+        self._inode = stat.st_ino
+        self._read_header()
+        self.offset = self.header_end
+        self.rotations += 1
+        return True
+
+    def read_new(self) -> Optional[pd.DataFrame]:
+        """
+        Parse complete rows added since the last call
+
+        Returns:
+            DataFrame with the file's columns, or None if nothing new
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            # Between removing the old file and creating the new one
+            return None
+
+        self._check_rotation(stat)
+        size = stat.st_size
+        if size <= self.offset:
+            return None
+
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+
+        # Keep any unfinished last line for the next read
+        cut = data.rfind(b'\n')
+        if cut < 0:
+            return None
+        self.offset += cut + 1
+
+        rows = pd.read_csv(io.BytesIO(data[:cut + 1]), sep=self.delimiter, header=None,
+                           names=self.columns, skip_blank_lines=True)
+        if rows.empty:
+            return None
+        return FileManager._convert_chunk_dtypes(rows)
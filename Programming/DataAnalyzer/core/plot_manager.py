@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from config.constants import PlotTypes, MissingDataMethods, TrendTypes
 from models.data_models import SeriesConfig, PlotConfiguration, FileData
 from core.data_utils import DataProcessor, DataValidator
+from core.decimation import decimate_for_axes
 
 logger = logging.getLogger(__name__)
 
@@ -201,9 +202,10 @@ class PlotManager:
         """Get data arrays for a series"""
         try:
             # Get data slice
+            source_df = file_data.get_sheet_data(series_config.sheet_name)
             start_idx = series_config.start_index or 0
-            end_idx = series_config.end_index or len(file_data.data)
-            data_slice = file_data.data.iloc[start_idx:end_idx]
+            end_idx = series_config.end_index or len(source_df)
+            data_slice = source_df.iloc[start_idx:end_idx]
             
             # Get X data
             if series_config.x_column == "Index":
@@ -252,6 +254,9 @@ class PlotManager:
             plot_type = series_config.plot_type or "line"
             color = series_config.color or self._get_next_color()
             label = series_config.name if self.show_legend else ""
+
+            # Draw long lines decimated; spikes are kept by min/max bucketing
+            x_data, y_data = decimate_for_axes(x_data, y_data, self.axes, series_config)
             
             if plot_type == "line":
                 line = self.axes.plot(
@@ -513,9 +518,12 @@ class PlotManager:
             plot_obj = None
             plot_type = series_config.plot_type.lower()
 
+            # Long lines are drawn decimated; the trend line still uses all points
+            x_draw, y_draw = decimate_for_axes(x_data, y_data, ax, series_config)
+
             if plot_type == "line":
                 plot_obj = ax.plot(
-                    x_data, y_data,
+                    x_draw, y_draw,
                     color=series_config.color,
                     linestyle=series_config.line_style,
                     linewidth=series_config.line_width,
@@ -564,7 +572,7 @@ class PlotManager:
 
             elif plot_type == "step":
                 plot_obj = ax.step(
-                    x_data, y_data,
+                    x_draw, y_draw,
                     color=series_config.color,
                     linewidth=series_config.line_width,
                     alpha=series_config.alpha,
@@ -636,7 +644,7 @@ class PlotManager:
             Tuple of (x_data, y_data) or (None, None) if error
         """
         try:
-            df = file_data.data
+            df = file_data.get_sheet_data(series_config.sheet_name)
 
             # Apply row range if specified
             start_row = series_config.start_row if series_config.start_row is not None else 0
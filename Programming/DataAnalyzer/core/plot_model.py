@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+core/plot_model.py - Retained Plot Model
+Tracks the artists drawn for each series so plots can be updated in place
+"""
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Hashable, Set
+
+import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.collections import Collection
+
+logger = logging.getLogger(__name__)
+
+# SeriesConfig fields that only change how existing artists look
+STYLE_KEYS = {
+    'color', 'line_style', 'line_width', 'marker', 'marker_size', 'alpha',
+    'visible', 'show_in_legend', 'legend_label', 'z_order'
+}
+
+# Style fields that also apply to a series' secondary artists (trend lines)
+SHARED_STYLE_KEYS = {'color', 'visible'}
+
+NEW = 'new'
+UNCHANGED = 'unchanged'
+STYLE = 'style'
+DATA = 'data'
+
+
+@dataclass
+class PlottedSeries:
+    """Artists drawn for one series and the settings they were drawn with"""
+    series_id: str
+    config: Dict[str, Any]
+    artists: List[Any] = field(default_factory=list)
+    data_key: Optional[Hashable] = None
+
+    @property
+    def primary(self) -> Optional[Any]:
+        """The series' main line or scatter collection"""
+        return self.artists[0] if self.artists else None
+
+
+class RetainedPlotModel:
+    """
+    Retained-mode record of a plotted Axes keyed by series id
+
+    After a full build every series' artists are recorded together with a
+    snapshot of its SeriesConfig. On the next refresh each series is diffed
+    against its snapshot: style-only changes are applied to the existing
+    artists, and only series whose data settings or source data changed
+    are re-plotted. The layout key captures figure-wide settings (theme,
+    axis scales) that still need a full rebuild when they change.
+    """
+
+    def __init__(self):
+        """Initialize an empty model"""
+        self.ax = None
+        self.layout_key: Optional[Hashable] = None
+        self.entries: Dict[str, PlottedSeries] = {}
+
+    def reset(self, ax, layout_key: Hashable):
+        """Start tracking a freshly built Axes"""
+        self.ax = ax
+        self.layout_key = layout_key
+        self.entries = {}
+
+    def can_update(self, ax, layout_key: Hashable) -> bool:
+        """True if ax is the tracked Axes and was built with the same layout"""
+        return ax is not None and ax is self.ax and layout_key == self.layout_key
+
+    @staticmethod
+    def snapshot(series) -> Dict[str, Any]:
+        """Copy of a series' settings for later diffing"""
+        return copy.deepcopy(series.to_dict())
+
+    @staticmethod
+    def capture(ax, draw: Callable[[], Any]) -> List[Any]:
+        """Run a drawing call and return the artists it added to ax"""
+        before = set(map(id, ax.get_children()))
+        draw()
+        return [artist for artist in ax.get_children() if id(artist) not in before]
+
+    def record(self, series, artists: List[Any], data_key: Optional[Hashable] = None):
+        """Remember the artists drawn for a series"""
+        self.entries[series.id] = PlottedSeries(series.id, self.snapshot(series), list(artists), data_key)
+
+    def changed_keys(self, series) -> Set[str]:
+        """Settings that differ from the recorded snapshot"""
+        entry = self.entries[series.id]
+        current = series.to_dict()
+        keys = set(current) | set(entry.config)
+        return {key for key in keys if current.get(key) != entry.config.get(key)}
+
+    def classify(self, series, data_key: Optional[Hashable] = None) -> str:
+        """
+        How a series differs from what is drawn
+
+        Returns:
+            NEW (not drawn yet), UNCHANGED, STYLE (restyle existing
+            artists) or DATA (needs re-plotting)
+        """
+        entry = self.entries.get(series.id)
+        if entry is None:
+            return NEW
+        if data_key != entry.data_key:
+            return DATA
+
+        changed = self.changed_keys(series)
+        if not changed:
+            return UNCHANGED
+        if not changed <= STYLE_KEYS:
+            return DATA
+        # A series hidden at build time was never drawn
+        if not entry.artists:
+            return DATA
+        # Scatter marker shapes are baked into the collection's paths
+        if 'marker' in changed and isinstance(entry.primary, Collection):
+            return DATA
+        return STYLE
+
+    def apply_style(self, series) -> Set[str]:
+        """
+        Apply style-only changes to a series' existing artists
+
+        Returns:
+            The settings that changed
+        """
+        entry = self.entries[series.id]
+        changed = self.changed_keys(series)
+
+        for index, artist in enumerate(entry.artists):
+            keys = changed if index == 0 else changed & SHARED_STYLE_KEYS
+            try:
+                self._style_artist(artist, series, keys)
+            except Exception as e:
+                logger.debug(f"Could not restyle artist for {series.name}: {e}")
+
+        entry.config = self.snapshot(series)
+        return changed
+
+    @staticmethod
+    def _style_artist(artist, series, keys: Set[str]):
+        if 'visible' in keys:
+            artist.set_visible(bool(series.visible))
+        if 'color' in keys:
+            artist.set_color(series.color)
+        if 'alpha' in keys:
+            artist.set_alpha(series.alpha)
+        if 'z_order' in keys:
+            artist.set_zorder(series.z_order)
+        if keys & {'show_in_legend', 'legend_label'}:
+            label = (series.legend_label or series.name) if series.show_in_legend else ""
+            artist.set_label(label)
+
+        if isinstance(artist, Line2D):
+            if 'line_style' in keys:
+                artist.set_linestyle(series.line_style)
+            if 'line_width' in keys:
+                artist.set_linewidth(series.line_width)
+            if 'marker' in keys:
+                artist.set_marker(series.marker if series.marker else 'None')
+            if 'marker_size' in keys:
+                artist.set_markersize(series.marker_size)
+        elif isinstance(artist, Collection) and 'marker_size' in keys:
+            artist.set_sizes([series.marker_size ** 2])
+
+    def extend(self, series, x: Any, y: Any, data_key: Optional[Hashable] = None) -> bool:
+        """
+        Append points to a series drawn as a single line
+
+        Used when rows are appended to the series' file, so the line grows
+        without being re-plotted. The series is recorded against the new
+        data_key and its current settings.
+
+        Returns:
+            False if the series is not drawn as a single line; it then
+            needs re-plotting
+        """
+        entry = self.entries.get(series.id)
+        if entry is None or len(entry.artists) != 1 or not isinstance(entry.primary, Line2D):
+            return False
+
+        line = entry.primary
+        if len(x):
+            line.set_data(np.concatenate((np.asarray(line.get_xdata(orig=True)), np.asarray(x))),
+                          np.concatenate((np.asarray(line.get_ydata(orig=True), dtype=float),
+                                          np.asarray(y, dtype=float))))
+        self.mark_current(series, data_key)
+        return True
+
+    def mark_current(self, series, data_key: Optional[Hashable] = None):
+        """Record that a series' artists already show the data identified by data_key"""
+        entry = self.entries[series.id]
+        entry.data_key = data_key
+        entry.config = self.snapshot(series)
+
+    def remove(self, series_id: str) -> List[Any]:
+        """
+        Remove a series' artists from the Axes
+
+        Returns:
+            The removed artists
+        """
+        entry = self.entries.pop(series_id, None)
+        if entry is None:
+            return []
+
+        for artist in entry.artists:
+            try:
+                artist.remove()
+            except (ValueError, NotImplementedError):
+                # Already detached from the Axes
+                pass
+        return entry.artists
@@ -7,14 +7,20 @@ Handles project saving, loading, and management
 import json
 import pickle
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 import logging
 from datetime import datetime
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+
+import pandas as pd
 
 from models.project_models import Project, ProjectMetadata, RecentProjects
 from models.data_models import FileData, SeriesConfig, AnnotationConfig, PlotConfiguration
 from core.file_manager import FileManager
+from core.project_store import ProjectDataStore
+from core.autosave import AutosaveJournal
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,15 @@ class ProjectManager:
         self.current_project: Optional[Project] = None
         self.project_modified = False
 
+        # Incremental autosave state
+        self.autosave_dir = Path.home() / '.excel_data_plotter' / 'autosave'
+        self._autosave_journals: Dict[str, AutosaveJournal] = {}
+        self._autosave_executor: Optional[ThreadPoolExecutor] = None
+        self._autosave_future: Optional[Future] = None
+        self._dirty_files: Set[str] = set()
+        # File changes may be reported from background threads
+        self._dirty_lock = threading.Lock()
+
     def create_new_project(self, name: str = "Untitled Project") -> Project:
         """
         Create a new project
@@ -44,8 +59,8 @@ class ProjectManager:
         project = Project(
             project_id=str(uuid.uuid4())[:8],
             name=name,
-            created_date=datetime.now(),
-            modified_date=datetime.now()
+            created_at=datetime.now(),
+            modified_at=datetime.now()
         )
 
         self.current_project = project
@@ -73,28 +88,33 @@ class ProjectManager:
                 path = path.with_suffix('.edp')
 
             # Update modified date
-            project.update_modified_date()
+            project.modified_at = datetime.now()
 
             # Create project data dictionary
             project_data = project.to_dict()
 
-            # Save file data separately (in same directory)
+            # Save file data column-wise alongside the project file
             data_dir = path.parent / f"{path.stem}_data"
             data_dir.mkdir(exist_ok=True)
+            store = ProjectDataStore(data_dir)
 
-            # Save each file's data
             for file_id, file_data in project.files.items():
-                data_file = data_dir / f"{file_id}.pkl"
-                with open(data_file, 'wb') as f:
-                    pickle.dump(file_data, f)
+                store.write(file_data)
+
+                # Drop the pre-columnar copy once the file is in the store
+                legacy_file = data_dir / f"{file_id}.pkl"
+                if legacy_file.exists():
+                    legacy_file.unlink()
+
+            # Remove data for files no longer in the project
+            store.prune(project.files.keys())
 
             # Save project metadata
             with open(path, 'w') as f:
-                json.dump(project_data, f, indent=2)
+                json.dump(project_data, f, indent=2, default=str)
 
             # Update recent projects
-            metadata = ProjectMetadata.from_project(project, str(path))
-            self.recent_projects.add_project(metadata)
+            self.recent_projects.add_project(str(path), project.name)
 
             self.project_modified = False
             logger.info(f"Saved project to {path}")
@@ -129,33 +149,28 @@ class ProjectManager:
             # Create project from data
             project = Project.from_dict(project_data)
 
-            # Load file data
+            # Load file data - only columns used by series are paged in now
             data_dir = path.parent / f"{path.stem}_data"
-
-            if data_dir.exists():
-                for file_ref in project_data.get('file_references', {}).values():
-                    file_id = file_ref['file_id']
-                    data_file = data_dir / f"{file_id}.pkl"
-
-                    if data_file.exists():
-                        with open(data_file, 'rb') as f:
-                            file_data = pickle.load(f)
-                            project.files[file_id] = file_data
-                    else:
-                        # Try to reload from original path
-                        original_path = file_ref['filepath']
-                        if Path(original_path).exists():
-                            file_data = self.file_manager.load_file(original_path)
-                            if file_data:
-                                file_data.file_id = file_id
-                                project.files[file_id] = file_data
+            store = ProjectDataStore(data_dir)
+            series_columns = self._series_columns(project)
+
+            for file_id, file_ref in project_data.get('files', {}).items():
+                file_data = self._load_file_data(store, file_id, file_ref,
+                                                 series_columns.get(file_id, set()))
+                if file_data is not None:
+                    project.files[file_id] = file_data
+                else:
+                    # Drop the data-less placeholder built by Project.from_dict
+                    project.files.pop(file_id, None)
+                    logger.warning(f"Data for {file_ref.get('filename', file_id)} not found")
 
             # Update recent projects
-            metadata = ProjectMetadata.from_project(project, str(path))
-            self.recent_projects.add_project(metadata)
+            self.recent_projects.add_project(str(path), project.name)
 
             self.current_project = project
             self.project_modified = False
+            for file_data in project.files.values():
+                self.track_file(file_data)
 
             logger.info(f"Loaded project from {path}")
             return project
@@ -164,6 +179,46 @@ class ProjectManager:
             logger.error(f"Failed to load project: {e}")
             return None
 
+    @staticmethod
+    def _series_columns(project: Project) -> Dict[str, Set[str]]:
+        """Columns each file must have in memory for the project's series"""
+        columns: Dict[str, Set[str]] = {}
+        for series in project.series.values():
+            used = columns.setdefault(series.file_id, set())
+            for column in (series.x_column, series.y_column):
+                if column and column != 'Index':
+                    used.add(column)
+        return columns
+
+    def _load_file_data(self, store: ProjectDataStore, file_id: str,
+                        file_ref: Dict, columns: Set[str]) -> Optional[FileData]:
+        """
+        Load one file's data for a project
+
+        Tries the columnar store, then a pickle written by older versions,
+        then the original source file.
+        """
+        if store.exists(file_id):
+            try:
+                return store.read(file_id, columns)
+            except Exception as e:
+                logger.warning(f"Could not read stored data for {file_id}: {e}")
+
+        legacy_file = store.data_dir / f"{file_id}.pkl"
+        if legacy_file.exists():
+            with open(legacy_file, 'rb') as f:
+                return pickle.load(f)
+
+        original_path = file_ref.get('filepath')
+        if original_path and Path(original_path).exists():
+            file_data = self.file_manager.load_file(original_path)
+            if file_data:
+                file_data.id = file_id
+                file_data.file_id = file_id
+                return file_data
+
+        return None
+
     def export_project(self, project: Project, filepath: str,
                        include_data: bool = True) -> bool:
         """
@@ -243,9 +298,9 @@ class ProjectManager:
                         df = pd.read_csv(io.StringIO(csv_data))
 
                         # Create FileData object
-                        file_ref = project_data['file_references'].get(file_id, {})
+                        file_ref = project_data.get('files', {}).get(file_id, {})
                         file_data = FileData(
-                            file_id=file_id,
+                            id=file_id,
                             filepath="imported",
                             filename=file_ref.get('filename', f"file_{file_id}"),
                             data=df
@@ -268,53 +323,62 @@ class ProjectManager:
         """Clear recent projects list"""
         self.recent_projects.clear()
 
-    def autosave_project(self, project: Project) -> bool:
+    def autosave_project(self, project: Project, wait: bool = False) -> bool:
         """
-        Autosave project to temporary location
+        Autosave changes since the last autosave
+
+        Only changed series, annotations, settings and file data are
+        written, as records appended to the project's autosave journal.
+        Changes are collected on the calling thread and written on a
+        background thread; a tick that arrives while the previous write is
+        still running is skipped and its changes go out with the next one.
 
         Args:
             project: Project to autosave
+            wait: Block until the write has finished
 
         Returns:
-            True if successful
+            True if the autosave was written (or scheduled)
         """
         try:
-            # Create autosave directory
-            autosave_dir = Path.home() / '.excel_data_plotter' / 'autosave'
-            autosave_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create autosave filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            autosave_file = autosave_dir / f"autosave_{project.project_id}_{timestamp}.edp"
-
-            # Save project
-            success = self.save_project(project, str(autosave_file))
-
-            if success:
-                # Clean old autosaves (keep last 5)
-                autosaves = sorted(autosave_dir.glob(f"autosave_{project.project_id}_*.edp"))
-                if len(autosaves) > 5:
-                    for old_file in autosaves[:-5]:
-                        try:
-                            old_file.unlink()
-                            # Also remove data directory
-                            data_dir = old_file.parent / f"{old_file.stem}_data"
-                            if data_dir.exists():
-                                import shutil
-                                shutil.rmtree(data_dir)
-                        except:
-                            pass
-
-            return success
+            if self._autosave_future is not None and not self._autosave_future.done():
+                logger.debug("Previous autosave still running - skipping this tick")
+                return False
+
+            journal = self._get_autosave_journal(project.project_id)
+            with self._dirty_lock:
+                dirty_files, self._dirty_files = self._dirty_files, set()
+            delta = journal.collect(project, dirty_files)
+
+            if delta.is_empty:
+                return True
+
+            if self._autosave_executor is None:
+                self._autosave_executor = ThreadPoolExecutor(max_workers=1,
+                                                             thread_name_prefix="autosave")
+            self._autosave_future = self._autosave_executor.submit(journal.write, delta)
+
+            if wait:
+                return self._autosave_future.result()
+            return True
 
         except Exception as e:
             logger.error(f"Failed to autosave project: {e}")
             return False
 
+    def _get_autosave_journal(self, project_id: str) -> AutosaveJournal:
+        if project_id not in self._autosave_journals:
+            self._autosave_journals[project_id] = AutosaveJournal(self.autosave_dir, project_id)
+        return self._autosave_journals[project_id]
+
     def recover_autosave(self, project_id: str) -> Optional[Project]:
         """
         Recover project from autosave
 
+        Replays the project's autosave journal onto its base snapshot.
+        Timestamped .edp autosaves written by older versions are used when
+        no journal exists.
+
         Args:
             project_id: Project ID to recover
 
@@ -322,13 +386,30 @@ class ProjectManager:
             Recovered project if found
         """
         try:
-            autosave_dir = Path.home() / '.excel_data_plotter' / 'autosave'
-
-            if not autosave_dir.exists():
+            if not self.autosave_dir.exists():
                 return None
 
-            # Find most recent autosave
-            autosaves = sorted(autosave_dir.glob(f"autosave_{project_id}_*.edp"))
+            journal = self._get_autosave_journal(project_id)
+            state = journal.replay()
+
+            if state is not None:
+                logger.info(f"Recovering from autosave journal: {journal.directory}")
+                project = Project.from_dict(state)
+                series_columns = self._series_columns(project)
+
+                for file_id, file_ref in state.get('files', {}).items():
+                    file_data = self._load_file_data(journal.store, file_id, file_ref,
+                                                     series_columns.get(file_id, set()))
+                    if file_data is not None:
+                        project.files[file_id] = file_data
+                    else:
+                        project.files.pop(file_id, None)
+                        logger.warning(f"Autosaved data for {file_ref.get('filename', file_id)} not found")
+
+                return project
+
+            # Find most recent legacy autosave
+            autosaves = sorted(self.autosave_dir.glob(f"autosave_{project_id}_*.edp"))
 
             if autosaves:
                 latest = autosaves[-1]
@@ -341,11 +422,43 @@ class ProjectManager:
             logger.error(f"Failed to recover autosave: {e}")
             return None
 
-    def mark_modified(self):
-        """Mark current project as modified"""
+    def mark_modified(self, file_id: Optional[str] = None):
+        """
+        Mark current project as modified
+
+        Args:
+            file_id: File whose DataFrame was edited in place, so autosave
+                writes its data again. Replacing a file's DataFrame or
+                changing series, annotations and settings is detected
+                without this.
+        """
         self.project_modified = True
+        if file_id:
+            with self._dirty_lock:
+                self._dirty_files.add(file_id)
         if self.current_project:
-            self.current_project.update_modified_date()
+            self.current_project.modified_at = datetime.now()
+
+    def track_file(self, file_data: FileData):
+        """Mark the project modified (and the file dirty) whenever the file's data changes"""
+        file_data.watch(self._on_file_changed)
+
+    def untrack_file(self, file_data: FileData):
+        """Stop tracking changes to a file's data"""
+        file_data.unwatch(self._on_file_changed)
+
+    def _on_file_changed(self, file_data: FileData):
+        self.mark_modified(file_data.id)
+
+    def discard_autosave(self, project_id: str):
+        """Delete a project's autosave (e.g. after a clean exit)"""
+        self._get_autosave_journal(project_id).clear()
+
+    def shutdown(self):
+        """Finish any autosave in progress and stop the autosave thread"""
+        if self._autosave_executor is not None:
+            self._autosave_executor.shutdown(wait=True)
+            self._autosave_executor = None
 
     def is_modified(self) -> bool:
         """Check if current project has unsaved changes"""
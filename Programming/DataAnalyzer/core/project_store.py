@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+core/project_store.py - Project Data Store
+Columnar, memory-mapped storage for the datasets of a saved project
+"""
+
+import os
+import json
+import pickle
+import shutil
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Set
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import FileData
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectDataStore:
+    """
+    Stores each FileData as one directory of column files plus a manifest
+
+    Layout::
+
+        <project>_data/<file_id>/CURRENT             name of the live version directory
+        <project>_data/<file_id>/v<n>/manifest.json  FileData metadata + column list
+        <project>_data/<file_id>/v<n>/c<n>.npy       numeric/bool/datetime columns
+        <project>_data/<file_id>/v<n>/c<n>.pkl       text and other object columns
+
+    ``.npy`` columns are opened with ``np.load(mmap_mode='c')`` so nothing
+    is read from disk until a column is touched, and writes stay private to
+    the process. Columns referenced by series are paged in eagerly on read;
+    the rest are only faulted in if something accesses them. Object columns
+    cannot be mapped and are always loaded.
+
+    Every write goes to a new version directory and then switches CURRENT,
+    so directories that loaded projects still have mapped are never renamed
+    or overwritten (Windows refuses both). Superseded versions are deleted
+    once nothing holds them open. Files stored before versioning (manifest
+    directly in ``<file_id>/``) are still read.
+    """
+
+    FORMAT_VERSION = 1
+    MANIFEST = 'manifest.json'
+    POINTER = 'CURRENT'
+
+    # FileData attributes carried in the manifest so the data need not be re-analyzed
+    METADATA_FIELDS = [
+        'id', 'file_id', 'filepath', 'filename', 'file_size', 'sheet_name',
+        'columns', 'dtypes', 'numeric_columns', 'datetime_columns', 'text_columns',
+        'missing_values', 'quality_score', 'notes', 'tags', 'series_list',
+        'datetime_formats'
+    ]
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize project data store
+
+        Args:
+            data_dir: The project's ``<stem>_data`` directory
+        """
+        self.data_dir = Path(data_dir)
+
+    def _file_dir(self, file_id: str) -> Path:
+        return self.data_dir / file_id
+
+    def _version_dir(self, file_id: str) -> Path:
+        """Directory holding the live version of a stored file"""
+        file_dir = self._file_dir(file_id)
+        try:
+            return file_dir / (file_dir / self.POINTER).read_text().strip()
+        except OSError:
+            # Stored before versioning
+            return file_dir
+
+    def exists(self, file_id: str) -> bool:
+        """Check whether a file has been stored in this format"""
+        return (self._version_dir(file_id) / self.MANIFEST).exists()
+
+    def file_ids(self) -> List[str]:
+        """IDs of every stored file"""
+        if not self.data_dir.exists():
+            return []
+        return [p.name for p in self.data_dir.iterdir()
+                if not p.name.startswith('.') and self.exists(p.name)]
+
+    @staticmethod
+    def _is_mappable(series: pd.Series) -> bool:
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype):
+            return dtype.kind in 'biufcM' and not dtype.hasobject
+        return False
+
+    def is_current(self, file_data: FileData) -> bool:
+        """
+        True if file_data was read from (or written to) this store unchanged
+
+        Compares FileData.data_key(), so replacing the DataFrame, appending
+        rows or an edit recorded with FileData.mark_changed() all count as
+        changes.
+        """
+        stored = getattr(file_data, '_stored_frames', {})
+        return stored.get(str(self._file_dir(file_data.id))) == file_data.data_key()
+
+    @staticmethod
+    def invalidate(file_data: FileData):
+        """Forget stored copies so the next write saves the data again (after in-place edits)"""
+        file_data._stored_frames = {}
+
+    def _mark_stored(self, file_data: FileData, key: Optional[tuple] = None):
+        if not isinstance(getattr(file_data, '_stored_frames', None), dict):
+            file_data._stored_frames = {}
+        file_data._stored_frames[str(self._file_dir(file_data.id))] = key or file_data.data_key()
+
+    def write(self, file_data: FileData) -> bool:
+        """
+        Write a file's columns and metadata
+
+        Files that are already backed by this store and unchanged are
+        skipped. New content is written to a fresh version directory before
+        CURRENT is switched to it, so a reader never sees a half-written
+        file and memory-mapped columns of the previous version stay valid.
+
+        Returns:
+            True if data was written, False if it was already current
+        """
+        if self.is_current(file_data):
+            return False
+        # The data this write saves; later edits make the file stale again
+        data_key = file_data.data_key()
+
+        file_dir = self._file_dir(file_data.id)
+        file_dir.mkdir(parents=True, exist_ok=True)
+        version = 1 + max((int(p.name[1:]) for p in file_dir.glob('v*') if p.name[1:].isdigit()),
+                          default=0)
+        target = file_dir / f"v{version}"
+        tmp_dir = file_dir / f".v{version}.tmp"
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir()
+
+        df = file_data.data if file_data.data is not None else pd.DataFrame()
+        column_entries = []
+
+        for i, name in enumerate(df.columns):
+            series = df[name]
+            if self._is_mappable(series):
+                filename = f"c{i}.npy"
+                np.save(tmp_dir / filename, np.ascontiguousarray(series.to_numpy()), allow_pickle=False)
+            else:
+                filename = f"c{i}.pkl"
+                with open(tmp_dir / filename, 'wb') as f:
+                    pickle.dump(series.to_numpy(dtype=object), f, protocol=pickle.HIGHEST_PROTOCOL)
+            column_entries.append({'name': str(name), 'file': filename, 'dtype': str(series.dtype)})
+
+        metadata = {key: getattr(file_data, key, None) for key in self.METADATA_FIELDS}
+        metadata['missing_values'] = {str(k): int(v) for k, v in (file_data.missing_values or {}).items()}
+        metadata['quality_score'] = float(file_data.quality_score)
+        metadata['load_time'] = file_data.load_time.isoformat()
+        metadata['shape'] = list(df.shape)
+        metadata['sheet_names'] = list(file_data.sheets) if file_data.sheets else []
+
+        manifest = {
+            'format_version': self.FORMAT_VERSION,
+            'metadata': metadata,
+            'columns': column_entries
+        }
+        with open(tmp_dir / self.MANIFEST, 'w') as f:
+            json.dump(manifest, f, indent=2, default=str)
+
+        # Switch to the new version; the old one stays intact for open maps
+        tmp_dir.rename(target)
+        pointer_tmp = file_dir / f".{self.POINTER}.tmp"
+        pointer_tmp.write_text(target.name)
+        os.replace(pointer_tmp, file_dir / self.POINTER)
+        self._remove_stale_versions(file_dir, keep=target.name)
+
+        self._mark_stored(file_data, data_key)
+        logger.debug(f"Stored {file_data.filename} ({len(column_entries)} columns) in {target}")
+        return True
+
+    def _remove_stale_versions(self, file_dir: Path, keep: str):
+        """
+        Delete superseded versions of a file
+
+        Versions whose columns are still memory-mapped cannot be deleted on
+        Windows; they are left for a later write to clean up.
+        """
+        for path in file_dir.iterdir():
+            if path.name in (keep, self.POINTER):
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.name == self.MANIFEST or path.suffix in ('.npy', '.pkl'):
+                # Columns stored before versioning
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def read(self, file_id: str, columns: Optional[Iterable[str]] = None) -> FileData:
+        """
+        Open a stored file
+
+        Args:
+            file_id: ID of the stored file
+            columns: Columns to page into memory now (e.g. those used by
+                series); other mappable columns stay on disk until accessed
+
+        Returns:
+            FileData with metadata restored from the manifest
+        """
+        file_dir = self._version_dir(file_id)
+        with open(file_dir / self.MANIFEST, 'r') as f:
+            manifest = json.load(f)
+
+        wanted: Set[str] = set(columns or [])
+        arrays: Dict[str, np.ndarray] = {}
+
+        for entry in manifest['columns']:
+            path = file_dir / entry['file']
+            if entry['file'].endswith('.npy'):
+                values = np.load(path, mmap_mode='c', allow_pickle=False)
+                if entry['name'] in wanted:
+                    values = np.array(values)
+            else:
+                with open(path, 'rb') as f:
+                    values = pickle.load(f)
+            arrays[entry['name']] = values
+
+        df = pd.DataFrame(arrays, copy=False)
+        file_data = self._restore_file_data(manifest['metadata'], df)
+
+        self._mark_stored(file_data)
+        return file_data
+
+    @staticmethod
+    def _restore_file_data(metadata: Dict, df: pd.DataFrame) -> FileData:
+        """Rebuild FileData from manifest metadata without re-analyzing the data"""
+        file_data = FileData(filepath=metadata.get('filepath', ''), data=None,
+                             filename=metadata.get('filename'))
+        file_data.data = df
+
+        for key in ProjectDataStore.METADATA_FIELDS:
+            value = metadata.get(key)
+            if value is not None:
+                setattr(file_data, key, value)
+
+        file_data.shape = tuple(metadata.get('shape', df.shape))
+        if metadata.get('load_time'):
+            file_data.load_time = datetime.fromisoformat(metadata['load_time'])
+
+        sheet_names = metadata.get('sheet_names')
+        if sheet_names and Path(file_data.filepath).exists():
+            from core.file_manager import LazySheetMapping
+            file_data.sheets = LazySheetMapping(file_data.filepath, sheet_names)
+
+        return file_data
+
+    def remove(self, file_id: str):
+        """Delete a stored file"""
+        shutil.rmtree(self._file_dir(file_id), ignore_errors=True)
+
+    def prune(self, keep: Iterable[str]):
+        """Delete stored files whose IDs are not in keep"""
+        keep = set(keep)
+        for file_id in self.file_ids():
+            if file_id not in keep:
+                self.remove(file_id)
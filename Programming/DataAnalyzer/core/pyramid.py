@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+core/pyramid.py - Column Pyramids
+Multi-resolution min/max summaries of long numeric columns
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, List, Dict, Tuple
+
+import numpy as np
+
+from config.constants import AppConfig
+from models.data_models import FileData
+
+logger = logging.getLogger(__name__)
+
+# Rows per bucket at the finest level, and buckets merged per coarser level
+BASE_BUCKET = 64
+FANOUT = 4
+
+# Rows summarised per pass when building the finest level
+_BUILD_CHUNK = BASE_BUCKET * 16384
+
+
+class ColumnPyramid:
+    """
+    Min/max of a column over fixed-size row buckets at several levels
+
+    Level k has buckets of BASE_BUCKET * FANOUT**k rows. Each level stores
+    the minimum and maximum with the row positions where they occur
+    (NaN for buckets without any values). Picking the level
+    whose bucket count matches the screen width turns an overview of any
+    row range into O(pixels) work instead of a scan of the raw column.
+    """
+
+    def __init__(self, values: np.ndarray, data_key: Optional[Tuple[int, int, int]] = None):
+        """
+        Initialize an empty pyramid - use build() to fill it
+
+        Args:
+            values: Raw column values (kept by reference for edge buckets)
+            data_key: FileData.data_key() of the data the column came from
+        """
+        self.values = values
+        self.n_rows = len(values)
+        self.data_key = data_key
+        self.levels: List[Dict[str, np.ndarray]] = []
+
+    @classmethod
+    def build(cls, values: np.ndarray, data_key: Optional[Tuple[int, int, int]] = None) -> 'ColumnPyramid':
+        """Summarise a column into every level down to a single bucket"""
+        pyramid = cls(values, data_key)
+        if pyramid.n_rows < BASE_BUCKET * FANOUT:
+            return pyramid
+
+        chunks = [cls._summarise_raw(values, start, min(start + _BUILD_CHUNK, pyramid.n_rows))
+                  for start in range(0, pyramid.n_rows, _BUILD_CHUNK)]
+        level = {key: np.concatenate([c[key] for c in chunks]) for key in chunks[0]}
+        pyramid.levels.append(level)
+
+        while len(level['mins']) >= FANOUT * 2:
+            level = cls._merge(level)
+            pyramid.levels.append(level)
+
+        return pyramid
+
+    @staticmethod
+    def _summarise_raw(values: np.ndarray, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Finest-level buckets for rows [start, stop); start is bucket aligned"""
+        block = np.asarray(values[start:stop], dtype=float)
+        n_buckets = -(-len(block) // BASE_BUCKET)
+        padded = np.full(n_buckets * BASE_BUCKET, np.nan)
+        padded[:len(block)] = block
+        grid = padded.reshape(n_buckets, BASE_BUCKET)
+
+        missing = np.isnan(grid)
+        rows = np.arange(n_buckets)
+        offsets = start + rows * BASE_BUCKET
+
+        low = np.where(missing, np.inf, grid)
+        high = np.where(missing, -np.inf, grid)
+        argmin = low.argmin(axis=1)
+        argmax = high.argmax(axis=1)
+        empty = missing.all(axis=1)
+
+        mins = low[rows, argmin]
+        maxs = high[rows, argmax]
+        mins[empty] = np.nan
+        maxs[empty] = np.nan
+
+        return {
+            'mins': mins,
+            'maxs': maxs,
+            'argmin': offsets + argmin,
+            'argmax': offsets + argmax
+        }
+
+    @staticmethod
+    def _merge(level: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Combine FANOUT neighbouring buckets into the next level"""
+        n_buckets = -(-len(level['mins']) // FANOUT)
+        pad = n_buckets * FANOUT - len(level['mins'])
+
+        def grid(key, fill):
+            values = level[key]
+            if pad:
+                values = np.concatenate([values, np.full(pad, fill, dtype=values.dtype)])
+            return values.reshape(n_buckets, FANOUT)
+
+        rows = np.arange(n_buckets)
+        mins = grid('mins', np.nan)
+        maxs = grid('maxs', np.nan)
+        pick_min = np.where(np.isnan(mins), np.inf, mins).argmin(axis=1)
+        pick_max = np.where(np.isnan(maxs), -np.inf, maxs).argmax(axis=1)
+
+        return {
+            'mins': mins[rows, pick_min],
+            'maxs': maxs[rows, pick_max],
+            'argmin': grid('argmin', 0)[rows, pick_min],
+            'argmax': grid('argmax', 0)[rows, pick_max]
+        }
+
+    def bucket_size(self, level: int) -> int:
+        """Rows per bucket at a level"""
+        return BASE_BUCKET * FANOUT ** level
+
+    def level_for(self, n_rows: int, n_buckets: int) -> Optional[int]:
+        """
+        Coarsest level that still gives at least n_buckets buckets over n_rows
+
+        Returns:
+            Level index, or None if even the finest level is too coarse
+        """
+        best = None
+        for level in range(len(self.levels)):
+            if n_rows // self.bucket_size(level) >= n_buckets:
+                best = level
+            else:
+                break
+        return best
+
+    def _edge_extremes(self, start: int, stop: int) -> List[int]:
+        """Positions of the min and max in a partial bucket, read from raw values"""
+        if stop <= start:
+            return []
+        block = np.asarray(self.values[start:stop], dtype=float)
+        if np.isnan(block).all():
+            return []
+        return [start + int(np.nanargmin(block)), start + int(np.nanargmax(block))]
+
+    def positions(self, start: int, stop: int, n_buckets: int) -> Optional[np.ndarray]:
+        """
+        Row positions that draw rows [start, stop) faithfully at n_buckets wide
+
+        Uses the coarsest level with at least n_buckets buckets over the
+        range (so up to FANOUT times that many) and keeps the first and
+        last row plus the min and max of every bucket, so spikes survive.
+        Whole buckets come from the pyramid; only the two partial buckets
+        at the ends touch raw values.
+
+        Returns:
+            Sorted positions, or None when the range is short enough to
+            draw directly (or no level fits)
+        """
+        start, stop = max(0, start), min(self.n_rows, stop)
+        if stop - start <= 4 * n_buckets:
+            return None
+
+        level = self.level_for(stop - start, n_buckets)
+        if level is None:
+            return None
+
+        size = self.bucket_size(level)
+        data = self.levels[level]
+        first = -(-start // size)
+        last = stop // size
+
+        parts = [np.array([start, stop - 1]),
+                 data['argmin'][first:last], data['argmax'][first:last],
+                 np.array(self._edge_extremes(start, min(first * size, stop)), dtype=np.int64),
+                 np.array(self._edge_extremes(max(last * size, start), stop), dtype=np.int64)]
+
+        positions = np.unique(np.concatenate(parts).astype(np.int64))
+        return positions[(positions >= start) & (positions < stop)]
+
+
+def overview_positions(file_data: FileData, column: str, start: int, stop: int,
+                       n_buckets: int) -> Optional[np.ndarray]:
+    """
+    Overview positions for a column of a file from its pyramid
+
+    Returns None when the file has no current pyramid for the column or the
+    range is short enough to draw directly, so callers fall back to the
+    raw data.
+    """
+    pyramid = file_data.get_pyramid(column) if file_data is not None else None
+    if pyramid is None:
+        return None
+    return pyramid.positions(start, stop, n_buckets)
+
+
+class PyramidBuilder:
+    """
+    Builds column pyramids for loaded files on a background thread
+
+    Pyramids are stored on FileData.pyramids, keyed by column, so every
+    series pointing at the same column shares one.
+    """
+
+    def __init__(self, min_rows: int = AppConfig.AUTO_DECIMATION_POINTS):
+        """
+        Initialize pyramid builder
+
+        Args:
+            min_rows: Columns shorter than this are drawn directly and skipped
+        """
+        self.min_rows = min_rows
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def build(self, file_data: FileData) -> int:
+        """
+        Build missing or stale pyramids for a file's numeric columns
+
+        Returns:
+            Number of pyramids built
+        """
+        df = file_data.data
+        if df is None or len(df) < self.min_rows:
+            return 0
+
+        built = 0
+        data_key = file_data.data_key()
+        for column in list(file_data.numeric_columns):
+            if column not in df.columns or file_data.get_pyramid(column) is not None:
+                continue
+            try:
+                file_data.pyramids[column] = ColumnPyramid.build(df[column].to_numpy(), data_key)
+                built += 1
+            except Exception as e:
+                logger.warning(f"Could not build pyramid for {file_data.filename}:{column}: {e}")
+
+        if built:
+            logger.info(f"Built {built} overview pyramid(s) for {file_data.filename}")
+        return built
+
+    def schedule(self, file_data: FileData) -> Optional[Future]:
+        """Build a file's pyramids in the background"""
+        if file_data is None or file_data.data is None or len(file_data.data) < self.min_rows:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyramid")
+        return self._executor.submit(self.build, file_data)
+
+    def shutdown(self):
+        """Stop the background thread without waiting for queued builds"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+core/quality_profiler.py - Background Quality Profiler
+Profiles the data quality of loaded files and caches the report on FileData
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Callable
+
+from analysis.data_quality import DataQualityAnalyzer, QualityReport
+from models.data_models import FileData
+
+logger = logging.getLogger(__name__)
+
+# Interval (ms) at which the Tk main loop checks for finished profiles
+POLL_INTERVAL_MS = 100
+
+
+class QualityProfiler:
+    """
+    Runs DataQualityAnalyzer on loaded files off the UI thread
+
+    Reports are stored on FileData (see FileData.get_quality_report), so
+    file cards and the quality report read them without rescanning. The
+    per-column scans also land in the file's statistics cache, so after
+    rows are appended only the affected columns are scanned again.
+    """
+
+    def __init__(self, analyzer: Optional[DataQualityAnalyzer] = None):
+        """
+        Initialize quality profiler
+
+        Args:
+            analyzer: Analyzer to use (a default instance is created if omitted)
+        """
+        self.analyzer = analyzer or DataQualityAnalyzer()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def profile(self, file_data: FileData) -> Optional[QualityReport]:
+        """
+        Profile a file now, or return its current cached report
+
+        Returns:
+            QualityReport, or None if the file has no data
+        """
+        if file_data is None or file_data.data is None:
+            return None
+
+        report = file_data.get_quality_report()
+        if report is not None:
+            return report
+
+        data_key = file_data.data_key()
+        report = self.analyzer.analyze_quality(file_data.data, file_data)
+        if not file_data.set_quality_report(report, data_key):
+            logger.debug(f"Data of {file_data.filename} changed while profiling; report not cached")
+        return report
+
+    def schedule(self, file_data: FileData, tk_widget=None,
+                 on_ready: Optional[Callable[[FileData, QualityReport], None]] = None,
+                 on_error: Optional[Callable[[FileData, Exception], None]] = None) -> Optional[Future]:
+        """
+        Profile a file in the background
+
+        Args:
+            file_data: File to profile
+            tk_widget: Any Tk widget, used to call on_ready on the UI thread
+            on_ready: Called with the file and its report once profiled
+            on_error: Called with the file and the exception if profiling fails
+
+        Returns:
+            Future of the report, or None if there is nothing to profile
+        """
+        if file_data is None or file_data.data is None:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quality")
+
+        future = self._executor.submit(self.profile, file_data)
+        if tk_widget is not None and on_ready is not None:
+            tk_widget.after(POLL_INTERVAL_MS, self._poll, future, file_data, tk_widget, on_ready, on_error)
+        return future
+
+    def _poll(self, future: Future, file_data: FileData, tk_widget, on_ready, on_error=None):
+        """Hand a finished profile to on_ready on the UI thread"""
+        if not future.done():
+            try:
+                tk_widget.after(POLL_INTERVAL_MS, self._poll, future, file_data, tk_widget,
+                                on_ready, on_error)
+            except Exception:
+                # Window was destroyed while profiling
+                future.cancel()
+            return
+
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"Quality profiling failed for {file_data.filename}: {error}")
+            if on_error is not None:
+                on_error(file_data, error)
+            return
+        if future.result() is not None:
+            on_ready(file_data, future.result())
+
+    def shutdown(self):
+        """Stop the background thread without waiting for queued profiles"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
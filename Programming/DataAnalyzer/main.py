@@ -14,6 +14,7 @@ app_dir.mkdir(exist_ok=True)
 (app_dir / 'logs').mkdir(exist_ok=True)
 (app_dir / 'temp').mkdir(exist_ok=True)
 (app_dir / 'autosave').mkdir(exist_ok=True)
+(app_dir / 'cache').mkdir(exist_ok=True)
 
 # Configure logging
 logging.basicConfig(
@@ -4,19 +4,130 @@ Data models for Excel Data Plotter - COMPLETE FIXED VERSION
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import uuid
-import warnings
+import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+from utils.type_inference import convert_text_columns, convert_column, DATETIME
+from utils.descriptive import describe
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnStatsCache:
+    """
+    LRU cache of per-column statistics and metadata
+
+    Entries are keyed by (kind, column, start, end, column version). A
+    change to some columns bumps only their versions, so statistics of
+    the other columns stay cached; appended rows only drop entries whose
+    row range reaches the new rows. Safe to use from background threads.
+    """
+
+    MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize statistics cache
+
+        Args:
+            max_entries: Entries kept before the least recently used are evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def column_version(self, column: str) -> int:
+        """Number of times a column has been invalidated"""
+        return self._versions.get(column, 0)
+
+    def _key(self, kind: Any, column: str, start: Optional[int], end: Optional[int]) -> Tuple:
+        return (kind, column, start, end, self.column_version(column))
+
+    def lookup(self, kind: Any, column: str, start: Optional[int] = None,
+               end: Optional[int] = None) -> Optional[Any]:
+        """Cached value, or None on a miss"""
+        with self._lock:
+            key = self._key(kind, column, start, end)
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def store(self, kind: Any, column: str, start: Optional[int], end: Optional[int], value: Any):
+        """Cache a value, evicting the least recently used entries if full"""
+        with self._lock:
+            key = self._key(kind, column, start, end)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, kind: Any, column: str, start: Optional[int], end: Optional[int],
+            compute: Callable[[], Any]) -> Any:
+        """Cached value, computed and stored on a miss"""
+        value = self.lookup(kind, column, start, end)
+        if value is None:
+            value = compute()
+            self.store(kind, column, start, end, value)
+        return value
+
+    def invalidate(self, columns: Optional[List[str]] = None):
+        """Forget the given columns (every column when None)"""
+        with self._lock:
+            if columns is None:
+                self._entries.clear()
+                self._versions = {column: version + 1 for column, version in self._versions.items()}
+                return
+
+            columns = set(columns)
+            for column in columns:
+                self._versions[column] = self.column_version(column) + 1
+            for key in [key for key in self._entries if key[1] in columns]:
+                del self._entries[key]
+
+    def invalidate_rows(self, first_row: int):
+        """Rows from first_row on changed: drop entries whose range reaches them"""
+        def unaffected(start, end):
+            return end is not None and 0 <= end <= first_row and (start is None or start >= 0)
+
+        with self._lock:
+            for key in [key for key in self._entries if not unaffected(key[2], key[3])]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every entry"""
+        self.invalidate()
+
 
 @dataclass
 class FileData:
     """Complete FileData class with all required attributes"""
     filepath: str
+    # Property over _data and rows appended since the last read (see append_rows)
     data: pd.DataFrame
     filename: Optional[str] = None
 
@@ -26,8 +137,12 @@ class FileData:
 
     # Metadata
     file_size: int = 0
+    # Bytes of the source file the data was parsed from (follow mode resumes here)
+    source_offset: int = 0
     load_time: datetime = field(default_factory=datetime.now)
     sheet_name: Optional[str] = None
+    # Sheet name -> DataFrame for workbooks (lazily parsed by FileManager)
+    sheets: Dict[str, pd.DataFrame] = field(default_factory=dict, repr=False)
 
     # Data properties
     columns: List[str] = field(default_factory=list)
@@ -43,6 +158,16 @@ class FileData:
     missing_values: Dict[str, int] = field(default_factory=dict)
     quality_score: float = 100.0
 
+    # Detected datetime formats, reused when the data is re-analyzed
+    datetime_formats: Dict[str, str] = field(default_factory=dict)
+
+    # Column -> min/max overview pyramid (built in the background)
+    pyramids: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    # Data quality report (profiled in the background) and the data it describes
+    quality_report: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _quality_key: Optional[Tuple[int, int, int]] = field(default=None, init=False, repr=False, compare=False)
+
     # User metadata
     notes: str = ""
     tags: List[str] = field(default_factory=list)
@@ -50,6 +175,19 @@ class FileData:
     # Series tracking
     series_list: List[str] = field(default_factory=list)  # Track associated series IDs
 
+    # Follow mode: tail reader on the source file and callbacks for new rows
+    follow_reader: Optional[Any] = field(default=None, repr=False)
+    subscribers: List[Callable[['FileData', pd.DataFrame], None]] = field(default_factory=list, repr=False)
+
+    # Callbacks run after every change to the data (see watch())
+    watchers: List[Callable[['FileData'], None]] = field(default_factory=list, repr=False, compare=False)
+
+    # Data version (bumped on every change) and the statistics cached against it
+    version: int = field(default=0, init=False, compare=False)
+    stats_cache: ColumnStatsCache = field(default_factory=ColumnStatsCache, init=False,
+                                          repr=False, compare=False)
+    _cache_data_id: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize computed properties"""
         # Sync id and file_id
@@ -65,6 +203,23 @@ class FileData:
         if self.data is not None:
             self.analyze_data()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_data'] = self.data
+        state['_pending_rows'] = []
+        state['_pending_count'] = 0
+        del state['_data_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        if 'data' in state:
+            # Pickled before data became a property
+            state['_data'] = state.pop('data')
+            state['_pending_rows'] = []
+            state['_pending_count'] = 0
+        self.__dict__.update(state)
+        self._data_lock = threading.RLock()
+
     @property
     def df(self) -> pd.DataFrame:
         """Return dataframe for backward compatibility"""
@@ -72,13 +227,16 @@ class FileData:
 
     @property
     def row_count(self) -> int:
-        """Return number of rows"""
-        return len(self.data) if self.data is not None else 0
+        """Return number of rows (without concatenating appended rows)"""
+        with self._data_lock:
+            if self._data is None:
+                return 0
+            return len(self._data) + self._pending_count
 
     @property
     def column_count(self) -> int:
         """Return number of columns"""
-        return len(self.data.columns) if self.data is not None else 0
+        return len(self._data.columns) if self._data is not None else 0
 
     @property
     def metadata(self) -> Dict[str, Any]:
@@ -95,10 +253,20 @@ class FileData:
             'file_size': self.file_size,
             'has_numeric': len(self.numeric_columns) > 0,  # Added this line
             'has_datetime': len(self.datetime_columns) > 0,  # Added for completeness
-            'memory_usage': self.data.memory_usage(deep=True).sum() if self.data is not None else 0,
+            'memory_usage': self.memory_usage(),
             'dtypes': self.dtypes
         }
 
+    def memory_usage(self) -> int:
+        """Bytes used by the data, with per-column sizes cached"""
+        if self.data is None:
+            return 0
+        total = int(self.data.index.memory_usage(deep=True))
+        for column in self.data.columns:
+            total += self.cached_stat('memory', column, compute=lambda c=column: int(
+                self.data[c].memory_usage(deep=True, index=False)))
+        return total
+
     def analyze_data(self):
         """Analyze the loaded data"""
         if self.data is None:
@@ -115,32 +283,15 @@ class FileData:
         self.datetime_columns = []
         self.text_columns = []
 
-        # Categorize columns and attempt data type conversion
+        # Classify text columns from a sample, then convert each one once
+        converted, formats = convert_text_columns(self.data, format_hints=self.datetime_formats)
+        self.datetime_formats.update(formats)
+        if converted:
+            self.mark_changed(converted)
+
+        # Categorize based on final dtype
         for col in self.columns:
             dtype = self.data[col].dtype
-            
-            # Try to convert string columns that look like numbers
-            if dtype == 'object':
-                # Try to convert to numeric
-                numeric_series = pd.to_numeric(self.data[col], errors='coerce')
-                if not numeric_series.isna().all() and numeric_series.notna().sum() > 0:
-                    # If most values can be converted to numeric, use that
-                    self.data[col] = numeric_series
-                    dtype = numeric_series.dtype
-                else:
-                    # Try to convert to datetime
-                    try:
-                        # Try to infer datetime format automatically, suppressing warnings
-                        with warnings.catch_warnings():
-                            warnings.simplefilter("ignore")
-                            datetime_series = pd.to_datetime(self.data[col], errors='coerce', infer_datetime_format=True)
-                        if not datetime_series.isna().all() and datetime_series.notna().sum() > 0:
-                            self.data[col] = datetime_series
-                            dtype = datetime_series.dtype
-                    except:
-                        pass
-            
-            # Categorize based on final dtype
             if pd.api.types.is_numeric_dtype(dtype):
                 self.numeric_columns.append(col)
             elif pd.api.types.is_datetime64_any_dtype(dtype):
@@ -163,32 +314,274 @@ class FileData:
         """Get list of numeric columns"""
         return self.numeric_columns.copy()
 
+    def mark_changed(self, columns: Optional[List[str]] = None):
+        """
+        Record a change to the data
+
+        Bumps the data version and drops cached statistics of the given
+        columns (every column when None).
+        """
+        self.version += 1
+        self.stats_cache.invalidate(columns)
+        self._cache_data_id = id(self._data)
+        self._notify_watchers()
+
+    def watch(self, callback: Callable[['FileData'], None]):
+        """Call callback(file_data) after every change to the data (edits and appended rows)"""
+        if callback not in self.watchers:
+            self.watchers.append(callback)
+
+    def unwatch(self, callback: Callable[['FileData'], None]):
+        """Remove a callback added with watch()"""
+        if callback in self.watchers:
+            self.watchers.remove(callback)
+
+    def _notify_watchers(self):
+        for callback in list(self.watchers):
+            try:
+                callback(self)
+            except Exception as e:
+                logger.warning(f"Change watcher failed for {self.filename}: {e}")
+
+    def _check_replaced(self):
+        if id(self._data) != self._cache_data_id:
+            # The DataFrame was replaced without mark_changed()
+            self.mark_changed()
+
+    def cached_stat(self, kind: Any, column: str, start: Optional[int] = None,
+                    end: Optional[int] = None, compute: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Statistic of a column or row range from the cache
+
+        Args:
+            kind: What is cached (e.g. 'describe'); any hashable value
+            column: Column the statistic depends on
+            start: First row position of the range
+            end: Row position after the range
+            compute: Called to compute the value on a miss; without it a
+                miss returns None
+
+        Returns:
+            The cached or computed value
+        """
+        self._check_replaced()
+        if compute is None:
+            return self.stats_cache.lookup(kind, column, start, end)
+        return self.stats_cache.get(kind, column, start, end, compute)
+
+    def store_stat(self, kind: Any, column: str, start: Optional[int], end: Optional[int], value: Any):
+        """Cache a statistic computed elsewhere (e.g. in a worker process)"""
+        self._check_replaced()
+        self.stats_cache.store(kind, column, start, end, value)
+
+    def describe_column(self, column: str, start: Optional[int] = None,
+                        end: Optional[int] = None) -> Dict[str, float]:
+        """
+        Descriptive statistics of a numeric column or row slice, cached
+
+        Args:
+            column: Column name
+            start: First row position of the slice
+            end: Row position after the slice
+
+        Returns:
+            utils.descriptive.describe() result
+        """
+        def compute():
+            values = pd.to_numeric(self.data[column].iloc[start:end], errors='coerce')
+            return describe(values.to_numpy(dtype=float, na_value=np.nan))
+
+        return self.cached_stat('describe', column, start, end, compute)
+
     def get_column_stats(self, column: str) -> Dict[str, Any]:
         """Get statistics for a column"""
         if column not in self.columns:
             return {}
 
         col_data = self.data[column]
-        stats = {
-            'dtype': str(col_data.dtype),
+        stats = {'dtype': str(col_data.dtype)}
+        stats.update(self.cached_stat('counts', column, compute=lambda: {
             'count': int(col_data.count()),
             'missing': int(col_data.isnull().sum()),
             'unique': int(col_data.nunique())
-        }
+        }))
 
         if column in self.numeric_columns:
+            summary = self.describe_column(column)
             stats.update({
-                'mean': float(col_data.mean()),
-                'std': float(col_data.std()),
-                'min': float(col_data.min()),
-                'max': float(col_data.max()),
-                'q25': float(col_data.quantile(0.25)),
-                'q50': float(col_data.quantile(0.50)),
-                'q75': float(col_data.quantile(0.75))
+                'mean': summary['mean'],
+                'std': summary['sample_std'],
+                'min': summary['min'],
+                'max': summary['max'],
+                'median': summary['median'],
+                'q25': summary['q1'],
+                'q50': summary['median'],
+                'q75': summary['q3']
             })
 
         return stats
 
+    def get_sheet_data(self, sheet_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the DataFrame for a sheet, parsing it on first access
+
+        Falls back to the main data when no sheet is requested, the sheet is
+        the active one, or the file has no such sheet.
+        """
+        if not sheet_name or sheet_name == self.sheet_name or sheet_name not in self.sheets:
+            return self.data
+        return self.sheets[sheet_name]
+
+    def get_pyramid(self, column: str) -> Optional[Any]:
+        """
+        Get the overview pyramid for a column if it matches the current data
+
+        Pyramids built for a previous version of the data (before an edit,
+        appended rows or a sheet switch) are ignored.
+        """
+        pyramid = self.pyramids.get(column)
+        if pyramid is None or self.data is None:
+            return None
+        if pyramid.data_key != self.data_key():
+            return None
+        return pyramid
+
+    def data_key(self) -> Tuple[int, int, int]:
+        """
+        Identifies the current data; changes whenever the data does
+
+        Replacing the DataFrame bumps the version (see _check_replaced), so
+        the key does not depend on the frame object and stays the same when
+        appended rows are concatenated on reading data.
+        """
+        self._check_replaced()
+        return (self.version, id(self), self.row_count)
+
+    def get_quality_report(self) -> Optional[Any]:
+        """
+        Get the data quality report if it describes the current data
+
+        Reports profiled before rows were appended or the data changed are
+        ignored.
+        """
+        if self.quality_report is None or self._quality_key != self.data_key():
+            return None
+        return self.quality_report
+
+    def set_quality_report(self, report: Any, data_key: Optional[Tuple[int, int, int]] = None) -> bool:
+        """
+        Store a data quality report
+
+        Args:
+            report: QualityReport
+            data_key: data_key() when profiling started; the report is
+                dropped if the data has changed since
+
+        Returns:
+            True if the report was stored
+        """
+        current = self.data_key()
+        if data_key is not None and data_key != current:
+            return False
+        self.quality_report = report
+        self._quality_key = current
+        return True
+
+    def _coerce_new_rows(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Give appended rows the columns and types of the loaded data"""
+        rows = rows.reindex(columns=self._data.columns)
+        for col in self._data.columns:
+            if col in self.datetime_columns:
+                rows[col] = convert_column(rows[col], DATETIME, self.datetime_formats.get(col))
+            elif col in self.numeric_columns:
+                rows[col] = pd.to_numeric(rows[col], errors='coerce')
+        return rows
+
+    def append_rows(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append rows read from the growing source file
+
+        New values are converted to the existing column types and the
+        metadata is updated from the new rows only, without re-analyzing
+        the whole frame. The rows are kept as a chunk and concatenated the
+        next time data is read, so each poll only touches the new rows.
+
+        Returns:
+            The rows as appended (after type conversion)
+        """
+        if rows is None or rows.empty or self._data is None:
+            return pd.DataFrame()
+
+        rows = self._coerce_new_rows(rows)
+        with self._data_lock:
+            first_row = len(self._data) + self._pending_count
+            rows.index = pd.RangeIndex(first_row, first_row + len(rows))
+            self._pending_rows.append(rows)
+            self._pending_count += len(rows)
+
+        # Statistics of ranges that end before the new rows stay valid
+        self.version += 1
+        self.stats_cache.invalidate_rows(first_row)
+
+        self.shape = (first_row + len(rows), self.column_count)
+        for col, missing in rows.isnull().sum().items():
+            self.missing_values[col] = int(self.missing_values.get(col, 0)) + int(missing)
+        total_cells = self.shape[0] * self.shape[1]
+        missing_cells = sum(self.missing_values.values())
+        self.quality_score = 100 * (1 - missing_cells / total_cells) if total_cells > 0 else 100
+        self._notify_watchers()
+        return rows
+
+    @property
+    def is_following(self) -> bool:
+        """True while new rows of the source file are being appended"""
+        return self.follow_reader is not None
+
+    def start_follow(self, reader):
+        """
+        Follow the source file
+
+        Args:
+            reader: Tail reader (see FileManager.start_following) whose
+                read_new() returns the rows appended since the last call
+        """
+        self.follow_reader = reader
+
+    def stop_follow(self):
+        """Stop following the source file"""
+        self.follow_reader = None
+
+    def subscribe(self, callback: Callable[['FileData', pd.DataFrame], None]):
+        """Call callback(file_data, new_rows) whenever rows are appended"""
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[['FileData', pd.DataFrame], None]):
+        """Remove a callback added with subscribe()"""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def poll_follow(self) -> int:
+        """
+        Append rows written to the source file since the last poll
+
+        Returns:
+            Number of rows appended
+        """
+        if self.follow_reader is None:
+            return 0
+
+        new_rows = self.append_rows(self.follow_reader.read_new())
+        if new_rows.empty:
+            return 0
+
+        for callback in list(self.subscribers):
+            try:
+                callback(self, new_rows)
+            except Exception as e:
+                logger.warning(f"Follow subscriber failed for {self.filename}: {e}")
+        return len(new_rows)
+
     def get_preview(self, rows: int = 10) -> pd.DataFrame:
         """Get preview of data"""
         return self.data.head(rows)
@@ -201,6 +594,7 @@ class FileData:
             'filename': self.filename,
             'filepath': self.filepath,
             'file_size': self.file_size,
+            'source_offset': self.source_offset,
             'load_time': self.load_time.isoformat(),
             'sheet_name': self.sheet_name,
             'shape': self.shape,
@@ -230,7 +624,7 @@ class FileData:
             file_data.file_id = data['file_id']
 
         # Set additional properties
-        for key in ['file_size', 'sheet_name', 'notes', 'tags']:
+        for key in ['file_size', 'source_offset', 'sheet_name', 'notes', 'tags']:
             if key in data:
                 setattr(file_data, key, data[key])
 
@@ -240,6 +634,31 @@ class FileData:
         return file_data
 
 
+def _get_file_data(self: FileData) -> Optional[pd.DataFrame]:
+    """The DataFrame, with rows appended since the last read concatenated on"""
+    with self._data_lock:
+        if self._pending_rows:
+            merged = pd.concat([self._data] + self._pending_rows)
+            if self._cache_data_id == id(self._data):
+                self._cache_data_id = id(merged)
+            self._data = merged
+            self._pending_rows = []
+            self._pending_count = 0
+        return self._data
+
+
+def _set_file_data(self: FileData, data: Optional[pd.DataFrame]):
+    # Runs first in __init__, so it also creates the appended-rows state
+    lock = self.__dict__.setdefault('_data_lock', threading.RLock())
+    with lock:
+        self._data = data
+        self._pending_rows = []
+        self._pending_count = 0
+
+
+# Installed after @dataclass so the generated __init__ assigns through it
+FileData.data = property(_get_file_data, _set_file_data)
+
 @dataclass
 class SeriesConfig:
     """Configuration for a data series"""
@@ -358,16 +777,19 @@ class SeriesConfig:
         if file_data is None or file_data.data is None:
             return np.array([]), np.array([])
 
-        df = file_data.data
+        df = file_data.get_sheet_data(self.sheet_name)
 
         # Apply range limits
         start = self.start_index or 0
         end = self.end_index or len(df)
         df = df.iloc[start:end]
 
-        # Extract columns
-        if self.x_column in df.columns and self.y_column in df.columns:
-            x_data = df[self.x_column]
+        # Extract columns ('Index' plots against row position)
+        if self.y_column in df.columns and (self.x_column in df.columns or self.x_column == 'Index'):
+            if self.x_column == 'Index':
+                x_data = pd.Series(np.arange(start, start + len(df)), index=df.index)
+            else:
+                x_data = df[self.x_column]
             y_data = df[self.y_column]
             
             # Convert to numeric if needed
@@ -386,6 +808,13 @@ class SeriesConfig:
 
         return np.array([]), np.array([])
 
+    def stats_key(self) -> Tuple[Any, str, Optional[int], Optional[int]]:
+        """
+        (kind, column, start, end) under which FileData caches statistics
+        of the values get_data() returns
+        """
+        return ('series', self.sheet_name, self.x_column), self.y_column, self.start_index, self.end_index
+
     def copy(self) -> 'SeriesConfig':
         """Create a copy of this SeriesConfig"""
         return SeriesConfig.from_dict(self.to_dict())
@@ -710,3 +1139,11 @@ class AnnotationConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         return self.__dict__.copy()
+
+    # Legacy aliases duplicated in to_dict(); x/y/x2/y2 are authoritative
+    _LEGACY_KEYS = ('x_data', 'x_end', 'y_data', 'y_end')
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AnnotationConfig':
+        """Create from dictionary"""
+        return cls(**{k: v for k, v in data.items() if k not in cls._LEGACY_KEYS})
@@ -9,8 +9,15 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from analysis.statistical import StatisticalAnalyzer
-from analysis.vacuum import VacuumAnalyzer
+from analysis.vacuum import VacuumAnalyzer, mask_runs, run_reduce, run_positions
+from analysis.legacy_analysis_tools import VacuumAnalysisTools
+from analysis.vacuum_stream import StreamingVacuumMetrics, LiveVacuumMonitor, PUMPDOWN, STABLE
 from analysis.data_quality import DataQualityAnalyzer
+from analysis.comparison import compare_all_pairs, common_time_base, compare_pair, estimate_lag
+from analysis.rolling import rolling_window_stats, base_pressure_by_window
+from utils.descriptive import describe
+from models.data_models import FileData
+from core.quality_profiler import QualityProfiler
 
 
 class TestStatisticalAnalyzer(unittest.TestCase):
@@ -124,6 +131,410 @@ class TestVacuumAnalyzer(unittest.TestCase):
         self.assertIn(100, spikes)
         self.assertIn(500, spikes)
 
+    def test_spike_events(self):
+        """Spike events come back as compact start/end pairs"""
+        spikes = self.analyzer.detect_spikes(self.data['pressure'])
+        starts = [s['start'] for s in spikes]
+
+        self.assertIn(100, starts)
+        self.assertIn(500, starts)
+        spike = spikes[starts.index(500)]
+        self.assertEqual(spike['max_pressure'], 1e-3)
+        self.assertNotIn('indices', spike)
+
+    def test_legacy_spike_events(self):
+        """The legacy detector reports the same spikes with severity"""
+        spikes = VacuumAnalysisTools.detect_pressure_spikes(self.data['pressure'].to_numpy())
+        by_start = {s['start']: s for s in spikes}
+
+        self.assertIn(100, by_start)
+        self.assertEqual(by_start[100]['max_pressure'], 1e-3)
+        self.assertIn(by_start[100]['severity'], ('high', 'critical'))
+        self.assertNotIn('time_indices', by_start[100])
+
+
+class TestRunLengthHelpers(unittest.TestCase):
+    """Test the run-length event helpers"""
+
+    def test_mask_runs(self):
+        """Runs are found at the edges and filtered by length"""
+        mask = np.array([1, 1, 0, 0, 1, 0, 1, 1, 1], dtype=bool)
+
+        starts, ends = mask_runs(mask)
+        np.testing.assert_array_equal(starts, [0, 4, 6])
+        np.testing.assert_array_equal(ends, [2, 5, 9])
+
+        starts, ends = mask_runs(mask, min_length=2)
+        np.testing.assert_array_equal(starts, [0, 6])
+
+    def test_run_reduce_and_positions(self):
+        """Per-run reductions ignore the gaps between runs"""
+        values = np.array([5.0, 1.0, 99.0, 2.0, 3.0, 7.0])
+        starts, ends = np.array([0, 3]), np.array([2, 6])
+
+        np.testing.assert_array_equal(run_reduce(np.maximum, values, starts, ends), [5.0, 7.0])
+        np.testing.assert_array_equal(run_reduce(np.minimum, values, starts, ends), [1.0, 2.0])
+        np.testing.assert_array_equal(run_positions(starts, ends), [0, 1, 3, 4, 5])
+        self.assertEqual(len(run_reduce(np.maximum, values, starts[:0], ends[:0])), 0)
+
+
+class TestStreamingVacuumMetrics(unittest.TestCase):
+    """Test the online vacuum metrics against the batch versions"""
+
+    def setUp(self):
+        np.random.seed(7)
+        self.pressure = np.random.exponential(1e-6, 2000)
+        self.pressure[700] = 1e-3
+        self.pressure[1500:1503] = 5e-4
+
+    def test_rolling_window(self):
+        """Rolling mean, std and min match pandas over the trailing window"""
+        metrics = StreamingVacuumMetrics(window=100)
+        metrics.feed(self.pressure)
+        tail = pd.Series(self.pressure[-100:])
+
+        self.assertAlmostEqual(metrics.rolling_mean, tail.mean(), delta=1e-15)
+        self.assertAlmostEqual(metrics.rolling_std, tail.std(), delta=1e-15)
+        self.assertEqual(metrics.rolling_min, tail.min())
+        self.assertEqual(metrics.samples, 2000)
+
+    def test_multi_decade_window(self):
+        """A window sliding from atmosphere to base pressure keeps an exact std"""
+        pressure = np.concatenate((np.logspace(np.log10(760), -7, 600),
+                                   1e-7 * (1 + 0.01 * np.random.randn(3000))))
+        metrics = StreamingVacuumMetrics(window=600)
+
+        is_spike = np.zeros(len(pressure), dtype=bool)
+        for i, value in enumerate(pressure):
+            metrics.update(value)
+            window = pressure[max(0, i + 1 - 600):i + 1]
+            if i % 250 == 0 or i == len(pressure) - 1:
+                if i:
+                    self.assertAlmostEqual(metrics.rolling_std, window.std(ddof=1),
+                                           delta=window.std(ddof=1) * 1e-6)
+            previous = pressure[max(0, i - 600):i]
+            if len(previous) >= 10:
+                is_spike[i] = value > previous.mean() + 3 * previous.std(ddof=1)
+        spikes = int(np.count_nonzero(is_spike[1:] & ~is_spike[:-1]) + is_spike[0])
+
+        self.assertEqual(metrics.spike_count, spikes)
+        self.assertAlmostEqual(metrics.current_base_pressure(), 1e-7, delta=5e-9)
+
+    def test_spike_events(self):
+        """Spikes are grouped into events"""
+        metrics = StreamingVacuumMetrics(window=100)
+        metrics.feed(self.pressure)
+        starts = [s['start'] for s in metrics.spikes]
+
+        self.assertIn(700, starts)
+        self.assertIn(1500, starts)
+        spike = metrics.spikes[starts.index(1500)]
+        self.assertEqual(spike['duration'], 3)
+        self.assertEqual(spike['max_pressure'], 5e-4)
+
+    def test_leak_rate_matches_batch(self):
+        """Running regression sums give the batch leak rate"""
+        time = np.arange(100, dtype=float)
+        pressure = 1e-6 + time * 1e-8
+        metrics = StreamingVacuumMetrics()
+        metrics.feed(pressure, time)
+
+        expected = VacuumAnalyzer.calculate_leak_rate(pressure, time)
+        self.assertAlmostEqual(metrics.leak_rate, expected, delta=expected * 1e-9)
+
+    def test_base_pressure_and_phase(self):
+        """A pump-down followed by a plateau settles at the plateau"""
+        pumpdown = np.logspace(0, -6, 300)
+        plateau = 1e-6 * (1 + 0.01 * np.random.rand(300))
+        metrics = StreamingVacuumMetrics(window=50)
+
+        metrics.feed(pumpdown)
+        self.assertEqual(metrics.phase, PUMPDOWN)
+        metrics.feed(plateau)
+
+        self.assertEqual(metrics.phase, STABLE)
+        self.assertAlmostEqual(metrics.current_base_pressure(), 1e-6, delta=2e-8)
+
+    def test_nan_skipped(self):
+        """Missing readings are counted, not fed"""
+        metrics = StreamingVacuumMetrics()
+        metrics.feed([1e-6, np.nan, 2e-6])
+
+        self.assertEqual(metrics.samples, 2)
+        self.assertEqual(metrics.skipped, 1)
+
+    def test_live_monitor(self):
+        """The monitor feeds only rows the reader has not returned yet"""
+        frames = [pd.DataFrame({'p': [1e-6, 2e-6]}), None, pd.DataFrame({'p': [3e-6]})]
+
+        class Reader:
+            def read_new(self):
+                return frames.pop(0)
+
+        monitor = LiveVacuumMonitor(Reader(), 'p')
+        self.assertEqual([monitor.poll() for _ in range(3)], [2, 0, 1])
+        self.assertEqual(monitor.metrics.samples, 3)
+        self.assertEqual(monitor.metrics.current_pressure, 3e-6)
+
+    def test_monitor_attached_to_file(self):
+        """An attached monitor is fed rows appended to a followed file"""
+        file_data = FileData(filepath="live.csv", data=pd.DataFrame({'p': [1e-6, 2e-6]}))
+        monitor = LiveVacuumMonitor(None, 'p')
+        monitor.attach(file_data)
+
+        file_data.append_rows(pd.DataFrame({'p': ['3e-6', '4e-6']}))
+        self.assertEqual(monitor.metrics.samples, 0)
+        self.assertEqual(monitor.poll(), 0)
+
+        class Reader:
+            def read_new(self):
+                return pd.DataFrame({'p': [5e-6]})
+
+        file_data.follow_reader = Reader()
+        self.assertEqual(file_data.poll_follow(), 1)
+        self.assertEqual(monitor.metrics.samples, 1)
+        self.assertEqual(monitor.metrics.current_pressure, 5e-6)
+
+        monitor.detach(file_data)
+        self.assertEqual(file_data.poll_follow(), 1)
+        self.assertEqual(monitor.metrics.samples, 1)
+
+
+class TestDescriptiveKernel(unittest.TestCase):
+    """Test the fused descriptive statistics kernel"""
+
+    def test_matches_numpy_and_scipy(self):
+        """Moments and quantiles match the separate numpy/scipy calls"""
+        from scipy import stats
+        data = np.random.RandomState(5).lognormal(size=10001)
+        data[::97] = np.nan
+        clean = data[~np.isnan(data)]
+        summary = describe(data)
+
+        self.assertEqual(summary['count'], len(clean))
+        self.assertAlmostEqual(summary['mean'], np.mean(clean))
+        self.assertAlmostEqual(summary['std'], np.std(clean))
+        self.assertAlmostEqual(summary['sample_std'], np.std(clean, ddof=1))
+        for key, q in (('q1', 25), ('median', 50), ('q3', 75)):
+            self.assertAlmostEqual(summary[key], np.percentile(clean, q))
+        self.assertEqual(summary['min'], clean.min())
+        self.assertEqual(summary['max'], clean.max())
+        self.assertAlmostEqual(summary['skewness'], stats.skew(clean))
+        self.assertAlmostEqual(summary['kurtosis'], stats.kurtosis(clean))
+
+    def test_degenerate_input(self):
+        """Empty and constant series"""
+        self.assertEqual(describe([np.nan])['count'], 0)
+        self.assertTrue(np.isnan(describe([])['mean']))
+
+        constant = describe([2.0, 2.0, 2.0])
+        self.assertEqual(constant['median'], 2.0)
+        self.assertEqual(constant['std'], 0.0)
+        self.assertTrue(np.isnan(constant['skewness']))
+
+
+class TestAllPairsComparison(unittest.TestCase):
+    """Test the vectorised all-pairs series comparison"""
+
+    def setUp(self):
+        rng = np.random.RandomState(3)
+        self.t = np.arange(0, 1000, 1.0)
+        self.base = np.convolve(rng.randn(1100), np.ones(20) / 20, mode='same')[:1000]
+        self.shifted = np.r_[np.zeros(15), self.base[:-15]]
+        self.noisy = self.base + rng.randn(1000) * 0.01
+
+    def test_matrix_against_pairwise(self):
+        """Correlation and RMS match a direct pairwise computation"""
+        result = compare_all_pairs(['a', 'b', 'c'], [(self.t, self.base), (self.t, self.noisy),
+                                                     (self.t, -self.base)])
+
+        self.assertEqual(result['correlation'].shape, (3, 3))
+        self.assertAlmostEqual(result['correlation'][0, 1], np.corrcoef(self.base, self.noisy)[0, 1], places=6)
+        self.assertAlmostEqual(result['correlation'][0, 2], -1.0, places=6)
+        expected_rms = np.sqrt(np.mean((self.base - self.noisy) ** 2))
+        self.assertAlmostEqual(result['rms_difference'][0, 1], expected_rms, places=6)
+        self.assertTrue(np.allclose(result['rms_difference'], result['rms_difference'].T))
+
+    def test_lag(self):
+        """A delayed copy is found at its delay, with opposite signs per direction"""
+        result = compare_all_pairs(['a', 'b'], [(self.t, self.base), (self.t, self.shifted)])
+
+        self.assertAlmostEqual(result['lag'][0, 1], 15.0)
+        self.assertAlmostEqual(result['lag'][1, 0], -15.0)
+        self.assertGreater(result['lag_correlation'][0, 1], 0.9)
+        self.assertEqual(result['lag'][0, 0], 0.0)
+
+    def test_shared_time_base(self):
+        """Series are resampled over their overlap, optionally from a common start"""
+        base = common_time_base([np.arange(0, 100.0), np.arange(50, 300.0, 0.5)])
+        self.assertEqual(base[0], 50.0)
+        self.assertEqual(base[-1], 99.0)
+        self.assertAlmostEqual(base[1] - base[0], 0.5)
+
+        late = (self.t + 5000, self.base)
+        with self.assertRaises(ValueError):
+            compare_all_pairs(['a', 'b'], [(self.t, self.base), late])
+        result = compare_all_pairs(['a', 'b'], [(self.t, self.base), late], align_start=True)
+        self.assertAlmostEqual(result['correlation'][0, 1], 1.0, places=6)
+
+
+class TestPairComparison(unittest.TestCase):
+    """Test the two-series comparison on an adaptive time base"""
+
+    def setUp(self):
+        rng = np.random.RandomState(4)
+        self.t = np.arange(0, 5000, 0.5)
+        self.y1 = rng.randn(len(self.t)).cumsum()
+        self.y2 = self.y1 + rng.randn(len(self.t))
+
+    def test_metrics_match_direct_computation(self):
+        """Correlation, differences and tests agree with numpy/scipy"""
+        from scipy import stats
+        result = compare_pair(self.t, self.y1, self.t, self.y2)
+
+        self.assertEqual(result['n_points'], len(self.t))
+        self.assertAlmostEqual(result['correlation'], np.corrcoef(self.y1, self.y2)[0, 1], places=10)
+        diff = self.y1 - self.y2
+        self.assertAlmostEqual(result['difference_stats']['std_diff'], diff.std(), places=8)
+        self.assertAlmostEqual(result['difference_stats']['rms_diff'], np.sqrt(np.mean(diff ** 2)), places=8)
+        expected = stats.ttest_ind(self.y1, self.y2)
+        self.assertAlmostEqual(result['ttest']['statistic'], expected.statistic, places=8)
+        self.assertAlmostEqual(result['ttest']['p_value'], expected.pvalue, places=8)
+
+    def test_grid_follows_sample_rate(self):
+        """The time base uses the finer native interval unless a step is given"""
+        coarse = self.t[::10]
+        result = compare_pair(self.t, self.y1, coarse, self.y2[::10])
+        self.assertAlmostEqual(result['step'], 0.5)
+
+        result = compare_pair(self.t, self.y1, coarse, self.y2[::10], step=2.0)
+        self.assertAlmostEqual(result['step'], 2.0, delta=0.01)
+        self.assertEqual(len(result['y1_interpolated']), result['n_points'])
+
+    def test_datetime_overlap(self):
+        """Datetime series are compared over their absolute overlap"""
+        times = pd.date_range('2024-01-01', periods=1000, freq='s')
+        result = compare_pair(times, self.y1[:1000], times[500:], self.y1[500:1000])
+        self.assertEqual(result['common_time'][0], 0.0)
+        self.assertAlmostEqual(result['common_time'][-1], 499.0)
+        self.assertAlmostEqual(result['correlation'], 1.0)
+
+        with self.assertRaises(ValueError):
+            compare_pair(times[:10], self.y1[:10], times[500:], self.y1[500:1000])
+
+    def test_start_aligned_datetimes_in_seconds(self):
+        """Timedeltas left by start-time alignment are compared in seconds"""
+        day1 = pd.date_range('2024-01-01', periods=1000, freq='s').values
+        day2 = pd.date_range('2024-01-05', periods=1000, freq='s').values
+        result = compare_pair(day1 - day1[0], self.y1[:1000], day2 - day2[0], self.y1[:1000], step=2.0)
+
+        self.assertAlmostEqual(result['step'], 2.0, delta=0.01)
+        self.assertEqual(result['n_points'], 501)
+        self.assertAlmostEqual(result['correlation'], 1.0)
+
+
+class TestLagEstimation(unittest.TestCase):
+    """Test FFT cross-correlation lag estimation"""
+
+    def setUp(self):
+        rng = np.random.RandomState(5)
+        self.t = np.arange(0, 2000, 1.0)
+        self.signal = np.convolve(rng.randn(2100), np.ones(30) / 30, mode='same')[:2000]
+
+    def test_subsample_lag_across_rates(self):
+        """A delayed copy at another sample rate is found to a fraction of a sample"""
+        t2 = np.arange(100, 2000, 0.5)
+        delayed = np.interp(t2 - 23.3, self.t, self.signal)
+        result = estimate_lag(self.t, self.signal, t2, delayed)
+
+        self.assertAlmostEqual(result['lag'], -23.3, delta=0.1)
+        self.assertEqual(result['step'], 0.5)
+        self.assertGreater(result['confidence'], 0.9)
+        self.assertLess(abs(result['zero_lag_correlation']), 0.5)
+
+    def test_max_lag_window(self):
+        """Shifts beyond max_lag are not considered"""
+        delayed = np.r_[np.zeros(40), self.signal[:-40]]
+        self.assertAlmostEqual(estimate_lag(self.t, self.signal, self.t, delayed)['lag'], -40.0, delta=0.05)
+
+        limited = estimate_lag(self.t, self.signal, self.t, delayed, max_lag=10)
+        self.assertLessEqual(abs(limited['lag']), 10.0)
+        self.assertLess(limited['confidence'], 0.5)
+
+    def test_datetime_and_nan(self):
+        """Datetime x values give the lag in seconds; NaN samples are dropped"""
+        times = pd.date_range('2024-01-01', periods=2000, freq='s')
+        delayed = np.r_[np.zeros(12), self.signal[:-12]]
+        delayed[500:510] = np.nan
+        result = estimate_lag(times, self.signal, times, delayed)
+        self.assertAlmostEqual(result['lag'], -12.0, delta=0.05)
+
+
+class TestRollingWindowStats(unittest.TestCase):
+    """Test the block-scan rolling window statistics"""
+
+    def setUp(self):
+        np.random.seed(3)
+        self.values = np.random.randn(500)
+        self.values[np.random.choice(500, 40, replace=False)] = np.nan
+        self.values[200:230] = np.nan
+
+    def test_matches_pandas(self):
+        """Centred and trailing windows match pandas rolling on NaN data"""
+        series = pd.Series(self.values)
+        for center in (True, False):
+            stats = rolling_window_stats(self.values, [7, 60], min_periods=3, center=center)
+            for window in (7, 60):
+                rolling = series.rolling(window, min_periods=3, center=center)
+                for key, expected in (('min', rolling.min()), ('max', rolling.max()),
+                                      ('mean', rolling.mean()), ('std', rolling.std())):
+                    np.testing.assert_allclose(stats[window][key], expected.to_numpy(),
+                                               rtol=1e-9, atol=1e-12, equal_nan=True)
+                counts = series.notna().astype(float).rolling(window, min_periods=0, center=center).sum()
+                np.testing.assert_array_equal(stats[window]['count'], counts.to_numpy())
+
+    def test_windows_keyed_by_request(self):
+        """Windows larger than the data are kept under their requested size"""
+        stats = rolling_window_stats(self.values[:50], [5, 1000])
+        self.assertEqual(set(stats), {5, 1000})
+        self.assertEqual(len(stats[1000]['min']), 50)
+
+    def test_std_on_multi_decade_data(self):
+        """Variance stays accurate after a pump-down from atmosphere"""
+        pressure = np.r_[np.logspace(3, -7, 1000), np.full(1000, 1e-7)]
+        pressure[1000:] += 1e-11 * np.tile([1.0, -1.0], 500)
+        stats = rolling_window_stats(pressure, [100])
+        self.assertAlmostEqual(np.nanmin(stats[100]['std'][1100:1900]), 1e-11, delta=1e-13)
+
+    def test_base_pressure_positions(self):
+        """Base pressure is found by position, whatever the Series index"""
+        pressure = pd.Series(np.r_[np.logspace(0, -6, 300), np.full(300, 1e-6)],
+                             index=np.arange(600) + 10_000)
+        results = base_pressure_by_window(pressure, [10, 30])
+        for window, (base_pressure, position, stats) in results.items():
+            self.assertAlmostEqual(base_pressure, 1e-6, delta=1e-9)
+            self.assertEqual(base_pressure, stats['min'][position])
+
+        windows = VacuumAnalysisTools.calculate_base_pressure_windows(pressure, [1, 5], sample_rate_hz=1)
+        base_pressure, rolling_min, rolling_std = windows[5]
+        self.assertTrue(rolling_min.index.equals(pressure.index))
+        self.assertEqual(VacuumAnalysisTools.calculate_base_pressure(pressure, window_minutes=5)[0],
+                         base_pressure)
+
+
+    def test_base_pressure_uses_full_windows(self):
+        """Base pressure callers only trust full windows, like pandas rolling"""
+        rng = np.random.RandomState(8)
+        pressure = pd.Series(1e-6 * (1 + 0.1 * rng.rand(600)))
+        # A quiet but short stretch at the edge must not be taken as the base
+        pressure.iloc[:35] = 5e-7
+        pressure.iloc[300:340] = np.nan
+
+        rolling = pressure.rolling(60, center=True)
+        expected = rolling.min().iloc[rolling.std().idxmin()]
+        self.assertEqual(VacuumAnalysisTools.calculate_base_pressure(pressure, window_minutes=1)[0], expected)
+        self.assertEqual(VacuumAnalyzer.calculate_base_pressure(pressure.to_numpy(), window_minutes=1), expected)
+
 
 class TestDataQualityAnalyzer(unittest.TestCase):
     """Test data quality analysis"""
@@ -169,6 +580,71 @@ class TestDataQualityAnalyzer(unittest.TestCase):
         self.assertGreater(len(report.issues), 0)
         self.assertTrue(any('missing' in issue.lower() for issue in report.issues))
 
+    def test_quality_counts_cached(self):
+        """Per-column counts come from the file's statistics cache"""
+        data = pd.DataFrame({'x': np.arange(100.0), 'y': [np.nan] * 10 + [0.0] * 20 + list(np.arange(70.0))})
+        file_data = FileData(filepath="q.csv", data=data)
+
+        report = self.analyzer.analyze_quality(file_data.data, file_data)
+        self.assertEqual(report.quality_score, self.analyzer.analyze_quality(data.copy()).quality_score)
+        self.assertEqual(report.missing_points, 10)
+
+        misses = file_data.stats_cache.misses
+        self.analyzer.analyze_quality(file_data.data, file_data)
+        self.assertEqual(file_data.stats_cache.misses, misses)
+
+    def test_scan_fields(self):
+        """Counts match pandas and zeros, gaps and noise are filled in"""
+        rng = np.random.RandomState(2)
+        data = pd.DataFrame({
+            'time': pd.date_range('2024-01-01', periods=300, freq='s'),
+            'a': rng.randn(300).round(1),
+            'b': np.r_[np.zeros(5), rng.randn(295)]
+        })
+        data.loc[100:119, 'a'] = np.nan
+        data.loc[200:, 'time'] += pd.Timedelta(minutes=5)
+
+        report = self.analyzer.analyze_quality(data)
+        columns = report.statistics['columns']
+
+        self.assertEqual(columns['a']['missing'], 20)
+        self.assertEqual(columns['a']['duplicates'], int(data['a'].duplicated().sum()))
+        self.assertEqual(columns['b']['zeros'], 5)
+        self.assertEqual(report.zeros[:5], [0, 1, 2, 3, 4])
+        self.assertEqual(report.gaps, [100, 200])
+        # Independent samples: noise sigma is about the whole spread
+        self.assertAlmostEqual(columns['b']['noise'], 1.0, delta=0.25)
+        self.assertGreater(report.noise_level, 0)
+
+        smooth = self.analyzer.analyze_quality(pd.Series(np.sin(np.linspace(0, 10, 1000))))
+        self.assertLess(smooth.noise_level, 0.1)
+
+    def test_scan_in_column_blocks(self):
+        """Scanning in narrow column blocks gives the same counts, without warnings"""
+        import warnings
+        from analysis import data_quality
+        rng = np.random.RandomState(3)
+        data = pd.DataFrame(rng.randn(500, 7).round(1), columns=list('abcdefg'))
+        data['empty'] = np.nan
+        data.loc[50:80, 'c'] = 0.0
+
+        whole = self.analyzer._scan_columns(data)
+        original = data_quality.SCAN_BLOCK_CELLS
+        data_quality.SCAN_BLOCK_CELLS = 2 * len(data)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                blocked = self.analyzer._scan_columns(data)
+        finally:
+            data_quality.SCAN_BLOCK_CELLS = original
+
+        self.assertEqual(list(blocked), list(data.columns))
+        for col in data.columns:
+            for key in ('missing', 'zeros', 'outliers', 'duplicates'):
+                self.assertEqual(blocked[col][key], whole[col][key])
+            np.testing.assert_array_equal(blocked[col]['zero_runs'][0], whole[col]['zero_runs'][0])
+        self.assertTrue(np.isnan(blocked['empty']['noise']))
+
     def test_quality_report(self):
         """Test quality report generation"""
         data = pd.DataFrame({
@@ -184,5 +660,69 @@ class TestDataQualityAnalyzer(unittest.TestCase):
         self.assertIsInstance(report.statistics, dict)
 
 
+class TestQualityProfiler(unittest.TestCase):
+    """Test background quality profiling cached on FileData"""
+
+    def setUp(self):
+        self.profiler = QualityProfiler()
+        data = pd.DataFrame({'x': np.arange(200.0), 'y': np.r_[np.zeros(20), np.random.randn(180)]})
+        self.file_data = FileData(filepath="p.csv", data=data)
+
+    def tearDown(self):
+        self.profiler.shutdown()
+
+    def test_profile_cached(self):
+        """The report is stored on the file and reused until rows are appended"""
+        report = self.profiler.schedule(self.file_data).result(timeout=30)
+
+        self.assertIs(self.file_data.get_quality_report(), report)
+        self.assertIs(self.profiler.profile(self.file_data), report)
+        self.assertEqual(report.statistics['columns']['y']['zero_runs'], 1)
+        self.assertEqual(report.statistics['columns']['y']['longest_zero_run'], 20)
+
+        self.file_data.append_rows(pd.DataFrame({'x': [200.0], 'y': [np.nan]}))
+        self.assertIsNone(self.file_data.get_quality_report())
+        self.assertEqual(self.profiler.profile(self.file_data).missing_points, 1)
+
+    def test_ready_callback(self):
+        """on_ready runs through the widget's after() once profiling finishes"""
+        scheduled, ready = [], []
+
+        class Widget:
+            def after(self, delay, callback, *args):
+                scheduled.append((callback, args))
+
+        future = self.profiler.schedule(self.file_data, Widget(),
+                                        on_ready=lambda f, r: ready.append((f, r)))
+        future.result(timeout=30)
+        while scheduled:
+            callback, args = scheduled.pop(0)
+            callback(*args)
+
+        self.assertEqual(ready, [(self.file_data, future.result())])
+
+    def test_error_callback(self):
+        """on_error is told when profiling fails"""
+        scheduled, failed = [], []
+
+        class Widget:
+            def after(self, delay, callback, *args):
+                scheduled.append((callback, args))
+
+        def broken(data, file_data=None):
+            raise ValueError("unreadable")
+
+        self.profiler.analyzer.analyze_quality = broken
+        future = self.profiler.schedule(self.file_data, Widget(), on_ready=lambda f, r: None,
+                                        on_error=lambda f, e: failed.append((f, str(e))))
+        with self.assertRaises(ValueError):
+            future.result(timeout=30)
+        while scheduled:
+            callback, args = scheduled.pop(0)
+            callback(*args)
+
+        self.assertEqual(failed, [(self.file_data, "unreadable")])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
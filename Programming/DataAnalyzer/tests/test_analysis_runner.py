@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the background analysis runner
+"""
+
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from core.analysis_runner import AnalysisJobRunner, analyze_series_statistics, analyze_series_vacuum
+from models.data_models import FileData, SeriesConfig
+from ui.multi_series_analysis import MultiSeriesAnalysisDialog
+from utils.descriptive import describe
+
+
+class FakeWidget:
+    """Stands in for a Tk widget: after() callbacks are run by pump()"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay, callback, *args):
+        self.pending.append((callback, args))
+
+    def pump(self, timeout=30.0):
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            callback, args = self.pending.pop(0)
+            callback(*args)
+            time.sleep(0.01)
+
+
+def slow_worker(series_id, seconds):
+    time.sleep(seconds)
+    return series_id, seconds
+
+
+def failing_worker(series_id):
+    raise ValueError("bad series")
+
+
+class TestAnalysisJobRunner(unittest.TestCase):
+    """Test fanning series out and streaming results back"""
+
+    def setUp(self):
+        self.runner = AnalysisJobRunner(max_workers=2)
+        self.widget = FakeWidget()
+        self.streamed = []
+        self.completed = []
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def _run(self, tasks, worker):
+        return self.runner.run(tasks, worker, self.widget,
+                               on_result=lambda sid, result: self.streamed.append(sid),
+                               on_complete=self.completed.append)
+
+    def test_statistics_worker(self):
+        """The worker runs only the selected analyses"""
+        data = np.r_[np.random.RandomState(0).randn(200), 50.0]
+        series_id, results = analyze_series_statistics("s1", data, ["basic_stats", "outlier_detection"])
+
+        self.assertEqual(series_id, "s1")
+        self.assertEqual(set(results), {"basic_stats", "outliers"})
+        self.assertEqual(results["basic_stats"]["count"], 201)
+        self.assertIn(200, results["outliers"])
+
+    def test_vacuum_worker(self):
+        """The vacuum worker reports base pressure, leaks and spike events"""
+        t = np.arange(2000, dtype=float)
+        pressure = 1e-6 * np.exp(-t / 500) + 1e-8
+        pressure[1200:1205] = 1e-5
+        series_id, results = analyze_series_vacuum(
+            "p", t, pressure, ["base_pressure", "leak_detection", "spike_detection", "stability_analysis"],
+            {"spike_threshold": 3.0, "leak_threshold": 1.0, "window_size": 100})
+
+        self.assertEqual(series_id, "p")
+        self.assertLess(results["base_pressure"], 1e-7)
+        self.assertFalse(results["leak"]["leak_detected"])
+        self.assertIn(1200, [spike["start"] for spike in results["spikes"]])
+        self.assertGreater(results["stability"]["coefficient_of_variation"], 0)
+
+    def test_results_streamed(self):
+        """Every series' result is handed back and the job completes"""
+        data = np.random.RandomState(1).randn(500)
+        tasks = {f"s{i}": (data * i, ["basic_stats", "normality_test"]) for i in range(1, 5)}
+        job = self._run(tasks, analyze_series_statistics)
+        self.widget.pump()
+
+        self.assertEqual(self.completed, [job])
+        self.assertEqual(sorted(self.streamed), sorted(tasks))
+        self.assertAlmostEqual(job.results["s2"]["basic_stats"]["std"], 2 * data.std())
+        self.assertFalse(self.runner.is_busy)
+
+    def test_errors_collected(self):
+        """A failing series is reported without stopping the job"""
+        job = self._run({"bad": ()}, failing_worker)
+        self.widget.pump()
+
+        self.assertEqual(self.completed, [job])
+        self.assertEqual(job.errors, [("bad", "bad series")])
+
+    def test_cancel(self):
+        """Cancelling completes the job and drops late results"""
+        tasks = {f"s{i}": (0.2,) for i in range(6)}
+        job = self._run(tasks, slow_worker)
+        job.cancel()
+        self.widget.pump()
+
+        self.assertEqual(self.completed, [job])
+        self.assertTrue(job.cancelled)
+        self.assertEqual(self.streamed, [])
+
+
+class TestSeriesDataForCache(unittest.TestCase):
+    """The analysis dialog reads series data the way the stats cache keys it"""
+
+    def test_series_on_other_sheet(self):
+        """A series on a non-active sheet is read from that sheet"""
+        first = pd.DataFrame({'t': np.arange(50.0), 'p': np.full(50, 1.0)})
+        second = pd.DataFrame({'t': np.arange(80.0), 'p': np.arange(80.0) * 2})
+        file_data = FileData(filepath="book.xlsx", data=first)
+        file_data.sheet_name = "Sheet1"
+        file_data.sheets = {"Sheet1": first, "Sheet2": second}
+        config = SeriesConfig(name="p2", file_id=file_data.id, x_column='t', y_column='p',
+                              sheet_name="Sheet2")
+
+        x_data, y_data = MultiSeriesAnalysisDialog.get_series_data(config, file_data)
+        np.testing.assert_array_equal(y_data, second['p'].to_numpy())
+
+        # Statistics stored by the dialog are what the series stats view computes
+        file_data.store_stat(*config.stats_key(), describe(y_data))
+        expected = describe(config.get_data(file_data)[1])
+        self.assertEqual(file_data.cached_stat(*config.stats_key())['mean'], expected['mean'])
+        self.assertEqual(file_data.cached_stat(*config.stats_key())['count'], 80)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,14 @@ Focused tests for annotation pathways, including datetime handling and spike/bas
 
 import unittest
 import datetime as dt
+from types import SimpleNamespace
 
-from core.annotation_manager import AnnotationManager
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from core.annotation_manager import AnnotationManager, BlitLayer
+from core.annotation_index import AnnotationIndex
 from models.data_models import AnnotationConfig
 
 
@@ -46,5 +52,210 @@ class TestAnnotationManager(unittest.TestCase):
         plt.close(fig)
 
 
+class TestAnnotationBlitting(unittest.TestCase):
+    """Test the interactive blit layer used for dragging and previews"""
+
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.plot(range(1000), range(1000))
+        self.mgr = AnnotationManager()
+        self.mgr.set_data_context(self.ax)
+        self.full_draws = 0
+        self.fig.canvas.mpl_connect('draw_event', self._count_draw)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def _count_draw(self, event):
+        self.full_draws += 1
+
+    def test_preview_updates_blit_after_first_draw(self):
+        """Only the first preview needs a full draw; later ones reuse the background"""
+        self.mgr.start_preview_mode()
+        for i in range(5):
+            self.mgr.update_preview(AnnotationConfig(annotation_type="text", text="p", x=100.0 + i, y=500.0))
+
+        self.assertEqual(self.full_draws, 1)
+        self.assertTrue(self.mgr.preview_object.get_animated())
+        self.assertIsNotNone(self.mgr._blit_layer.background)
+
+    def test_new_static_artist_invalidates_background(self):
+        """Animating an artist that is already drawn forces a fresh background"""
+        layer = BlitLayer(self.ax)
+        line, = self.ax.plot([0, 1], [0, 1])
+        layer.update()
+        self.assertIsNotNone(layer.background)
+
+        layer.set_artists([line])
+        self.assertIsNone(layer.background)
+        layer.close()
+        self.assertFalse(line.get_animated())
+
+    def test_motion_is_coalesced(self):
+        """Motion events between frames collapse into one move"""
+        ann = AnnotationConfig(annotation_type="text", text="a", x=100.0, y=100.0)
+        self.mgr.add_annotation(ann)
+        self.mgr.start_preview_mode()
+        x_px, y_px = self.ax.transData.transform((100.0, 100.0))
+        self.mgr._on_mouse_press(SimpleNamespace(inaxes=self.ax, x=x_px, y=y_px, xdata=100.0, ydata=100.0))
+        self.assertIs(self.mgr.dragging_annotation, ann)
+
+        for step in range(1, 11):
+            self.mgr._on_mouse_motion(SimpleNamespace(inaxes=self.ax, xdata=100.0 + step, ydata=100.0))
+        self.assertEqual(ann.x, 100.0)
+
+        self.mgr._flush_motion()
+        self.assertEqual(ann.x, 110.0)
+        self.assertTrue(self.mgr.annotation_objects[ann.annotation_id].get_animated())
+
+        self.mgr._on_mouse_release(SimpleNamespace(inaxes=self.ax, xdata=110.0, ydata=100.0))
+        self.assertIsNone(self.mgr.dragging_annotation)
+        self.assertFalse(self.mgr.annotation_objects[ann.annotation_id].get_animated())
+
+    def _press(self, ann):
+        x_px, y_px = self.ax.transData.transform((ann.x, ann.y))
+        self.mgr._on_mouse_press(SimpleNamespace(inaxes=self.ax, x=x_px, y=y_px, xdata=ann.x, ydata=ann.y))
+
+    def test_drag_moves_artist_in_place(self):
+        """Dragging moves the existing artist and reports one change on release"""
+        ann = self.mgr.add_line(100.0, 100.0, 200.0, 200.0)
+        self.mgr.start_preview_mode()
+        changes = []
+        self.mgr.on_change = lambda: changes.append(1)
+        artist = self.mgr.annotation_objects[ann.annotation_id]
+
+        self._press(ann)
+        for step in range(1, 4):
+            self.mgr._on_mouse_motion(SimpleNamespace(inaxes=self.ax, xdata=100.0 + step * 10, ydata=100.0))
+            self.mgr._flush_motion()
+
+        self.assertIs(self.mgr.annotation_objects[ann.annotation_id], artist)
+        self.assertEqual(list(artist.get_xdata()), [130.0, 230.0])
+        self.assertEqual(changes, [])
+
+        self.mgr._on_mouse_release(SimpleNamespace(inaxes=self.ax, xdata=130.0, ydata=100.0))
+        self.assertEqual(changes, [1])
+        self.assertIs(self.mgr.find_annotation_at_point(180.0, 150.0), ann)
+
+    def test_click_without_drag_is_not_a_change(self):
+        """Pressing and releasing on an annotation leaves it and the project alone"""
+        ann = AnnotationConfig(annotation_type="text", text="a", x=100.0, y=100.0)
+        self.mgr.add_annotation(ann)
+        self.mgr.start_preview_mode()
+        changes = []
+        self.mgr.on_change = lambda: changes.append(1)
+        artist = self.mgr.annotation_objects[ann.annotation_id]
+
+        self._press(ann)
+        self.mgr._on_mouse_release(SimpleNamespace(inaxes=self.ax, xdata=100.0, ydata=100.0))
+
+        self.assertEqual(changes, [])
+        self.assertIs(self.mgr.annotation_objects[ann.annotation_id], artist)
+        self.assertEqual((ann.x, ann.y), (100.0, 100.0))
+
+
+
+class TestAnnotationIndex(unittest.TestCase):
+    """Test the display-space grid index"""
+
+    def test_box_and_segment_hits(self):
+        """Boxes hit inside their extent, segments only along the line"""
+        index = AnnotationIndex(cell_size=10)
+        index.insert("box", (0, 0, 20, 20))
+        index.insert("diag", (100, 100, 200, 200), ((100, 100), (200, 200)))
+
+        self.assertEqual(index.query(5, 5), ["box"])
+        self.assertEqual(index.query(23, 5, tolerance=4), ["box"])
+        self.assertEqual(index.query(150, 151, tolerance=2), ["diag"])
+        # Inside the segment's bounding box but far from the line
+        self.assertEqual(index.query(190, 110, tolerance=2), [])
+
+    def test_incremental_updates(self):
+        """Moving and removing entries updates the cells"""
+        index = AnnotationIndex(cell_size=10)
+        index.insert("a", (0, 0, 5, 5))
+        index.insert("a", (500, 500, 505, 505))
+
+        self.assertEqual(index.query(2, 2), [])
+        self.assertEqual(index.query(502, 502), ["a"])
+        index.remove("a")
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query(502, 502), [])
+
+    def test_nearest_and_topmost_first(self):
+        """Nearest hits come first; overlapping ties go to the newest"""
+        index = AnnotationIndex()
+        index.insert("under", (0, 0, 50, 50))
+        index.insert("over", (0, 0, 50, 50))
+        index.insert("near", (60, 0, 70, 50))
+
+        self.assertEqual(index.query(25, 25, tolerance=40), ["over", "under", "near"])
+
+    def test_oversized_entries(self):
+        """Huge regions are still found"""
+        index = AnnotationIndex(cell_size=1)
+        index.insert("region", (0, 0, 1e6, 1e6))
+        self.assertEqual(index.query(5e5, 5e5), ["region"])
+
+
+class TestAnnotationHitTesting(unittest.TestCase):
+    """Test AnnotationManager hit-testing through the index"""
+
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.set_xlim(0, 100)
+        self.ax.set_ylim(0, 100)
+        self.mgr = AnnotationManager()
+        self.mgr.set_data_context(self.ax)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def _px(self, x, y):
+        return self.ax.transData.transform((x, y))
+
+    def test_line_hit_along_its_length(self):
+        """Lines are hit anywhere along them, not just at the anchor"""
+        line = self.mgr.add_line(10.0, 10.0, 90.0, 90.0)
+
+        self.assertIs(self.mgr.hit_test(*self._px(50.0, 50.0)), line)
+        self.assertIsNone(self.mgr.hit_test(*self._px(80.0, 20.0)))
+
+    def test_rectangle_extent(self):
+        """Rectangles are hit over their whole area"""
+        rect = self.mgr.add_rectangle(20.0, 20.0, 40.0, 30.0)
+
+        self.assertIs(self.mgr.hit_test(*self._px(55.0, 45.0)), rect)
+        self.assertIsNone(self.mgr.hit_test(*self._px(70.0, 70.0)))
+
+    def test_many_annotations(self):
+        """Thousands of spike markers resolve to the one under the cursor"""
+        spikes = [self.mgr.add_point(x=i * 0.05, y=50.0) for i in range(2000)]
+
+        self.assertIs(self.mgr.find_annotation_at_point(60.0, 50.0), spikes[1200])
+        self.assertIsNone(self.mgr.find_annotation_at_point(60.0, 10.0))
+
+    def test_drag_and_limit_changes(self):
+        """Moved annotations and new axis limits are reflected"""
+        point = self.mgr.add_point(x=30.0, y=30.0)
+        point.x, point.y = 70.0, 70.0
+        self.mgr.update_annotation(point)
+
+        self.assertIsNone(self.mgr.find_annotation_at_point(30.0, 30.0))
+        self.assertIs(self.mgr.find_annotation_at_point(70.0, 70.0), point)
+
+        self.ax.set_xlim(60, 80)
+        self.ax.set_ylim(60, 80)
+        self.assertIs(self.mgr.hit_test(*self._px(70.0, 70.0)), point)
+        self.assertIsNone(self.mgr.hit_test(*self._px(75.0, 70.0)))
+
+    def test_removed_annotation_not_hit(self):
+        """Removed annotations leave the index"""
+        point = self.mgr.add_point(x=30.0, y=30.0)
+        self.mgr.remove_annotation(point.annotation_id)
+
+        self.assertIsNone(self.mgr.find_annotation_at_point(30.0, 30.0))
+
+
 if __name__ == '__main__':
     unittest.main()
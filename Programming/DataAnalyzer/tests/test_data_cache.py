@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the on-disk file cache
+"""
+
+import os
+import time
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.data_cache import DataCache, FEATHER_AVAILABLE
+from core.file_manager import FileManager
+
+
+@unittest.skipUnless(FEATHER_AVAILABLE, "pyarrow not installed")
+class TestDataCache(unittest.TestCase):
+    """Test DataCache lookups, invalidation and eviction"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.csv_path = root / "log.csv"
+        pd.DataFrame({
+            'Time': pd.date_range('2025-08-01', periods=200, freq='s').strftime('%Y-%m-%d %H:%M:%S'),
+            'Pressure': np.random.rand(200)
+        }).to_csv(self.csv_path, index=False)
+
+        self.cache = DataCache(cache_dir=root / "cache")
+        self.manager = FileManager(data_cache=self.cache)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_second_load_hits_cache(self):
+        """Reloading an unchanged file is served from the cache"""
+        first = self.manager.load_file(str(self.csv_path))
+        second = self.manager.load_file(str(self.csv_path))
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(second.datetime_columns, ['Time'])
+        pd.testing.assert_frame_equal(first.data, second.data)
+
+    def test_modified_file_misses(self):
+        """Changing the source file invalidates its entry"""
+        self.manager.load_file(str(self.csv_path))
+
+        later = time.time() + 10
+        os.utime(self.csv_path, (later, later))
+        self.manager.load_file(str(self.csv_path))
+
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_size_cap_evicts_oldest(self):
+        """Entries beyond the size cap are evicted least recently used first"""
+        self.cache.max_size_bytes = 1
+        self.manager.load_file(str(self.csv_path))
+
+        self.assertEqual(self.cache.get_stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
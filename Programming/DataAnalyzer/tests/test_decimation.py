@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Unit tests for min/max (M4) plot decimation
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from core.decimation import m4_decimate, m4_indices, decimate_for_axes, should_decimate, ViewportDecimator
+from core.pyramid import ColumnPyramid, PyramidBuilder, overview_positions, FANOUT
+from models.data_models import SeriesConfig, FileData
+
+
+class TestM4Decimation(unittest.TestCase):
+    """Test bucketing and spike preservation"""
+
+    def setUp(self):
+        n = 200000
+        self.x = np.arange(n, dtype=float)
+        self.y = np.random.rand(n)
+        self.y[123457] = 50.0
+        self.y[654] = -50.0
+
+    def test_reduces_to_four_points_per_bucket(self):
+        """Output is bounded by four points per bucket"""
+        x_out, y_out = m4_decimate(self.x, self.y, 500)
+
+        self.assertLessEqual(len(y_out), 4 * 500)
+        self.assertTrue(np.all(np.diff(x_out) > 0))
+
+    def test_spikes_preserved(self):
+        """Extremes survive decimation"""
+        _, y_out = m4_decimate(self.x, self.y, 500)
+
+        self.assertEqual(y_out.max(), 50.0)
+        self.assertEqual(y_out.min(), -50.0)
+
+    def test_datetime_x(self):
+        """Datetime Series stay datetime and keep their order"""
+        x = pd.Series(pd.date_range('2024-01-01', periods=len(self.y), freq='s'))
+        x_out, y_out = m4_decimate(x, pd.Series(self.y), 500)
+
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(x_out))
+        self.assertTrue(x_out.is_monotonic_increasing)
+        self.assertEqual(y_out.max(), 50.0)
+
+    def test_nan_buckets_kept(self):
+        """A run of missing values still leaves a gap in the output"""
+        y = self.y.copy()
+        y[1000:5000] = np.nan
+        positions = m4_indices(self.x, y, 500)
+
+        self.assertTrue(np.isnan(y[positions]).any())
+
+    def test_short_series_untouched(self):
+        """Series already below the target are returned as-is"""
+        x, y = self.x[:100], self.y[:100]
+        x_out, y_out = m4_decimate(x, y, 500)
+
+        self.assertIs(x_out, x)
+        self.assertIs(y_out, y)
+
+
+class TestDecimationSettings(unittest.TestCase):
+    """Test SeriesConfig flags and axes sizing"""
+
+    def test_series_flags(self):
+        """data_decimation forces decimation, scatter plots are never decimated"""
+        series = SeriesConfig(name="s", file_id="f", x_column="x", y_column="y")
+        self.assertFalse(should_decimate(series, 1000))
+
+        series.data_decimation = True
+        self.assertTrue(should_decimate(series, 1000))
+
+        series.plot_type = 'scatter'
+        self.assertFalse(should_decimate(series, 10 ** 7))
+
+    def test_decimate_for_axes_uses_pixel_width(self):
+        """Bucket count follows the axes width and decimation_factor"""
+        fig, ax = plt.subplots(figsize=(4, 3), dpi=100)
+        width = int(ax.get_window_extent().width)
+        series = SeriesConfig(name="s", file_id="f", x_column="x", y_column="y", data_decimation=True)
+
+        x = np.arange(100000, dtype=float)
+        y = np.sin(x / 50.0)
+        _, y_out = decimate_for_axes(x, y, ax, series)
+        self.assertLessEqual(len(y_out), 4 * width)
+
+        series.decimation_factor = 4
+        _, y_coarse = decimate_for_axes(x, y, ax, series)
+        self.assertLess(len(y_coarse), len(y_out))
+        plt.close(fig)
+
+
+class TestViewportDecimator(unittest.TestCase):
+    """Test re-decimation on axis limit changes"""
+
+    def setUp(self):
+        self.fig, self.ax = plt.subplots(figsize=(4, 3), dpi=100)
+        self.decimator = ViewportDecimator(self.ax)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def _plot(self, x, y):
+        x_draw, y_draw = m4_decimate(x, y, 300)
+        line, = self.ax.plot(x_draw, y_draw)
+        self.assertTrue(self.decimator.register(line, x, y))
+        return line
+
+    def test_zoom_reveals_raw_points(self):
+        """A narrow x window shows every raw point in it"""
+        x = np.arange(500000, dtype=float)
+        y = np.random.rand(len(x))
+        line = self._plot(x, y)
+        full_count = len(line.get_xdata())
+
+        self.ax.set_xlim(1000, 1200)
+
+        x_shown = np.asarray(line.get_xdata())
+        np.testing.assert_array_equal(x_shown, x[999:1202])
+        self.assertLess(len(x_shown), full_count)
+
+    def test_zoom_on_datetime_axis(self):
+        """Windows are found on datetime x values"""
+        x = pd.Series(pd.date_range('2024-01-01', periods=300000, freq='s'))
+        y = np.random.rand(len(x))
+        line = self._plot(x, y)
+
+        start, end = pd.Timestamp('2024-01-02 00:00'), pd.Timestamp('2024-01-02 00:01')
+        self.ax.set_xlim(start, end)
+
+        x_shown = pd.to_datetime(np.asarray(line.get_xdata()))
+        self.assertEqual(len(x_shown), 63)
+        self.assertLessEqual(x_shown[1], start)
+
+    def test_extend_follows_end(self):
+        """Appended points reach a line whose view showed the old end"""
+        x = np.arange(100000, dtype=float)
+        line = self._plot(x, np.random.rand(len(x)))
+        self.ax.set_xlim(0, x[-1])
+
+        self.assertTrue(self.decimator.extend(line, np.arange(100000, 100100, dtype=float), np.full(100, 9.0)))
+        self.assertEqual(np.asarray(line.get_xdata())[-1], 100099)
+        self.assertEqual(np.asarray(line.get_ydata()).max(), 9.0)
+
+        # Points before the end would break the sorted order
+        self.assertFalse(self.decimator.extend(line, np.array([5.0]), np.array([1.0])))
+        other, = self.ax.plot([0, 1], [0, 1])
+        self.assertFalse(self.decimator.extend(other, np.array([2.0]), np.array([1.0])))
+
+    def test_unsorted_x_not_registered(self):
+        """Lines whose x is not sorted are left alone"""
+        line, = self.ax.plot([0, 1], [0, 1])
+        self.assertFalse(self.decimator.register(line, np.array([3.0, 1.0, 2.0]), np.zeros(3)))
+
+
+class TestColumnPyramid(unittest.TestCase):
+    """Test multi-resolution column summaries"""
+
+    def setUp(self):
+        n = 300001
+        self.y = np.random.rand(n)
+        self.y[123457] = 50.0
+        self.y[200000:200500] = np.nan
+        self.pyramid = ColumnPyramid.build(self.y)
+
+    def test_levels_summarise_column(self):
+        """Every level agrees with the raw column"""
+        for level in range(len(self.pyramid.levels)):
+            data = self.pyramid.levels[level]
+            self.assertEqual(np.nanmax(data['maxs']), 50.0)
+            self.assertAlmostEqual(np.nanmin(data['mins']), np.nanmin(self.y))
+            filled = ~np.isnan(data['maxs'])
+            np.testing.assert_array_equal(self.y[data['argmax']][filled], data['maxs'][filled])
+            np.testing.assert_array_equal(self.y[data['argmin']][filled], data['mins'][filled])
+
+    def test_positions_keep_range_extremes(self):
+        """Overview positions stay in range and keep the extremes of that range"""
+        start, stop = 1234, 250000
+        positions = self.pyramid.positions(start, stop, 400)
+
+        self.assertLessEqual(len(positions), 2 * FANOUT * 400 + 6)
+        self.assertEqual(positions[0], start)
+        self.assertEqual(positions[-1], stop - 1)
+        self.assertEqual(np.nanmax(self.y[positions]), 50.0)
+        self.assertEqual(np.nanmin(self.y[positions]), np.nanmin(self.y[start:stop]))
+
+    def test_short_range_not_summarised(self):
+        """Ranges short enough to draw directly return None"""
+        self.assertIsNone(self.pyramid.positions(0, 1000, 400))
+
+    def test_builder_shares_and_invalidates(self):
+        """Pyramids are stored per column and ignored once the data is replaced"""
+        df = pd.DataFrame({'t': np.arange(len(self.y), dtype=float), 'p': self.y})
+        file_data = FileData(filepath="long.csv", data=df)
+
+        builder = PyramidBuilder(min_rows=1000)
+        builder.schedule(file_data).result()
+        builder.shutdown()
+
+        self.assertIsNotNone(file_data.get_pyramid('p'))
+        self.assertIsNotNone(overview_positions(file_data, 'p', 0, len(df), 300))
+
+        file_data.data = df.copy()
+        self.assertIsNone(file_data.get_pyramid('p'))
+
+    def test_in_place_edit_invalidates(self):
+        """A column edited in place (same frame, same length) drops its pyramid"""
+        df = pd.DataFrame({'p': self.y.copy()})
+        file_data = FileData(filepath="long.csv", data=df)
+        PyramidBuilder(min_rows=1000).build(file_data)
+        self.assertIsNotNone(file_data.get_pyramid('p'))
+
+        df['p'] = df['p'] * 2
+        file_data.mark_changed(['p'])
+        self.assertIsNone(file_data.get_pyramid('p'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Unit tests for FileManager loading paths
+"""
+
+import unittest
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.file_manager import FileManager, LoadCancelled
+from core.file_loader import BackgroundFileLoader
+
+
+class TestChunkedCsvLoading(unittest.TestCase):
+    """Test streaming CSV ingestion"""
+
+    def setUp(self):
+        """Write a CSV large enough to span several chunks"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "chamber.csv"
+
+        n = 2500
+        self.df = pd.DataFrame({
+            'Time': np.arange(n, dtype=float),
+            'Pressure': np.random.rand(n) * 1e-6,
+            'Phase': np.where(np.arange(n) % 2 == 0, 'Pumping', 'Base')
+        })
+        self.df.to_csv(self.csv_path, index=False)
+        self.manager = FileManager()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunked_load_matches_single_read(self):
+        """Chunked load produces the same frame as a single read"""
+        file_data = self.manager.load_csv_file(str(self.csv_path), chunk_size=300)
+
+        self.assertIsNotNone(file_data)
+        self.assertEqual(file_data.shape, self.df.shape)
+        np.testing.assert_allclose(file_data.data['Pressure'].values, self.df['Pressure'].values)
+        self.assertIn('Pressure', file_data.numeric_columns)
+        self.assertIn('Phase', file_data.text_columns)
+
+    def test_column_types_merged_across_chunks(self):
+        """Columns whose chunks parse to different types join like a frame concat"""
+        n = 1000
+        counts = pd.Series(np.arange(n), dtype=object)
+        counts[700:] = ''
+        df = pd.DataFrame({'count': counts, 'flag': ['on'] * 500 + ['1'] * 500})
+        df.to_csv(self.csv_path, index=False)
+
+        file_data = self.manager.load_csv_file(str(self.csv_path), chunk_size=300)
+
+        self.assertEqual(file_data.data['count'].dtype, np.float64)
+        self.assertEqual(file_data.data['count'].iloc[699], 699)
+        self.assertTrue(file_data.data['count'].iloc[700:].isna().all())
+        self.assertEqual(list(file_data.data.index), list(range(n)))
+
+    def test_peak_memory_near_frame_size(self):
+        """Chunks are not all held alongside the joined frame"""
+        import tracemalloc
+        n = 200000
+        pd.DataFrame({f'c{i}': np.random.rand(n) for i in range(8)}).to_csv(self.csv_path, index=False)
+
+        tracemalloc.start()
+        file_data = self.manager.load_csv_file(str(self.csv_path), chunk_size=20000)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(peak, 1.5 * file_data.data.memory_usage(index=False).sum())
+
+    def test_progress_reported(self):
+        """Progress callback is monotonic and finishes at 1.0"""
+        progress = []
+        self.manager.load_csv_file(str(self.csv_path), progress_callback=progress.append, chunk_size=300)
+
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1.0)
+
+    def test_cancel_aborts_load(self):
+        """Setting the cancel event stops the load"""
+        cancel_event = threading.Event()
+
+        def cancel_after_first_chunk(fraction):
+            cancel_event.set()
+
+        with self.assertRaises(LoadCancelled):
+            self.manager.load_csv_file(str(self.csv_path), progress_callback=cancel_after_first_chunk,
+                                       cancel_event=cancel_event, chunk_size=300)
+
+    def test_numeric_text_converted_per_chunk(self):
+        """Text columns holding numbers are converted while streaming"""
+        chunk = pd.DataFrame({'a': ['1.5', '2.5', 'bad'], 'b': ['x', 'y', 'z']})
+        converted = FileManager._convert_chunk_dtypes(chunk)
+
+        self.assertTrue(pd.api.types.is_numeric_dtype(converted['a']))
+        self.assertFalse(pd.api.types.is_numeric_dtype(converted['b']))
+
+
+class TestCsvTailReader(unittest.TestCase):
+    """Test reading rows appended to a growing CSV"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "live.csv"
+        self.csv_path.write_text("Time,Pressure\n0,1e-6\n1,2e-6\n")
+        self.manager = FileManager()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _append(self, text):
+        with open(self.csv_path, 'a') as f:
+            f.write(text)
+
+    def test_reads_only_new_rows(self):
+        """Rows already in the file are skipped unless reading from the start"""
+        reader = self.manager.open_tail(str(self.csv_path))
+        self.assertIsNone(reader.read_new())
+
+        self._append("2,3e-6\n3,4e-6\n")
+        rows = reader.read_new()
+        self.assertEqual(list(rows.columns), ['Time', 'Pressure'])
+        self.assertEqual(rows['Time'].tolist(), [2, 3])
+        self.assertIsNone(reader.read_new())
+
+        full = self.manager.open_tail(str(self.csv_path), from_start=True)
+        self.assertEqual(len(full.read_new()), 4)
+
+    def test_partial_line_waits(self):
+        """A row still being written is read once its newline arrives"""
+        reader = self.manager.open_tail(str(self.csv_path))
+
+        self._append("2,3e")
+        self.assertIsNone(reader.read_new())
+        self._append("-6\n4,5")
+        rows = reader.read_new()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows['Pressure'].iloc[0], 3e-6)
+
+
+class TestFollowMode(unittest.TestCase):
+    """Test appending rows of a growing CSV to a loaded FileData"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "chamber.csv"
+        self.csv_path.write_text("Time,Pressure,Phase\n"
+                                 "2024-01-01 00:00:00,1e-6,Pumping\n"
+                                 "2024-01-01 00:00:01,2e-6,Pumping\n")
+        self.manager = FileManager()
+        self.file_data = self.manager.load_file(str(self.csv_path))
+        self.received = []
+        self.file_data.subscribe(lambda f, rows: self.received.append(rows))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _append(self, text):
+        with open(self.csv_path, 'a') as f:
+            f.write(text)
+
+    def test_appends_with_existing_types(self):
+        """New rows keep the loaded column types and notify subscribers"""
+        self.assertTrue(self.manager.start_following(self.file_data))
+        self.assertEqual(self.file_data.poll_follow(), 0)
+
+        self._append("2024-01-01 00:00:02,3e-6,Base\n2024-01-01 00:00:03,,Base\n")
+        self.assertEqual(self.file_data.poll_follow(), 2)
+
+        df = self.file_data.data
+        self.assertEqual(len(df), 4)
+        self.assertEqual(list(df.index), [0, 1, 2, 3])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['Time']))
+        self.assertEqual(df['Pressure'].iloc[2], 3e-6)
+        self.assertEqual(self.file_data.shape, (4, 3))
+        self.assertEqual(self.file_data.missing_values['Pressure'], 1)
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(len(self.received[0]), 2)
+
+    def test_polls_do_not_copy_loaded_rows(self):
+        """Appended rows wait as chunks until data is read"""
+        self.manager.start_following(self.file_data)
+        loaded = self.file_data.data
+        key = self.file_data.data_key()
+
+        for second in range(2, 5):
+            self._append(f"2024-01-01 00:00:0{second},{second}e-6,Base\n")
+            self.assertEqual(self.file_data.poll_follow(), 1)
+        self.assertIs(self.file_data._data, loaded)
+        self.assertEqual(self.file_data.row_count, 5)
+        self.assertNotEqual(self.file_data.data_key(), key)
+
+        key = self.file_data.data_key()
+        df = self.file_data.data
+        self.assertEqual(list(df.index), [0, 1, 2, 3, 4])
+        self.assertEqual(df['Pressure'].iloc[4], 4e-6)
+        self.assertEqual(self.file_data.data_key(), key)
+        self.assertIs(self.file_data.data, df)
+
+    def test_rotation(self):
+        """A replaced log file is read again from its first row"""
+        self.manager.start_following(self.file_data)
+        reader = self.file_data.follow_reader
+
+        rotated = Path(self.temp_dir.name) / "new.csv"
+        rotated.write_text("Time,Pressure,Phase\n2024-01-02 00:00:00,5e-6,Vent\n")
+        rotated.replace(self.csv_path)
+
+        self.assertEqual(self.file_data.poll_follow(), 1)
+        self.assertEqual(reader.rotations, 1)
+        self.assertEqual(self.file_data.data['Pressure'].iloc[-1], 5e-6)
+
+    def test_truncation(self):
+        """A truncated file counts as rotated"""
+        self.manager.start_following(self.file_data)
+        self.csv_path.write_text("Time,Pressure,Phase\n")
+        self.assertEqual(self.file_data.poll_follow(), 0)
+        self.assertEqual(self.file_data.follow_reader.rotations, 1)
+
+        self._append("2024-01-02 00:00:00,7e-6,Vent\n")
+        self.assertEqual(self.file_data.poll_follow(), 1)
+
+    def test_load_stops_at_partial_line(self):
+        """A row still being written at load time is read whole by follow mode"""
+        self._append("2024-01-01 00:00:02,1.2")
+        file_data = self.manager.load_file(str(self.csv_path))
+        self.assertEqual(len(file_data.data), 2)
+        self.assertEqual(file_data.source_offset, self.csv_path.stat().st_size - len("2024-01-01 00:00:02,1.2"))
+
+        self.assertTrue(self.manager.start_following(file_data))
+        self._append("5e-6,Base\n")
+        self.assertEqual(file_data.poll_follow(), 1)
+        self.assertEqual(len(file_data.data), 3)
+        self.assertEqual(file_data.data['Pressure'].iloc[-1], 1.25e-6)
+        self.assertEqual(file_data.data['Phase'].iloc[-1], 'Base')
+
+    def test_rows_written_after_load_are_followed(self):
+        """Following resumes where the load stopped, not at the current size"""
+        self._append("2024-01-01 00:00:02,3e-6,Base\n")
+        self.assertTrue(self.manager.start_following(self.file_data))
+        self.assertEqual(self.file_data.poll_follow(), 1)
+        self.assertEqual(len(self.file_data.data), 3)
+
+    def test_stop_follow(self):
+        """A stopped file is not polled"""
+        self.manager.start_following(self.file_data)
+        self.file_data.stop_follow()
+        self._append("2024-01-01 00:00:02,3e-6,Base\n")
+
+        self.assertFalse(self.file_data.is_following)
+        self.assertEqual(self.file_data.poll_follow(), 0)
+
+
+class TestLazyExcelSheets(unittest.TestCase):
+    """Test on-demand sheet parsing for workbooks"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.xlsx_path = Path(self.temp_dir.name) / "gauges.xlsx"
+        with pd.ExcelWriter(self.xlsx_path) as writer:
+            for i in range(4):
+                pd.DataFrame({'t': np.arange(10), f'gauge_{i}': np.arange(10) * (i + 1),
+                              'reading': [f"{v:.1f}" for v in np.arange(10) / 2]}).to_excel(
+                    writer, sheet_name=f"Sheet{i}", index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_first_sheet_parsed(self):
+        """Opening a workbook parses just the main sheet"""
+        file_data = FileManager().load_excel_file(str(self.xlsx_path))
+
+        self.assertEqual(file_data.sheet_name, "Sheet0")
+        self.assertEqual(list(file_data.sheets), ["Sheet0", "Sheet1", "Sheet2", "Sheet3"])
+        self.assertTrue(file_data.sheets.is_loaded("Sheet0"))
+        self.assertFalse(file_data.sheets.is_loaded("Sheet2"))
+
+        sheet = file_data.get_sheet_data("Sheet2")
+        self.assertIn('gauge_2', sheet.columns)
+        self.assertTrue(file_data.sheets.is_loaded("Sheet2"))
+
+    def test_sheets_typed_like_main_sheet(self):
+        """Numbers stored as text are converted on every sheet, not just the first"""
+        file_data = FileManager().load_excel_file(str(self.xlsx_path))
+
+        self.assertIn('reading', file_data.numeric_columns)
+        sheet = file_data.get_sheet_data("Sheet3")
+        self.assertTrue(pd.api.types.is_numeric_dtype(sheet['reading']))
+        self.assertEqual(sheet['reading'].iloc[3], 1.5)
+
+    def test_workbook_not_held_open(self):
+        """The workbook handle is closed once loading finishes"""
+        file_data = FileManager().load_excel_file(str(self.xlsx_path))
+        self.assertIsNone(file_data.sheets._excel_file)
+
+        file_data.get_sheet_data("Sheet1")
+        self.assertIsNone(file_data.sheets._excel_file)
+
+    def test_lru_eviction(self):
+        """Parsed sheets beyond the cache size are evicted oldest first"""
+        file_data = FileManager().load_excel_file(str(self.xlsx_path))
+        sheets = file_data.sheets
+        sheets.max_cached = 2
+
+        sheets["Sheet1"]
+        sheets["Sheet2"]
+
+        self.assertFalse(sheets.is_loaded("Sheet0"))
+        self.assertTrue(sheets.is_loaded("Sheet1"))
+        self.assertTrue(sheets.is_loaded("Sheet2"))
+
+
+class _AfterLoop:
+    """Minimal stand-in for a Tk widget's after() scheduler"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+
+    def run(self, timeout=30.0):
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            func, args = self.pending.pop(0)
+            func(*args)
+            time.sleep(0.01)
+
+
+class TestBackgroundFileLoader(unittest.TestCase):
+    """Test the worker-pool file loader"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(3):
+            path = Path(self.temp_dir.name) / f"shift_{i}.csv"
+            pd.DataFrame({'t': np.arange(50), 'p': np.random.rand(50)}).to_csv(path, index=False)
+            self.paths.append(str(path))
+        self.loader = BackgroundFileLoader(max_workers=2)
+
+    def tearDown(self):
+        self.loader.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_loads_files_and_reports_errors(self):
+        """Loaded files reach on_loaded and failures are collected"""
+        loop = _AfterLoop()
+        loaded = []
+        completed = []
+        missing = str(Path(self.temp_dir.name) / "missing.csv")
+
+        self.loader.load_files(self.paths + [missing], loop,
+                               on_loaded=loaded.append, on_complete=completed.append)
+        loop.run()
+
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(sorted(f.filepath for f in loaded), sorted(self.paths))
+        self.assertEqual([path for path, _ in completed[0].errors], [missing])
+        self.assertFalse(self.loader.is_busy)
+
+    def test_failed_loads_keep_file_checks(self):
+        """Files FileManager rejects are reported, not re-read without its checks"""
+        self.loader.file_manager.max_file_size = 10
+        unsupported = Path(self.temp_dir.name) / "notes.dat"
+        unsupported.write_text("t,p\n1,2\n")
+
+        loop = _AfterLoop()
+        loaded, completed = [], []
+        self.loader.load_files([self.paths[0], str(unsupported)], loop,
+                               on_loaded=loaded.append, on_complete=completed.append)
+        loop.run()
+
+        self.assertEqual(loaded, [])
+        errors = dict(completed[0].errors)
+        self.assertIn("File too large", errors[self.paths[0]])
+        self.assertIn("Unsupported file type", errors[str(unsupported)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ import numpy as np
 from datetime import datetime
 from pathlib import Path
 
-from models.data_models import FileData, SeriesConfig, AnnotationConfig
+from models.data_models import FileData, SeriesConfig, AnnotationConfig, ColumnStatsCache
 from models.project_models import Project
 
 
@@ -51,6 +51,106 @@ class TestFileData(unittest.TestCase):
         self.assertIn('x', numeric_cols)
         self.assertIn('y', numeric_cols)
 
+    def test_text_column_inference(self):
+        """Test text columns are classified and converted"""
+        n = 5000
+        df = pd.DataFrame({
+            'Timestamp': pd.date_range('2025-08-01', periods=n, freq='s').strftime('%Y-%m-%d %H:%M:%S'),
+            'Pressure': np.random.rand(n).astype(str),
+            'Phase': np.where(np.arange(n) % 3 == 0, 'Pumping', 'Base'),
+            'Sparse': [None] * (n - 1) + ['12.5']
+        }, dtype=object)
+        file_data = FileData(self.filepath, df)
+
+        self.assertEqual(file_data.datetime_columns, ['Timestamp'])
+        self.assertEqual(file_data.numeric_columns, ['Pressure', 'Sparse'])
+        self.assertEqual(file_data.text_columns, ['Phase'])
+        self.assertEqual(file_data.datetime_formats['Timestamp'], '%Y-%m-%d %H:%M:%S')
+        self.assertEqual(file_data.data['Timestamp'].iloc[-1], pd.Timestamp('2025-08-01 01:23:19'))
+
+
+    def test_column_stats(self):
+        """Column statistics come from the shared kernel and are memoised"""
+        file_data = FileData(self.filepath, self.df)
+        stats = file_data.get_column_stats('y')
+
+        self.assertAlmostEqual(stats['std'], self.df['y'].std())
+        self.assertAlmostEqual(stats['q75'], self.df['y'].quantile(0.75))
+        self.assertEqual(stats['median'], stats['q50'])
+
+        summary = file_data.describe_column('y', 10, 20)
+        self.assertEqual(summary['count'], 10)
+        self.assertAlmostEqual(summary['mean'], self.df['y'].iloc[10:20].mean())
+        self.assertIs(file_data.describe_column('y', 10, 20), summary)
+
+        file_data.append_rows(pd.DataFrame({'x': [100], 'y': [1e6], 'z': [0.0]}))
+        self.assertEqual(file_data.describe_column('y')['max'], 1e6)
+
+class TestColumnStatsCache(unittest.TestCase):
+    """Test the versioned per-column statistics cache"""
+
+    def setUp(self):
+        self.df = pd.DataFrame({'a': np.arange(100.0), 'b': np.arange(100.0) * 2})
+        self.file_data = FileData("test.csv", self.df)
+        self.calls = []
+
+    def _stat(self, column, start=None, end=None):
+        def compute():
+            self.calls.append((column, start, end))
+            return float(self.file_data.data[column].iloc[start:end].sum())
+        return self.file_data.cached_stat('sum', column, start, end, compute)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = ColumnStatsCache(max_entries=2)
+        cache.store('k', 'a', None, None, 1)
+        cache.store('k', 'b', None, None, 2)
+        cache.lookup('k', 'a')
+        cache.store('k', 'c', None, None, 3)
+
+        self.assertEqual(cache.lookup('k', 'a'), 1)
+        self.assertIsNone(cache.lookup('k', 'b'))
+        self.assertEqual(len(cache), 2)
+
+    def test_invalidate_column(self):
+        """A change to one column keeps the other column's statistics"""
+        self._stat('a')
+        self._stat('b')
+        version = self.file_data.version
+
+        self.file_data.data['a'] = 0.0
+        self.file_data.mark_changed(['a'])
+
+        self.assertEqual(self._stat('a'), 0.0)
+        self._stat('b')
+        self.assertEqual(self.calls, [('a', None, None), ('b', None, None), ('a', None, None)])
+        self.assertGreater(self.file_data.version, version)
+
+    def test_append_keeps_earlier_ranges(self):
+        """Appending rows only drops entries whose range reaches the new rows"""
+        self._stat('a', 0, 50)
+        self._stat('a')
+        self.file_data.append_rows(pd.DataFrame({'a': [1000.0], 'b': [0.0]}))
+
+        self._stat('a', 0, 50)
+        self.assertEqual(self._stat('a'), sum(range(100)) + 1000.0)
+        self.assertEqual(self.calls, [('a', 0, 50), ('a', None, None), ('a', None, None)])
+
+    def test_replaced_data(self):
+        """Replacing the DataFrame invalidates everything"""
+        self._stat('a')
+        self.file_data.data = self.df * 3
+        self.assertEqual(self._stat('a'), 3 * sum(range(100)))
+        self.assertEqual(len(self.calls), 2)
+
+    def test_metadata_memory_cached(self):
+        """Column memory usage is computed once per column version"""
+        usage = self.file_data.metadata['memory_usage']
+        self.assertEqual(usage, self.df.memory_usage(deep=True).sum())
+        hits = self.file_data.stats_cache.hits
+        self.file_data.metadata
+        self.assertEqual(self.file_data.stats_cache.hits, hits + 2)
+
 
 class TestSeriesConfig(unittest.TestCase):
     """Test SeriesConfig model"""
@@ -86,6 +186,16 @@ class TestSeriesConfig(unittest.TestCase):
         self.assertEqual(series.line_style, '-')
         self.assertEqual(series.line_width, 1.5)
 
+    def test_get_data_index(self):
+        """An 'Index' x column plots against row position"""
+        file_data = FileData("test.csv", pd.DataFrame({'y': [1.0, np.nan, 3.0, 4.0]}))
+        series = SeriesConfig(name="s", file_id=file_data.id, x_column="Index", y_column="y",
+                              start_index=1)
+        x_data, y_data = series.get_data(file_data)
+
+        self.assertEqual(list(x_data), [2, 3])
+        self.assertEqual(list(y_data), [3.0, 4.0])
+
     def test_get_data(self):
         """Test data extraction"""
         df = pd.DataFrame({
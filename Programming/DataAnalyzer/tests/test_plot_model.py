@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the retained plot model
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from core.plot_model import RetainedPlotModel, NEW, UNCHANGED, STYLE, DATA
+from models.data_models import SeriesConfig, FileData
+
+
+class TestRetainedPlotModel(unittest.TestCase):
+    """Test diffing series settings against drawn artists"""
+
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.model = RetainedPlotModel()
+        self.model.reset(self.ax, ('Light', False, False))
+        self.series = SeriesConfig(name="Pressure", file_id="f1", x_column="t", y_column="p")
+        self.x = np.arange(100)
+        self.y = np.sin(self.x / 10.0)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def _draw(self, series, data_key=1):
+        def draw():
+            self.ax.plot(self.x, self.y, color=series.color, label=series.legend_label)
+            self.ax.plot(self.x, self.y * 0.5, color=series.color, label="trend")
+        artists = self.model.capture(self.ax, draw)
+        self.model.record(series, artists, data_key)
+        return artists
+
+    def test_capture_returns_new_artists(self):
+        """Only artists added by the drawing call are captured"""
+        self.ax.plot([0, 1], [0, 1])
+        artists = self._draw(self.series)
+
+        self.assertEqual(len(artists), 2)
+        self.assertEqual(len(self.ax.lines), 3)
+
+    def test_classify(self):
+        """Series are classified by what changed since they were drawn"""
+        self.assertEqual(self.model.classify(self.series, 1), NEW)
+        self._draw(self.series)
+        self.assertEqual(self.model.classify(self.series, 1), UNCHANGED)
+
+        self.series.color = "#FF0000"
+        self.assertEqual(self.model.classify(self.series, 1), STYLE)
+        self.assertEqual(self.model.classify(self.series, 2), DATA)
+
+        self.series.y_column = "q"
+        self.assertEqual(self.model.classify(self.series, 1), DATA)
+
+    def test_style_changes_applied_in_place(self):
+        """Visibility and colour reach every artist; line style only the main one"""
+        line, trend = self._draw(self.series)
+
+        self.series.visible = False
+        self.series.color = "#FF0000"
+        self.series.line_style = "--"
+        changed = self.model.apply_style(self.series)
+
+        self.assertEqual(changed, {'visible', 'color', 'line_style'})
+        self.assertFalse(line.get_visible())
+        self.assertFalse(trend.get_visible())
+        self.assertEqual(matplotlib.colors.to_hex(trend.get_color()), "#ff0000")
+        self.assertEqual(line.get_linestyle(), "--")
+        self.assertEqual(trend.get_linestyle(), "-")
+        self.assertIn(line, self.ax.lines)
+        self.assertEqual(self.model.classify(self.series, 1), UNCHANGED)
+
+    def test_legend_label(self):
+        """Hiding a series from the legend clears its label"""
+        line, _ = self._draw(self.series)
+
+        self.series.show_in_legend = False
+        self.model.apply_style(self.series)
+
+        self.assertEqual(line.get_label(), "")
+
+    def test_remove(self):
+        """Removing a series detaches its artists and forgets it"""
+        artists = self._draw(self.series)
+
+        removed = self.model.remove(self.series.id)
+
+        self.assertEqual(removed, artists)
+        self.assertEqual(len(self.ax.lines), 0)
+        self.assertEqual(self.model.classify(self.series, 1), NEW)
+
+    def test_scatter_marker_needs_replot(self):
+        """Scatter marker shapes cannot be changed in place"""
+        artists = self.model.capture(self.ax, lambda: self.ax.scatter(self.x, self.y))
+        self.model.record(self.series, artists, 1)
+
+        self.series.marker_size = 9.0
+        self.assertEqual(self.model.classify(self.series, 1), STYLE)
+        self.model.apply_style(self.series)
+        self.assertEqual(artists[0].get_sizes()[0], 81.0)
+
+        self.series.marker = "s"
+        self.assertEqual(self.model.classify(self.series, 1), DATA)
+
+    def test_extend_line(self):
+        """Appended points grow a single line without re-plotting it"""
+        artists = self.model.capture(self.ax, lambda: self.ax.plot(self.x, self.y))
+        self.model.record(self.series, artists, 1)
+
+        self.series.end_index = 110
+        self.assertTrue(self.model.extend(self.series, np.arange(100, 110), np.ones(10), 2))
+
+        self.assertEqual(len(artists[0].get_xdata()), 110)
+        self.assertEqual(self.model.classify(self.series, 2), UNCHANGED)
+
+        # A series with a trend line needs re-plotting
+        self._draw(self.series)
+        self.assertFalse(self.model.extend(self.series, [110], [1.0], 3))
+
+    def test_in_place_edit_needs_replot(self):
+        """Data edited in place and reported with mark_changed is re-plotted"""
+        df = pd.DataFrame({'t': self.x, 'p': self.y})
+        file_data = FileData(filepath="run.csv", data=df)
+        self._draw(self.series, file_data.data_key())
+        self.assertEqual(self.model.classify(self.series, file_data.data_key()), UNCHANGED)
+
+        df['p'] = df['p'] * 2
+        file_data.mark_changed(['p'])
+        self.assertEqual(self.model.classify(self.series, file_data.data_key()), DATA)
+
+    def test_layout_change_needs_rebuild(self):
+        """A different theme, axis scale or Axes cannot be updated in place"""
+        self.assertTrue(self.model.can_update(self.ax, ('Light', False, False)))
+        self.assertFalse(self.model.can_update(self.ax, ('Dark', False, False)))
+        self.assertFalse(self.model.can_update(self.ax, ('Light', True, False)))
+
+        fig, other = plt.subplots()
+        self.assertFalse(self.model.can_update(other, ('Light', False, False)))
+        plt.close(fig)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Unit tests for project saving and the columnar project data store
+"""
+
+import unittest
+import tempfile
+import pickle
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import FileData, SeriesConfig
+from models.project_models import Project
+from core.project_manager import ProjectManager
+from core.project_store import ProjectDataStore
+
+
+def _is_memory_mapped(values: np.ndarray) -> bool:
+    """True if an array is a view onto a memory-mapped file"""
+    while values is not None:
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base if isinstance(values.base, np.ndarray) else None
+    return False
+
+
+class TestProjectDataStore(unittest.TestCase):
+    """Test column-wise project storage"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+        n = 200
+        df = pd.DataFrame({
+            'Time': pd.date_range('2024-01-01', periods=n, freq='s'),
+            'Pressure': np.linspace(1e-3, 1e-6, n),
+            'Temperature': np.random.rand(n) * 30,
+            'Phase': ['Pumping'] * n
+        })
+        self.file_data = FileData(filepath=str(self.root / "run.csv"), data=df)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Columns and metadata survive a write/read cycle"""
+        store = ProjectDataStore(self.root / "proj_data")
+        store.write(self.file_data)
+
+        loaded = store.read(self.file_data.id, columns=['Pressure'])
+
+        pd.testing.assert_frame_equal(loaded.data, self.file_data.data)
+        self.assertEqual(loaded.id, self.file_data.id)
+        self.assertEqual(loaded.numeric_columns, self.file_data.numeric_columns)
+        self.assertEqual(loaded.datetime_columns, ['Time'])
+        self.assertEqual(loaded.text_columns, ['Phase'])
+
+    def test_unreferenced_columns_memory_mapped(self):
+        """Only requested columns are copied into memory"""
+        store = ProjectDataStore(self.root / "proj_data")
+        store.write(self.file_data)
+
+        loaded = store.read(self.file_data.id, columns=['Pressure'])
+
+        self.assertFalse(_is_memory_mapped(loaded.data['Pressure'].to_numpy()))
+        self.assertTrue(_is_memory_mapped(loaded.data['Temperature'].to_numpy()))
+
+    def test_unchanged_file_not_rewritten(self):
+        """Saving data read from the store again is a no-op"""
+        store = ProjectDataStore(self.root / "proj_data")
+        self.assertTrue(store.write(self.file_data))
+        self.assertFalse(store.write(self.file_data))
+
+        loaded = store.read(self.file_data.id)
+        self.assertFalse(store.write(loaded))
+
+    def test_in_place_edit_rewritten(self):
+        """A column edited in place and recorded with mark_changed is saved again"""
+        store = ProjectDataStore(self.root / "proj_data")
+        store.write(self.file_data)
+        loaded = store.read(self.file_data.id)
+
+        loaded.data['Pressure'] = loaded.data['Pressure'] * 2
+        loaded.mark_changed(['Pressure'])
+        self.assertTrue(store.write(loaded))
+
+        reread = store.read(self.file_data.id)
+        np.testing.assert_allclose(reread.data['Pressure'], self.file_data.data['Pressure'] * 2)
+
+    def test_rewrite_keeps_mapped_version(self):
+        """Writing a new version leaves the one a loaded file maps untouched"""
+        store = ProjectDataStore(self.root / "proj_data")
+        store.write(self.file_data)
+        loaded = store.read(self.file_data.id)
+        mapped = loaded.data['Temperature'].to_numpy()
+        self.assertTrue(_is_memory_mapped(mapped))
+
+        self.file_data.mark_changed()
+        self.assertTrue(store.write(self.file_data))
+
+        np.testing.assert_array_equal(mapped, self.file_data.data['Temperature'].to_numpy())
+        self.assertEqual(store.file_ids(), [self.file_data.id])
+        self.assertEqual((store.data_dir / self.file_data.id / ProjectDataStore.POINTER).read_text(), 'v2')
+
+    def test_unversioned_layout_read(self):
+        """Files stored with the manifest directly in their directory still load"""
+        store = ProjectDataStore(self.root / "proj_data")
+        store.write(self.file_data)
+        file_dir = store.data_dir / self.file_data.id
+        for path in (file_dir / 'v1').iterdir():
+            path.rename(file_dir / path.name)
+        (file_dir / 'v1').rmdir()
+        (file_dir / ProjectDataStore.POINTER).unlink()
+
+        self.assertTrue(store.exists(self.file_data.id))
+        pd.testing.assert_frame_equal(store.read(self.file_data.id).data, self.file_data.data)
+
+
+class TestProjectManagerStorage(unittest.TestCase):
+    """Test saving and loading projects through ProjectManager"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.manager = ProjectManager()
+
+        df = pd.DataFrame({'t': np.arange(100.0), 'p': np.random.rand(100), 'q': np.random.rand(100)})
+        self.file_data = FileData(filepath=str(self.root / "run.csv"), data=df)
+
+        self.project = Project(name="Chamber test")
+        self.project.add_file(self.file_data)
+        self.project.add_series(SeriesConfig(name="p", file_id=self.file_data.id,
+                                             x_column='t', y_column='p'))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        """Saved projects load back with their data"""
+        project_path = self.root / "chamber.edp"
+        self.assertTrue(self.manager.save_project(self.project, str(project_path)))
+
+        loaded = self.manager.load_project(str(project_path))
+
+        self.assertIsNotNone(loaded)
+        self.assertIn(self.file_data.id, loaded.files)
+        pd.testing.assert_frame_equal(loaded.files[self.file_data.id].data, self.file_data.data)
+        self.assertEqual(len(loaded.series), 1)
+
+    def test_legacy_pickle_loaded_and_migrated(self):
+        """Projects saved as per-file pickles still load and are converted on save"""
+        project_path = self.root / "legacy.edp"
+        self.manager.save_project(self.project, str(project_path))
+
+        data_dir = self.root / "legacy_data"
+        store = ProjectDataStore(data_dir)
+        store.remove(self.file_data.id)
+        with open(data_dir / f"{self.file_data.id}.pkl", 'wb') as f:
+            pickle.dump(self.file_data, f)
+
+        loaded = self.manager.load_project(str(project_path))
+        self.assertIn(self.file_data.id, loaded.files)
+
+        self.manager.save_project(loaded, str(project_path))
+        self.assertTrue(store.exists(self.file_data.id))
+        self.assertFalse((data_dir / f"{self.file_data.id}.pkl").exists())
+
+
+class TestIncrementalAutosave(unittest.TestCase):
+    """Test journal-based autosave and recovery"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = ProjectManager()
+        self.manager.autosave_dir = Path(self.temp_dir.name) / "autosave"
+
+        df = pd.DataFrame({'t': np.arange(50.0), 'p': np.random.rand(50)})
+        self.file_data = FileData(filepath="run.csv", data=df)
+        self.series = SeriesConfig(name="p", file_id=self.file_data.id, x_column='t', y_column='p')
+
+        self.project = Project(name="Autosaved")
+        self.project.add_file(self.file_data)
+        self.project.add_series(self.series)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        self.temp_dir.cleanup()
+
+    def _journal_lines(self):
+        journal = self.manager.autosave_dir / self.project.project_id / "journal.jsonl"
+        return journal.read_text().splitlines()
+
+    def test_only_changes_are_journaled(self):
+        """After the first snapshot, a tick appends just the changed series"""
+        self.assertTrue(self.manager.autosave_project(self.project, wait=True))
+        self.assertEqual(self._journal_lines(), [])
+
+        self.series.color = "#FF0000"
+        self.assertTrue(self.manager.autosave_project(self.project, wait=True))
+
+        records = [json.loads(line) for line in self._journal_lines()]
+        self.assertEqual([(r['kind'], r['id']) for r in records], [('series', self.series.id)])
+
+        # Nothing changed - nothing written
+        self.assertTrue(self.manager.autosave_project(self.project, wait=True))
+        self.assertEqual(len(self._journal_lines()), 1)
+
+    def test_tracked_edit_journaled_once(self):
+        """An in-place edit of a tracked file produces exactly one journal entry"""
+        self.manager.track_file(self.file_data)
+        self.manager.autosave_project(self.project, wait=True)
+
+        self.file_data.data['p'] = self.file_data.data['p'] * 2
+        self.file_data.mark_changed(['p'])
+        self.assertIn(self.file_data.id, self.manager._dirty_files)
+        self.assertTrue(self.manager.project_modified)
+
+        self.assertTrue(self.manager.autosave_project(self.project, wait=True))
+        records = [json.loads(line) for line in self._journal_lines()]
+        self.assertEqual([(r['kind'], r['id']) for r in records], [('file', self.file_data.id)])
+
+        self.manager.untrack_file(self.file_data)
+        self.file_data.mark_changed(['p'])
+        self.assertEqual(self.manager._dirty_files, set())
+
+    def test_recover_replays_journal(self):
+        """Recovery applies journaled changes on top of the base snapshot"""
+        self.manager.autosave_project(self.project, wait=True)
+
+        self.series.color = "#00FF00"
+        second = SeriesConfig(name="t", file_id=self.file_data.id, x_column='p', y_column='t')
+        self.project.add_series(second)
+        self.manager.autosave_project(self.project, wait=True)
+
+        self.project.remove_series(second.id)
+        self.manager.autosave_project(self.project, wait=True)
+
+        recovered = ProjectManager()
+        recovered.autosave_dir = self.manager.autosave_dir
+        project = recovered.recover_autosave(self.project.project_id)
+
+        self.assertEqual(list(project.series), [self.series.id])
+        self.assertEqual(project.series[self.series.id].color, "#00FF00")
+        pd.testing.assert_frame_equal(project.files[self.file_data.id].data, self.file_data.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
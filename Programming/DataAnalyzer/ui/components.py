@@ -749,6 +749,16 @@ class StatusBar(ctk.CTkFrame):
         )
         self.progress_label.grid(row=0, column=1, sticky="w", padx=(5, 10), pady=5)
 
+        # Cancel button for long-running operations (shown on demand)
+        self.cancel_button = ctk.CTkButton(
+            self.progress_frame,
+            text="Cancel",
+            width=60,
+            height=22,
+            font=("", 10)
+        )
+        self.is_cancel_visible = False
+
         # Right side - counts
         self.counts_label = ctk.CTkLabel(
             self,
@@ -780,13 +790,24 @@ class StatusBar(ctk.CTkFrame):
             text=f"Files: {files} | Series: {series}"
         )
 
-    def show_progress(self, value: float = 0):
-        """Show progress bar centered at bottom with optional value (0-1)"""
+    def show_progress(self, value: float = 0, cancel_command=None):
+        """Show progress bar centered at bottom with optional value (0-1)
+
+        Args:
+            value: Progress fraction (0-1)
+            cancel_command: Optional callback that shows a Cancel button
+        """
         if not self.is_progress_visible:
             # Show progress frame in center column
             self.progress_frame.grid(row=0, column=1, sticky="ew", padx=20, pady=2)
             self.is_progress_visible = True
 
+        if cancel_command is not None:
+            self.cancel_button.configure(command=cancel_command, state="normal")
+            if not self.is_cancel_visible:
+                self.cancel_button.grid(row=0, column=2, sticky="e", padx=(0, 10), pady=5)
+                self.is_cancel_visible = True
+
         # Update progress value
         if value > 0:
             self.progress_bar.set(value)
@@ -807,6 +828,10 @@ class StatusBar(ctk.CTkFrame):
             self.progress_label.configure(text="")
             self.progress_label.configure(text="")
 
+        if self.is_cancel_visible:
+            self.cancel_button.grid_forget()
+            self.is_cancel_visible = False
+
 class CollapsibleFrame(ctk.CTkFrame):
     """Collapsible frame widget - Compatibility alias"""
 
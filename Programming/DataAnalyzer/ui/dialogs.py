@@ -19,10 +19,12 @@ from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 from analysis.vacuum import VacuumAnalyzer
+from analysis.comparison import estimate_lag, compare_pair
 from models.data_models import FileData, SeriesConfig, AnnotationConfig
+from utils.descriptive import describe
 from config.constants import UIConfig, MissingDataMethods, TrendTypes
 from ui.components import CollapsibleFrame, ToolTip
-from utils.helpers import detect_datetime_column
+from utils.helpers import detect_datetime_column, to_seconds
 from scipy.signal import find_peaks, savgol_filter
 
 # Initialize logger
@@ -1559,6 +1561,9 @@ class StatisticalAnalysisDialog:
         self.statistical_analyzer = statistical_analyzer
         self.vacuum_analyzer = vacuum_analyzer
         self.vacuum_results = {}
+        
+        # (key, compare_pair result) of the last series comparison
+        self._comparison_cache = (None, None)
 
         # Create dialog
         self.dialog = ctk.CTkToplevel(parent)
@@ -2028,6 +2033,24 @@ class StatisticalAnalysisDialog:
         )
         self.align_desc.pack(anchor="w", padx=10, pady=(0, 8))
         
+        # Cross-correlation search window
+        max_lag_frame = ctk.CTkFrame(align_frame, fg_color="transparent")
+        max_lag_frame.pack(fill="x", padx=10, pady=(0, 8))
+        
+        ctk.CTkLabel(
+            max_lag_frame,
+            text="Max Lag (0 = any):",
+            font=ctk.CTkFont(size=10)
+        ).pack(side="left")
+        
+        self.max_lag_var = tk.DoubleVar(value=0.0)
+        ctk.CTkEntry(
+            max_lag_frame,
+            textvariable=self.max_lag_var,
+            width=80,
+            height=25
+        ).pack(side="right")
+        
         # Manual offset controls (initially hidden)
         self.manual_offset_frame = ctk.CTkFrame(align_frame, corner_radius=4)
         # Don't pack initially - will be shown when "Custom Offset" is selected
@@ -2139,6 +2162,24 @@ class StatisticalAnalysisDialog:
         )
         confidence_desc.pack(anchor="w", pady=(0, 5))
         
+        # Common time base spacing
+        grid_frame = ctk.CTkFrame(advanced_frame, fg_color="transparent")
+        grid_frame.pack(fill="x", padx=10, pady=(0, 5))
+        
+        ctk.CTkLabel(
+            grid_frame,
+            text="Grid Step (0 = auto):",
+            font=ctk.CTkFont(size=11)
+        ).pack(side="left")
+        
+        self.grid_step_var = tk.DoubleVar(value=0.0)
+        ctk.CTkEntry(
+            grid_frame,
+            textvariable=self.grid_step_var,
+            width=80,
+            height=25
+        ).pack(side="right")
+        
         # Smart toggles
         toggles_frame = ctk.CTkFrame(advanced_frame, fg_color="transparent")
         toggles_frame.pack(fill="x", padx=10, pady=(0, 8))
@@ -2586,9 +2627,11 @@ class StatisticalAnalysisDialog:
                         raise ValueError(f"Data access error: {data_error}")
                     
                     # Perform comparison and create plot with the selected type
+                    series_key = (self._comparison_key(primary_config, primary_file_data, whole_columns=True),
+                                  self._comparison_key(secondary_config, secondary_file_data, whole_columns=True))
                     results = self.perform_series_comparison(
                         x1, y1, x2, y2, primary_name, secondary_name, 
-                        mapped_type, self.time_align_var.get()
+                        mapped_type, self.time_align_var.get(), series_key
                     )
                     
                     # Create the plot with the specific type
@@ -2753,9 +2796,9 @@ class StatisticalAnalysisDialog:
             
             comparison_type = comp_type_mapping.get(self.comp_type_var.get(), "Overlay")
             
-            # Map alignment names
+            # Map alignment names (Auto-Detect is resolved by perform_series_comparison)
             align_mapping = {
-                "Auto-Detect": self._detect_best_alignment(primary_x, primary_y, secondary_x, secondary_y),
+                "Auto-Detect": "Auto-Detect",
                 "None": "None",
                 "Start Times": "Start Times", 
                 "Peak Alignment": "Peak Alignment",
@@ -2766,9 +2809,11 @@ class StatisticalAnalysisDialog:
             time_align = align_mapping.get(self.time_align_var.get(), "None")
             
             # Perform enhanced comparison
+            series_key = (self._comparison_key(primary_series, primary_file),
+                          self._comparison_key(secondary_series, secondary_file))
             results = self.perform_series_comparison(
                 primary_x, primary_y, secondary_x, secondary_y,
-                primary_name, secondary_name, comparison_type, time_align
+                primary_name, secondary_name, comparison_type, time_align, series_key
             )
             
             # Create intelligent visualization
@@ -2798,53 +2843,60 @@ class StatisticalAnalysisDialog:
             self.run_button.configure(text=original_text, state="normal")
     
     def _detect_best_alignment(self, x1, y1, x2, y2):
-        """Intelligently detect the best alignment method"""
+        """
+        Pick an alignment method from how well the series match
+        
+        Series that already correlate with their starts lined up are aligned
+        by start time; otherwise a clear cross-correlation peak selects
+        cross-correlation alignment, and peak alignment is the fallback.
+        """
         try:
-            # Check if series have similar time ranges
-            t1_range = np.max(x1) - np.min(x1) 
-            t2_range = np.max(x2) - np.min(x2)
+            if len(y1) <= 10 or len(y2) <= 10:
+                return "Start Times"
             
-            # Check for similar patterns (correlation-based)
-            if len(y1) > 10 and len(y2) > 10:
-                # Simple correlation check with error handling
-                try:
-                    min_len = min(len(y1), len(y2))
-                    y1_sample = y1[:min_len]
-                    y2_sample = y2[:min_len]
-                    
-                    # Check for valid data
-                    valid_mask = np.isfinite(y1_sample) & np.isfinite(y2_sample)
-                    if np.sum(valid_mask) > 10:
-                        y1_clean = y1_sample[valid_mask]
-                        y2_clean = y2_sample[valid_mask]
-                        
-                        # Check for sufficient variation
-                        if np.std(y1_clean) > 1e-10 and np.std(y2_clean) > 1e-10:
-                            corr = np.corrcoef(y1_clean, y2_clean)[0, 1]
-                            
-                            if not np.isfinite(corr):
-                                corr = 0.0
-                                
-                            if abs(corr) > 0.7:
-                                return "Start Times"  # Similar patterns, align starts
-                            elif abs(corr) > 0.3:
-                                return "Cross-Correlation"  # Some similarity, find best offset
-                            else:
-                                return "Peak Alignment"  # Different patterns, align peaks
-                        else:
-                            return "Start Times"  # No variation, use simple alignment
-                    else:
-                        return "Start Times"  # Not enough valid data
-                except (np.linalg.LinAlgError, ValueError) as e:
-                    print(f"Correlation calculation failed: {e}")
-                    return "Start Times"  # Fallback to simple alignment
+            t1 = to_seconds(pd.Series(x1))
+            t2 = to_seconds(pd.Series(x2))
+            estimate = estimate_lag(t1 - np.nanmin(t1), y1, t2 - np.nanmin(t2), y2,
+                                    max_lag=self._max_lag())
             
-            # Default for short series
-            return "Start Times"
+            if abs(estimate['zero_lag_correlation']) > 0.7:
+                return "Start Times"  # Similar patterns, align starts
+            elif estimate['confidence'] > 0.3:
+                return "Cross-Correlation"  # Some similarity, find best offset
+            else:
+                return "Peak Alignment"  # Different patterns, align peaks
             
+        except ValueError as e:
+            logger.debug(f"Alignment detection fell back to start times: {e}")
+            return "Start Times"
         except Exception:
             return "None"
     
+    def _grid_step(self) -> Optional[float]:
+        """Common time base spacing from the dialog (None = from the sample rates)"""
+        try:
+            step = float(self.grid_step_var.get()) if hasattr(self, 'grid_step_var') else 0.0
+        except (tk.TclError, ValueError):
+            step = 0.0
+        return step if step > 0 else None
+    
+    @staticmethod
+    def _comparison_key(config: SeriesConfig, file_data: FileData, whole_columns: bool = False):
+        """Identifies a series' data until its file changes"""
+        if whole_columns:
+            stats_key = (config.x_column, config.y_column)
+        else:
+            stats_key = config.stats_key()
+        return (config.file_id, file_data.data_key(), stats_key)
+    
+    def _max_lag(self) -> Optional[float]:
+        """Cross-correlation search window from the dialog (None = unrestricted)"""
+        try:
+            max_lag = float(self.max_lag_var.get()) if hasattr(self, 'max_lag_var') else 0.0
+        except (tk.TclError, ValueError):
+            max_lag = 0.0
+        return max_lag if max_lag > 0 else None
+    
     def _generate_insights(self, results, primary_name, secondary_name, comparison_type):
         """Generate AI-like insights from comparison results"""
         insights = []
@@ -2977,8 +3029,20 @@ class StatisticalAnalysisDialog:
         self.insights_text.delete("1.0", "end")
         self.insights_text.insert("1.0", insights_text)
 
-    def perform_series_comparison(self, x1, y1, x2, y2, name1, name2, comp_type, time_align):
-        """Perform detailed comparison analysis between two series"""
+    def perform_series_comparison(self, x1, y1, x2, y2, name1, name2, comp_type, time_align,
+                                  series_key=None):
+        """
+        Perform detailed comparison analysis between two series
+        
+        Args:
+            x1, y1, x2, y2: Series data
+            name1, name2: Series names
+            comp_type: Comparison type
+            time_align: Alignment method
+            series_key: Identifies the two series' data (see _comparison_key);
+                when given, the resampled arrays and metrics are reused across
+                comparison types until the data or alignment changes
+        """
         results = {}
         
         # Validate input data
@@ -3010,107 +3074,52 @@ class StatisticalAnalysisDialog:
         }
         
         # Time alignment if requested
+        if time_align == "Auto-Detect":
+            time_align = self._detect_best_alignment(x1, y1, x2, y2)
+        
+        if time_align == "None" and not self._overlaps_in_time(x1, x2):
+            # Runs logged at different times share no absolute time range
+            time_align = "Start Times"
+            results['alignment_note'] = ("The series do not overlap in time - "
+                                         "start times were aligned instead")
+            logger.warning("Series do not overlap in time; aligning start times")
+        
+        if time_align == "Cross-Correlation":
+            try:
+                results['alignment'] = estimate_lag(x1, y1, x2, y2, max_lag=self._max_lag())
+            except ValueError as e:
+                logger.warning(f"Cross-correlation alignment failed: {e}")
+        
         if time_align != "None":
             x1_aligned, y1_aligned, x2_aligned, y2_aligned = self.align_time_series(
-                x1, y1, x2, y2, time_align
+                x1, y1, x2, y2, time_align, results.get('alignment')
             )
             results['alignment_method'] = time_align
         else:
             x1_aligned, y1_aligned = x1, y1
             x2_aligned, y2_aligned = x2, y2
         
-        # Interpolate to common time base for detailed comparison
+        # Resample onto a common time base for detailed comparison
         if comp_type in ["Difference", "Correlation", "Statistical"]:
-            # Create common time base
-            try:
-                # Convert datetime to numeric if needed
-                if pd.api.types.is_datetime64_any_dtype(x1_aligned):
-                    x1_numeric = (pd.Series(x1_aligned) - pd.Series(x1_aligned).iloc[0]).dt.total_seconds()
-                else:
-                    x1_numeric = np.array(x1_aligned)
-                    
-                if pd.api.types.is_datetime64_any_dtype(x2_aligned):
-                    x2_numeric = (pd.Series(x2_aligned) - pd.Series(x2_aligned).iloc[0]).dt.total_seconds()
-                else:
-                    x2_numeric = np.array(x2_aligned)
-                
-                t_min = max(np.min(x1_numeric), np.min(x2_numeric))
-                t_max = min(np.max(x1_numeric), np.max(x2_numeric))
-                
-                if t_max > t_min:
-                    common_time = np.linspace(t_min, t_max, 1000)
-                    
-                    # Interpolate both series to common time base
-                    y1_interp = np.interp(common_time, x1_numeric, y1_aligned)
-                    y2_interp = np.interp(common_time, x2_numeric, y2_aligned)
-                    
-                    results['common_time'] = common_time
-                    results['y1_interpolated'] = y1_interp
-                    results['y2_interpolated'] = y2_interp
-                    
-                    # Calculate correlation with robust error handling
-                    if len(y1_interp) > 1 and len(y2_interp) > 1:
-                        try:
-                            # Check for valid data
-                            valid_mask = np.isfinite(y1_interp) & np.isfinite(y2_interp)
-                            if np.sum(valid_mask) > 1:
-                                y1_clean = y1_interp[valid_mask]
-                                y2_clean = y2_interp[valid_mask]
-                                
-                                # Check for sufficient variation
-                                if np.std(y1_clean) > 1e-10 and np.std(y2_clean) > 1e-10 and len(y1_clean) > 1:
-                                    correlation = np.corrcoef(y1_clean, y2_clean)[0, 1]
-                                    if np.isfinite(correlation):
-                                        results['correlation'] = correlation
-                                    else:
-                                        results['correlation'] = 0.0
-                                else:
-                                    results['correlation'] = 0.0
-                            else:
-                                results['correlation'] = 0.0
-                        except (np.linalg.LinAlgError, ValueError) as e:
-                            print(f"Correlation calculation failed: {e}")
-                            results['correlation'] = 0.0
-                    
-                    # Calculate difference metrics
-                    try:
-                        diff = y1_interp - y2_interp
-                        results['difference_stats'] = {
-                            'mean_diff': np.mean(diff),
-                            'std_diff': np.std(diff),
-                            'max_diff': np.max(np.abs(diff)),
-                            'rms_diff': np.sqrt(np.mean(diff**2))
-                        }
-                    except Exception as e:
-                        print(f"Difference calculation failed: {e}")
-                        results['difference_stats'] = {
-                            'mean_diff': 0.0,
-                            'std_diff': 0.0,
-                            'max_diff': 0.0,
-                            'rms_diff': 0.0
-                        }
-                    
-                    # Statistical tests
-                    try:
-                        from scipy.stats import ttest_ind, ks_2samp
-                        
-                        # T-test for means
-                        t_stat, t_pval = ttest_ind(y1_interp, y2_interp)
-                        results['ttest'] = {'statistic': t_stat, 'p_value': t_pval}
-                        
-                        # Kolmogorov-Smirnov test for distributions
-                        ks_stat, ks_pval = ks_2samp(y1_interp, y2_interp)
-                        results['ks_test'] = {'statistic': ks_stat, 'p_value': ks_pval}
-                        
-                    except ImportError:
-                        logger.warning("scipy.stats not available for statistical tests")
-                    except Exception as e:
-                        print(f"Statistical tests failed: {e}")
-                        
-            except Exception as e:
-                logger.warning(f"Failed to create common time base: {e}")
-                # Skip interpolation-dependent analysis
-                results['correlation'] = 0.0
+            cache_key = None
+            if series_key is not None:
+                # The aligned start times capture whatever shift the alignment applied
+                cache_key = (series_key, time_align, np.asarray(x1_aligned)[0],
+                             np.asarray(x2_aligned)[0], self._grid_step())
+            
+            if cache_key is not None and self._comparison_cache[0] == cache_key:
+                results.update(self._comparison_cache[1])
+            else:
+                try:
+                    pair = compare_pair(x1_aligned, y1_aligned, x2_aligned, y2_aligned,
+                                        step=self._grid_step())
+                    results.update(pair)
+                    if cache_key is not None:
+                        self._comparison_cache = (cache_key, pair)
+                except ValueError as e:
+                    logger.warning(f"Failed to create common time base: {e}")
+                    # Skip interpolation-dependent analysis
+                    results['correlation'] = 0.0
         
         # Performance metrics comparison (if applicable for vacuum data)
         if 'pressure' in name1.lower() or 'vacuum' in name1.lower():
@@ -3120,8 +3129,24 @@ class StatisticalAnalysisDialog:
         
         return results
 
-    def align_time_series(self, x1, y1, x2, y2, method):
-        """Align time series using specified method"""
+    @staticmethod
+    def _overlaps_in_time(x1, x2) -> bool:
+        """True if the two x ranges share any part of their span"""
+        t1 = to_seconds(pd.Series(x1))
+        t2 = to_seconds(pd.Series(x2))
+        if not np.isfinite(t1).any() or not np.isfinite(t2).any():
+            return True
+        return max(np.nanmin(t1), np.nanmin(t2)) < min(np.nanmax(t1), np.nanmax(t2))
+
+    def align_time_series(self, x1, y1, x2, y2, method, estimate=None):
+        """
+        Align time series using specified method
+        
+        Args:
+            x1, y1, x2, y2: Series data
+            method: Alignment method name
+            estimate: Precomputed estimate_lag result for Cross-Correlation
+        """
         if method == "Start Times":
             # Align start times to zero
             x1_aligned = x1 - x1[0]
@@ -3139,23 +3164,20 @@ class StatisticalAnalysisDialog:
             return x1, y1, x2_aligned, y2
             
         elif method == "Cross-Correlation":
-            # Align based on cross-correlation
-            # Simplified implementation - could be enhanced
-            correlation = np.correlate(y1, y2, mode='full')
-            lag = np.argmax(correlation) - len(y2) + 1
+            # Shift the secondary series by the (sub-sample) lag of best correlation
+            if estimate is None:
+                try:
+                    estimate = estimate_lag(x1, y1, x2, y2, max_lag=self._max_lag())
+                except ValueError as e:
+                    logger.warning(f"Cross-correlation alignment failed: {e}")
+                    return x1, y1, x2, y2
             
-            if lag > 0:
-                x1_aligned = x1[lag:]
-                y1_aligned = y1[lag:]
-                x2_aligned = x2
-                y2_aligned = y2
+            if pd.api.types.is_datetime64_any_dtype(np.asarray(x2).dtype):
+                x2_aligned = x2 + pd.to_timedelta(estimate['lag'], unit='s')
             else:
-                x1_aligned = x1
-                y1_aligned = y1
-                x2_aligned = x2[-lag:]
-                y2_aligned = y2[-lag:]
+                x2_aligned = x2 + estimate['lag']
             
-            return x1_aligned, y1_aligned, x2_aligned, y2_aligned
+            return x1, y1, x2_aligned, y2
             
         elif method == "Custom Offset":
             # Apply manual time offsets
@@ -3433,6 +3455,8 @@ class StatisticalAnalysisDialog:
         results_text += f"Primary Series: {name1}\n"
         results_text += f"Secondary Series: {name2}\n"
         results_text += f"Comparison Type: {comp_type}\n\n"
+        if 'alignment_note' in results:
+            results_text += f"Note: {results['alignment_note']}\n\n"
         
         # Basic statistics
         if 'series1_stats' in results and 'series2_stats' in results:
@@ -3464,6 +3488,15 @@ class StatisticalAnalysisDialog:
                 results_text += f"Std difference: {std_diff_pct:.2f}%\n"
             results_text += "\n"
         
+        # Cross-correlation alignment
+        if 'alignment' in results:
+            alignment = results['alignment']
+            results_text += "TIME ALIGNMENT\n"
+            results_text += "-" * 20 + "\n"
+            results_text += f"Lag applied to {name2}: {alignment['lag']:.6g}\n"
+            results_text += f"Resampled step: {alignment['step']:.6g}\n"
+            results_text += f"Confidence: {alignment['confidence']:.3f}\n\n"
+        
         # Correlation
         if 'correlation' in results:
             results_text += "CORRELATION ANALYSIS\n"
@@ -3575,8 +3608,8 @@ class StatisticalAnalysisDialog:
 
         x_data, y_data = series.get_data(file_data)
 
-        # Run analysis
-        stats = self.statistical_analyzer.calculate_basic_stats(y_data)
+        # Run analysis (basic statistics are cached on the file until its data changes)
+        stats = file_data.cached_stat(*series.stats_key(), compute=lambda: describe(y_data))
         normality = self.statistical_analyzer.test_normality(y_data)
         outliers = self.statistical_analyzer.detect_outliers(y_data)
 
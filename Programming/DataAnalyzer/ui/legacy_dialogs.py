@@ -19,6 +19,7 @@ import matplotlib.pyplot as plt
 
 from analysis.vacuum import VacuumAnalyzer
 from models.data_models import FileData, SeriesConfig, AnnotationConfig
+from utils.descriptive import describe
 from config.constants import UIConfig, MissingDataMethods, TrendTypes
 from ui.components import CollapsibleFrame, ToolTip
 from utils.helpers import detect_datetime_column
@@ -1827,8 +1828,8 @@ class AnalysisDialog:
 
         x_data, y_data = series.get_data(file_data)
 
-        # Run analysis
-        stats = self.statistical_analyzer.calculate_basic_stats(y_data)
+        # Run analysis (basic statistics are cached on the file until its data changes)
+        stats = file_data.cached_stat(*series.stats_key(), compute=lambda: describe(y_data))
         normality = self.statistical_analyzer.test_normality(y_data)
         outliers = self.statistical_analyzer.detect_outliers(y_data)
 
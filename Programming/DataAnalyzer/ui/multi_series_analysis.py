@@ -20,6 +20,9 @@ from models.data_models import SeriesConfig, FileData
 from ui.theme_manager import theme_manager
 from analysis.statistical import StatisticalAnalyzer
 from analysis.vacuum import VacuumAnalyzer
+from utils.helpers import to_seconds
+from core.analysis_runner import (AnalysisJobRunner, analyze_series_statistics,
+                                  analyze_series_vacuum, compare_series_batch)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,11 @@ class MultiSeriesAnalysisDialog:
         self.analysis_results = {}
         self.statistical_analyzer = StatisticalAnalyzer()
         self.vacuum_analyzer = VacuumAnalyzer()
+        self.analysis_runner = AnalysisJobRunner()
+        self.jobs = {}
+        self.job_controls = {}
+        self._comparison_series = []
+        self._cached_basic_stats = {}
         
         # Create dialog
         self.create_dialog()
@@ -176,13 +184,9 @@ class MultiSeriesAnalysisDialog:
                 variable=var
             ).pack(anchor="w", pady=2)
             
-        # Run button
-        ctk.CTkButton(
-            stats_tab,
-            text="Run Statistical Analysis",
-            command=self.run_statistical_analysis,
-            font=theme_manager.get_font("subheading")
-        ).pack(pady=10)
+        # Run / cancel buttons
+        self._create_job_controls(stats_tab, "statistical", "Run Statistical Analysis",
+                                  self.run_statistical_analysis)
         
     def create_vacuum_analysis_tab(self):
         """Create vacuum-specific analysis tab"""
@@ -247,13 +251,9 @@ class MultiSeriesAnalysisDialog:
         self.window_size_var = tk.IntVar(value=100)
         ctk.CTkEntry(param_grid, textvariable=self.window_size_var, width=100).grid(row=2, column=1, sticky="ew", padx=5, pady=2)
         
-        # Run button
-        ctk.CTkButton(
-            vacuum_tab,
-            text="Run Vacuum Analysis",
-            command=self.run_vacuum_analysis,
-            font=theme_manager.get_font("subheading")
-        ).pack(pady=10)
+        # Run / cancel buttons
+        self._create_job_controls(vacuum_tab, "vacuum", "Run Vacuum Analysis",
+                                  self.run_vacuum_analysis)
         
     def create_comparison_tab(self):
         """Create series comparison tab"""
@@ -288,13 +288,37 @@ class MultiSeriesAnalysisDialog:
                 variable=var
             ).pack(anchor="w", pady=2)
             
-        # Run button
-        ctk.CTkButton(
-            comparison_tab,
-            text="Run Comparison Analysis",
-            command=self.run_comparison_analysis,
+        # Run / cancel buttons
+        self._create_job_controls(comparison_tab, "comparison", "Run Comparison Analysis",
+                                  self.run_comparison_analysis)
+        
+    def _create_job_controls(self, tab, kind: str, run_text: str, run_command: Callable):
+        """Run and cancel buttons plus a progress label for one analysis kind"""
+        run_button = ctk.CTkButton(
+            tab,
+            text=run_text,
+            command=run_command,
             font=theme_manager.get_font("subheading")
-        ).pack(pady=10)
+        )
+        run_button.pack(pady=(10, 5))
+        
+        cancel_button = ctk.CTkButton(
+            tab,
+            text="Cancel",
+            command=lambda: self.cancel_analysis(kind),
+            state="disabled",
+            width=100
+        )
+        cancel_button.pack(pady=5)
+        
+        progress_label = ctk.CTkLabel(tab, text="")
+        progress_label.pack(pady=5)
+        
+        self.job_controls[kind] = {
+            'run': run_button,
+            'cancel': cancel_button,
+            'progress': progress_label
+        }
         
     def create_results_panel(self, parent):
         """Create results and visualization panel"""
@@ -463,152 +487,330 @@ class MultiSeriesAnalysisDialog:
                 selected.append(series_id)
         return selected
         
+    def _start_analysis(self, kind: str, tasks: Dict[str, tuple], worker: Callable,
+                        on_result: Callable[[str, Any], None],
+                        on_finished: Callable[[Any], None], title: str):
+        """
+        Run an analysis job in the background and keep its controls in sync
+        
+        Args:
+            kind: Analysis kind ('statistical', 'vacuum' or 'comparison')
+            tasks: Task ID -> worker arguments (see AnalysisJobRunner.run)
+            worker: Picklable worker function
+            on_result: Called with each task's result as it finishes
+            on_finished: Called with the job once every task has finished
+            title: Heading written to the summary and detailed tabs
+        """
+        # Only one job owns the result tabs; a superseded job's late
+        # on_complete finds itself replaced and leaves the new one alone
+        for other_kind, job in list(self.jobs.items()):
+            if not job.done:
+                job.cancel()
+            if other_kind != kind:
+                del self.jobs[other_kind]
+                self._reset_job_controls(other_kind, f"Cancelled after {len(job.results)} of {job.total}")
+                
+        # Clear previous results
+        self.summary_text.delete(1.0, tk.END)
+        self.detailed_text.delete(1.0, tk.END)
+        self.summary_text.insert(tk.END, f"{title} SUMMARY\n" + "="*50 + "\n\n")
+        self.detailed_text.insert(tk.END, f"DETAILED {title}\n" + "="*60 + "\n\n")
+        self.analysis_results[kind] = {}
+        
+        controls = self.job_controls[kind]
+        controls['run'].configure(state="disabled")
+        controls['cancel'].configure(state="normal")
+        controls['progress'].configure(text=f"Running 0 of {len(tasks)}...")
+        
+        def on_progress(job):
+            controls['progress'].configure(text=f"Running {job.finished} of {job.total}...")
+            
+        def on_complete(job):
+            if job is not self.jobs.get(kind):
+                # Superseded by a newer run
+                return
+            if job.cancelled:
+                if self._reset_job_controls(kind, f"Cancelled after {len(job.results)} of {job.total}"):
+                    self.summary_text.insert(tk.END, "Analysis cancelled.\n")
+                return
+            if not self._reset_job_controls(kind):
+                # Dialog closed while analysing
+                return
+                
+            status = f"Finished {len(job.results)} of {job.total}"
+            if job.errors:
+                status += f" ({len(job.errors)} failed)"
+                for task_id, error in job.errors:
+                    config = self.series_configs.get(task_id)
+                    name = config.name if config else task_id
+                    self.summary_text.insert(tk.END, f"{name}\n  Failed: {error}\n\n")
+            controls['progress'].configure(text=status)
+            on_finished(job)
+            
+        self.jobs[kind] = self.analysis_runner.run(
+            tasks, worker, self.dialog,
+            on_result=on_result,
+            on_complete=on_complete,
+            on_progress=on_progress
+        )
+        
+    def _reset_job_controls(self, kind: str, status: Optional[str] = None) -> bool:
+        """
+        Re-enable an analysis kind's run button once its job has ended
+        
+        Returns:
+            False if the dialog has been closed
+        """
+        controls = self.job_controls[kind]
+        try:
+            controls['run'].configure(state="normal")
+            controls['cancel'].configure(state="disabled")
+            if status is not None:
+                controls['progress'].configure(text=status)
+        except tk.TclError:
+            return False
+        return True
+        
+    def cancel_analysis(self, kind: str):
+        """Cancel a running analysis job"""
+        job = self.jobs.get(kind)
+        if job is not None:
+            job.cancel()
+            
+    def _collect_series(self, selected_series: List[str]) -> Dict[str, tuple]:
+        """Series ID -> (numeric x, y) arrays for the series that contain data"""
+        collected = {}
+        for series_id in selected_series:
+            config = self.series_configs[series_id]
+            file_data = self.loaded_files[config.file_id]
+            x_data, y_data = self.get_series_data(config, file_data)
+            if len(y_data) > 0:
+                collected[series_id] = (self._numeric_x(x_data), np.asarray(y_data, dtype=float))
+        return collected
+        
+    @staticmethod
+    def _numeric_x(x_data) -> np.ndarray:
+        """X values as floats - datetimes become seconds"""
+        x_data = np.asarray(x_data)
+        if np.issubdtype(x_data.dtype, np.datetime64):
+            return to_seconds(pd.Series(x_data))
+        return pd.to_numeric(pd.Series(x_data), errors='coerce').to_numpy(dtype=float)
+        
     def run_statistical_analysis(self):
-        """Run statistical analysis on selected series"""
+        """Run statistical analysis on selected series in the background"""
         try:
             selected_series = self.get_selected_series()
             if not selected_series:
                 messagebox.showwarning("Warning", "Please select at least one series")
                 return
                 
-            # Clear previous results
-            self.summary_text.delete(1.0, tk.END)
-            self.detailed_text.delete(1.0, tk.END)
-            
-            # Run analysis
-            results = {}
-            summary = "STATISTICAL ANALYSIS SUMMARY\n" + "="*50 + "\n\n"
-            detailed = "DETAILED STATISTICAL ANALYSIS\n" + "="*60 + "\n\n"
-            
-            for series_id in selected_series:
-                config = self.series_configs[series_id]
-                file_data = self.loaded_files[config.file_id]
-                
-                # Get data
-                x_data, y_data = self.get_series_data(config, file_data)
-                
-                if len(y_data) == 0:
-                    continue
-                    
-                # Run statistical analysis
-                series_results = {}
-                
-                if self.stats_options["basic_stats"].get():
-                    series_results["basic_stats"] = self.statistical_analyzer.calculate_basic_stats(y_data)
-                    
-                if self.stats_options["normality_test"].get():
-                    series_results["normality"] = self.statistical_analyzer.test_normality(y_data)
-                    
-                if self.stats_options["outlier_detection"].get():
-                    series_results["outliers"] = self.statistical_analyzer.detect_outliers(y_data)
-                    
-                results[series_id] = series_results
-                
-                # Add to summary
-                summary += f"Series: {config.name}\n"
-                if "basic_stats" in series_results:
-                    stats = series_results["basic_stats"]
-                    summary += f"  Mean: {stats['mean']:.3e}\n"
-                    summary += f"  Std:  {stats['std']:.3e}\n"
-                    summary += f"  Min:  {stats['min']:.3e}\n"
-                    summary += f"  Max:  {stats['max']:.3e}\n"
-                    
-                if "normality" in series_results:
-                    norm = series_results["normality"]
-                    summary += f"  Normal: {'Yes' if norm['is_normal'] else 'No'} (p={norm['p_value']:.3f})\n"
-                    
-                if "outliers" in series_results:
-                    outliers = series_results["outliers"]
-                    summary += f"  Outliers: {len(outliers)} detected\n"
-                    
-                summary += "\n"
-                
-                # Add detailed results
-                detailed += f"SERIES: {config.name}\n" + "-"*40 + "\n"
-                for key, value in series_results.items():
-                    detailed += f"{key.upper()}:\n"
-                    if isinstance(value, dict):
-                        for k, v in value.items():
-                            detailed += f"  {k}: {v}\n"
-                    else:
-                        detailed += f"  {value}\n"
-                    detailed += "\n"
-                detailed += "\n"
+            options = [key for key in ("basic_stats", "normality_test", "outlier_detection")
+                       if self.stats_options[key].get()]
+            
+            # Series data is extracted here; only the arrays go to the workers.
+            # Basic statistics already cached on the file are not recomputed.
+            self._cached_basic_stats = {}
+            tasks = {}
+            for series_id, (_, y_data) in self._collect_series(selected_series).items():
+                series_options = options
+                if "basic_stats" in options:
+                    config = self.series_configs[series_id]
+                    cached = self.loaded_files[config.file_id].cached_stat(*config.stats_key())
+                    if cached is not None:
+                        self._cached_basic_stats[series_id] = cached
+                        series_options = [option for option in options if option != "basic_stats"]
+                tasks[series_id] = (y_data, series_options)
+            if not tasks:
+                messagebox.showwarning("Warning", "The selected series contain no data")
+                return
                 
-            # Store results
-            self.analysis_results["statistical"] = results
-            
-            # Display results
-            self.summary_text.insert(1.0, summary)
-            self.detailed_text.insert(1.0, detailed)
-            
-            # Create plots
-            self.create_statistical_plots(results)
-            
-            messagebox.showinfo("Success", "Statistical analysis completed!")
+            self._start_analysis("statistical", tasks, analyze_series_statistics,
+                                 self._on_statistical_result, self._on_statistical_complete,
+                                 "STATISTICAL ANALYSIS")
             
         except Exception as e:
             logger.error(f"Error in statistical analysis: {e}")
             messagebox.showerror("Error", f"Statistical analysis failed: {str(e)}")
             
+    def _on_statistical_result(self, series_id: str, series_results: Dict[str, Any]):
+        """Show one series' results as soon as it finishes"""
+        config = self.series_configs[series_id]
+        file_data = self.loaded_files[config.file_id]
+        if series_id in self._cached_basic_stats:
+            series_results = {"basic_stats": self._cached_basic_stats[series_id], **series_results}
+        elif "basic_stats" in series_results:
+            file_data.store_stat(*config.stats_key(), series_results["basic_stats"])
+        self.analysis_results["statistical"][series_id] = series_results
+        self.summary_text.insert(tk.END, self._format_statistical_summary(config, series_results))
+        self.detailed_text.insert(tk.END, self._format_details(config.name, series_results))
+        
+    def _on_statistical_complete(self, job):
+        # Plot in selection order rather than completion order
+        streamed = self.analysis_results["statistical"]
+        results = {sid: streamed[sid] for sid in job.series_ids if sid in streamed}
+        self.analysis_results["statistical"] = results
+        self.create_statistical_plots(results)
+        
+    @staticmethod
+    def _format_statistical_summary(config: SeriesConfig, series_results: Dict[str, Any]) -> str:
+        """Summary lines for one series"""
+        lines = [f"Series: {config.name}"]
+        if "basic_stats" in series_results:
+            stats = series_results["basic_stats"]
+            lines.append(f"  Mean: {stats['mean']:.3e}")
+            lines.append(f"  Std:  {stats['std']:.3e}")
+            lines.append(f"  Min:  {stats['min']:.3e}")
+            lines.append(f"  Max:  {stats['max']:.3e}")
+            
+        if "normality" in series_results:
+            norm = series_results["normality"]
+            lines.append(f"  Normal: {'Yes' if norm['is_normal'] else 'No'} (p={norm['p_value']:.3f})")
+            
+        if "outliers" in series_results:
+            lines.append(f"  Outliers: {len(series_results['outliers'])} detected")
+            
+        return "\n".join(lines) + "\n\n"
+        
+    @staticmethod
+    def _format_details(name: str, series_results: Dict[str, Any]) -> str:
+        """Detailed results for one series"""
+        lines = [f"SERIES: {name}", "-"*40]
+        for key, value in series_results.items():
+            lines.append(f"{key.upper()}:")
+            if isinstance(value, dict):
+                lines.extend(f"  {k}: {v}" for k, v in value.items())
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                lines.extend(f"  {item}" for item in value)
+            else:
+                lines.append(f"  {value}")
+            lines.append("")
+        return "\n".join(lines) + "\n\n"
+            
     def run_vacuum_analysis(self):
-        """Run vacuum-specific analysis"""
+        """Run vacuum-specific analysis on selected series in the background"""
         try:
             selected_series = self.get_selected_series()
             if not selected_series:
                 messagebox.showwarning("Warning", "Please select at least one series")
                 return
                 
-            # Implementation similar to statistical analysis
-            # but using vacuum-specific methods
-            
-            messagebox.showinfo("Info", "Vacuum analysis feature coming soon!")
+            options = [key for key, var in self.vacuum_options.items() if var.get()]
+            params = {
+                'spike_threshold': float(self.spike_threshold_var.get()),
+                'leak_threshold': float(self.leak_threshold_var.get()),
+                'window_size': int(self.window_size_var.get())
+            }
+            
+            tasks = {series_id: (x_data, y_data, options, params)
+                     for series_id, (x_data, y_data) in self._collect_series(selected_series).items()}
+            if not tasks:
+                messagebox.showwarning("Warning", "The selected series contain no data")
+                return
+                
+            self._start_analysis("vacuum", tasks, analyze_series_vacuum,
+                                 self._on_vacuum_result, self._on_vacuum_complete,
+                                 "VACUUM ANALYSIS")
             
+        except (tk.TclError, ValueError) as e:
+            messagebox.showerror("Error", f"Invalid analysis parameters: {str(e)}")
         except Exception as e:
             logger.error(f"Error in vacuum analysis: {e}")
             messagebox.showerror("Error", f"Vacuum analysis failed: {str(e)}")
             
+    def _on_vacuum_result(self, series_id: str, series_results: Dict[str, Any]):
+        """Show one series' vacuum results as soon as it finishes"""
+        config = self.series_configs[series_id]
+        self.analysis_results["vacuum"][series_id] = series_results
+        
+        lines = [f"Series: {config.name}"]
+        if "base_pressure" in series_results:
+            lines.append(f"  Base pressure: {series_results['base_pressure']:.3e}")
+        if "leak" in series_results:
+            leak = series_results["leak"]
+            flag = "  (above threshold)" if leak["leak_detected"] else ""
+            lines.append(f"  Leak rate: {leak['leak_rate']:.3e}{flag}")
+        if "spikes" in series_results:
+            lines.append(f"  Spikes: {len(series_results['spikes'])} events")
+        if "pumpdown" in series_results:
+            pumpdown = series_results["pumpdown"]
+            lines.append(f"  Pump-down: {pumpdown['initial_pressure']:.3e} -> {pumpdown['min_pressure']:.3e}")
+        if "stability" in series_results:
+            lines.append(f"  Variation (CV): {series_results['stability']['coefficient_of_variation']:.3f}")
+        self.summary_text.insert(tk.END, "\n".join(lines) + "\n\n")
+        self.detailed_text.insert(tk.END, self._format_details(config.name, series_results))
+        
+    def _on_vacuum_complete(self, job):
+        results = {sid: job.results[sid] for sid in job.series_ids if sid in job.results}
+        self.analysis_results["vacuum"] = results
+        self.create_vacuum_plots(results)
+        
     def run_comparison_analysis(self):
-        """Run series comparison analysis"""
+        """Compare every pair of selected series in one background job"""
         try:
             selected_series = self.get_selected_series()
             if len(selected_series) < 2:
                 messagebox.showwarning("Warning", "Please select at least two series for comparison")
                 return
                 
-            # Implementation for comparison analysis
+            collected = self._collect_series(selected_series)
+            if len(collected) < 2:
+                messagebox.showwarning("Warning", "At least two of the selected series must contain data")
+                return
+                
+            names = [self.series_configs[series_id].name for series_id in collected]
+            align_start = self.comparison_options["time_alignment"].get()
+            tasks = {"comparison": (names, list(collected.values()), align_start)}
+            self._comparison_series = list(collected)
             
-            messagebox.showinfo("Info", "Comparison analysis feature coming soon!")
+            self._start_analysis("comparison", tasks, compare_series_batch,
+                                 self._on_comparison_result, lambda job: None,
+                                 "SERIES COMPARISON")
             
         except Exception as e:
             logger.error(f"Error in comparison analysis: {e}")
             messagebox.showerror("Error", f"Comparison analysis failed: {str(e)}")
             
-    def get_series_data(self, config: SeriesConfig, file_data: FileData):
-        """Get data for a series"""
+    def _on_comparison_result(self, task_id: str, comparison: Dict[str, Any]):
+        """Show the all-pairs comparison tables"""
+        self.analysis_results["comparison"] = comparison
+        names = comparison['names']
+        width = max(12, max(len(name) for name in names) + 2)
+        
+        def matrix_table(title, matrix, fmt):
+            rows = [title, " " * width + "".join(name[:width - 2].rjust(width) for name in names)]
+            for name, row in zip(names, matrix):
+                rows.append(name[:width - 2].ljust(width) + "".join(format(v, fmt).rjust(width) for v in row))
+            return "\n".join(rows) + "\n\n"
+            
+        summary = [f"{len(names)} series on a shared time base of {comparison['n_points']} points "
+                   f"({comparison['time'][0]:.6g} to {comparison['time'][-1]:.6g})\n\n"]
+        if self.comparison_options["statistical_comparison"].get():
+            summary.append("\n".join(f"{name}: mean {mean:.3e}, std {std:.3e}"
+                                      for name, mean, std in zip(names, comparison['mean'], comparison['std'])))
+            summary.append("\n\n")
+        if self.comparison_options["correlation_matrix"].get():
+            summary.append(matrix_table("CORRELATION", comparison['correlation'], ".3f"))
+        if self.comparison_options["performance_metrics"].get():
+            summary.append(matrix_table("RMS DIFFERENCE", comparison['rms_difference'], ".3e"))
+        self.summary_text.insert(tk.END, "".join(summary))
+        
+        details = [matrix_table("LAG (column trails row, x units)", comparison['lag'], ".4g"),
+                   matrix_table("CORRELATION AT LAG", comparison['lag_correlation'], ".3f")]
+        self.detailed_text.insert(tk.END, "".join(details))
+        
+        self.create_comparison_plots(comparison)
+        
+    @staticmethod
+    def get_series_data(config: SeriesConfig, file_data: FileData):
+        """
+        Get data for a series
+
+        Uses SeriesConfig.get_data, so series on other sheets read their own
+        sheet and the values match what the file's statistics cache holds
+        under config.stats_key().
+        """
         try:
-            # Get data slice
-            start_idx = config.start_index or 0
-            end_idx = config.end_index or len(file_data.data)
-            data_slice = file_data.data.iloc[start_idx:end_idx]
-            
-            # Get X data
-            if config.x_column == "Index":
-                x_data = np.arange(len(data_slice))
-            else:
-                x_data = data_slice[config.x_column].values
-                if pd.api.types.is_object_dtype(x_data):
-                    x_data = pd.to_numeric(x_data, errors='coerce')
-                    
-            # Get Y data
-            y_data = data_slice[config.y_column].values
-            if pd.api.types.is_object_dtype(y_data):
-                y_data = pd.to_numeric(y_data, errors='coerce')
-                
-            # Remove NaN values
-            mask = ~(pd.isna(x_data) | pd.isna(y_data))
-            return x_data[mask], y_data[mask]
-            
+            return config.get_data(file_data)
         except Exception as e:
             logger.error(f"Error getting series data: {e}")
             return np.array([]), np.array([])
@@ -666,6 +868,78 @@ class MultiSeriesAnalysisDialog:
         except Exception as e:
             logger.error(f"Error creating statistical plots: {e}")
             
+    def create_vacuum_plots(self, results):
+        """Bar charts of base pressure and leak rate per series"""
+        try:
+            self.plots_fig.clear()
+            names = [self.series_configs[sid].name for sid in results]
+            colors = [self.series_configs[sid].color for sid in results]
+            
+            panels = []
+            if any("base_pressure" in r for r in results.values()):
+                panels.append(("Base Pressure", [r.get("base_pressure", np.nan) for r in results.values()]))
+            if any("leak" in r for r in results.values()):
+                panels.append(("Leak Rate", [r["leak"]["leak_rate"] if "leak" in r else np.nan
+                                             for r in results.values()]))
+            if any("spikes" in r for r in results.values()):
+                panels.append(("Spike Events", [len(r.get("spikes", [])) for r in results.values()]))
+                
+            for i, (title, values) in enumerate(panels):
+                ax = self.plots_fig.add_subplot(len(panels), 1, i + 1)
+                theme_manager.configure_matplotlib_figure(self.plots_fig, ax)
+                ax.bar(range(len(names)), values, color=colors)
+                ax.set_xticks(range(len(names)))
+                ax.set_xticklabels(names, rotation=30, ha="right")
+                ax.set_title(title)
+                if title != "Spike Events" and np.nanmin(np.asarray(values, dtype=float)) > 0:
+                    ax.set_yscale("log")
+                    
+            self.plots_fig.tight_layout()
+            self.plots_canvas.draw()
+            
+        except Exception as e:
+            logger.error(f"Error creating vacuum plots: {e}")
+            
+    def create_comparison_plots(self, comparison):
+        """Overlay of the resampled series and the correlation matrix"""
+        try:
+            self.plots_fig.clear()
+            names = comparison['names']
+            show_overlay = self.comparison_options["overlay_plot"].get()
+            show_matrix = self.comparison_options["correlation_matrix"].get()
+            n_panels = int(show_overlay) + int(show_matrix)
+            if n_panels == 0:
+                self.plots_canvas.draw()
+                return
+                
+            panel = 1
+            if show_overlay:
+                ax = self.plots_fig.add_subplot(1, n_panels, panel)
+                theme_manager.configure_matplotlib_figure(self.plots_fig, ax)
+                for series_id, name, values in zip(self._comparison_series, names, comparison['values']):
+                    ax.plot(comparison['time'], values, color=self.series_configs[series_id].color,
+                            label=name, linewidth=1)
+                ax.set_title("Shared Time Base")
+                ax.legend(fontsize=8)
+                panel += 1
+                
+            if show_matrix:
+                ax = self.plots_fig.add_subplot(1, n_panels, panel)
+                theme_manager.configure_matplotlib_figure(self.plots_fig, ax)
+                image = ax.imshow(comparison['correlation'], cmap="coolwarm", vmin=-1, vmax=1)
+                ax.set_xticks(range(len(names)))
+                ax.set_yticks(range(len(names)))
+                ax.set_xticklabels(names, rotation=45, ha="right", fontsize=8)
+                ax.set_yticklabels(names, fontsize=8)
+                ax.set_title("Correlation")
+                self.plots_fig.colorbar(image, ax=ax)
+                
+            self.plots_fig.tight_layout()
+            self.plots_canvas.draw()
+            
+        except Exception as e:
+            logger.error(f"Error creating comparison plots: {e}")
+            
     def export_results(self):
         """Export analysis results"""
         try:
@@ -704,6 +978,7 @@ class MultiSeriesAnalysisDialog:
     def close_dialog(self):
         """Close the dialog"""
         self.result = 'close'
+        self.analysis_runner.shutdown()
         self.dialog.destroy()
 
 
@@ -17,6 +17,8 @@ import logging
 from models.data_models import FileData, SeriesConfig
 from core.ui_factory import UIFactory, DualRangeSlider
 from core.data_utils import DataProcessor, DataValidator
+from core.decimation import m4_decimate, bucket_count, DECIMATED_PLOT_TYPES
+from core.pyramid import overview_positions
 from config.constants import PlotTypes, MissingDataMethods, TrendTypes
 
 logger = logging.getLogger(__name__)
@@ -564,6 +566,7 @@ class SeriesDialog:
             
             # Get data
             x_data, y_data = self._get_current_data()
+            n_raw = len(y_data)
             
             if len(y_data) == 0:
                 self.ax.text(0.5, 0.5, "No valid data to plot", 
@@ -586,10 +589,25 @@ class SeriesDialog:
             plot_type = self.plot_type_var.get()
             color = self.color_var.get()
             label = self.name_var.get() if self.show_legend_var.get() else ""
+
+            # Long lines are drawn from the column pyramid (or M4-decimated);
+            # statistics below still use every point
+            x_draw, y_draw = x_data, y_data
+            if plot_type in DECIMATED_PLOT_TYPES:
+                n_buckets = bucket_count(self.ax)
+                positions = None
+                if not self.smoothing_var.get() and len(y_data) == n_raw:
+                    start_idx = max(0, self.start_var.get())
+                    positions = overview_positions(self._get_current_file(), self.y_column_var.get(),
+                                                   start_idx, start_idx + n_raw, n_buckets)
+                if positions is not None:
+                    x_draw, y_draw = x_data[positions - start_idx], y_data[positions - start_idx]
+                else:
+                    x_draw, y_draw = m4_decimate(x_data, y_data, n_buckets)
             
             if plot_type == "line":
                 self.ax.plot(
-                    x_data, y_data,
+                    x_draw, y_draw,
                     color=color,
                     linestyle=self.line_style_var.get(),
                     linewidth=self.line_width_var.get(),
@@ -621,7 +639,7 @@ class SeriesDialog:
             elif plot_type == "area":
                 self.ax.fill_between(x_data, y_data, color=color, alpha=self.alpha_var.get(), label=label)
             elif plot_type == "step":
-                self.ax.step(x_data, y_data, color=color, linewidth=self.line_width_var.get(), 
+                self.ax.step(x_draw, y_draw, color=color, linewidth=self.line_width_var.get(), 
                            alpha=self.alpha_var.get(), label=label)
             
             # Add trend line
@@ -657,27 +675,32 @@ class SeriesDialog:
             logger.error(f"Error updating preview: {e}")
             self.info_label.configure(text=f"Error: {str(e)}", text_color="red")
     
+    def _get_current_file(self) -> Optional[FileData]:
+        """Get the selected file"""
+        file_key = self.file_var.get()
+        if not file_key:
+            return None
+
+        # Get file data by key (could be filename or file_id)
+        if file_key in self.files:
+            return self.files[file_key]
+
+        # Fall back to searching by filename
+        for f in self.files.values():
+            if f.filename == file_key:
+                return f
+        return None
+
     def _get_current_data(self) -> tuple:
         """Get current data based on selections"""
         try:
             # Get file
-            file_key = self.file_var.get()
-            if not file_key:
+            if not self.file_var.get():
                 return np.array([]), np.array([])
-            
-            # Get file data by key (could be filename or file_id)
-            file_data = None
-            if file_key in self.files:
-                file_data = self.files[file_key]
-            else:
-                # Fall back to searching by filename
-                for f in self.files.values():
-                    if f.filename == file_key:
-                        file_data = f
-                        break
-            
+
+            file_data = self._get_current_file()
             if not file_data:
-                logger.warning(f"Could not find file data for key: {file_key}")
+                logger.warning(f"Could not find file data for key: {self.file_var.get()}")
                 return np.array([]), np.array([])
             
             # Get columns
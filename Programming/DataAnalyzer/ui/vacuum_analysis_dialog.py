@@ -146,6 +146,23 @@ class VacuumAnalysisDialog:
             width=220
         ).grid(row=0, column=5, padx=5, pady=5)
 
+        # Window slider - re-evaluates the analyzed series without re-reading it
+        ctk.CTkLabel(controls_frame, text="Window slider:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        self.window_slider = ctk.CTkSlider(
+            controls_frame,
+            from_=1,
+            to=60,
+            number_of_steps=59,
+            command=self._on_base_pressure_window
+        )
+        self.window_slider.set(self.window_var.get())
+        self.window_slider.grid(row=1, column=1, columnspan=3, sticky="ew", padx=5, pady=5)
+
+        # Series analyzed last and its base pressure per window (minutes)
+        self._base_pressure_source = None
+        self._base_pressure_windows = {}
+        self._base_pressure_artists = None
+
         # Results frame
         results_frame = ctk.CTkFrame(tab)
         results_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -430,17 +447,49 @@ class VacuumAnalysisDialog:
             return
 
         try:
-            # Perform analysis
             window_minutes = self.window_var.get()
-            base_pressure, rolling_min, rolling_std = VacuumAnalysisTools.calculate_base_pressure(
-                y_data, window_minutes=window_minutes
-            )
+            self._base_pressure_source = (series, x_data, y_data)
+            self._base_pressure_windows = {}
+            base_pressure, rolling_min, rolling_std = self._base_pressure_for_window(window_minutes)
 
             # Create plot
             self.create_base_pressure_plot(x_data, y_data, rolling_min, rolling_std, base_pressure)
+            self._show_base_pressure_results(series, base_pressure, window_minutes)
 
-            # Display results
-            results_text = f"""Base Pressure Analysis Results:
+        except Exception as e:
+            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+
+    def _base_pressure_for_window(self, window_minutes):
+        """Base pressure of the analyzed series for one window, cached per window"""
+        if window_minutes not in self._base_pressure_windows:
+            _, _, y_data = self._base_pressure_source
+            self._base_pressure_windows.update(
+                VacuumAnalysisTools.calculate_base_pressure_windows(y_data, [window_minutes]))
+        return self._base_pressure_windows[window_minutes]
+
+    def _on_base_pressure_window(self, value):
+        """Follow the window slider on the series analyzed last"""
+        window_minutes = int(round(value))
+        if window_minutes == self.window_var.get() and self._base_pressure_artists is not None:
+            return
+        self.window_var.set(window_minutes)
+        if self._base_pressure_source is None:
+            return
+
+        base_pressure, rolling_min, _ = self._base_pressure_for_window(window_minutes)
+        series = self._base_pressure_source[0]
+        if self._base_pressure_artists is not None:
+            canvas, min_line, base_line = self._base_pressure_artists
+            min_line.set_ydata(rolling_min)
+            base_line.set_ydata([base_pressure, base_pressure])
+            base_line.set_label(f'Base Pressure: {base_pressure:.3e}')
+            base_line.axes.legend()
+            canvas.draw_idle()
+        self._show_base_pressure_results(series, base_pressure, window_minutes)
+
+    def _show_base_pressure_results(self, series, base_pressure, window_minutes):
+        """Display and store base pressure results"""
+        results_text = f"""Base Pressure Analysis Results:
 
 Base Pressure: {base_pressure:.3e} mbar
 Analysis Window: {window_minutes} minutes
@@ -452,18 +501,15 @@ Rolling minimum and standard deviation are
 shown in the plot to illustrate pressure 
 stability over time."""
 
-            self.base_pressure_results.delete("1.0", "end")
-            self.base_pressure_results.insert("1.0", results_text)
+        self.base_pressure_results.delete("1.0", "end")
+        self.base_pressure_results.insert("1.0", results_text)
 
-            # Store results
-            self.analysis_results['base_pressure'] = {
-                'base_pressure': base_pressure,
-                'window_minutes': window_minutes,
-                'series_name': series.name
-            }
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+        # Store results
+        self.analysis_results['base_pressure'] = {
+            'base_pressure': base_pressure,
+            'window_minutes': window_minutes,
+            'series_name': series.name
+        }
 
     def create_base_pressure_plot(self, x_data, y_data, rolling_min, rolling_std, base_pressure):
         """Create base pressure analysis plot"""
@@ -477,8 +523,8 @@ stability over time."""
 
         # Plot data
         ax.plot(x_data, y_data, 'b-', alpha=0.7, label='Pressure Data')
-        ax.plot(x_data, rolling_min, 'g-', linewidth=2, label='Rolling Minimum')
-        ax.axhline(y=base_pressure, color='r', linestyle='--', linewidth=2, label=f'Base Pressure: {base_pressure:.3e}')
+        min_line, = ax.plot(x_data, rolling_min, 'g-', linewidth=2, label='Rolling Minimum')
+        base_line = ax.axhline(y=base_pressure, color='r', linestyle='--', linewidth=2, label=f'Base Pressure: {base_pressure:.3e}')
 
         ax.set_xlabel('Time/Index')
         ax.set_ylabel('Pressure (mbar)')
@@ -492,6 +538,9 @@ stability over time."""
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True)
 
+        # Kept so the window slider can update the lines in place
+        self._base_pressure_artists = (canvas, min_line, base_line)
+
     def analyze_leak_rate(self):
         """Analyze leak rate"""
         series, x_data, y_data = self.get_series_data(self.leak_rate_series_var)
@@ -9,6 +9,7 @@ from utils.helpers import (
     sanitize_filename,
     generate_unique_id,
     detect_datetime_column,
+    to_seconds,
     convert_to_datetime,
     detect_datetime_axis,
     interpolate_missing_data,
@@ -19,6 +20,13 @@ from utils.helpers import (
     calculate_hash
 )
 
+from utils.type_inference import (
+    infer_column_types,
+    convert_column
+)
+
+from utils.descriptive import describe
+
 from utils.validators import (
     validate_file_size,
     validate_dataframe,
@@ -37,6 +45,7 @@ __all__ = [
     'sanitize_filename',
     'generate_unique_id',
     'detect_datetime_column',
+    'to_seconds',
     'convert_to_datetime',
     'detect_datetime_axis',
     'interpolate_missing_data',
@@ -46,6 +55,13 @@ __all__ = [
     'create_backup',
     'calculate_hash',
 
+    # Type inference
+    'infer_column_types',
+    'convert_column',
+
+    # Descriptive statistics
+    'describe',
+
     # Validators
     'validate_file_size',
     'validate_dataframe',
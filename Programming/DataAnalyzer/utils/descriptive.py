@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Descriptive statistics kernel
+Moments and quantiles of a series computed together in a few array passes
+"""
+
+import logging
+from typing import Dict, Iterable, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Quantiles reported by describe(), keyed by result name
+QUANTILES = {'q1': 0.25, 'median': 0.5, 'q3': 0.75}
+
+STAT_KEYS = ('count', 'mean', 'median', 'std', 'sample_std', 'var', 'min', 'max', 'range',
+             'q1', 'q3', 'iqr', 'skewness', 'kurtosis', 'cv')
+
+
+def empty_stats() -> Dict[str, float]:
+    """Result of describe() for a series without valid values"""
+    result = {key: np.nan for key in STAT_KEYS}
+    result['count'] = 0
+    return result
+
+
+def quantiles(partitioned: np.ndarray, qs: Iterable[float]) -> np.ndarray:
+    """
+    Linear-interpolated quantiles (numpy's default method) of clean values
+
+    The values only need to be partitioned at the positions
+    quantile_positions() returns; a full sort is not required.
+    """
+    n = len(partitioned)
+    positions = np.asarray(list(qs), dtype=float) * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, n - 1)
+    fraction = positions - lower
+    low_values = partitioned[lower]
+    return low_values + fraction * (partitioned[upper] - low_values)
+
+
+def quantile_positions(n: int, qs: Iterable[float]) -> np.ndarray:
+    """Order-statistic positions needed for the quantiles of n values, plus min and max"""
+    positions = np.asarray(list(qs), dtype=float) * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    needed = np.concatenate(([0, n - 1], lower, np.minimum(lower + 1, n - 1)))
+    return np.unique(needed)
+
+
+def describe(values: Any) -> Dict[str, float]:
+    """
+    Descriptive statistics of a series in one go
+
+    NaN values are ignored. The moments come from a single set of centred
+    powers (one pass for the mean, one for the deviations) and min, max
+    and every quantile from a single np.partition call, instead of a
+    separate pass per statistic.
+
+    Args:
+        values: Array-like numeric values
+
+    Returns:
+        Dictionary with count, mean, median, std (population), sample_std,
+        var, min, max, range, q1, q3, iqr, skewness and kurtosis (as
+        scipy.stats.skew/kurtosis with default arguments) and cv
+    """
+    data = np.asarray(values, dtype=float).ravel()
+    data = data[~np.isnan(data)]
+    n = len(data)
+    if n == 0:
+        return empty_stats()
+
+    mean = data.sum() / n
+    deviations = data - mean
+    squared = deviations * deviations
+    m2 = squared.sum() / n
+    m3 = (squared * deviations).sum() / n
+    m4 = (squared * squared).sum() / n
+
+    # One selection pass places min, max and every quantile's neighbours
+    partitioned = np.partition(data, quantile_positions(n, QUANTILES.values()))
+    q1, median, q3 = quantiles(partitioned, QUANTILES.values())
+    minimum, maximum = partitioned[0], partitioned[-1]
+
+    # Same tolerance scipy uses to treat near-constant data as constant
+    constant = m2 <= (np.finfo(float).eps * mean) ** 2
+    std = float(np.sqrt(m2))
+
+    return {
+        'count': n,
+        'mean': float(mean),
+        'median': float(median),
+        'std': std,
+        'sample_std': float(np.sqrt(m2 * n / (n - 1))) if n > 1 else np.nan,
+        'var': float(m2),
+        'min': float(minimum),
+        'max': float(maximum),
+        'range': float(maximum - minimum),
+        'q1': float(q1),
+        'q3': float(q3),
+        'iqr': float(q3 - q1),
+        'skewness': np.nan if constant else float(m3 / m2 ** 1.5),
+        'kurtosis': np.nan if constant else float(m4 / (m2 * m2) - 3.0),
+        'cv': float(std / mean) if mean != 0 else np.nan
+    }
@@ -181,6 +181,32 @@ def detect_datetime_column(series: pd.Series, sample_size: int = 100) -> bool:
     return False
 
 
+def to_seconds(values: pd.Series) -> np.ndarray:
+    """
+    Convert time values to float seconds
+
+    Args:
+        values: Datetime, timedelta or numeric series
+
+    Returns:
+        Seconds as floats (datetimes relative to the epoch, timedeltas as
+        durations, numbers unchanged); missing or unparseable values are NaN
+    """
+    if pd.api.types.is_timedelta64_dtype(values.dtype):
+        deltas = values.to_numpy(dtype='timedelta64[ns]')
+        seconds = deltas.view(np.int64) / 1e9
+        seconds[np.isnat(deltas)] = np.nan
+        return seconds
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        index = pd.DatetimeIndex(values)
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        seconds = index.values.astype('datetime64[ns]').view(np.int64) / 1e9
+        seconds[np.isnat(index.values)] = np.nan
+        return seconds
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
 def convert_to_datetime(series: pd.Series, format: Optional[str] = None) -> pd.Series:
     """
     Convert a series to datetime
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Column type inference
+Classifies text columns as numeric, datetime or text from a bounded sample
+"""
+
+import logging
+import warnings
+from typing import Dict, List, Optional, Tuple, Iterable
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+logger = logging.getLogger(__name__)
+
+# Rows inspected per column when classifying
+DEFAULT_SAMPLE_SIZE = 1000
+
+NUMERIC = 'numeric'
+DATETIME = 'datetime'
+TEXT = 'text'
+
+
+def is_text_dtype(dtype) -> bool:
+    """True for object and pandas string dtypes (the columns worth inferring)"""
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def sample_positions(n_rows: int, sample_size: int = DEFAULT_SAMPLE_SIZE) -> np.ndarray:
+    """
+    Row positions to inspect: the head of the frame plus evenly spaced rows
+
+    The head catches header-adjacent values, the spread catches columns whose
+    content changes further down the file.
+    """
+    if n_rows <= sample_size:
+        return np.arange(n_rows)
+
+    head = np.arange(sample_size // 2)
+    spread = np.linspace(sample_size // 2, n_rows - 1, sample_size - len(head)).astype(np.int64)
+    return np.unique(np.concatenate([head, spread]))
+
+
+def _sample_values(df: pd.DataFrame, columns: List[str], positions: np.ndarray) -> np.ndarray:
+    """
+    Sampled values as an object array of shape (rows, columns)
+
+    Columns whose sampled rows are all missing are re-sampled from their
+    first non-null values so sparse columns are still classified.
+    """
+    values = df[columns].iloc[positions].to_numpy(dtype=object)
+    if values.size == 0:
+        return values
+
+    empty = pd.isna(values).all(axis=0)
+    for j in np.flatnonzero(empty):
+        first_valid = df[columns[j]].dropna().head(len(positions)).to_numpy(dtype=object)
+        values[:len(first_valid), j] = first_valid
+
+    return values
+
+
+def _detect_format(values: np.ndarray) -> Optional[str]:
+    """Guess a datetime format from the first string value in a column sample"""
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            try:
+                return guess_datetime_format(value.strip())
+            except Exception:
+                return None
+    return None
+
+
+def infer_column_types(df: pd.DataFrame, columns: Iterable[str],
+                       format_hints: Optional[Dict[str, str]] = None,
+                       sample_size: int = DEFAULT_SAMPLE_SIZE) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Classify text columns from a bounded sample
+
+    Uses the same rules as a full-column scan: a column is numeric if any
+    value parses as a number, otherwise datetime if any value parses as a
+    date, otherwise text. All columns are tested together with one
+    vectorised conversion per rule instead of a pass per column.
+
+    Args:
+        df: DataFrame holding the columns
+        columns: Text columns to classify
+        format_hints: Previously detected datetime formats by column
+        sample_size: Rows inspected per column
+
+    Returns:
+        Tuple of (column -> kind, column -> datetime format)
+    """
+    columns = list(columns)
+    format_hints = format_hints or {}
+    kinds: Dict[str, str] = {col: TEXT for col in columns}
+    formats: Dict[str, str] = {}
+
+    if not columns or len(df) == 0:
+        return kinds, formats
+
+    values = _sample_values(df, columns, sample_positions(len(df), sample_size))
+    n_sample, n_cols = values.shape
+
+    # Numeric test over every sampled cell at once
+    flat = pd.Series(values.ravel(order='F'), dtype=object)
+    numeric = pd.to_numeric(flat, errors='coerce').to_numpy(dtype=float).reshape((n_sample, n_cols), order='F')
+    is_numeric = ~np.isnan(numeric).all(axis=0)
+
+    for j in np.flatnonzero(is_numeric):
+        kinds[columns[j]] = NUMERIC
+
+    # Datetime test - group the remaining columns by format so each format
+    # is parsed in a single call
+    groups: Dict[Optional[str], List[int]] = {}
+    for j in np.flatnonzero(~is_numeric):
+        fmt = format_hints.get(columns[j]) or _detect_format(values[:, j])
+        groups.setdefault(fmt, []).append(j)
+
+    for fmt, indices in groups.items():
+        stacked = pd.Series(values[:, indices].ravel(order='F'), dtype=object)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                parsed = pd.to_datetime(stacked, format=fmt, errors='coerce')
+            except (ValueError, TypeError):
+                parsed = pd.Series(pd.NaT, index=stacked.index)
+        has_dates = parsed.notna().to_numpy().reshape((n_sample, len(indices)), order='F').any(axis=0)
+
+        for j, is_date in zip(indices, has_dates):
+            if is_date:
+                kinds[columns[j]] = DATETIME
+                if fmt:
+                    formats[columns[j]] = fmt
+
+    return kinds, formats
+
+
+def convert_column(series: pd.Series, kind: str, datetime_format: Optional[str] = None) -> pd.Series:
+    """
+    Convert a full column to the inferred kind in a single pass
+
+    Datetime columns are parsed with the detected format; if the format
+    does not fit the full column the parser falls back to inference.
+    """
+    if kind == NUMERIC:
+        return pd.to_numeric(series, errors='coerce')
+
+    if kind == DATETIME:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            converted = None
+            if datetime_format:
+                try:
+                    converted = pd.to_datetime(series, format=datetime_format, errors='coerce')
+                except (ValueError, TypeError):
+                    converted = None
+            if converted is None or converted.isna().all():
+                return pd.to_datetime(series, errors='coerce')
+
+            # Re-parse only the values the explicit format rejected
+            rejected = converted.isna() & series.notna()
+            if rejected.any():
+                reparsed = pd.to_datetime(series[rejected], errors='coerce')
+                if reparsed.notna().any():
+                    converted = converted.astype(object)
+                    converted[rejected] = reparsed
+                    converted = pd.to_datetime(converted, errors='coerce')
+        return converted
+
+    return series
+
+
+def convert_text_columns(df: pd.DataFrame,
+                         format_hints: Optional[Dict[str, str]] = None) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Convert the text columns of a frame that hold numbers or datetimes, in place
+
+    Args:
+        df: Frame to convert
+        format_hints: Column -> datetime format already known for the column
+
+    Returns:
+        Converted column names and the datetime formats detected
+    """
+    format_hints = dict(format_hints or {})
+    text_like = [col for col in df.columns if is_text_dtype(df[col].dtype)]
+    kinds, formats = infer_column_types(df, text_like, format_hints=format_hints)
+    format_hints.update(formats)
+
+    converted = []
+    for col, kind in kinds.items():
+        if kind in (NUMERIC, DATETIME):
+            df[col] = convert_column(df[col], kind, format_hints.get(col))
+            converted.append(col)
+    return converted, formats